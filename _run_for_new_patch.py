@@ -1,66 +1,155 @@
-import subprocess
+import argparse
 import os
+import sys
+
+import config.constants as constants
+from utils.pipeline import Stage, run_pipeline
+
+# ---------------------------------------------------------------------------
+# Paths used in the stage declarations below
+# ---------------------------------------------------------------------------
+
+def _in(*parts):
+    return os.path.join(constants.INPUT_DIRECTORY, *parts)
+
+def _json(name):
+    return os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", name)
+
+def _wiki(*parts):
+    return os.path.join(constants.OUTPUT_DIRECTORY, "Wiki Formatted", *parts)
+
+_MONOBEHAVIOUR  = _in("MonoBehaviour")
+_GAMEOBJECT     = _in("GameObject")
+_ENGLISH        = _in("English.prefab")
+_SCENES         = _in("Scenes")
+_ASSET_INDEX    = _json("asset_index.json")
+_LOCALIZATION   = _json("localization.sqlite")
+_ITEMS          = _json("items_data.json")
+_NPC_DIALOGUE   = _wiki("NPC Dialogue")
+_NPC_SCHEDULES  = _wiki("NPC Schedules")
+_UNIQUE_NPCS    = os.path.join(constants.OUTPUT_DIRECTORY, "Unique_NPC_Names_For_Patch.txt")
+_STATE_FILE     = _json("pipeline_state.json")
 
 # ---------------------------------------------------------------------------
 # Phase 1 — Builders
 # Reads raw game files and produces structured JSON caches.
-# Run item_builder first; other builders may depend on items_data.json.
+# asset_index indexes MonoBehaviour/GameObject once for every later builder.
+# localization parses English.prefab once for every builder and exporter.
+# Stages that read items_data.json run after item_builder automatically.
 # ---------------------------------------------------------------------------
-builder_order = [
-    "builders/item_builder.py",
-    "builders/shop_builder.py",
-    "builders/recipe_builder.py",
-    "builders/npc_dialogue_builder.py",
-    "builders/quest_builder.py",
-    "builders/breakable_object_builder.py",
-    "builders/image_builder.py",
-    "builders/entity_builder.py",           # Requires Scenes folder
-    "builders/fish_spawner_builder.py",     # Requires Scenes folder
-    "builders/cutscene_builder.py",
+builder_stages = [
+    Stage("builders/asset_index.py",
+          inputs=(_MONOBEHAVIOUR, _GAMEOBJECT),
+          outputs=(_ASSET_INDEX,)),
+    Stage("builders/localization.py",
+          inputs=(_ENGLISH,),
+          outputs=(_LOCALIZATION,)),
+    Stage("builders/item_builder.py",
+          inputs=(_MONOBEHAVIOUR, _GAMEOBJECT, _ASSET_INDEX, _LOCALIZATION),
+          outputs=(_ITEMS,)),
+    Stage("builders/shop_builder.py",
+          inputs=(_MONOBEHAVIOUR, _ASSET_INDEX),
+          outputs=(_json("shop_data.json"),)),
+    Stage("builders/recipe_builder.py",
+          inputs=(_MONOBEHAVIOUR, _ASSET_INDEX, _ITEMS),
+          outputs=(_json("recipes_data.json"),)),
+    Stage("builders/npc_dialogue_builder.py",
+          inputs=(_MONOBEHAVIOUR, _ASSET_INDEX, _LOCALIZATION),
+          outputs=(_json("npc_dialogue.json"),)),
+    Stage("builders/quest_builder.py",
+          inputs=(_MONOBEHAVIOUR, _ASSET_INDEX),
+          outputs=(_json("quest_data_BB_SQ.json"), _json("quest_data_MainQuests.json"), _json("quest_data_IDK.json"))),
+    Stage("builders/breakable_object_builder.py",
+          inputs=(_GAMEOBJECT, _ASSET_INDEX),
+          outputs=(_json("breakable_objects.json"),)),
+    Stage("builders/image_builder.py",
+          inputs=(_in("Sprite"),),
+          outputs=(_json("images_data.json"),)),
+    Stage("builders/entity_builder.py",             # Requires Scenes folder
+          inputs=(_GAMEOBJECT, _SCENES, _ASSET_INDEX),
+          outputs=(_json("entities_data.json"),)),
+    Stage("builders/fish_spawner_builder.py",       # Requires Scenes folder
+          inputs=(_SCENES,),
+          outputs=(_json("fish_spawner_data.json"),)),
+    Stage("builders/cutscene_builder.py",
+          inputs=(_LOCALIZATION,),
+          outputs=(_json("cutscenes_convos.json"),)),
 ]
 
 # ---------------------------------------------------------------------------
 # Phase 2 — Exporters
 # Reads JSON caches and writes wiki-formatted .txt output files.
-# Ordering matters where one exporter reads output from another.
+# Ordering comes from the declared inputs/outputs:
 #   all_npc_names  → produces Unique_NPC_Names_For_Patch.txt
 #   npc_dialogue   → produces "<NPC> one liners.txt" per NPC
 #   npc_cycles     → produces "<NPC> cycles.txt" per NPC
 #   npc_walk_schedule → produces "<NPC>_schedule.txt" per NPC
 #   create_npc_pages  → consumes all three of the above
 # ---------------------------------------------------------------------------
-exporter_order = [
+exporter_stages = [
     # Item / recipe / shop outputs
-    "exporters/all_item_descriptions.py",
-    "exporters/all_recipes.py",
-    "exporters/all_shops.py",
+    Stage("exporters/all_item_descriptions.py",
+          inputs=(_ITEMS,),
+          outputs=(_wiki("Module_Description_data.txt"),)),
+    Stage("exporters/all_recipes.py",
+          inputs=(_json("recipes_data.json"),),
+          outputs=(_wiki("Recipes.txt"),)),
+    Stage("exporters/all_shops.py",                 # also scans the whole input tree for table assets
+          inputs=(_json("shop_data.json"), _ITEMS, constants.INPUT_DIRECTORY),
+          outputs=(_wiki("shops.txt"),)),
 
     # NPC names (must run before create_npc_pages)
-    "exporters/all_npc_names.py",
+    Stage("exporters/all_npc_names.py",
+          inputs=(_LOCALIZATION,),
+          outputs=(_wiki("npc_list.txt"), _UNIQUE_NPCS)),
 
     # NPC dialogue outputs (must run before create_npc_pages)
-    "exporters/npc_dialogue.py",
-    "exporters/npc_cycles.py",
-    "exporters/npc_romance_dialogue_unique_gifts.py",
-    "exporters/npc_romance_gift_preferences.py",
-    "exporters/npc_walk_schedule.py",
-    "exporters/npc_wedding_cutscene.py",
+    Stage("exporters/npc_dialogue.py",
+          inputs=(_json("npc_dialogue.json"),),
+          outputs=(_NPC_DIALOGUE,)),
+    Stage("exporters/npc_cycles.py",
+          inputs=(_json("npc_dialogue.json"), _json("quest_data_BB_SQ.json")),
+          outputs=(_NPC_DIALOGUE,)),
+    Stage("exporters/npc_romance_dialogue_unique_gifts.py",
+          inputs=(_MONOBEHAVIOUR, _ITEMS, _LOCALIZATION),
+          outputs=(_NPC_DIALOGUE,)),
+    Stage("exporters/npc_romance_gift_preferences.py",
+          inputs=(_MONOBEHAVIOUR, _ITEMS),
+          outputs=(_wiki("npc_gift_preferences.txt"),)),
+    Stage("exporters/npc_walk_schedule.py",
+          inputs=(_MONOBEHAVIOUR,),
+          outputs=(_NPC_SCHEDULES,)),
+    Stage("exporters/npc_wedding_cutscene.py",
+          inputs=(_LOCALIZATION,),
+          outputs=(os.path.join(_NPC_DIALOGUE, "_All_Wedding_Dialogue.txt"),)),
 
     # NPC page assembly (depends on the four exporters above)
-    "exporters/create_npc_pages.py",
+    Stage("exporters/create_npc_pages.py",
+          inputs=(_UNIQUE_NPCS, _NPC_DIALOGUE, _NPC_SCHEDULES),
+          outputs=(_wiki("NPC Pages"),)),
 
     # Enemy / entity outputs (require Scenes folder)
-    "exporters/all_monster_drops.py",
-    "exporters/all_enemy_infoboxes.py",
+    Stage("exporters/all_monster_drops.py",
+          inputs=(_json("entities_data.json"), _ITEMS),
+          outputs=(_wiki("All Monster Drops.txt"),)),
+    Stage("exporters/all_enemy_infoboxes.py",
+          inputs=(_json("entities_data.json"),),
+          outputs=(_wiki("all_enemy_infobox.txt"),)),
 
     # Fish spawn chances (requires Scenes folder)
-    "exporters/fish_spawn_chance.py",
+    Stage("exporters/fish_spawn_chance.py",
+          inputs=(_json("fish_spawner_data.json"), _ITEMS),
+          outputs=(_wiki("Fish_Spawn_Chance.txt"), _json("fish_spawn_table.npy"))),
 
     # Cutscene outputs (requires Scripts folder)
-    "exporters/all_cutscenes.py",
+    Stage("exporters/all_cutscenes.py",
+          inputs=(_in("Scripts"), _LOCALIZATION),
+          outputs=(_wiki("Cutscenes"),)),
 
     # Quest page assembly
-    "exporters/create_quest_pages.py",
+    Stage("exporters/create_quest_pages.py",
+          inputs=(_json("quest_data_MainQuests.json"), _json("quest_data_BB_SQ.json"), _ITEMS),
+          outputs=(_wiki("Quest Pages"),)),
 ]
 
 # ---------------------------------------------------------------------------
@@ -88,31 +177,6 @@ exporter_order = [
 # Runners
 # ---------------------------------------------------------------------------
 
-def run_scripts(script_list):
-    for script in script_list:
-        if not os.path.exists(script):
-            print(f"⚠ Script not found: {script}")
-            break
-
-        print(f"\n▶ Running {script}")
-        try:
-            process = subprocess.Popen(
-                ["python", script],
-                universal_newlines=True,
-                encoding='utf-8',
-                errors='replace'
-            )
-            process.wait()
-            if process.returncode == 0:
-                print(f"✅ {script} completed successfully.\n")
-            else:
-                print(f"❌ Error running {script} (exit code {process.returncode})")
-                break
-        except Exception as e:
-            print(f"❌ Exception while running {script}: {e}")
-            break
-
-
 # def run_pwb_scripts(pwb_list):
 #     for script in pwb_list:
 #         print(f"\n▶ Running Pywikibot: {script}")
@@ -140,7 +204,11 @@ def run_scripts(script_list):
 
 
 if __name__ == "__main__":
-    run_scripts(builder_order)
-    run_scripts(exporter_order)
+    parser = argparse.ArgumentParser(description="Run all builders and exporters for a new patch.")
+    parser.add_argument("--force", action="store_true", help="Run every stage, even if its inputs are unchanged.")
+    parser.add_argument("--workers", type=int, default=4, help="Stages allowed to run at the same time (default: 4).")
+    args = parser.parse_args()
+
+    ok = run_pipeline(builder_stages + exporter_stages, _STATE_FILE, workers=args.workers, force=args.force)
     # run_pwb_scripts(pwb_scripts)
-    # run_scripts(analysis_order)
+    sys.exit(0 if ok else 1)
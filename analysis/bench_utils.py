@@ -0,0 +1,74 @@
+"""
+Shared harness for the old-path vs new-path benchmarks in analysis/.
+
+Each benchmark generates its own synthetic input, runs a frozen copy of
+the pre-refactor code and the current code over it, and compares the
+results; this module holds the parts that were identical between them.
+
+Public API:
+  scratch_dir(prefix)                     →  context manager yielding a temp dir (removed afterwards)
+  warm_file_cache(paths)                  →  None   (read every file once)
+  time_calls(fn, inputs, repeat=1)        →  (best seconds, results of the last pass)
+  print_speedup(old, new, count, unit, per="ms")
+                                          →  None   (old / new are (label, seconds))
+  parse_count(description, default)       →  int    (--count from the command line)
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable, Iterable, Iterator
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Seed for every synthetic generator, so runs are comparable across commits
+SEED = 1234
+
+_PER_UNIT = {"ms": 1e3, "µs": 1e6}
+
+
+@contextlib.contextmanager
+def scratch_dir(prefix: str) -> Iterator[str]:
+    path = tempfile.mkdtemp(prefix=prefix)
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def warm_file_cache(paths: Iterable[str]) -> None:
+    """Read each file once so both paths measure parsing, not cold disk reads."""
+    for path in paths:
+        with open(path, "rb") as f:
+            f.read()
+
+
+def time_calls(fn: Callable, inputs: list, repeat: int = 1) -> tuple[float, list]:
+    """Best of `repeat` passes of fn over inputs, plus the last pass's results."""
+    best = float("inf")
+    results: list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [fn(x) for x in inputs]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def print_speedup(old: tuple[str, float], new: tuple[str, float], count: int, unit: str, per: str = "ms") -> None:
+    width = max(len(old[0]), len(new[0])) + 1
+    scale = _PER_UNIT[per]
+    for label, seconds in (old, new):
+        print(f"  {(label + ':').ljust(width)} {seconds:.3f}s  ({seconds / count * scale:.3f} {per}/{unit})")
+    print(f"  Speed-up: {old[1] / new[1]:.2f}x")
+
+
+def parse_count(description: str, default: int) -> int:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--count", type=int, default=default, help="Number of synthetic inputs to generate.")
+    return parser.parse_args().count
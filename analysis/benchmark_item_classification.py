@@ -0,0 +1,360 @@
+"""
+Checks and benchmarks the table-driven item classifier
+(mappings/item_classification.py) against the previous if-chain.
+
+Golden checks (any difference is printed and the script exits non-zero):
+  - synthetic items built from every keyword, useDescription, description
+    prefix and flag the rules look at, classified from an item dict and
+    from ItemData, against the frozen if-chain below
+  - when items_data.json exists, every item's stored classification
+    (written by the if-chain) against the engine's answer for that ItemData
+
+Benchmark: the old builder path (camelCase compat dict per item + if-chain)
+against classify_item(ItemData), best of three passes over the synthetic
+items. _legacy_classify is the if-chain the rule table replaced; the
+committed fixture check that does not need it is
+analysis/check_item_classification.py.
+
+Run:
+    python analysis/benchmark_item_classification.py [--count 50000]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from analysis import bench_utils
+from builders.item_data import FoodStatEntry, ItemData, StatEntry
+from mappings import item_classification
+from mappings.item_classification import classify_item
+
+# ---------------------------------------------------------------------------
+# Synthetic item generator
+# ---------------------------------------------------------------------------
+
+_FILLER = ["golden", "old", "tiny", "royal", "frosted", "ancient", "blue", "elven", "cozy", "of the", "deluxe", "x"]
+
+
+def _rule_vocabulary() -> tuple[list[str], list[str], list[str]]:
+    """Keywords, useDescriptions and description prefixes the engine's rules test for."""
+    keywords, use_descs, prefixes = set(), set(), set()
+    for group in item_classification._RULES:
+        if group.use_desc is not None:
+            use_descs.add(group.use_desc)
+        for words, _ in group.names:
+            keywords.update(words)
+        prefixes.update(prefix for prefix, _ in group.desc_prefixes)
+    return sorted(keywords), sorted(use_descs), sorted(prefixes)
+
+
+def generate_items(count: int, seed: int = bench_utils.SEED) -> list[ItemData]:
+    """ItemData records mixing rule keywords, useDescriptions, prefixes and flags."""
+    rng = random.Random(seed)
+    keywords, use_descs, prefixes = _rule_vocabulary()
+    use_descs += ["", "(Left click to eat)", "(Left click to use)"]
+    descriptions = [
+        "", "   ", "A generated item.",
+        "When selected on your toolbelt, this staff grants +2 mana.",
+    ] + [p + "cozy style." for p in prefixes] + [p.lower() + "cozy style." for p in prefixes]
+
+    items = []
+    for n in range(count):
+        words = rng.sample(keywords, rng.randint(0, 3)) + rng.sample(_FILLER, rng.randint(0, 2))
+        rng.shuffle(words)
+        name = " ".join(words).title() if rng.random() < 0.5 else " ".join(words)
+        if rng.random() < 0.2:
+            name = "".join(words)        # keywords glued together (e.g. "chestplatering")
+        items.append(ItemData(
+            asset_name=f"{n} - {name}",
+            guid=f"{rng.getrandbits(128):032x}",
+            item_id=n,
+            name=name,
+            description=rng.choice(descriptions),
+            use_description=rng.choice(use_descs),
+            is_forageable=rng.random() < 0.15,
+            is_meal=rng.random() < 0.1,
+            is_potion=rng.random() < 0.1,
+            has_set_season=rng.choice([None, None, 0, 2]),
+            stats=[StatEntry(1, 2.0)] * rng.randint(0, 1),
+            food_stat=[FoodStatEntry(3.0, 0)] * rng.choice([0, 0, 1]),
+        ))
+    return items
+
+
+def _compat(item_data: ItemData) -> dict:
+    """The camelCase dict item_builder used to build for every item before calling the if-chain."""
+    return {
+        "Name": item_data.name,
+        "name": item_data.name,
+        "description": item_data.description,
+        "useDescription": item_data.use_description,
+        "stats": [{"statType": s.stat_type, "value": s.value} for s in item_data.stats],
+        "foodStat": [{"increase": f.increase, "stat": f.stat} for f in item_data.food_stat],
+        "isForageable": int(item_data.is_forageable),
+        "isPotion": int(item_data.is_potion),
+        "isMeal": int(item_data.is_meal),
+        "hasSetSeason": item_data.has_set_season,
+    }
+
+# ---------------------------------------------------------------------------
+# Legacy classifier (frozen copy of the pre-refactor if-chain)
+# ---------------------------------------------------------------------------
+
+def _legacy_classify(item):
+    raw_name = item.get("name") or item.get("Name") or ""
+    name = str(raw_name).lower()
+
+    desc = item.get("description") or item.get("Description") or ""
+    use_desc = item.get("useDescription") or item.get("UseDescription") or ""
+
+    stats = item.get("stats", "")
+    foodStat = item.get("foodStat", "")
+    isForageable = item.get("isForageable", 0)
+    isPotion = item.get("isPotion", 0)
+    isMeal = item.get("isMeal", 0)
+    hasSetSeason = item.get("hasSetSeason")
+
+    # 1. Animal classification.
+    if use_desc == "\"(Grab a leash to have them follow you!)\\n(Left click at house or farm to place)\"":
+        return "Animal", "Pet", ""
+    elif use_desc == "(Left click at farm to place)":
+        if desc and desc.strip():
+            return "Animal", "Barn Animal", ""
+        else:
+            return "Animal", "Wild Animal", ""
+
+    # 2. Weapon classification.
+    if "great sword" in name and use_desc == "(Left click to swing)":
+        return "Equipment", "Weapon", "Great Sword"
+    if "sword" in name and use_desc == "(Left click to swing)":
+        return "Equipment", "Weapon", "Sword"
+    if "hammer" in name and use_desc == "(Left click to swing)":
+        return "Equipment", "Weapon", "Hammer"
+    if "crossbow" in name and use_desc == "(Left click to fire)":
+        return "Equipment", "Weapon", "Crossbow"
+    if ("staff" in name or "staves" in name) and desc and "when selected on your toolbelt, this staff grants" in desc.lower():
+        return "Equipment", "Weapon", "Staff"
+
+    # 3. Tool classification.
+    if "axe" in name and use_desc == "(Left click on trees to use)":
+        return "Equipment", "Tool", "Axe"
+    if "pickaxe" in name and use_desc == "(Left click on a rock or decoration to use)":
+        return "Equipment", "Tool", "Pickaxe"
+    if use_desc == "(Press left click and hold to cast your line)":
+        return "Equipment", "Tool", "Rod"
+    if use_desc == "\"(Left click to hoe)\\n(Right click to unhoe)\"":
+        return "Equipment", "Tool", "Hoe"
+    if use_desc == "\"(Left click on tilled dirt to water)\\n(Left click on water to refill)\"":
+        return "Equipment", "Tool", "Watering Can"
+    if "fishing net" in name:
+        return "Equipment", "Tool", "Net"
+    if "scythe" in name and use_desc == "(Left click to swing)":
+        return "Equipment", "Tool", "Scythe"
+
+    # 4. Forageable classification.
+    if isForageable == 1:
+        if not foodStat:
+            # NON-FOOD forageables → Item + Forageables/Resources
+            return "Item", "Forageables", "Resources"
+        else:
+            # FOOD forageables → Forageables/Food (mapped to Consumable infobox later)
+            return "Forageables", "Food", ""
+
+    # 5. Fish classification.
+    if hasSetSeason is not None and foodStat:
+        return "Fish", "", ""
+
+    # 6. Consumable classification.
+    if isMeal == 1 or (isPotion == 0 and isForageable == 0 and foodStat):
+        if "tome" in name.lower():
+            return "Consumable", "Tome", ""
+        if "jam" in name.lower():
+            return "Consumable", "Jam", ""
+        return "Consumable", "Food", ""
+
+    if isPotion == 1:
+        return "Consumable", "Potion", ""
+
+    # 7. Record classification.
+    if use_desc == "(Use on record player to play)":
+        return "Item", "Record", ""
+
+    # 8. Mount classification.
+    if use_desc == "(Left click to summon/unsummon mount)":
+        return "Item", "Mount", ""
+
+    # 9. House Customization
+    if desc.startswith("Customizes your house's door in a "):
+        return "Item", "House Customization", "Door"
+    if desc.startswith("Customizes your house's patio in a "):
+        return "Item", "House Customization", "Patio"
+    if desc.startswith("Customizes your house's roof in a "):
+        return "Item", "House Customization", "Roof"
+    if desc.startswith("Customizes your house's walls in a "):
+        return "Item", "House Customization", "Walls"
+    if desc.startswith("Customizes your house's windows in a "):
+        return "Item", "House Customization", "Windows"
+
+    # 10. Flooring
+    if use_desc == "(Left click to place path on farm)":
+        return "Furniture", "Tile", ""
+    if use_desc == "(Use on floor to place)":
+        return "Furniture", "Flooring", ""
+
+    # 11. Wallpaper
+    if use_desc == "(Use on a wall to place)":
+        return "Furniture", "Wallpaper", ""
+
+    # 12. Other Furniture classification.
+    if use_desc == "(Left click to place)":
+        if "end table" in name or "nightstand" in name or "night stand" in name:
+            return "Furniture", "Nightstand", ""
+        if "bed" in name:
+            return "Furniture", "Bed", ""
+        if "bridge" in name:
+            return "Furniture", "Bridge", ""
+        if "bookcase" in name:
+            return "Furniture", "Bookcase", ""
+        if "couch" in name:
+            return "Furniture", "Couch", ""
+        if any(k in name for k in ["chair", "floor cushion", "stool"]):
+            return "Furniture", "Chair", ""
+        if "chest" in name:
+            return "Furniture", "Chest", ""
+        if any(k in name for k in ["Fence", "Fences"]):
+            return "Furniture", "Fence", ""
+        if "fireplace" in name:
+            return "Furniture", "Fireplace", ""
+        if "gate" in name:
+            return "Furniture", "Fence Gate", ""
+        if "painting" in name:
+            return "Furniture", "Painting", ""
+        if any(k in name for k in ["statue", "sculpture", "model", "column"]):
+            return "Furniture", "Statue", ""
+        if any(k in name for k in ["plant", "tree", "vase", "cactus", "flower", "seaweed", "bush", "leaf", "ivy"]):
+            return "Furniture", "Plant", ""
+        if any(k in name for k in ["light", "lamp", "lantern", "candle", "candelabra"]):
+            return "Furniture", "Lighting", ""
+        if any(k in name for k in ["plushie", "plush"]):
+            return "Furniture", "Plushie", ""
+        if any(k in name for k in ["rug", "mat", "doormat"]):
+            return "Furniture", "Rug", ""
+        if "shelf" in name:
+            return "Furniture", "Shelf", ""
+        if "table" in name:
+            return "Furniture", "Table", ""
+        if any(k in name for k in ["wardrobe", "dresser"]):
+            return "Furniture", "Wardrobe", ""
+        if any(k in name for k in ["window", "windows"]):
+            return "Furniture", "Window", ""
+        if "selling portal" in name:
+            return "Furniture", "Selling Portal", ""
+        return "Furniture", "Misc", ""
+
+    # 13. Equipment fallback classification.
+    if stats:
+        if "ring" in name:
+            return "Equipment", "Accessory", "Ring"
+        if "amulet" in name:
+            return "Equipment", "Accessory", "Amulet"
+        if "keepsake" in name:
+            return "Equipment", "Accessory", "Keepsake"
+        if "helmet" in name:
+            return "Equipment", "Armor", "Helmet"
+        if any(k in name for k in ["robe", "chest", "chestplate", "chest plate"]):
+            return "Equipment", "Armor", "Chest"
+        if any(k in name for k in ["gloves", "gauntlets"]):
+            return "Equipment", "Armor", "Gloves"
+        if any(k in name for k in ["leg", "legs", "shoes", "pants"]):
+            return "Equipment", "Armor", "Legs"
+        if any(k in name for k in ["cape", "wings", "back"]):
+            return "Equipment", "Armor", "Cape"
+    else:
+        if any(k in name for k in ["hat", "cap", "crown", "headband", "headphones", "hood", "goggles", "tiara", "helmet", "head scarf", "beanie", "halo", "helm"]):
+            return "Equipment", "Clothing", "Hat"
+        if "wig" in name:
+            return "Equipment", "Clothing", "Wig"
+        if "dress" in name or "robe" in name:
+            return "Equipment", "Clothing", "Dress"
+        if any(k in name for k in ["chest", "gown", "toga", "kimono", "chestplate", "chest plate", "shirt", "tank top", "hoodie", "jacket", "crop top", "sweater", "torso", "costume", "outfit", "vest", "coat", "tee", "t-shirt", "blouse", "suit", "cover up"]):
+            return "Equipment", "Clothing", "Shirt"
+        if any(k in name for k in ["gloves", "gauntlets"]):
+            return "Equipment", "Clothing", "Gloves"
+        if any(k in name for k in ["cape", "wings", "tail"]):
+            return "Equipment", "Clothing", "Cape"
+        if any(k in name for k in ["pants", "slacks", "shoes", "boots", "greaves"]):
+            return "Equipment", "Clothing", "Pants"
+        if "shorts" in name:
+            return "Equipment", "Clothing", "Shorts"
+        if any(k in name for k in ["skirt", "skirts"]):
+            return "Equipment", "Clothing", "Skirt"
+
+    return "", "", ""
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _golden_synthetic(items: list[ItemData]) -> int:
+    mismatches = 0
+    for item in items:
+        compat = _compat(item)
+        expected = _legacy_classify(compat)
+        for label, got in (("dict", classify_item(compat)), ("ItemData", classify_item(item))):
+            if got != expected:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"  ❌ [{label}] {item.name!r} / {item.use_description!r}: {got} != {expected}")
+    return mismatches
+
+
+def _golden_items_data() -> tuple[int, int]:
+    """(items checked, mismatches) against classifications stored in items_data.json."""
+    from builders.item_builder import _load_cache
+    items = _load_cache()
+    mismatches = 0
+    for key in items:
+        item = items[key]
+        c = item.classification
+        expected = (c.item_type, c.subtype, c.category) if c else ("", "", "")
+        got = classify_item(item)
+        if got != expected:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"  ❌ {item.name!r}: {got} != stored {expected}")
+    return len(items), mismatches
+
+
+def run(count: int) -> int:
+    items = generate_items(count)
+
+    mismatches = _golden_synthetic(items)
+    print(f"  Synthetic golden check: {count} items, {mismatches} mismatches")
+    checked, stored_mismatches = _golden_items_data()
+    if checked:
+        print(f"  items_data.json golden check: {checked} items, {stored_mismatches} mismatches")
+    else:
+        print("  items_data.json not found — skipped the stored-classification check.")
+
+    # Best of three, so one noisy pass does not skew the comparison
+    old_time, _ = bench_utils.time_calls(lambda item: _legacy_classify(_compat(item)), items, repeat=3)
+    new_time, _ = bench_utils.time_calls(classify_item, items, repeat=3)
+    bench_utils.print_speedup(
+        ("Old path (compat dict + if-chain)", old_time), ("New path (rule engine, ItemData)", new_time),
+        count, "item", per="µs",
+    )
+
+    total = mismatches + stored_mismatches
+    if total:
+        print(f"❌ {total} classifications differ.")
+        return 1
+    print("✅ All classifications identical.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(bench_utils.parse_count("Golden check and benchmark for the item classifier.", 50000)))
@@ -0,0 +1,543 @@
+"""
+Benchmarks the single-pass item record parser against the previous
+four-reads-per-asset path, on a synthetic MonoBehaviour directory.
+
+Old path (per asset): keyDisplayName read + attribute read + icon read +
+statBuff read + .meta read.
+New path (per asset): one _parse_item_record() read; the GUID comes from
+the asset index, so no .meta read is needed at build time.
+
+Every generated asset is parsed both ways and the attribute dicts must
+match (the .meta GUID aside, which the new path no longer reads). The
+_legacy_* functions are the item builder's parsers as of the last
+multi-read release.
+
+Run:
+    python analysis/benchmark_item_parser.py [--count 5000]
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import re
+import sys
+from math import floor
+from typing import Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from builders.item_builder import _parse_item_record, _parse_number
+from builders.item_data import StatBuffEntry
+from analysis import bench_utils
+from utils import file_utils
+
+log = logging.getLogger("benchmark_item_parser")
+
+# ---------------------------------------------------------------------------
+# Synthetic asset generator
+# ---------------------------------------------------------------------------
+
+_ASSET_TEMPLATE = """%YAML 1.1
+%TAG !u! tag:unity3d.com,2011:
+--- !u!114 &11400000
+MonoBehaviour:
+  m_ObjectHideFlags: 0
+  m_CorrespondingSourceObject: {{fileID: 0}}
+  m_PrefabInstance: {{fileID: 0}}
+  m_GameObject: {{fileID: 0}}
+  m_Enabled: 1
+  m_Script: {{fileID: 11500000, guid: 3b1a2c4d5e6f708192a3b4c5d6e7f809, type: 3}}
+  m_Name: {item_id} - {name}
+  id: {item_id}
+  keyDisplayName: Items.{key}
+  icon: {{fileID: 21300000, guid: {icon_guid}, type: 3}}
+  description: {description}
+  useDescription: {use_description}
+  helpDescription: {help_description}
+  stackSize: {stack_size}
+  canSell: {can_sell}
+  sellPrice: {sell_price}
+  orbsSellPrice: {orbs}
+  ticketSellPrice: 0
+  rarity: {rarity}
+  hearts: {hearts}
+  decorationType: {decoration}
+  isDLCItem: {dlc}
+  isForageable: {forageable}
+  isGem: 0
+  isAnimalProduct: 0
+  isMeal: {meal}
+  isFruit: 0
+  isArtisanryItem: 0
+  isPotion: {potion}
+  health: {health}
+  mana: {mana}
+  requiredLevel: {level}
+  hasSetSeason: {has_set_season}
+  setSeason: {set_season}
+  stats:
+{stats}  maxStats:
+{max_stats}  foodStat:
+{food_stat}  statBuff:
+    buffType: 3
+    buffName: Synthetic Buff
+    description: 
+    stats:
+{buff_stats}    duration: {duration}
+  exps:
+{exps}  seasons:
+{seasons}  cropStages:
+{crop_stages}  dropRange: {{x: {drop_x}, y: {drop_y}}}
+  daysToRegrow: {regrow_days}
+  regrowable: {regrowable}
+"""
+
+_USE_DESCRIPTIONS = [
+    "(Left click to place)",
+    "(Left click to swing)",
+    "(Use on floor to place)",
+    "(Press left click and hold to cast your line)",
+    "",
+]
+
+
+def _stat_list(rng: random.Random, count: int, indent: str = "  ") -> str:
+    return "".join(
+        f"{indent}- statType: {rng.randint(0, 70)}\n{indent}  value: {rng.choice(['1', '2.5', '-3', '0.15'])}\n"
+        for _ in range(count)
+    ) or f"{indent}[]\n"
+
+
+def _generate_asset(rng: random.Random, item_id: int) -> str:
+    name = f"Synthetic Item {item_id}"
+    multiline = rng.random() < 0.3
+    description = "" if multiline else f"A generated item numbered {item_id}."
+    if multiline:
+        description = "\n    A generated item that spans\n    several description lines."
+    return _ASSET_TEMPLATE.format(
+        item_id=item_id,
+        name=name,
+        key=f"synthetic_{item_id}",
+        icon_guid=f"{rng.getrandbits(128):032x}",
+        description=description,
+        use_description=rng.choice(_USE_DESCRIPTIONS),
+        help_description=rng.choice(["", "Hold shift to stack."]),
+        stack_size=rng.choice([1, 99, 999]),
+        can_sell=rng.randint(0, 1),
+        sell_price=rng.randint(0, 5000),
+        orbs=rng.randint(0, 50),
+        rarity=rng.randint(0, 4),
+        hearts=rng.randint(0, 3),
+        decoration=rng.randint(0, 12),
+        dlc=rng.randint(0, 1),
+        forageable=rng.randint(0, 1),
+        meal=rng.randint(0, 1),
+        potion=rng.randint(0, 1),
+        health=rng.randint(0, 100),
+        mana=rng.randint(0, 100),
+        level=rng.randint(0, 70),
+        has_set_season=rng.randint(0, 1),
+        set_season=rng.randint(0, 3),
+        stats=_stat_list(rng, rng.randint(0, 4)),
+        max_stats=_stat_list(rng, rng.randint(0, 2)),
+        food_stat="".join(
+            f"  - increase: {rng.randint(0, 4)}\n    stat: {rng.randint(0, 1)}\n"
+            for _ in range(rng.randint(0, 2))
+        ) or "  []\n",
+        buff_stats=_stat_list(rng, rng.randint(0, 2), indent="    "),
+        duration=rng.choice([30, 60, 120.5]),
+        exps="".join(
+            f"  - profession: {rng.randint(0, 4)}\n    amount: {rng.randint(1, 50)}\n"
+            for _ in range(rng.randint(0, 2))
+        ) or "  []\n",
+        seasons="".join(f"  - {s}\n" for s in sorted(rng.sample(range(4), rng.randint(0, 4)))) or "  []\n",
+        crop_stages="".join(
+            f"  - daysToGrow: {rng.choice([1, 1.5, 2])}\n"
+            f"    sprite: {{fileID: 21300000, guid: {rng.getrandbits(128):032x}, type: 3}}\n"
+            f"    height: 0\n"
+            for _ in range(rng.randint(0, 4))
+        ) or "  []\n",
+        drop_x=rng.randint(1, 3),
+        drop_y=rng.randint(3, 5),
+        regrow_days=rng.randint(0, 5),
+        regrowable=rng.randint(0, 1),
+    )
+
+
+def generate_assets(directory: str, count: int, seed: int = bench_utils.SEED) -> list[str]:
+    """Write `count` synthetic item assets (+ .meta) and return their paths."""
+    rng = random.Random(seed)
+    paths = []
+    for item_id in range(1, count + 1):
+        path = os.path.join(directory, f"{item_id} - Synthetic Item {item_id}.asset")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_generate_asset(rng, item_id))
+        with open(path + ".meta", "w", encoding="utf-8") as f:
+            f.write(f"fileFormatVersion: 2\nguid: {rng.getrandbits(128):032x}\n")
+        paths.append(path)
+    return paths
+
+# ---------------------------------------------------------------------------
+# Legacy parsers (frozen copy of the pre-refactor item builder)
+# ---------------------------------------------------------------------------
+
+def _legacy_icon_guid(asset_file: str) -> Optional[str]:
+    try:
+        lines = file_utils.read_file_lines(asset_file)
+    except Exception as exc:
+        log.warning("Error reading %s: %s", asset_file, exc)
+        return None
+    for line in lines:
+        match = re.match(r"icon:\s*\{fileID:\s*\d+,\s*guid:\s*([\da-f]+),", line.strip())
+        if match:
+            return match.group(1)
+    return None
+
+
+def _legacy_key_display_name(asset_file: str) -> Optional[str]:
+    try:
+        for line in file_utils.read_file_lines(asset_file):
+            if "keyDisplayName:" in line:
+                return line.split("keyDisplayName:")[1].strip()
+    except Exception as exc:
+        log.warning("Failed to extract keyDisplayName from %s: %s", asset_file, exc)
+    return None
+
+
+def _legacy_stat_buff(lines: list[str]) -> list[StatBuffEntry]:
+    capturing = False
+    capturing_stats = False
+    duration: Optional[float] = None
+    entries: list[StatBuffEntry] = []
+
+    # Sub-fields of the statBuff block that are not stats/duration — skip them
+    _SKIP_KEYS = ("buffType:", "buffName:", "description:")
+
+    for line in lines:
+        line = line.strip()
+        if line.startswith("statBuff:"):
+            capturing = True
+            capturing_stats = False
+            duration = None
+            entries = []
+            continue
+        if not capturing:
+            continue
+
+        # duration can appear before or after the stats list
+        if match := re.match(r"duration:\s*([\d.]+)", line):
+            duration = _parse_number(match.group(1))
+            for i, e in enumerate(entries):
+                if e.duration == 0:
+                    entries[i] = StatBuffEntry(e.stat_type, e.value, int(duration))
+            continue
+
+        if line.startswith("stats:"):
+            capturing_stats = True
+            continue
+
+        # Skip known sub-fields that would otherwise trigger the stop condition
+        if line.startswith(_SKIP_KEYS):
+            continue
+
+        if capturing_stats:
+            if match := re.match(r"-\s*statType:\s*(\d+)", line):
+                entries.append(StatBuffEntry(
+                    stat_type=int(match.group(1)),
+                    value=0.0,
+                    duration=int(duration) if duration is not None else 0,
+                ))
+            elif match := re.match(r"value:\s*(-?[\d.]+)", line):
+                if entries:
+                    last = entries[-1]
+                    entries[-1] = StatBuffEntry(last.stat_type, _parse_number(match.group(1)), last.duration)
+            elif re.match(r"^\S", line):
+                capturing_stats = False
+                capturing = False
+        elif re.match(r"^\S", line):
+            capturing = False
+
+    return entries
+
+
+def _legacy_attributes(asset_file: str) -> dict:
+    """Parse a raw .asset file and return a flat dict of all extracted fields."""
+    attrs: dict = {
+        "id": None,
+        "description": None,
+        "use_description": None,
+        "help_description": None,
+        "stack_size": None,
+        "can_sell": False,
+        "sell_price": None,
+        "orbs_sell_price": None,
+        "ticket_sell_price": None,
+        "rarity": None,
+        "hearts": None,
+        "decoration_type": None,
+        "is_dlc": False,
+        "is_forageable": False,
+        "is_gem": False,
+        "is_animal_product": False,
+        "is_meal": False,
+        "is_fruit": False,
+        "is_artisanry": False,
+        "is_potion": False,
+        "crop_yield": None,
+        "days_to_regrow": None,
+        "regrowable": False,
+        "has_set_season": None,
+        "set_season": None,
+        "exp": None,
+        "health": None,
+        "mana": None,
+        "armor_set": None,
+        "required_level": None,
+        "stats": [],
+        "max_stats": [],
+        "food_stat": [],
+        "stat_buff": [],
+        "exps": [],
+        "crop_stages": [],
+        "seasons": None,
+        "icon_guid": None,
+    }
+
+    boolean_fields = {
+        "isDLCItem": "is_dlc",
+        "isForageable": "is_forageable",
+        "isGem": "is_gem",
+        "isAnimalProduct": "is_animal_product",
+        "isMeal": "is_meal",
+        "isFruit": "is_fruit",
+        "isArtisanryItem": "is_artisanry",
+        "isPotion": "is_potion",
+        "canSell": "can_sell",
+    }
+
+    numeric_fields = {
+        "health": "health",
+        "mana": "mana",
+        "requiredLevel": "required_level",
+        "stackSize": "stack_size",
+        "sellPrice": "sell_price",
+        "orbsSellPrice": "orbs_sell_price",
+        "ticketSellPrice": "ticket_sell_price",
+        "rarity": "rarity",
+        "hearts": "hearts",
+        "decorationType": "decoration_type",
+        "hasSetSeason": "has_set_season",
+        "setSeason": "set_season",
+        "armorSet": "armor_set",
+        "exp": "exp",
+        "experience": "exp",
+        "daysToRegrow": "days_to_regrow",
+    }
+
+    boolean_fields["regrowable"] = "regrowable"
+
+    # Pre-compile combined patterns for performance
+    _NUMERIC_PATTERN = re.compile(
+        r"^(health|mana|requiredLevel|stackSize|sellPrice|orbsSellPrice|ticketSellPrice"
+        r"|rarity|hearts|decorationType|hasSetSeason|setSeason|armorSet|exp|experience|daysToRegrow):\s*([\d.]+)"
+    )
+    _BOOL_PATTERN = re.compile(
+        r"^(isDLCItem|isForageable|isGem|isAnimalProduct|isMeal|isFruit|isArtisanryItem|isPotion|canSell|regrowable):\s*(\d+)"
+    )
+
+    try:
+        lines = file_utils.read_file_lines(asset_file)
+        capturing_description = False
+        capturing_stats = False
+        capturing_max_stats = False
+        capturing_food_stat = False
+        capturing_exps = False
+        capturing_seasons = False
+        capturing_crop_stages = False
+        description_lines: list[str] = []
+        seasons_list: list[str] = []
+        crop_stages: list[dict] = []
+
+        for line in lines:
+            line = line.strip()
+
+            # Numeric fields — single combined regex
+            if match := _NUMERIC_PATTERN.match(line):
+                raw_key, value = match.group(1), match.group(2)
+                snake_key = numeric_fields[raw_key]
+                attrs[snake_key] = _parse_number(value)
+                continue
+
+            # Boolean fields + canSell — single combined regex
+            if match := _BOOL_PATTERN.match(line):
+                raw_key, value = match.group(1), match.group(2)
+                snake_key = boolean_fields.get(raw_key, "can_sell")
+                attrs[snake_key] = int(value) == 1
+                continue
+
+            # useDescription / helpDescription
+            if match := re.match(r"useDescription:\s*(.+)", line):
+                attrs["use_description"] = match.group(1).strip()
+            if match := re.match(r"helpDescription:\s*(.+)", line):
+                attrs["help_description"] = match.group(1).strip()
+
+            # description (may be multi-line)
+            if line.startswith("description:"):
+                parts = line.split(":", 1)
+                if len(parts) > 1 and parts[1].strip():
+                    attrs["description"] = parts[1].strip()
+                else:
+                    capturing_description = True
+                continue
+            if capturing_description:
+                if line.startswith("-") or ":" in line:
+                    capturing_description = False
+                else:
+                    description_lines.append(line)
+                    continue
+
+            # stats
+            if line.startswith("stats:") and not capturing_stats:
+                capturing_stats = True
+                continue
+            if capturing_stats:
+                if match := re.match(r"-\s*statType:\s*(\d+)", line):
+                    attrs["stats"].append({"stat_type": int(match.group(1)), "value": None})
+                elif match := re.match(r"value:\s*(-?[\d.]+)", line):
+                    if attrs["stats"]:
+                        attrs["stats"][-1]["value"] = _parse_number(match.group(1))
+                elif re.match(r"^\S", line):
+                    capturing_stats = False
+
+            # maxStats
+            if line.startswith("maxStats:"):
+                capturing_max_stats = True
+                continue
+            if capturing_max_stats:
+                if match := re.match(r"-\s*statType:\s*(\d+)", line):
+                    attrs["max_stats"].append({"stat_type": int(match.group(1)), "value": None})
+                elif match := re.match(r"value:\s*(-?[\d.]+)", line):
+                    if attrs["max_stats"]:
+                        attrs["max_stats"][-1]["value"] = _parse_number(match.group(1))
+                elif re.match(r"^\S", line):
+                    capturing_max_stats = False
+
+            # foodStat
+            if line.startswith("foodStat:"):
+                capturing_food_stat = True
+                continue
+            if capturing_food_stat:
+                if match := re.match(r"increase:\s*([\d.]+)", line):
+                    attrs["food_stat"].append({"increase": _parse_number(match.group(1)), "stat": None})
+                elif match := re.match(r"stat:\s*(\d+)", line):
+                    if attrs["food_stat"]:
+                        attrs["food_stat"][-1]["stat"] = int(match.group(1))
+                elif re.match(r"^\S", line):
+                    capturing_food_stat = False
+
+            # exps (EXP bonuses granted when the item is consumed)
+            if line.startswith("exps:"):
+                capturing_exps = True
+                continue
+            if capturing_exps:
+                if match := re.match(r"-\s*profession:\s*(\d+)", line):
+                    attrs["exps"].append({"profession": int(match.group(1)), "amount": 0})
+                elif match := re.match(r"amount:\s*(\d+)", line):
+                    if attrs["exps"]:
+                        attrs["exps"][-1]["amount"] = int(match.group(1))
+                elif re.match(r"^\S", line):
+                    capturing_exps = False
+
+            # dropRange: {x: N, y: M} — crop yield comes from x value
+            if match := re.match(r"dropRange:\s*\{x:\s*([\d.]+)", line):
+                attrs["crop_yield"] = int(floor(float(match.group(1))))
+
+            # cropStages
+            if re.match(r"^\s*cropStages:\s*$", line):
+                capturing_crop_stages = True
+                crop_stages = []
+                continue
+            if capturing_crop_stages:
+                if match := re.match(r"^\s*-\s*daysToGrow:\s*([\d.]+)", line):
+                    crop_stages.append({"days_to_grow": _parse_number(match.group(1)), "guid": None})
+                elif match := re.match(r"sprite:.*guid:\s*([\da-f]+)", line):
+                    if crop_stages:
+                        crop_stages[-1]["guid"] = match.group(1)
+                elif re.match(r"^(height|offset|animator):", line):
+                    pass  # sub-fields within a crop stage entry — keep capturing
+                elif re.match(r"^\S", line):
+                    capturing_crop_stages = False
+
+            # seasons
+            if re.match(r"^\s*seasons:\s*$", line):
+                capturing_seasons = True
+                seasons_list = []
+                continue
+            if capturing_seasons:
+                if match := re.match(r"^\s*-\s*(\d+)", line):
+                    seasons_list.append(match.group(1))
+                elif re.match(r"^\s*\S", line):
+                    capturing_seasons = False
+
+        if description_lines:
+            attrs["description"] = " ".join(description_lines).strip()
+        if seasons_list:
+            attrs["seasons"] = "; ".join(seasons_list)
+        if crop_stages:
+            attrs["crop_stages"] = crop_stages
+
+    except Exception as exc:
+        log.error("Error parsing %s: %s", asset_file, exc)
+
+    return attrs
+
+
+def _legacy_guid(meta_file: str) -> Optional[str]:
+    content = "\n".join(file_utils.read_file_lines(meta_file))
+    match = re.search(r"guid:\s*([a-f0-9]+)", content)
+    return match.group(1) if match else None
+
+
+def _legacy_path(asset_path: str) -> dict:
+    attrs = _legacy_attributes(asset_path)
+    attrs["key_display_name"] = _legacy_key_display_name(asset_path)
+    attrs["icon_guid"] = _legacy_icon_guid(asset_path)
+    attrs["stat_buff"] = _legacy_stat_buff(file_utils.read_file_lines(asset_path))
+    attrs["guid"] = _legacy_guid(asset_path + ".meta")
+    return attrs
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run(count: int) -> None:
+    with bench_utils.scratch_dir("item_parser_bench_") as workdir:
+        print(f"Generating {count} synthetic item assets in {workdir}...")
+        paths = generate_assets(workdir, count)
+        bench_utils.warm_file_cache(paths)
+
+        old_time, old_results = bench_utils.time_calls(_legacy_path, paths)
+        new_time, new_results = bench_utils.time_calls(_parse_item_record, paths)
+
+        mismatches = 0
+        for path, old, new in zip(paths, old_results, new_results):
+            old.pop("guid")
+            if old != new:
+                mismatches += 1
+                if mismatches <= 5:
+                    diff = sorted(k for k in old if old.get(k) != new.get(k))
+                    print(f"  ❌ {os.path.basename(path)} differs on: {diff}")
+
+        bench_utils.print_speedup(
+            ("Old path (4 reads + .meta)", old_time), ("New path (single pass)", new_time), count, "asset"
+        )
+        if mismatches:
+            print(f"❌ {mismatches} of {count} assets parsed differently.")
+        else:
+            print(f"✅ All {count} assets parsed identically.")
+
+
+if __name__ == "__main__":
+    run(bench_utils.parse_count("Benchmark the item record parser.", 5000))
@@ -0,0 +1,152 @@
+"""
+Benchmarks loading items from the binary item store against decoding the
+4-space-indented items_data.json, on a synthetic item set.
+
+Old path: json_utils.load_json() + _item_data_from_dict() for every item.
+New path: item_store.open_store() (header only), then a single lookup and
+a full decode of every item.
+
+Both paths are checked for identical ItemData, and tracemalloc reports the
+peak memory of each.
+
+Run:
+    python analysis/benchmark_item_store.py [--count 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from builders import item_store
+from builders.item_builder import _item_data_from_dict
+from builders.item_data import (
+    CropStage,
+    ExpsEntry,
+    FoodStatEntry,
+    ItemClassification,
+    ItemData,
+    StatBuffEntry,
+    StatEntry,
+)
+from utils import json_utils
+
+# ---------------------------------------------------------------------------
+# Synthetic item generator
+# ---------------------------------------------------------------------------
+
+_WORDS = ["Apple", "Bronze", "Crystal", "Dragon", "Elven", "Frost", "Golden", "Mana", "Shadow", "Sun"]
+
+
+def _generate_item(rng: random.Random, item_id: int) -> ItemData:
+    name = f"{rng.choice(_WORDS)} {rng.choice(_WORDS)} {item_id}"
+    return ItemData(
+        asset_name=name.replace(" ", ""),
+        name=name,
+        guid=f"{rng.getrandbits(128):032x}",
+        item_id=item_id,
+        icon_guid=f"{rng.getrandbits(128):032x}",
+        description=" ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 25))),
+        use_description=rng.choice(["", "Use to eat."]),
+        stack_size=rng.choice([None, 1, 99, 999]),
+        can_sell=rng.random() < 0.8,
+        sell_price=rng.randint(0, 5000),
+        rarity=rng.randint(0, 5),
+        required_level=rng.choice([None, rng.randint(1, 80)]),
+        is_meal=rng.random() < 0.1,
+        stats=[StatEntry(rng.randint(0, 30), round(rng.uniform(0, 50), 2)) for _ in range(rng.randint(0, 4))],
+        food_stat=[FoodStatEntry(round(rng.uniform(0, 5), 1), rng.randint(0, 10)) for _ in range(rng.randint(0, 2))],
+        stat_buff=[StatBuffEntry(rng.randint(0, 30), 5.0, rng.randint(60, 600)) for _ in range(rng.randint(0, 1))],
+        exps=[ExpsEntry(rng.randint(0, 4), rng.randint(1, 50)) for _ in range(rng.randint(0, 1))],
+        crop_stages=[CropStage(1.0, f"{rng.getrandbits(64):016x}") for _ in range(rng.randint(0, 3))],
+        classification=ItemClassification("Equipment", "Armor", "Chest"),
+    )
+
+
+def generate_items(count: int, seed: int = 1234) -> dict[str, ItemData]:
+    rng = random.Random(seed)
+    items = (_generate_item(rng, 1000 + i) for i in range(count))
+    return {item.name.lower(): item for item in items}
+
+# ---------------------------------------------------------------------------
+# Load paths
+# ---------------------------------------------------------------------------
+
+def _load_json(json_path: str) -> dict[str, ItemData]:
+    raw = json_utils.load_json(json_path)
+    return {name: _item_data_from_dict(d) for name, d in raw.items()}
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def _peak_memory(fn) -> int:
+    # Separate pass: tracemalloc slows allocation-heavy code down several times
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _store_full_decode(json_path: str) -> None:
+    item_store.release(json_path)
+    store = item_store.open_store(json_path)
+    for key in store:
+        store[key]
+
+
+def run(count: int) -> None:
+    workdir = tempfile.mkdtemp(prefix="item_store_bench_")
+    json_path = os.path.join(workdir, "items_data.json")
+    try:
+        print(f"Generating {count} synthetic items in {workdir}...")
+        items = generate_items(count)
+        json_utils.write_json({k: dataclasses.asdict(v) for k, v in items.items()}, json_path, indent=4)
+        item_store.save_snapshot(items, json_path)
+        probe = next(reversed(items))
+
+        json_time, from_json = _timed(lambda: _load_json(json_path))
+        item_store.release(json_path)
+        open_time, store = _timed(lambda: item_store.open_store(json_path))
+        lookup_time, _ = _timed(lambda: store[probe])
+        full_time, _ = _timed(lambda: [store[k] for k in store])
+
+        json_peak = _peak_memory(lambda: _load_json(json_path))
+        full_peak = _peak_memory(lambda: _store_full_decode(json_path))
+        store = item_store.open_store(json_path)
+
+        mismatches = sum(1 for k in items if from_json[k] != items[k] or store[k] != items[k])
+
+        print(f"  JSON decode (all items):   {json_time * 1000:8.1f} ms  peak {json_peak / 1e6:6.1f} MB")
+        print(f"  Store open (header only):  {open_time * 1000:8.1f} ms")
+        print(f"  Store single lookup:       {lookup_time * 1000:8.3f} ms")
+        print(f"  Store decode (all items):  {full_time * 1000:8.1f} ms  peak {full_peak / 1e6:6.1f} MB")
+        print(f"  JSON size {os.path.getsize(json_path) / 1e6:.1f} MB, "
+              f"snapshot size {os.path.getsize(os.path.splitext(json_path)[0] + '.bin') / 1e6:.1f} MB")
+        if mismatches:
+            print(f"❌ {mismatches} of {count} items differ between JSON and store.")
+        else:
+            print(f"✅ All {count} items identical.")
+    finally:
+        item_store.release(json_path)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the binary item store.")
+    parser.add_argument("--count", type=int, default=10000, help="Number of synthetic items to generate.")
+    args = parser.parse_args()
+    run(args.count)
@@ -0,0 +1,323 @@
+"""
+Benchmarks the single-pass prefab field extractor (builders/prefab_fields.py)
+against the previous per-field regex searches, on a synthetic GameObject
+directory.
+
+Old path (per prefab): readlines + join, one re.search per entity field,
+a line walk for _drops2, then another line walk each for lootTable and
+professionEXP and two more full-text searches for respawnRate / rarity.
+New path (per prefab): one read, one PrefabExtractor scan per builder.
+
+The generator mixes enemies, breakables and plain objects, with optional
+fields left out at random; each prefab's (entity, breakable) pair from the
+_legacy_* parsers — the entity / breakable builders before prefab_fields
+existed — must equal the extractor's.
+
+Run:
+    python analysis/benchmark_prefab_fields.py [--count 5000]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import re
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from builders import prefab_fields
+from builders.breakable_object_builder import _parse_breakable
+from builders.entity_builder import _parse_prefab_entity
+from analysis import bench_utils
+from utils import file_utils
+
+# ---------------------------------------------------------------------------
+# Synthetic prefab generator
+# ---------------------------------------------------------------------------
+
+_HEADER = "%YAML 1.1\n%TAG !u! tag:unity3d.com,2011:\n"
+
+_GAMEOBJECT = """--- !u!1 &{file_id}
+GameObject:
+  m_ObjectHideFlags: 0
+  serializedVersion: 6
+  m_Component:
+  - component: {{fileID: {t_id}}}
+  - component: {{fileID: {r_id}}}
+  m_Layer: 0
+  m_Name: {name}
+  m_TagString: Untagged
+  m_IsActive: 1
+--- !u!4 &{t_id}
+Transform:
+  m_ObjectHideFlags: 0
+  m_GameObject: {{fileID: {file_id}}}
+  m_LocalRotation: {{x: 0, y: 0, z: 0, w: 1}}
+  m_LocalPosition: {{x: {x}, y: {y}, z: 0}}
+  m_LocalScale: {{x: 1, y: 1, z: 1}}
+  m_Children: []
+  m_Father: {{fileID: 0}}
+--- !u!212 &{r_id}
+SpriteRenderer:
+  m_ObjectHideFlags: 0
+  m_GameObject: {{fileID: {file_id}}}
+  m_Enabled: 1
+  m_CastShadows: 0
+  m_ReceiveShadows: 0
+  m_Materials:
+  - {{fileID: 2100000, guid: {material_guid}, type: 2}}
+  m_SortingLayerID: 0
+  m_Sprite: {{fileID: 21300000, guid: {sprite_guid}, type: 3}}
+  m_Color: {{r: 1, g: 1, b: 1, a: 1}}
+"""
+
+_ENEMY_SCRIPT = """--- !u!114 &{file_id}
+MonoBehaviour:
+  m_ObjectHideFlags: 0
+  m_GameObject: {{fileID: {go_id}}}
+  m_Enabled: 1
+  m_Script: {{fileID: 11500000, guid: 5a1b2c3d4e5f60718293a4b5c6d7e8f9, type: 3}}
+  m_Name:
+{fields}  _drops2:
+{drops}  knockBackResistance: 0
+"""
+
+_BREAKABLE_SCRIPT = """--- !u!114 &{file_id}
+MonoBehaviour:
+  m_ObjectHideFlags: 0
+  m_GameObject: {{fileID: {go_id}}}
+  m_Enabled: 1
+  m_Script: {{fileID: 11500000, guid: 0f1e2d3c4b5a69788796a5b4c3d2e1f0, type: 3}}
+  m_Name:
+  respawnRate: {respawn}
+  rarity: {rarity}
+  lootTable:
+{loot}  professionEXP:
+{prof}  breakSound: {{fileID: 0}}
+"""
+
+
+def _enemy_fields(rng: random.Random, n: int) -> str:
+    lines = []
+    name = rng.choice([f"Synthetic Enemy {n}", f'"Quoted Enemy {n}"', "keyEnemyName", ""])
+    lines.append(f"  enemyName: {name}")
+    lines.append(f"  keyEnemyName: Enemies.enemy_{n}")
+    for field, values in [
+        ("_health",      ["120", "45.5", "7"]),
+        ("_experience",  ["10", "2.25"]),
+        ("_powerLevel",  ["3", "12", "2.5"]),
+        ("defense",      ["0", "4", "1.5"]),
+        ("_hasAttack",   ["0", "1"]),
+        ("_damageRange", ["{x: 3, y: 8}", "{x: 10, y: 14}"]),
+        ("_damageType",  ["0", "2"]),
+        ("_hitType",     ["1", "3"]),
+        ("_hitCooldown", ["0.5", "1"]),
+        ("_knockBack",   ["2", "0.25"]),
+    ]:
+        if rng.random() < 0.85:
+            lines.append(f"  {field}: {rng.choice(values)}")
+    if rng.random() < 0.2:
+        lines.append("  _quests:\n  - {fileID: 11400000, guid: 00112233445566778899aabbccddeeff, type: 2}")
+    return "\n".join(lines) + "\n"
+
+
+def _drops(rng: random.Random) -> str:
+    tables = []
+    for _ in range(rng.randint(0, 3)):
+        entries = "".join(
+            f"    - id: {rng.randint(1000, 60000)}\n"
+            f"      dropChance: {rng.choice(['0.5', '0.05', '1', '0.125'])}\n"
+            f"      dropAmount: {{x: {rng.randint(1, 3)}, y: {rng.randint(3, 6)}}}\n"
+            for _ in range(rng.randint(1, 4))
+        )
+        tables.append(f"  - drops:\n{entries}")
+    return "".join(tables) or "  []\n"
+
+
+def _loot(rng: random.Random) -> str:
+    tables = []
+    for _ in range(rng.randint(0, 2)):
+        entries = "".join(
+            f"    - drop: {{fileID: 11400000, guid: {rng.getrandbits(128):032x}, type: 2}}\n"
+            f"      dropChance: {rng.choice(['0.5', '1', '0.05'])}\n"
+            f"      dropAmount: {{x: {rng.randint(1, 2)}, y: {rng.randint(2, 4)}}}\n"
+            for _ in range(rng.randint(1, 3))
+        )
+        tables.append(f"    - drops:\n{entries}")
+    return "".join(tables) or "    drops: []\n"
+
+
+def _generate_prefab(rng: random.Random, n: int) -> str:
+    file_id = rng.randint(10 ** 17, 10 ** 18)
+    parts = [_HEADER]
+    for k in range(rng.randint(2, 8)):
+        parts.append(_GAMEOBJECT.format(
+            file_id=file_id + 3 * k, t_id=file_id + 3 * k + 1, r_id=file_id + 3 * k + 2,
+            name=f"Part {k}", x=rng.uniform(-5, 5), y=rng.uniform(-5, 5),
+            material_guid=f"{rng.getrandbits(128):032x}", sprite_guid=f"{rng.getrandbits(128):032x}",
+        ))
+    kind = rng.random()
+    if kind < 0.35:
+        parts.append(_ENEMY_SCRIPT.format(
+            file_id=file_id + 900, go_id=file_id,
+            fields=_enemy_fields(rng, n), drops=_drops(rng),
+        ))
+    elif kind < 0.6:
+        parts.append(_BREAKABLE_SCRIPT.format(
+            file_id=file_id + 900, go_id=file_id,
+            respawn=rng.choice(["1", "3.5", "", '"2"']), rarity=rng.randint(0, 4),
+            loot=_loot(rng),
+            prof="".join(
+                f"  - profession: {rng.randint(0, 4)}\n    exp: {rng.randint(1, 20)}\n"
+                for _ in range(rng.randint(0, 2))
+            ),
+        ))
+    return "".join(parts)
+
+
+def generate_prefabs(directory: str, count: int, seed: int = bench_utils.SEED) -> list[str]:
+    """Write `count` synthetic prefabs (enemies, breakables, plain objects) and return their paths."""
+    rng = random.Random(seed)
+    paths = []
+    for n in range(1, count + 1):
+        path = os.path.join(directory, f"Synthetic Prefab {n}.prefab")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_generate_prefab(rng, n))
+        paths.append(path)
+    return paths
+
+# ---------------------------------------------------------------------------
+# Legacy parsers (frozen copy of the pre-refactor entity / breakable builders)
+# ---------------------------------------------------------------------------
+
+def _legacy_match_line_value(pattern: str, text: str, cast=None):
+    m = re.search(pattern, text, flags=re.MULTILINE)
+    if not m:
+        return None
+    val = m.group(1).strip().strip('"')
+    if cast is None:
+        return val
+    try:
+        return cast(val)
+    except Exception:
+        return None
+
+
+def _legacy_entity(path: str) -> dict | None:
+    lines   = file_utils.read_file_lines(path)
+    content = "\n".join(lines)
+
+    entity: dict = {"prefab": os.path.splitext(os.path.basename(path))[0]}
+
+    enemy_name = re.search(r'(?<!key)enemyName:\s*"?([^\r\n":]+(?: [^\r\n":]+)*)"?', content)
+    if enemy_name:
+        name = enemy_name.group(1).strip()
+        if name != "keyEnemyName":
+            entity["enemy_name"] = name
+
+    entity["guid"] = "GUID"
+
+    for key, field, cast in [
+        ("health",       "_health",              float),
+        ("exp",          "_experience",          float),
+        ("level",        "_powerLevel",          int),
+        ("defense",      "defense",              int),
+        ("has_attack",   "_hasAttack",           int),
+        ("damage_range", "_damageRange",         str),
+        ("damage_type",  "_damageType",          str),
+        ("hit_type",     "_hitType",             str),
+        ("hit_cooldown", "_hitCooldown",         float),
+        ("knock_back",   "_knockBack",           float),
+        ("npc_name",     "_npcName",             str),
+        ("romanceable",  "_romanceable",         int),
+        ("shop_keeper",  "_shopKeeper",          int),
+        ("quests",       "_quests",              str),
+    ]:
+        match = re.search(rf"{field}:\s*(.+)", content)
+        if match:
+            value = match.group(1).strip().strip('"')
+            if cast == int:
+                try:
+                    value = int(value)
+                except ValueError:
+                    continue
+            elif cast == float:
+                try:
+                    value = float(value)
+                except ValueError:
+                    continue
+            entity[key] = value
+
+    if "health" not in entity:
+        return None
+
+    # The block parsers moved verbatim into prefab_fields; the legacy path fed them every line
+    entity.update(prefab_fields.parse_drop_tables(lines))
+    return entity
+
+
+def _legacy_breakable(path: str) -> dict | None:
+    lines   = file_utils.read_file_lines(path)
+    content = "\n".join(lines)
+
+    loot_tables = prefab_fields.parse_loot_tables(lines)
+    if not loot_tables:
+        return None
+
+    return {
+        "prefab":       os.path.splitext(os.path.basename(path))[0],
+        "guid":         "GUID",
+        "respawn_rate": _legacy_match_line_value(r'^\s*respawnRate\s*:\s*([^\n]+)$', content, cast=float),
+        "rarity":       _legacy_match_line_value(r'^\s*rarity\s*:\s*([^\n]+)$', content),
+        "profession_exp": prefab_fields.parse_profession_exp(lines),
+        "loot_table":   loot_tables,
+    }
+
+
+def _legacy_path(path: str) -> tuple:
+    return _legacy_entity(path), _legacy_breakable(path)
+
+
+def _new_path(path: str) -> tuple:
+    name = os.path.splitext(os.path.basename(path))[0]
+    return (
+        _parse_prefab_entity(prefab_fields.read_prefab(path), name, "GUID"),
+        _parse_breakable(prefab_fields.read_prefab(path), name, "GUID"),
+    )
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run(count: int) -> None:
+    with bench_utils.scratch_dir("prefab_fields_bench_") as workdir:
+        print(f"Generating {count} synthetic prefabs in {workdir}...")
+        paths = generate_prefabs(workdir, count)
+        bench_utils.warm_file_cache(paths)
+
+        old_time, old_results = bench_utils.time_calls(_legacy_path, paths)
+        new_time, new_results = bench_utils.time_calls(_new_path, paths)
+
+        mismatches = 0
+        for path, old, new in zip(paths, old_results, new_results):
+            if old != new:
+                mismatches += 1
+                if mismatches <= 5:
+                    which = [label for label, a, b in zip(("entity", "breakable"), old, new) if a != b]
+                    print(f"  ❌ {os.path.basename(path)} differs on: {which}")
+
+        entities   = sum(1 for e, _ in new_results if e)
+        breakables = sum(1 for _, b in new_results if b)
+        print(f"  {entities} entities, {breakables} breakable objects")
+        bench_utils.print_speedup(
+            ("Old path (regex per field)", old_time), ("New path (single pass)", new_time), count, "prefab"
+        )
+        if mismatches:
+            print(f"❌ {mismatches} of {count} prefabs parsed differently.")
+        else:
+            print(f"✅ All {count} prefabs parsed identically.")
+
+
+if __name__ == "__main__":
+    run(bench_utils.parse_count("Benchmark the single-pass prefab field extractor.", 5000))
@@ -0,0 +1,115 @@
+"""
+Golden check for the item classifier (mappings/item_classification.py).
+
+analysis/fixtures/item_classification_golden.json holds items and the
+(itemType, subtype, category) the original if-chain classifier gave them:
+at least two items per distinct result, plus an item for every
+useDescription, description prefix and name keyword the rules test for
+(the capitalized "Fence" / "Fences" keywords can never match a lowercased
+name and have none). Each item is classified
+from ItemData and from the camelCase item dict; any difference is printed
+and the script exits non-zero, so rule drift fails instead of going unseen.
+
+When a rule change is intentional, review the printed differences, then
+rewrite the expected values with --update.
+
+Run:
+    python analysis/check_item_classification.py [--update]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from builders.item_data import FoodStatEntry, ItemData, StatEntry
+from mappings.item_classification import classify_item
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+_FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "item_classification_golden.json")
+
+# ---------------------------------------------------------------------------
+# Fixture
+# ---------------------------------------------------------------------------
+
+def _item_data(n: int, entry: dict) -> ItemData:
+    return ItemData(
+        asset_name=f"{n} - {entry['name']}",
+        guid="",
+        item_id=n,
+        name=entry["name"],
+        description=entry["description"],
+        use_description=entry["use_description"],
+        is_forageable=entry["is_forageable"],
+        is_meal=entry["is_meal"],
+        is_potion=entry["is_potion"],
+        has_set_season=entry["has_set_season"],
+        stats=[StatEntry(*s) for s in entry["stats"]],
+        food_stat=[FoodStatEntry(*f) for f in entry["food_stat"]],
+    )
+
+
+def _item_dict(item: ItemData) -> dict:
+    """The camelCase item dict form classify_item also accepts."""
+    return {
+        "name": item.name,
+        "description": item.description,
+        "useDescription": item.use_description,
+        "stats": [{"statType": s.stat_type, "value": s.value} for s in item.stats],
+        "foodStat": [{"increase": f.increase, "stat": f.stat} for f in item.food_stat],
+        "isForageable": int(item.is_forageable),
+        "isPotion": int(item.is_potion),
+        "isMeal": int(item.is_meal),
+        "hasSetSeason": item.has_set_season,
+    }
+
+
+def _write_fixture(entries: list[dict]) -> None:
+    # One item per line keeps fixture diffs readable
+    with open(_FIXTURE, "w", encoding="utf-8") as f:
+        f.write("[\n" + ",\n".join(json.dumps(e, ensure_ascii=False) for e in entries) + "\n]\n")
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run(update: bool = False) -> int:
+    with open(_FIXTURE, encoding="utf-8") as f:
+        entries = json.load(f)
+
+    mismatches = 0
+    for n, entry in enumerate(entries):
+        item = _item_data(n, entry)
+        expected = tuple(entry["expected"])
+        results = {"ItemData": classify_item(item), "dict": classify_item(_item_dict(item))}
+        for label, got in results.items():
+            if got != expected:
+                print(f"  ❌ [{label}] {item.name!r} / {item.use_description!r}: {got} != golden {expected}")
+        if any(got != expected for got in results.values()):
+            mismatches += 1
+        if update:
+            entry["expected"] = list(results["ItemData"])
+
+    if update:
+        _write_fixture(entries)
+        print(f"📋 Rewrote {len(entries)} golden classifications ({mismatches} changed).")
+        return 0
+    if mismatches:
+        print(f"❌ {mismatches} of {len(entries)} golden items classified differently.")
+        return 1
+    print(f"✅ {len(entries)} golden items classified identically.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the item classifier against the golden fixture.")
+    parser.add_argument("--update", action="store_true", help="Rewrite the fixture's expected values from the current rules.")
+    args = parser.parse_args()
+    sys.exit(run(update=args.update))
@@ -0,0 +1,90 @@
+"""
+Check that consumers of the shared localization table (builders/localization.py)
+still see the English.prefab terms the per-script parsers used to find.
+
+A small English.prefab snippet covers the shapes that tripped the table up:
+YAML-quoted terms, a blank line between Languages: and its entry, and a
+term with no entry at all. It is parsed without touching the persisted
+localization.sqlite, run through the wedding cutscene exporter's term
+filter, and compared with the expected {term: text}. Any difference is
+printed and the script exits non-zero.
+
+Run:
+    python analysis/check_localization_terms.py
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from builders import localization
+from exporters.npc_wedding_cutscene import _wedding_terms
+
+# ---------------------------------------------------------------------------
+# Fixture
+# ---------------------------------------------------------------------------
+
+_PREFAB = """\
+  mSource:
+    mTerms:
+    - Term: Wedding.Speech.Bob
+      TermType: 0
+      Languages:
+      - Dearly beloved.
+    - Term: "Wedding.Bob.Vows"
+      TermType: 0
+      Languages:
+      - "I do."
+    - Term: Wedding.Title.Bob
+      TermType: 0
+      Languages:
+
+      - Bob's Wedding
+    - Term: Wedding.Vows.Empty
+      TermType: 0
+      Languages: []
+      Flags: 00
+    - Term: Item.Apple
+      TermType: 0
+      Languages:
+      - Apple
+"""
+
+_EXPECTED = {
+    "Wedding.Speech.Bob": "Dearly beloved.",
+    "Wedding.Bob.Vows":   "I do.",
+    "Wedding.Title.Bob":  "Bob's Wedding",
+}
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run() -> int:
+    with tempfile.TemporaryDirectory(prefix="localization_check_") as tmp:
+        prefab_path = os.path.join(tmp, "English.prefab")
+        with open(prefab_path, "w", encoding="utf-8") as f:
+            f.write(_PREFAB)
+        terms, texts = localization._parse_prefab(prefab_path)
+
+    got = _wedding_terms(localization.LocalizationTable("check", terms, texts))
+
+    mismatches = 0
+    for term in sorted(set(_EXPECTED) | set(got)):
+        if got.get(term) != _EXPECTED.get(term):
+            print(f"  ❌ {term!r}: {got.get(term)!r} != expected {_EXPECTED.get(term)!r}")
+            mismatches += 1
+
+    if mismatches:
+        print(f"❌ {mismatches} Wedding.* terms differ.")
+        return 1
+    print(f"✅ {len(got)} Wedding.* terms found as expected.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,358 @@
+"""
+Asset index — Layer 1 of the pipeline (runs before every other builder).
+
+Walks the MonoBehaviour and GameObject folders once, splits each Unity YAML
+file into its ``--- !u!`` documents and records per file:
+  - the GUID from the matching .meta file
+  - the first m_Name
+  - per document: class ID, anchor fileID, byte offsets, type name,
+    top-level keys and m_Script GUID (keys and script are kept for
+    MonoBehaviour documents only — other Unity components carry engine
+    fields the builders never look at)
+
+The index is persisted to asset_index.json and refreshed incrementally:
+only files whose size or mtime changed since the last run are re-read.
+Builders query it instead of listing directories and re-opening .meta files.
+
+Public API:
+  load_index()  →  AssetIndex   (built or refreshed on demand)
+
+Usage:
+    python builders/asset_index.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import config.constants as constants
+from utils import file_utils
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+_INDEXED_FOLDERS = {
+    "MonoBehaviour": (".asset",),
+    "GameObject":    (".prefab",),
+}
+
+_CACHE_FILE = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "asset_index.json")
+
+_INDEX_VERSION = 2
+
+# ---------------------------------------------------------------------------
+# Regex constants (bytes — files are scanned without decoding)
+# ---------------------------------------------------------------------------
+
+_MONOBEHAVIOUR_CLASS_ID = 114
+
+_DOC_HEADER_RE = re.compile(rb"^--- !u!(\d+) &(-?\d+)[^\n]*\n([A-Za-z_]\w*):", re.MULTILINE)
+_TOP_KEY_RE    = re.compile(rb"^  ([A-Za-z_]\w*):", re.MULTILINE)
+_M_NAME_RE     = re.compile(rb"^  m_Name: ?([^\r\n]*)", re.MULTILINE)
+_M_SCRIPT_RE   = re.compile(rb"^  m_Script: \{fileID: -?\d+, guid: ([a-f0-9]+)", re.MULTILINE)
+_META_GUID_RE  = re.compile(rb"guid:\s*([a-fA-F0-9]+)")
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class UnityDocument:
+    """A single ``--- !u!`` document inside a Unity YAML file."""
+    class_id: int
+    file_id: int
+    start: int
+    end: int
+    type_name: str
+    keys: tuple[str, ...] = ()
+    script: Optional[str] = None
+
+
+class AssetIndex:
+    """
+    Read-only view over the persisted asset index.
+
+    Paths may be given either absolute or relative to INPUT_DIRECTORY;
+    relative keys always use forward slashes ("MonoBehaviour/Foo.asset").
+    """
+
+    def __init__(self, root: str, files: dict[str, dict]):
+        self._root = root
+        self._files = files
+        self._by_guid: Optional[dict[str, str]] = None
+        self._by_key: Optional[dict[str, list[str]]] = None
+        self._by_script: Optional[dict[str, list[str]]] = None
+
+    # --- Path helpers ---
+
+    def _rel(self, path: str) -> str:
+        if os.path.isabs(path):
+            path = os.path.relpath(path, self._root)
+        return path.replace(os.sep, "/")
+
+    def abspath(self, rel_path: str) -> str:
+        return os.path.join(self._root, *rel_path.split("/"))
+
+    def __contains__(self, path: str) -> bool:
+        return self._rel(path) in self._files
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    # --- Listing ---
+
+    def files(self, folder: str, suffix: str | None = None, recursive: bool = False) -> list[str]:
+        """
+        Return the indexed filenames in a folder, sorted, relative to that folder.
+        Mirrors os.listdir() when recursive is False.
+        """
+        prefix = folder.rstrip("/") + "/"
+        out = []
+        for rel in self._files:
+            if not rel.startswith(prefix):
+                continue
+            name = rel[len(prefix):]
+            if not recursive and "/" in name:
+                continue
+            if suffix and not name.endswith(suffix):
+                continue
+            out.append(name)
+        return sorted(out)
+
+    def files_with_key(self, folder: str, key: str) -> list[str]:
+        """Return filenames in a folder whose MonoBehaviour documents contain a top-level key."""
+        if self._by_key is None:
+            by_key: dict[str, list[str]] = {}
+            for rel, entry in self._files.items():
+                seen: set[str] = set()
+                for doc in entry["docs"]:
+                    seen.update(doc[5])
+                for k in seen:
+                    by_key.setdefault(k, []).append(rel)
+            self._by_key = by_key
+        prefix = folder.rstrip("/") + "/"
+        return sorted(
+            rel[len(prefix):] for rel in self._by_key.get(key, ()) if rel.startswith(prefix)
+        )
+
+    def files_with_script(self, folder: str, guids: set[str]) -> list[str]:
+        """Return filenames in a folder with a MonoBehaviour document whose m_Script GUID is in guids."""
+        if self._by_script is None:
+            by_script: dict[str, list[str]] = {}
+            for rel, entry in self._files.items():
+                for script in {doc[6] for doc in entry["docs"] if doc[6]}:
+                    by_script.setdefault(script, []).append(rel)
+            self._by_script = by_script
+        prefix = folder.rstrip("/") + "/"
+        return sorted({
+            rel[len(prefix):]
+            for guid in guids
+            for rel in self._by_script.get(guid, ())
+            if rel.startswith(prefix)
+        })
+
+    # --- Per-file lookups ---
+
+    def guid(self, path: str) -> Optional[str]:
+        entry = self._files.get(self._rel(path))
+        return entry["guid"] if entry else None
+
+    def m_name(self, path: str) -> Optional[str]:
+        entry = self._files.get(self._rel(path))
+        return entry["m_name"] if entry else None
+
+    def path_for_guid(self, guid: str) -> Optional[str]:
+        """Return the absolute path of the indexed file with this GUID, if any."""
+        if self._by_guid is None:
+            self._by_guid = {e["guid"]: rel for rel, e in self._files.items() if e["guid"]}
+        rel = self._by_guid.get(guid)
+        return self.abspath(rel) if rel else None
+
+    def documents(self, path: str, class_id: int | None = None) -> list[UnityDocument]:
+        entry = self._files.get(self._rel(path))
+        if not entry:
+            return []
+        return [
+            UnityDocument(d[0], d[1], d[2], d[3], d[4], tuple(d[5]), d[6])
+            for d in entry["docs"]
+            if class_id is None or d[0] == class_id
+        ]
+
+    def has_key(self, path: str, key: str) -> bool:
+        entry = self._files.get(self._rel(path))
+        return bool(entry) and any(key in d[5] for d in entry["docs"])
+
+    def read_document(self, path: str, doc: UnityDocument) -> str:
+        """Read a single document's text by seeking to its recorded byte offset."""
+        with open(self.abspath(self._rel(path)), "rb") as f:
+            f.seek(doc.start)
+            return f.read(doc.end - doc.start).decode("utf-8", errors="replace")
+
+# ---------------------------------------------------------------------------
+# File scanning
+# ---------------------------------------------------------------------------
+
+def _read_meta_guid(meta_path: str) -> Optional[str]:
+    try:
+        with open(meta_path, "rb") as f:
+            match = _META_GUID_RE.search(f.read())
+    except OSError:
+        return None
+    return match.group(1).decode("ascii") if match else None
+
+
+def _scan_file(path: str) -> tuple[Optional[str], list[list]]:
+    """Split a Unity YAML file into documents. Returns (m_name, docs)."""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    headers = list(_DOC_HEADER_RE.finditer(data))
+    docs: list[list] = []
+    m_name: Optional[str] = None
+
+    for i, match in enumerate(headers):
+        start = match.start()
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(data)
+        class_id = int(match.group(1))
+        keys: list[str] = []
+        script: Optional[str] = None
+        if class_id == _MONOBEHAVIOUR_CLASS_ID:
+            keys = list(dict.fromkeys(
+                k.decode("ascii") for k in _TOP_KEY_RE.findall(data, match.end(), end)
+            ))
+            script_match = _M_SCRIPT_RE.search(data, match.end(), end)
+            if script_match:
+                script = script_match.group(1).decode("ascii")
+        if m_name is None:
+            name_match = _M_NAME_RE.search(data, match.end(), end)
+            if name_match and name_match.group(1).strip():
+                m_name = name_match.group(1).decode("utf-8", errors="replace").strip()
+        docs.append([
+            class_id,
+            int(match.group(2)),
+            start,
+            end,
+            match.group(3).decode("ascii"),
+            keys,
+            script,
+        ])
+
+    return m_name, docs
+
+
+def _stat_key(entry: os.DirEntry) -> list[int]:
+    st = entry.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _walk(folder_path: str):
+    """Yield (DirEntry, meta DirEntry | None) for every file below a folder."""
+    stack = [folder_path]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except FileNotFoundError:
+            continue
+        metas = {e.name: e for e in entries if e.name.endswith(".meta")}
+        for entry in entries:
+            if entry.is_dir():
+                stack.append(entry.path)
+            elif not entry.name.endswith(".meta"):
+                yield entry, metas.get(entry.name + ".meta")
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+def _load_raw() -> dict:
+    try:
+        with open(_CACHE_FILE, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if raw.get("version") != _INDEX_VERSION or raw.get("root") != constants.INPUT_DIRECTORY:
+        return {}
+    return raw.get("files", {})
+
+
+def _save_raw(files: dict[str, dict]) -> None:
+    file_utils.ensure_dir_exists(os.path.dirname(_CACHE_FILE))
+    tmp_path = _CACHE_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": _INDEX_VERSION, "root": constants.INPUT_DIRECTORY, "files": files},
+            f,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+    os.replace(tmp_path, _CACHE_FILE)
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def load_index(verbose: bool = False) -> AssetIndex:
+    """
+    Return the asset index, re-scanning only files that changed since the
+    persisted copy was written. Safe to call from any builder.
+    """
+    previous = _load_raw()
+    files: dict[str, dict] = {}
+    rescanned = 0
+
+    for folder, suffixes in _INDEXED_FOLDERS.items():
+        folder_path = os.path.join(constants.INPUT_DIRECTORY, folder)
+        for entry, meta in _walk(folder_path):
+            if not entry.name.endswith(suffixes):
+                continue
+            rel = os.path.relpath(entry.path, constants.INPUT_DIRECTORY).replace(os.sep, "/")
+            stat = _stat_key(entry)
+            meta_stat = _stat_key(meta) if meta else None
+
+            cached = previous.get(rel)
+            if cached and cached["stat"] == stat and cached["meta_stat"] == meta_stat:
+                files[rel] = cached
+                continue
+
+            try:
+                m_name, docs = _scan_file(entry.path)
+            except OSError as exc:
+                print(f"  ⚠️  Error reading {entry.path}: {exc}")
+                continue
+            files[rel] = {
+                "stat":      stat,
+                "meta_stat": meta_stat,
+                "guid":      _read_meta_guid(meta.path) if meta else None,
+                "m_name":    m_name,
+                "docs":      docs,
+            }
+            rescanned += 1
+
+    if rescanned or len(files) != len(previous):
+        _save_raw(files)
+    if verbose:
+        print(f"  🔄 {rescanned} of {len(files)} files re-indexed.")
+
+    return AssetIndex(constants.INPUT_DIRECTORY, files)
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run() -> None:
+    print("Indexing asset files...")
+    index = load_index(verbose=True)
+    print(f"✅ {len(index)} files indexed in {_CACHE_FILE}")
+
+
+if __name__ == "__main__":
+    run()
@@ -21,6 +21,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 sys.stdout.reconfigure(encoding="utf-8")
 
 import config.constants as constants
+from builders import localization
 from utils import json_utils
 from utils.text_utils import clean_game_dialogue
 
@@ -35,11 +36,8 @@ _CACHE_FILE   = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "cutscenes
 # Regex constants
 # ---------------------------------------------------------------------------
 
-_TERM_RE             = re.compile(r"^\s*-\s*Term:\s*(.+?)\s*$")
-_LANGUAGES_HEADER_RE = re.compile(r"^\s*Languages:\s*$")
-_LANG_ITEM_RE        = re.compile(r"^\s*-\s*(.*)\s*$")
-_NPC_PREFIX_RE       = re.compile(r"^(R?NPC)\.", re.IGNORECASE)
-_TAIL_RE             = re.compile(r"^(D|O|R)(\d+)?([A-Za-z]*)$", re.IGNORECASE)
+_NPC_PREFIX_RE = re.compile(r"^(R?NPC)\.", re.IGNORECASE)
+_TAIL_RE       = re.compile(r"^(D|O|R)(\d+)?([A-Za-z]*)$", re.IGNORECASE)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -65,30 +63,11 @@ def _decode_yaml_scalar(value: str) -> str:
 
 
 def _extract_term_english_pairs(prefab_path: str) -> List[Tuple[str, str]]:
-    pairs: List[Tuple[str, str]] = []
-    current_term: Optional[str] = None
-    waiting_for_lang = False
-
-    with open(prefab_path, "r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            m_term = _TERM_RE.match(line)
-            if m_term:
-                current_term = m_term.group(1).strip()
-                waiting_for_lang = False
-                continue
-
-            if current_term and _LANGUAGES_HEADER_RE.match(line):
-                waiting_for_lang = True
-                continue
-
-            if current_term and waiting_for_lang:
-                m_lang = _LANG_ITEM_RE.match(line)
-                if m_lang:
-                    english = clean_game_dialogue(_decode_yaml_scalar(m_lang.group(1)))
-                    pairs.append((current_term, english))
-                waiting_for_lang = False
-
-    return pairs
+    table = localization.load_table(prefab_path)
+    return [
+        (term, clean_game_dialogue(_decode_yaml_scalar(raw)))
+        for term, raw in table.pairs()
+    ]
 
 
 def _split_scene_and_tail(term: str) -> Optional[Tuple[str, str]]:
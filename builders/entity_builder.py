@@ -17,6 +17,8 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
+from builders import prefab_fields
+from builders.asset_index import load_index
 from utils import file_utils, json_utils
 
 # ---------------------------------------------------------------------------
@@ -27,59 +29,76 @@ _GAMEDATA_DIR  = os.path.join(constants.INPUT_DIRECTORY, "GameObject")
 _SCENES_DIR    = os.path.join(constants.INPUT_DIRECTORY, "Scenes")
 _CACHE_FILE    = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "entities_data.json")
 
+# ---------------------------------------------------------------------------
+# Prefab fields
+# ---------------------------------------------------------------------------
+
+# (entity key, prefab field, cast) — values that fail the cast are left out
+_PREFAB_FIELDS = [
+    ("health",       "_health",              float),
+    ("exp",          "_experience",          float),
+    ("level",        "_powerLevel",          int),
+    ("defense",      "defense",              int),
+    ("has_attack",   "_hasAttack",           int),
+    ("damage_range", "_damageRange",         str),
+    ("damage_type",  "_damageType",          str),
+    ("hit_type",     "_hitType",             str),
+    ("hit_cooldown", "_hitCooldown",         float),
+    ("knock_back",   "_knockBack",           float),
+    ("npc_name",     "_npcName",             str),
+    ("romanceable",  "_romanceable",         int),
+    ("shop_keeper",  "_shopKeeper",          int),
+    ("quests",       "_quests",              str),
+]
+
+# All fields and the _drops2 block come out of one scan per prefab
+_EXTRACTOR = prefab_fields.PrefabExtractor(
+    [prefab_fields.Field("enemy_name", "enemyName:", r'(?<!key)enemyName:\s*"?([^\r\n":]+(?: [^\r\n":]+)*)"?')]
+    + [prefab_fields.Field(key, field + ":") for key, field, _ in _PREFAB_FIELDS],
+    blocks=[prefab_fields.DROPS2],
+)
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _extract_drop_tables(lines: list[str]) -> dict:
-    drop_tables = []
-    current_table: list[dict] = []
-    drop_id = None
-    drop_chance = None
-    inside_drops2 = False
+def _parse_prefab_entity(text: str, prefab_name: str, guid: str) -> dict | None:
+    """Entity entry for one prefab, or None when it has no health (not an entity)."""
+    found = _EXTRACTOR.extract(text)
 
-    for line in lines:
-        line = line.rstrip()
-        stripped = line.strip()
+    entity: dict = {"prefab": prefab_name}
 
-        if "_drops2:" in stripped:
-            inside_drops2 = True
-            continue
+    if "enemy_name" in found:
+        name = found["enemy_name"].strip()
+        if name != "keyEnemyName":
+            entity["enemy_name"] = name
+
+    entity["guid"] = guid
 
-        if inside_drops2:
-            if "- drops:" in stripped:
-                if current_table:
-                    drop_tables.append(current_table)
-                current_table = []
+    for key, _, cast in _PREFAB_FIELDS:
+        if key not in found:
+            continue
+        value = found[key].strip().strip('"')
+        if cast == int:
+            try:
+                value = int(value)
+            except ValueError:
+                continue
+        elif cast == float:
+            try:
+                value = float(value)
+            except ValueError:
                 continue
-            elif not line.startswith(" "):
-                break
-
-            if "id:" in stripped:
-                try:
-                    drop_id = int(stripped.split("id:")[1].strip())
-                except Exception:
-                    drop_id = None
-            elif "dropChance:" in stripped:
-                try:
-                    drop_chance = float(stripped.split("dropChance:")[1].strip())
-                except Exception:
-                    drop_chance = None
-            elif "dropAmount:" in stripped:
-                match = re.search(r"x:\s*(\d+),\s*y:\s*(\d+)", stripped)
-                if match and drop_id is not None and drop_chance is not None:
-                    current_table.append({
-                        "id":          drop_id,
-                        "drop_chance": drop_chance,
-                        "drop_amount": int(match.group(1)),
-                    })
-                    drop_id = None
-                    drop_chance = None
-
-    if current_table:
-        drop_tables.append(current_table)
-
-    return {f"drop_table_{i + 1}": table for i, table in enumerate(drop_tables)}
+        entity[key] = value
+
+    # Skip entries with no health and no furniture placement data
+    if "health" not in entity and not any(
+        k in entity for k in ["placeable_on_tables", "placeable_on_walls", "placeable_as_rug", "placeable_in_water"]
+    ):
+        return None
+
+    entity.update(found.get("drop_tables", {}))
+    return entity
 
 
 # ---------------------------------------------------------------------------
@@ -91,7 +110,8 @@ def run() -> None:
     entity_data: dict = {}
 
     # --- Prefab entities (NPCs, enemies, furniture) ---
-    file_list = [f for f in os.listdir(_GAMEDATA_DIR) if f.endswith(".prefab")]
+    index     = load_index()
+    file_list = index.files("GameObject", ".prefab")
     total = len(file_list)
     step  = max(1, total // 5)
 
@@ -100,72 +120,13 @@ def run() -> None:
             print(f"  🔄 {int((i / total) * 100)}% complete...")
 
         prefab_path = os.path.join(_GAMEDATA_DIR, filename)
-        meta_path   = prefab_path + ".meta"
         prefab_name = os.path.splitext(filename)[0]
 
         try:
-            lines   = file_utils.read_file_lines(prefab_path)
-            content = "\n".join(lines)
-
-            guid = "UNKNOWN"
-            if os.path.exists(meta_path):
-                for line in file_utils.read_file_lines(meta_path):
-                    if "guid:" in line:
-                        guid = line.split("guid:")[1].strip()
-                        break
-
-            entity: dict = {"prefab": prefab_name}
-
-            enemy_name = re.search(r'(?<!key)enemyName:\s*"?([^\r\n":]+(?: [^\r\n":]+)*)"?', content)
-            if enemy_name:
-                name = enemy_name.group(1).strip()
-                if name != "keyEnemyName":
-                    entity["enemy_name"] = name
-
-            entity["guid"] = guid
-
-            for key, field, cast in [
-                ("health",       "_health",              float),
-                ("exp",          "_experience",          float),
-                ("level",        "_powerLevel",          int),
-                ("defense",      "defense",              int),
-                ("has_attack",   "_hasAttack",           int),
-                ("damage_range", "_damageRange",         str),
-                ("damage_type",  "_damageType",          str),
-                ("hit_type",     "_hitType",             str),
-                ("hit_cooldown", "_hitCooldown",         float),
-                ("knock_back",   "_knockBack",           float),
-                ("npc_name",     "_npcName",             str),
-                ("romanceable",  "_romanceable",         int),
-                ("shop_keeper",  "_shopKeeper",          int),
-                ("quests",       "_quests",              str),
-            ]:
-                match = re.search(rf"{field}:\s*(.+)", content)
-                if match:
-                    value = match.group(1).strip().strip('"')
-                    if cast == int:
-                        try:
-                            value = int(value)
-                        except ValueError:
-                            continue
-                    elif cast == float:
-                        try:
-                            value = float(value)
-                        except ValueError:
-                            continue
-                    entity[key] = value
-
-            # Skip entries with no health and no furniture placement data
-            if "health" not in entity and not any(
-                k in entity for k in ["placeable_on_tables", "placeable_on_walls", "placeable_as_rug", "placeable_in_water"]
-            ):
-                continue
-
-            drop_tables = _extract_drop_tables(lines)
-            entity.update(drop_tables)
-
-            entity_data[prefab_name] = entity
-
+            guid   = index.guid(prefab_path) or "UNKNOWN"
+            entity = _parse_prefab_entity(prefab_fields.read_prefab(prefab_path), prefab_name, guid)
+            if entity is not None:
+                entity_data[prefab_name] = entity
         except Exception as exc:
             print(f"  ⚠️  Error processing {filename}: {exc}")
 
@@ -1,15 +1,26 @@
 """
 Fish spawner builder — Layer 1 of the pipeline.
 
-Parses raw Scenes (.unity) files to extract fish spawner data per scene,
-writing fish_spawner_data.json.
+Parses raw Scenes (.unity) files to extract every fish spawner per scene,
+writing fish_spawner_data.json. Scene files are streamed document by document
+(builders/scene_parser.py), so memory stays bounded however large a scene is.
+
+Each scene entry holds:
+  - spawners:  one entry per fish spawner component — file_id, game_object
+               (name), position (local {x, y, z}), fish_drops,
+               has_seasonal_fish, seasonal_fish. Each spawner is its own
+               spawn pool; the fish spawn engine reads these.
+  - fish_drops / has_seasonal_fish / seasonal_fish of the first spawner
+    (the scene-level fields from before spawners were listed)
 
 Usage:
     python builders/fish_spawner_builder.py
+    python builders/fish_spawner_builder.py --workers 4
 """
 
 from __future__ import annotations
 
+import multiprocessing
 import os
 import re
 import sys
@@ -17,6 +28,7 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
+from builders import scene_parser
 from utils import file_utils, json_utils
 
 # ---------------------------------------------------------------------------
@@ -62,47 +74,80 @@ def _parse_fish_block(block: str) -> tuple[list[dict], dict]:
     return named_fish_drops, seasonal
 
 
-def _process_unity_file(filepath: str) -> dict | None:
-    try:
-        content = "\n".join(file_utils.read_file_lines(filepath))
-        match = re.search(r"_fish:(.*?)--- !u!", content, re.DOTALL)
-        if not match:
-            return None
+def _spawner_entry(component: scene_parser.SceneComponent, game_objects: dict) -> dict:
+    named_fish, seasonal = _parse_fish_block(component.text)
+    obj = game_objects.get(component.game_object_id)
+    position = obj.position if obj else None
+    return {
+        "file_id":           component.file_id,
+        "game_object":       obj.name if obj else None,
+        "position":          dict(zip("xyz", position)) if position else None,
+        "fish_drops":        named_fish,
+        "has_seasonal_fish": bool(re.search(r"hasSeasonalFish: 1", component.text)),
+        "seasonal_fish":     seasonal,
+    }
+
 
-        named_fish, seasonal = _parse_fish_block(match.group(1))
-        has_seasonal = bool(re.search(r"hasSeasonalFish: 1", match.group(1)))
+def _process_unity_file(filepath: str) -> tuple[dict | None, str | None]:
+    """Return (scene entry or None, error message or None) for one scene file."""
+    try:
+        # Streams the scene document by document; only spawner documents are decoded
+        components = list(scene_parser.find_components(filepath, "_fish"))
+        if not components:
+            return None, None
+
+        game_objects = scene_parser.resolve_game_objects(
+            filepath, [c.game_object_id for c in components if c.game_object_id is not None]
+        )
+        spawners = [_spawner_entry(c, game_objects) for c in components]
+        first = spawners[0]
         scene_name = os.path.splitext(os.path.basename(filepath))[0]
         return {
             "scene_name":        scene_name,
-            "fish_drops":        named_fish,
-            "has_seasonal_fish": has_seasonal,
-            "seasonal_fish":     seasonal,
-        }
+            "fish_drops":        first["fish_drops"],
+            "has_seasonal_fish": first["has_seasonal_fish"],
+            "seasonal_fish":     first["seasonal_fish"],
+            "spawners":          spawners,
+        }, None
     except Exception as exc:
-        file_utils.write_debug_log(f"Error processing {filepath}: {exc}", _DEBUG_LOG)
-        return None
+        return None, f"Error processing {filepath}: {exc}"
 
 
 # ---------------------------------------------------------------------------
 # Runner
 # ---------------------------------------------------------------------------
 
-def run() -> None:
+def run(workers: int = 1) -> None:
     file_utils.ensure_dir_exists(os.path.dirname(_CACHE_FILE))
     file_utils.ensure_dir_exists(os.path.dirname(_DEBUG_LOG))
 
     results: dict = {}
-    unity_files = [f for f in os.listdir(_SCENES_DIR) if f.endswith(".unity")]
+    unity_files = [
+        os.path.join(_SCENES_DIR, f) for f in os.listdir(_SCENES_DIR) if f.endswith(".unity")
+    ]
+
+    if workers > 1 and len(unity_files) > 1:
+        # Scenes are independent; imap keeps file order so the output matches a serial run
+        with multiprocessing.Pool(processes=min(workers, len(unity_files))) as pool:
+            processed = list(pool.imap(_process_unity_file, unity_files))
+    else:
+        processed = [_process_unity_file(path) for path in unity_files]
 
-    for filename in unity_files:
-        filepath = os.path.join(_SCENES_DIR, filename)
-        result = _process_unity_file(filepath)
+    for result, error in processed:
+        if error:
+            file_utils.write_debug_log(error, _DEBUG_LOG)
         if result:
             results[result["scene_name"]] = result
 
+    spawner_count = sum(len(r["spawners"]) for r in results.values())
     json_utils.write_json(results, _CACHE_FILE, indent=2)
-    print(f"✅ {len(results)} scenes written to {_CACHE_FILE}")
+    print(f"✅ {len(results)} scenes ({spawner_count} fish spawners) written to {_CACHE_FILE}")
 
 
 if __name__ == "__main__":
-    run()
+    # Add --workers N to parse scene files across N processes (output is identical).
+    import argparse
+    parser = argparse.ArgumentParser(description="Rebuild fish_spawner_data.json from the Scenes folder.")
+    parser.add_argument("--workers", type=int, default=1, help="Parse scenes in N processes (default: 1).")
+    args = parser.parse_args()
+    run(workers=args.workers)
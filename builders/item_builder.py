@@ -5,27 +5,36 @@ Responsibilities:
   - Parse raw MonoBehaviour (.asset) and GameObject (.prefab) files
   - Produce ItemData objects (fully typed, classified)
   - Write a JSON cache for warm reloads and manual reference
-  - Load from JSON cache when source files have not changed
+  - Keep a per-file content-hash manifest so a rebuild only re-parses the
+    items whose .asset, .meta, .prefab or English.prefab term changed
 
 Public API:
-  build_all_items()  →  dict[str, ItemData]   (keyed by lowercase display name)
+  build_all_items()  →  dict[str, ItemData]   (keyed by lowercase display name;
+                                                pass workers=N to parse in a process pool)
   load_item(name)    →  ItemData | None
 """
 
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import json
 import logging
+import logging.handlers
+import multiprocessing
 import os
 import re
 import sys
+import threading
+from collections.abc import Mapping
 from math import floor
 from typing import Optional
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
+from builders import item_store, localization
+from builders.asset_index import load_index
 from builders.item_data import (
     CropStage,
     ExpsEntry,
@@ -35,9 +44,10 @@ from builders.item_data import (
     StatBuffEntry,
     StatEntry,
 )
-from config import skip_items
+from mappings import item_classification
 from mappings.item_classification import classify_item as _classify_raw
 from utils import file_utils, json_utils
+from utils.skip_matcher import skip_matcher
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -48,6 +58,7 @@ _GAMEDATA_DIR = os.path.join(constants.INPUT_DIRECTORY, "GameObject")
 _DISPLAY_NAMES_FILE = os.path.join(constants.INPUT_DIRECTORY, "English.prefab")
 
 _CACHE_FILE = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "items_data.json")
+_MANIFEST_FILE = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "items_manifest.json")
 _DEBUG_LOG = os.path.join(constants.DEBUG_DIRECTORY, "json", "item_builder_debug.txt")
 
 # ---------------------------------------------------------------------------
@@ -59,6 +70,9 @@ def _setup_logger() -> logging.Logger:
     if logger.handlers:
         return logger
     logger.setLevel(logging.DEBUG)
+    if multiprocessing.current_process().name != "MainProcess":
+        # Pool workers must not truncate the parent's log; see _init_worker().
+        return logger
     file_utils.ensure_dir_exists(os.path.dirname(_DEBUG_LOG))
     handler = logging.FileHandler(_DEBUG_LOG, mode="w", encoding="utf-8")
     handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
@@ -71,42 +85,131 @@ _log = _setup_logger()
 # Cache helpers
 # ---------------------------------------------------------------------------
 
-def _is_cache_valid() -> bool:
-    """Return True if the JSON cache is newer than the source MonoBehaviour directory."""
-    if not os.path.exists(_CACHE_FILE):
-        return False
-    if not os.path.isdir(_MONOBEHAVIOUR_DIR):
-        return False
-    cache_mtime = os.path.getmtime(_CACHE_FILE)
-    source_mtime = max(
-        os.path.getmtime(os.path.join(_MONOBEHAVIOUR_DIR, f))
-        for f in os.listdir(_MONOBEHAVIOUR_DIR)
-        if f.endswith(".asset")
-    )
-    return cache_mtime >= source_mtime
+# Serializes the JSON fallback in _load_cache() when stages share a process
+_cache_lock = threading.Lock()
 
 
 def _save_cache(items: dict[str, ItemData]) -> None:
-    """Serialize all ItemData objects to JSON and write the cache file."""
+    """Write the JSON cache (reference copy) and the binary snapshot used for loading."""
     file_utils.ensure_dir_exists(os.path.dirname(_CACHE_FILE))
     serializable = {name: dataclasses.asdict(item) for name, item in items.items()}
     json_utils.write_json(serializable, _CACHE_FILE, indent=4)
+    item_store.save_snapshot(items, _CACHE_FILE)
     _log.info("Cache written: %d items → %s", len(items), _CACHE_FILE)
 
 
-def _load_cache() -> dict[str, ItemData]:
-    """Deserialize the JSON cache back into ItemData objects."""
-    raw = json_utils.load_json(_CACHE_FILE)
-    if not raw:
+def _load_cache() -> Mapping[str, ItemData]:
+    """
+    Return the cached items as a read-only mapping keyed by lowercase display name.
+
+    Served from the memory-mapped snapshot (items decode on first access and
+    the store is shared per process). If the snapshot is missing or older
+    than items_data.json, the JSON is decoded once and the snapshot rewritten.
+    """
+    store = item_store.open_store(_CACHE_FILE)
+    if store is not None:
+        return store
+
+    with _cache_lock:
+        store = item_store.open_store(_CACHE_FILE)
+        if store is not None:
+            return store
+        raw = json_utils.load_json(_CACHE_FILE)
+        if not raw:
+            return {}
+        result = {}
+        for name, d in raw.items():
+            try:
+                result[name] = _item_data_from_dict(d)
+            except Exception as exc:
+                _log.warning("Failed to deserialize cached item '%s': %s", name, exc)
+        _log.info("Loaded %d items from JSON cache; writing snapshot.", len(result))
+        item_store.save_snapshot(result, _CACHE_FILE)
+        return item_store.open_store(_CACHE_FILE) or result
+
+# ---------------------------------------------------------------------------
+# Incremental manifest
+# ---------------------------------------------------------------------------
+#
+# items_manifest.json records, per item asset, the content hashes of its
+# sources and the ItemData parsed from them (before collision handling):
+#
+#   {"version": 1, "code": <hash of this parser>, "english": <hash>,
+#    "classifier": <hash>, "entries": {filename: {"sources": {...},
+#    "key_display_name": str, "item": {...} | null}}}
+#
+# Hashing content rather than comparing mtimes means a patch dump copied
+# with preserved timestamps can never be mistaken for the previous one.
+
+_MANIFEST_VERSION = 1
+
+_META_GUID_RE = re.compile(rb"guid:\s*([a-fA-F0-9]+)")
+
+
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def _hash_file(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return _hash_bytes(f.read())
+    except OSError:
+        return None
+
+
+def _code_fingerprint() -> str:
+    """Hash of the parser sources — any edit to them invalidates every entry."""
+    import builders.item_data as item_data_module
+    return _hash_bytes(b"".join(
+        (_hash_file(path) or "").encode("ascii")
+        for path in (os.path.abspath(__file__), item_data_module.__file__)
+    ))
+
+
+def _source_hashes(filename: str, asset_name: str, prefab_lookup: dict[str, str]) -> tuple[dict, Optional[str]]:
+    """
+    Hash an item's .asset, .meta and matching .prefab.
+    Returns (sources, guid) — the GUID is read from the .meta bytes already in hand.
+    """
+    asset_path = os.path.join(_MONOBEHAVIOUR_DIR, filename)
+    guid = None
+    try:
+        with open(asset_path + ".meta", "rb") as f:
+            meta = f.read()
+        meta_hash = _hash_bytes(meta)
+        if match := _META_GUID_RE.search(meta):
+            guid = match.group(1).decode("ascii")
+    except OSError:
+        meta_hash = None
+
+    prefab_path = prefab_lookup.get(asset_name)
+    sources = {
+        "asset":  _hash_file(asset_path),
+        "meta":   meta_hash,
+        "prefab": [os.path.basename(prefab_path), _hash_file(prefab_path)] if prefab_path else None,
+    }
+    return sources, guid
+
+
+def _load_manifest(code_hash: str) -> dict:
+    try:
+        with open(_MANIFEST_FILE, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if manifest.get("version") != _MANIFEST_VERSION or manifest.get("code") != code_hash:
+        _log.info("Manifest is missing or from another parser version — full rebuild.")
         return {}
-    result = {}
-    for name, d in raw.items():
-        try:
-            result[name] = _item_data_from_dict(d)
-        except Exception as exc:
-            _log.warning("Failed to deserialize cached item '%s': %s", name, exc)
-    _log.info("Loaded %d items from cache.", len(result))
-    return result
+    return manifest
+
+
+def _save_manifest(manifest: dict) -> None:
+    file_utils.ensure_dir_exists(os.path.dirname(_MANIFEST_FILE))
+    tmp_path = _MANIFEST_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, _MANIFEST_FILE)
 
 # ---------------------------------------------------------------------------
 # Deserialization (JSON dict → ItemData)
@@ -201,29 +304,6 @@ def _parse_number(val: str) -> int | float:
     return float(val) if "." in val else int(val)
 
 
-def _extract_guid(meta_file: str) -> Optional[str]:
-    try:
-        content = "\n".join(file_utils.read_file_lines(meta_file))
-    except Exception as exc:
-        _log.warning("Error reading %s: %s", meta_file, exc)
-        return None
-    match = re.search(r"guid:\s*([a-f0-9]+)", content)
-    return match.group(1) if match else None
-
-
-def _extract_icon_guid(asset_file: str) -> Optional[str]:
-    try:
-        lines = file_utils.read_file_lines(asset_file)
-    except Exception as exc:
-        _log.warning("Error reading %s: %s", asset_file, exc)
-        return None
-    for line in lines:
-        match = re.match(r"icon:\s*\{fileID:\s*\d+,\s*guid:\s*([\da-f]+),", line.strip())
-        if match:
-            return match.group(1)
-    return None
-
-
 def _extract_item_info(asset_file: str) -> tuple[Optional[int], Optional[str]]:
     basename = os.path.basename(asset_file)
     match = re.match(r"(\d+)\s+-\s+(.+)\.asset", basename)
@@ -232,108 +312,96 @@ def _extract_item_info(asset_file: str) -> tuple[Optional[int], Optional[str]]:
     return None, None
 
 
-def _extract_key_display_name(asset_file: str) -> Optional[str]:
-    try:
-        for line in file_utils.read_file_lines(asset_file):
-            if "keyDisplayName:" in line:
-                return line.split("keyDisplayName:")[1].strip()
-    except Exception as exc:
-        _log.warning("Failed to extract keyDisplayName from %s: %s", asset_file, exc)
-    return None
-
-
 def _should_exclude_item(item_name: str) -> bool:
-    name = item_name.lower()
-    if name in (p.lower() for p in skip_items.SKIP_ITEMS):
-        return True
-    for pattern in skip_items.SKIP_PATTERNS:
-        cleaned = pattern.strip("*").lower()
-        if cleaned in name:
-            return True
-    return False
+    return skip_matcher().skips(item_name)
 
 
 def _get_display_names(prefab_file: str) -> dict[str, str]:
-    display_names: dict[str, str] = {}
     try:
-        lines = file_utils.read_file_lines(prefab_file)
-        current_term = None
-        capturing_language = False
-        for line in lines:
-            line = line.strip()
-            if line.startswith("- Term:"):
-                current_term = line.split(":", 1)[1].strip()
-                capturing_language = False
-            elif line.startswith("Languages:") and current_term:
-                capturing_language = True
-            elif capturing_language and line.startswith("- "):
-                display_names[current_term] = line[2:].strip()
-                capturing_language = False
-                current_term = None
+        return localization.load_table(prefab_file).as_dict()
     except Exception as exc:
         _log.warning("Error reading display names: %s", exc)
-    return display_names
-
-
-def _extract_stat_buff(lines: list[str]) -> list[StatBuffEntry]:
-    capturing = False
-    capturing_stats = False
-    duration: Optional[float] = None
-    entries: list[StatBuffEntry] = []
-
-    # Sub-fields of the statBuff block that are not stats/duration — skip them
-    _SKIP_KEYS = ("buffType:", "buffName:", "description:")
-
-    for line in lines:
-        line = line.strip()
-        if line.startswith("statBuff:"):
-            capturing = True
-            capturing_stats = False
-            duration = None
-            entries = []
-            continue
-        if not capturing:
-            continue
+        return {}
 
-        # duration can appear before or after the stats list
-        if match := re.match(r"duration:\s*([\d.]+)", line):
-            duration = _parse_number(match.group(1))
-            for i, e in enumerate(entries):
-                if e.duration == 0:
-                    entries[i] = StatBuffEntry(e.stat_type, e.value, int(duration))
-            continue
 
-        if line.startswith("stats:"):
-            capturing_stats = True
-            continue
+# Pre-compiled line patterns for the single-pass item record parser
+_NUMERIC_PATTERN = re.compile(
+    r"^(health|mana|requiredLevel|stackSize|sellPrice|orbsSellPrice|ticketSellPrice"
+    r"|rarity|hearts|decorationType|hasSetSeason|setSeason|armorSet|exp|experience|daysToRegrow):\s*([\d.]+)"
+)
+_BOOL_PATTERN = re.compile(
+    r"^(isDLCItem|isForageable|isGem|isAnimalProduct|isMeal|isFruit|isArtisanryItem|isPotion|canSell|regrowable):\s*(\d+)"
+)
+_ICON_RE          = re.compile(r"icon:\s*\{fileID:\s*\d+,\s*guid:\s*([\da-f]+),")
+_USE_DESC_RE      = re.compile(r"useDescription:\s*(.+)")
+_HELP_DESC_RE     = re.compile(r"helpDescription:\s*(.+)")
+_STAT_TYPE_RE     = re.compile(r"-\s*statType:\s*(\d+)")
+_VALUE_RE         = re.compile(r"value:\s*(-?[\d.]+)")
+_INCREASE_RE      = re.compile(r"increase:\s*([\d.]+)")
+_FOOD_STAT_RE     = re.compile(r"stat:\s*(\d+)")
+_PROFESSION_RE    = re.compile(r"-\s*profession:\s*(\d+)")
+_AMOUNT_RE        = re.compile(r"amount:\s*(\d+)")
+_DURATION_RE      = re.compile(r"duration:\s*([\d.]+)")
+_DROP_RANGE_RE    = re.compile(r"dropRange:\s*\{x:\s*([\d.]+)")
+_CROP_STAGES_RE   = re.compile(r"^\s*cropStages:\s*$")
+_DAYS_TO_GROW_RE  = re.compile(r"^\s*-\s*daysToGrow:\s*([\d.]+)")
+_SPRITE_GUID_RE   = re.compile(r"sprite:.*guid:\s*([\da-f]+)")
+_CROP_SUBFIELD_RE = re.compile(r"^(height|offset|animator):")
+_SEASONS_RE       = re.compile(r"^\s*seasons:\s*$")
+_SEASON_ENTRY_RE  = re.compile(r"^\s*-\s*(\d+)")
+_NON_BLANK_RE     = re.compile(r"^\s*\S")
+_TOP_LEVEL_RE     = re.compile(r"^\S")
+
+_BOOLEAN_FIELDS = {
+    "isDLCItem": "is_dlc",
+    "isForageable": "is_forageable",
+    "isGem": "is_gem",
+    "isAnimalProduct": "is_animal_product",
+    "isMeal": "is_meal",
+    "isFruit": "is_fruit",
+    "isArtisanryItem": "is_artisanry",
+    "isPotion": "is_potion",
+    "canSell": "can_sell",
+    "regrowable": "regrowable",
+}
+
+_NUMERIC_FIELDS = {
+    "health": "health",
+    "mana": "mana",
+    "requiredLevel": "required_level",
+    "stackSize": "stack_size",
+    "sellPrice": "sell_price",
+    "orbsSellPrice": "orbs_sell_price",
+    "ticketSellPrice": "ticket_sell_price",
+    "rarity": "rarity",
+    "hearts": "hearts",
+    "decorationType": "decoration_type",
+    "hasSetSeason": "has_set_season",
+    "setSeason": "set_season",
+    "armorSet": "armor_set",
+    "exp": "exp",
+    "experience": "exp",
+    "daysToRegrow": "days_to_regrow",
+}
+
+# Sub-fields of the statBuff block that are not stats/duration — skip them
+_STAT_BUFF_SKIP_KEYS = ("buffType:", "buffName:", "description:")
+
+
+def _parse_item_record(asset_file: str) -> dict:
+    """
+    Parse a raw item .asset file in a single read and a single pass.
 
-        # Skip known sub-fields that would otherwise trigger the stop condition
-        if line.startswith(_SKIP_KEYS):
-            continue
+    Returns a flat dict of every extracted field, including
+    ``key_display_name``, ``icon_guid`` and ``stat_buff`` (StatBuffEntry list).
 
-        if capturing_stats:
-            if match := re.match(r"-\s*statType:\s*(\d+)", line):
-                entries.append(StatBuffEntry(
-                    stat_type=int(match.group(1)),
-                    value=0.0,
-                    duration=int(duration) if duration is not None else 0,
-                ))
-            elif match := re.match(r"value:\s*(-?[\d.]+)", line):
-                if entries:
-                    last = entries[-1]
-                    entries[-1] = StatBuffEntry(last.stat_type, _parse_number(match.group(1)), last.duration)
-            elif re.match(r"^\S", line):
-                capturing_stats = False
-                capturing = False
-        elif re.match(r"^\S", line):
-            capturing = False
-
-    return entries
-
-
-def _extract_attributes(asset_file: str) -> dict:
-    """Parse a raw .asset file and return a flat dict of all extracted fields."""
+    The statBuff block is scanned by its own state machine alongside the
+    attribute scan, so its nested ``stats:`` list is also seen by the main
+    stats scanner — build_all_items() filters those duplicates back out.
+    """
     attrs: dict = {
+        "key_display_name": None,
+        "icon_guid": None,
         "id": None,
         "description": None,
         "use_description": None,
@@ -371,53 +439,15 @@ def _extract_attributes(asset_file: str) -> dict:
         "exps": [],
         "crop_stages": [],
         "seasons": None,
-        "icon_guid": None,
-    }
-
-    boolean_fields = {
-        "isDLCItem": "is_dlc",
-        "isForageable": "is_forageable",
-        "isGem": "is_gem",
-        "isAnimalProduct": "is_animal_product",
-        "isMeal": "is_meal",
-        "isFruit": "is_fruit",
-        "isArtisanryItem": "is_artisanry",
-        "isPotion": "is_potion",
-        "canSell": "can_sell",
     }
 
-    numeric_fields = {
-        "health": "health",
-        "mana": "mana",
-        "requiredLevel": "required_level",
-        "stackSize": "stack_size",
-        "sellPrice": "sell_price",
-        "orbsSellPrice": "orbs_sell_price",
-        "ticketSellPrice": "ticket_sell_price",
-        "rarity": "rarity",
-        "hearts": "hearts",
-        "decorationType": "decoration_type",
-        "hasSetSeason": "has_set_season",
-        "setSeason": "set_season",
-        "armorSet": "armor_set",
-        "exp": "exp",
-        "experience": "exp",
-        "daysToRegrow": "days_to_regrow",
-    }
-
-    boolean_fields["regrowable"] = "regrowable"
-
-    # Pre-compile combined patterns for performance
-    _NUMERIC_PATTERN = re.compile(
-        r"^(health|mana|requiredLevel|stackSize|sellPrice|orbsSellPrice|ticketSellPrice"
-        r"|rarity|hearts|decorationType|hasSetSeason|setSeason|armorSet|exp|experience|daysToRegrow):\s*([\d.]+)"
-    )
-    _BOOL_PATTERN = re.compile(
-        r"^(isDLCItem|isForageable|isGem|isAnimalProduct|isMeal|isFruit|isArtisanryItem|isPotion|canSell|regrowable):\s*(\d+)"
-    )
-
     try:
         lines = file_utils.read_file_lines(asset_file)
+    except Exception as exc:
+        _log.error("Error reading %s: %s", asset_file, exc)
+        return attrs
+
+    try:
         capturing_description = False
         capturing_stats = False
         capturing_max_stats = False
@@ -429,27 +459,70 @@ def _extract_attributes(asset_file: str) -> dict:
         seasons_list: list[str] = []
         crop_stages: list[dict] = []
 
-        for line in lines:
-            line = line.strip()
+        buff_capturing = False
+        buff_capturing_stats = False
+        buff_duration: Optional[float] = None
+        stat_buff: list[StatBuffEntry] = []
+
+        for raw_line in lines:
+            if attrs["key_display_name"] is None and "keyDisplayName:" in raw_line:
+                attrs["key_display_name"] = raw_line.split("keyDisplayName:")[1].strip()
+
+            line = raw_line.strip()
+
+            if attrs["icon_guid"] is None and (match := _ICON_RE.match(line)):
+                attrs["icon_guid"] = match.group(1)
+
+            # statBuff — scanned alongside everything below, never consumes the line
+            if line.startswith("statBuff:"):
+                buff_capturing = True
+                buff_capturing_stats = False
+                buff_duration = None
+                stat_buff = []
+            elif buff_capturing:
+                # duration can appear before or after the stats list
+                if match := _DURATION_RE.match(line):
+                    buff_duration = _parse_number(match.group(1))
+                    for i, e in enumerate(stat_buff):
+                        if e.duration == 0:
+                            stat_buff[i] = StatBuffEntry(e.stat_type, e.value, int(buff_duration))
+                elif line.startswith("stats:"):
+                    buff_capturing_stats = True
+                elif line.startswith(_STAT_BUFF_SKIP_KEYS):
+                    pass
+                elif buff_capturing_stats:
+                    if match := _STAT_TYPE_RE.match(line):
+                        stat_buff.append(StatBuffEntry(
+                            stat_type=int(match.group(1)),
+                            value=0.0,
+                            duration=int(buff_duration) if buff_duration is not None else 0,
+                        ))
+                    elif match := _VALUE_RE.match(line):
+                        if stat_buff:
+                            last = stat_buff[-1]
+                            stat_buff[-1] = StatBuffEntry(last.stat_type, _parse_number(match.group(1)), last.duration)
+                    elif _TOP_LEVEL_RE.match(line):
+                        buff_capturing_stats = False
+                        buff_capturing = False
+                elif _TOP_LEVEL_RE.match(line):
+                    buff_capturing = False
 
             # Numeric fields — single combined regex
             if match := _NUMERIC_PATTERN.match(line):
                 raw_key, value = match.group(1), match.group(2)
-                snake_key = numeric_fields[raw_key]
-                attrs[snake_key] = _parse_number(value)
+                attrs[_NUMERIC_FIELDS[raw_key]] = _parse_number(value)
                 continue
 
             # Boolean fields + canSell — single combined regex
             if match := _BOOL_PATTERN.match(line):
                 raw_key, value = match.group(1), match.group(2)
-                snake_key = boolean_fields.get(raw_key, "can_sell")
-                attrs[snake_key] = int(value) == 1
+                attrs[_BOOLEAN_FIELDS[raw_key]] = int(value) == 1
                 continue
 
             # useDescription / helpDescription
-            if match := re.match(r"useDescription:\s*(.+)", line):
+            if match := _USE_DESC_RE.match(line):
                 attrs["use_description"] = match.group(1).strip()
-            if match := re.match(r"helpDescription:\s*(.+)", line):
+            if match := _HELP_DESC_RE.match(line):
                 attrs["help_description"] = match.group(1).strip()
 
             # description (may be multi-line)
@@ -472,12 +545,12 @@ def _extract_attributes(asset_file: str) -> dict:
                 capturing_stats = True
                 continue
             if capturing_stats:
-                if match := re.match(r"-\s*statType:\s*(\d+)", line):
+                if match := _STAT_TYPE_RE.match(line):
                     attrs["stats"].append({"stat_type": int(match.group(1)), "value": None})
-                elif match := re.match(r"value:\s*(-?[\d.]+)", line):
+                elif match := _VALUE_RE.match(line):
                     if attrs["stats"]:
                         attrs["stats"][-1]["value"] = _parse_number(match.group(1))
-                elif re.match(r"^\S", line):
+                elif _TOP_LEVEL_RE.match(line):
                     capturing_stats = False
 
             # maxStats
@@ -485,12 +558,12 @@ def _extract_attributes(asset_file: str) -> dict:
                 capturing_max_stats = True
                 continue
             if capturing_max_stats:
-                if match := re.match(r"-\s*statType:\s*(\d+)", line):
+                if match := _STAT_TYPE_RE.match(line):
                     attrs["max_stats"].append({"stat_type": int(match.group(1)), "value": None})
-                elif match := re.match(r"value:\s*(-?[\d.]+)", line):
+                elif match := _VALUE_RE.match(line):
                     if attrs["max_stats"]:
                         attrs["max_stats"][-1]["value"] = _parse_number(match.group(1))
-                elif re.match(r"^\S", line):
+                elif _TOP_LEVEL_RE.match(line):
                     capturing_max_stats = False
 
             # foodStat
@@ -498,12 +571,12 @@ def _extract_attributes(asset_file: str) -> dict:
                 capturing_food_stat = True
                 continue
             if capturing_food_stat:
-                if match := re.match(r"increase:\s*([\d.]+)", line):
+                if match := _INCREASE_RE.match(line):
                     attrs["food_stat"].append({"increase": _parse_number(match.group(1)), "stat": None})
-                elif match := re.match(r"stat:\s*(\d+)", line):
+                elif match := _FOOD_STAT_RE.match(line):
                     if attrs["food_stat"]:
                         attrs["food_stat"][-1]["stat"] = int(match.group(1))
-                elif re.match(r"^\S", line):
+                elif _TOP_LEVEL_RE.match(line):
                     capturing_food_stat = False
 
             # exps (EXP bonuses granted when the item is consumed)
@@ -511,43 +584,43 @@ def _extract_attributes(asset_file: str) -> dict:
                 capturing_exps = True
                 continue
             if capturing_exps:
-                if match := re.match(r"-\s*profession:\s*(\d+)", line):
+                if match := _PROFESSION_RE.match(line):
                     attrs["exps"].append({"profession": int(match.group(1)), "amount": 0})
-                elif match := re.match(r"amount:\s*(\d+)", line):
+                elif match := _AMOUNT_RE.match(line):
                     if attrs["exps"]:
                         attrs["exps"][-1]["amount"] = int(match.group(1))
-                elif re.match(r"^\S", line):
+                elif _TOP_LEVEL_RE.match(line):
                     capturing_exps = False
 
             # dropRange: {x: N, y: M} — crop yield comes from x value
-            if match := re.match(r"dropRange:\s*\{x:\s*([\d.]+)", line):
+            if match := _DROP_RANGE_RE.match(line):
                 attrs["crop_yield"] = int(floor(float(match.group(1))))
 
             # cropStages
-            if re.match(r"^\s*cropStages:\s*$", line):
+            if _CROP_STAGES_RE.match(line):
                 capturing_crop_stages = True
                 crop_stages = []
                 continue
             if capturing_crop_stages:
-                if match := re.match(r"^\s*-\s*daysToGrow:\s*([\d.]+)", line):
+                if match := _DAYS_TO_GROW_RE.match(line):
                     crop_stages.append({"days_to_grow": _parse_number(match.group(1)), "guid": None})
-                elif match := re.match(r"sprite:.*guid:\s*([\da-f]+)", line):
+                elif match := _SPRITE_GUID_RE.match(line):
                     if crop_stages:
                         crop_stages[-1]["guid"] = match.group(1)
-                elif re.match(r"^(height|offset|animator):", line):
+                elif _CROP_SUBFIELD_RE.match(line):
                     pass  # sub-fields within a crop stage entry — keep capturing
-                elif re.match(r"^\S", line):
+                elif _TOP_LEVEL_RE.match(line):
                     capturing_crop_stages = False
 
             # seasons
-            if re.match(r"^\s*seasons:\s*$", line):
+            if _SEASONS_RE.match(line):
                 capturing_seasons = True
                 seasons_list = []
                 continue
             if capturing_seasons:
-                if match := re.match(r"^\s*-\s*(\d+)", line):
+                if match := _SEASON_ENTRY_RE.match(line):
                     seasons_list.append(match.group(1))
-                elif re.match(r"^\s*\S", line):
+                elif _NON_BLANK_RE.match(line):
                     capturing_seasons = False
 
         if description_lines:
@@ -556,6 +629,7 @@ def _extract_attributes(asset_file: str) -> dict:
             attrs["seasons"] = "; ".join(seasons_list)
         if crop_stages:
             attrs["crop_stages"] = crop_stages
+        attrs["stat_buff"] = stat_buff
 
     except Exception as exc:
         _log.error("Error parsing %s: %s", asset_file, exc)
@@ -595,166 +669,311 @@ def _extract_prefab_attributes(prefab_file: str) -> dict:
 # ---------------------------------------------------------------------------
 
 def _classify(item_data: ItemData) -> ItemClassification:
-    """
-    Run the existing classify_item() logic against a temporary compatibility
-    dict built from ItemData fields. Returns an ItemClassification.
+    """Classify an ItemData with the rule engine in mappings/item_classification.py."""
+    item_type, subtype, category = _classify_raw(item_data)
+    return ItemClassification(item_type=item_type, subtype=subtype, category=category)
+
 
-    Note: classify_item() will be updated to accept ItemData directly in a
-    future refactor once all callers are migrated.
+# ---------------------------------------------------------------------------
+# Per-asset build (shared by the serial and process-pool paths)
+# ---------------------------------------------------------------------------
+
+def _build_item(
+    filename: str,
+    guid: Optional[str],
+    display_names: dict[str, str],
+    prefab_lookup: dict[str, str],
+) -> tuple[Optional[ItemData], Optional[str]]:
     """
-    compat = {
-        "Name": item_data.name,
-        "name": item_data.name,
-        "description": item_data.description,
-        "useDescription": item_data.use_description,
-        "stats": [{"statType": s.stat_type, "value": s.value} for s in item_data.stats],
-        "foodStat": [{"increase": f.increase, "stat": f.stat} for f in item_data.food_stat],
-        "isForageable": int(item_data.is_forageable),
-        "isPotion": int(item_data.is_potion),
-        "isMeal": int(item_data.is_meal),
-        "hasSetSeason": item_data.has_set_season,
-    }
-    item_type, subtype, category = _classify_raw(compat)
-    return ItemClassification(item_type=item_type, subtype=subtype, category=category)
+    Parse and classify a single MonoBehaviour asset.
+    Returns (item, key_display_name); item is None if the asset is not an item.
+    """
+    asset_path = os.path.join(_MONOBEHAVIOUR_DIR, filename)
+    item_id, asset_name = _extract_item_info(asset_path)
+    if not item_id or not asset_name:
+        return None, None
+    if _should_exclude_item(asset_name):
+        return None, None
+
+    attrs = _parse_item_record(asset_path)
+    display_name = display_names.get(attrs["key_display_name"], asset_name)
+
+    # Merge prefab attributes
+    prefab_path = prefab_lookup.get(asset_name)
+    if prefab_path:
+        attrs.update(_extract_prefab_attributes(prefab_path))
+    else:
+        _log.debug("No prefab match for %s", asset_name)
+
+    stat_buff_entries = attrs["stat_buff"]
+
+    # Filter stat_buff types out of raw stats to avoid duplication
+    stat_buff_types = {e.stat_type for e in stat_buff_entries}
+    filtered_stats = [
+        s for s in attrs.get("stats", []) if s["stat_type"] not in stat_buff_types
+    ]
+
+    item = ItemData(
+        asset_name=asset_name,
+        name=display_name,
+        guid=guid or "",
+        item_id=item_id,
+        icon_guid=attrs["icon_guid"],
+        description=attrs.get("description") or "",
+        use_description=attrs.get("use_description") or "",
+        help_description=attrs.get("help_description") or "",
+        stack_size=attrs.get("stack_size"),
+        can_sell=attrs.get("can_sell", False),
+        sell_price=attrs.get("sell_price") or 0,
+        orbs_sell_price=attrs.get("orbs_sell_price") or 0,
+        ticket_sell_price=attrs.get("ticket_sell_price") or 0,
+        rarity=attrs.get("rarity"),
+        hearts=attrs.get("hearts"),
+        health=attrs.get("health"),
+        mana=attrs.get("mana"),
+        exp=attrs.get("exp"),
+        required_level=attrs.get("required_level"),
+        armor_set=attrs.get("armor_set"),
+        decoration_type=attrs.get("decoration_type"),
+        is_dlc=attrs.get("is_dlc", False),
+        is_forageable=attrs.get("is_forageable", False),
+        is_gem=attrs.get("is_gem", False),
+        is_animal_product=attrs.get("is_animal_product", False),
+        is_meal=attrs.get("is_meal", False),
+        is_fruit=attrs.get("is_fruit", False),
+        is_artisanry=attrs.get("is_artisanry", False),
+        is_potion=attrs.get("is_potion", False),
+        crop_yield=attrs.get("crop_yield"),
+        days_to_regrow=attrs.get("days_to_regrow"),
+        regrowable=attrs.get("regrowable", False),
+        has_set_season=attrs.get("has_set_season"),
+        set_season=attrs.get("set_season"),
+        seasons=attrs.get("seasons"),
+        stats=[StatEntry(s["stat_type"], s["value"] or 0.0) for s in filtered_stats],
+        max_stats=[StatEntry(s["stat_type"], s["value"] or 0.0) for s in attrs.get("max_stats", [])],
+        food_stat=[FoodStatEntry(f["increase"], f["stat"] or 0) for f in attrs.get("food_stat", [])],
+        stat_buff=stat_buff_entries,
+        exps=[ExpsEntry(e["profession"], e["amount"]) for e in attrs.get("exps", [])],
+        crop_stages=[CropStage(c["days_to_grow"], c.get("guid")) for c in attrs.get("crop_stages", [])],
+        placeable_on_tables=attrs.get("placeable_on_tables", False),
+        placeable_on_walls=attrs.get("placeable_on_walls", False),
+        placeable_as_rug=attrs.get("placeable_as_rug", False),
+        placeable_in_water=attrs.get("placeable_in_water", False),
+        pickaxeable=attrs.get("pickaxeable", False),
+        axeable=attrs.get("axeable", False),
+        can_rotate=attrs.get("can_rotate", False),
+    )
+
+    item.classification = _classify(item)
+    return item, attrs["key_display_name"]
+
+
+def _merge_items(built: list[Optional[ItemData]]) -> dict[str, ItemData]:
+    """Key items by lowercase display name in asset order; on collision keep the first."""
+    all_items: dict[str, ItemData] = {}
+    for item in built:
+        if item is None:
+            continue
+        key = item.name.lower()
+        if key in all_items:
+            existing = all_items[key]
+            _log.warning(
+                "Display name collision: '%s' (asset: %s, id: %s) already exists as (asset: %s, id: %s) — keeping first.",
+                item.name, item.asset_name, item.item_id, existing.asset_name, existing.item_id,
+            )
+            print(f"  ⚠️  Collision: '{item.name}' ({item.asset_name}) duplicates ({existing.asset_name}) — keeping first.")
+        else:
+            all_items[key] = item
+    return all_items
+
+# ---------------------------------------------------------------------------
+# Process-pool workers
+# ---------------------------------------------------------------------------
+
+_worker_context: dict = {}
+
 
+def _init_worker(display_names: dict[str, str], prefab_lookup: dict[str, str]) -> None:
+    """
+    Pool initializer: receive the shared lookups once per worker and buffer
+    log records so the parent can write them to the debug log in asset order.
+    """
+    _worker_context["display_names"] = display_names
+    _worker_context["prefab_lookup"] = prefab_lookup
+    buffer = logging.handlers.BufferingHandler(capacity=sys.maxsize)
+    _log.handlers = [buffer]
+    _log.propagate = False
+    _worker_context["log_buffer"] = buffer
+
+
+def _build_item_in_worker(
+    task: tuple[str, Optional[str]],
+) -> tuple[tuple[Optional[ItemData], Optional[str]], list[logging.LogRecord]]:
+    filename, guid = task
+    result = _build_item(
+        filename, guid, _worker_context["display_names"], _worker_context["prefab_lookup"]
+    )
+    buffer = _worker_context["log_buffer"]
+    records = buffer.buffer
+    buffer.buffer = []
+    for record in records:
+        # Pre-format so the record pickles regardless of its args
+        record.msg, record.args = record.getMessage(), None
+    return result, records
+
+
+def _build_items_parallel(
+    tasks: list[tuple[str, Optional[str]]],
+    display_names: dict[str, str],
+    prefab_lookup: dict[str, str],
+    workers: int,
+) -> list[tuple[Optional[ItemData], Optional[str]]]:
+    total = len(tasks)
+    step = max(1, total // 5)
+    chunksize = max(1, total // (workers * 16))
+    built: list[tuple[Optional[ItemData], Optional[str]]] = []
+
+    with multiprocessing.Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(display_names, prefab_lookup),
+    ) as pool:
+        # imap preserves input order, so the merge sees assets exactly as the serial loop would
+        for idx, (result, records) in enumerate(pool.imap(_build_item_in_worker, tasks, chunksize)):
+            if idx % step == 0:
+                print(f"  🔄 {floor((idx / total) * 100)}% complete...")
+            for record in records:
+                _log.handle(record)
+            built.append(result)
+
+    return built
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def build_all_items(force_rebuild: bool = False) -> dict[str, ItemData]:
+def build_all_items(force_rebuild: bool = False, workers: int = 1) -> Mapping[str, ItemData]:
     """
     Return all items as a dict keyed by lowercase display name.
 
-    Loads from the JSON cache if it is up-to-date, otherwise re-parses
-    the raw game files and writes a fresh cache.
+    Source files are content-hashed against items_manifest.json: only items
+    whose .asset, .meta or .prefab changed are re-parsed, and unchanged items
+    are only renamed/re-classified when their English.prefab term or the
+    classification rules changed. If nothing changed the JSON cache is loaded.
 
     Args:
-        force_rebuild: Skip the cache check and always re-parse raw files.
+        force_rebuild: Ignore the manifest and re-parse every item.
+        workers:       Number of processes used to parse assets. Results are
+                       merged in sorted filename order, so the cache is
+                       byte-identical to a serial (workers=1) build.
     """
-    if not force_rebuild and _is_cache_valid():
-        _log.info("Cache is valid — loading from %s", _CACHE_FILE)
+    index = load_index()
+    prefab_files = index.files("GameObject", ".prefab")
+    prefab_lookup = {
+        os.path.splitext(f)[0]: os.path.join(_GAMEDATA_DIR, f) for f in prefab_files
+    }
+
+    candidates: list[tuple[str, str]] = []
+    for filename in index.files("MonoBehaviour", ".asset"):
+        item_id, asset_name = _extract_item_info(filename)
+        if item_id and asset_name and not _should_exclude_item(asset_name):
+            candidates.append((filename, asset_name))
+
+    code_hash = _code_fingerprint()
+    manifest = {} if force_rebuild else _load_manifest(code_hash)
+    previous: dict[str, dict] = manifest.get("entries", {})
+    english_hash = localization.source_hash(_DISPLAY_NAMES_FILE)
+    classifier_hash = _hash_file(item_classification.__file__)
+    english_changed = manifest.get("english") != english_hash
+    classifier_changed = manifest.get("classifier") != classifier_hash
+
+    sources: dict[str, tuple[dict, Optional[str]]] = {
+        filename: _source_hashes(filename, asset_name, prefab_lookup)
+        for filename, asset_name in candidates
+    }
+    stale = [
+        (filename, guid) for filename, (hashes, guid) in sources.items()
+        if filename not in previous or previous[filename]["sources"] != hashes
+    ]
+
+    if (
+        not stale
+        and not english_changed
+        and not classifier_changed
+        and previous.keys() == sources.keys()
+        and os.path.exists(_CACHE_FILE)
+    ):
+        _log.info("No source changes — loading from %s", _CACHE_FILE)
         cached = _load_cache()
         if cached:
             return cached
         _log.warning("Cache load returned empty — falling back to full build.")
+        previous, stale = {}, [(f, guid) for f, (_, guid) in sources.items()]
 
     _log.info("Building items from raw files in %s", _MONOBEHAVIOUR_DIR)
-    print("Building item data from raw files...")
-
-    prefab_files = [f for f in os.listdir(_GAMEDATA_DIR) if f.endswith(".prefab")]
-    prefab_lookup = {
-        os.path.splitext(f)[0]: os.path.join(_GAMEDATA_DIR, f) for f in prefab_files
-    }
-    display_names = _get_display_names(_DISPLAY_NAMES_FILE)
-
-    asset_files = [f for f in os.listdir(_MONOBEHAVIOUR_DIR) if f.endswith(".asset")]
-    total = len(asset_files)
-    step = max(1, total // 5)
-    all_items: dict[str, ItemData] = {}
-
-    for idx, filename in enumerate(asset_files):
-        if idx % step == 0:
-            print(f"  🔄 {floor((idx / total) * 100)}% complete...")
+    print(f"Building item data from raw files ({len(stale)} of {len(sources)} changed)...")
 
-        asset_path = os.path.join(_MONOBEHAVIOUR_DIR, filename)
-        item_id, asset_name = _extract_item_info(asset_path)
-        if not item_id or not asset_name:
-            continue
-        if _should_exclude_item(asset_name):
-            continue
-
-        key_display = _extract_key_display_name(asset_path)
-        display_name = display_names.get(key_display, asset_name)
-
-        attrs = _extract_attributes(asset_path)
+    display_names = (
+        _get_display_names(_DISPLAY_NAMES_FILE) if stale or english_changed else {}
+    )
 
-        # Merge prefab attributes
-        prefab_path = prefab_lookup.get(asset_name)
-        if prefab_path:
-            attrs.update(_extract_prefab_attributes(prefab_path))
+    if workers > 1 and stale:
+        parsed = _build_items_parallel(stale, display_names, prefab_lookup, workers)
+    else:
+        total = len(stale)
+        step = max(1, total // 5)
+        parsed = []
+        for idx, (filename, guid) in enumerate(stale):
+            if idx % step == 0:
+                print(f"  🔄 {floor((idx / total) * 100)}% complete...")
+            parsed.append(_build_item(filename, guid, display_names, prefab_lookup))
+    rebuilt = {filename: result for (filename, _), result in zip(stale, parsed)}
+
+    entries: dict[str, dict] = {}
+    built: list[Optional[ItemData]] = []
+    reclassified = 0
+    for filename, (hashes, _) in sources.items():
+        if filename in rebuilt:
+            item, key_display_name = rebuilt[filename]
         else:
-            _log.debug("No prefab match for %s", asset_name)
-
-        icon_guid = _extract_icon_guid(asset_path)
-        stat_buff_entries = _extract_stat_buff(file_utils.read_file_lines(asset_path))
-
-        # Filter stat_buff types out of raw stats to avoid duplication
-        stat_buff_types = {e.stat_type for e in stat_buff_entries}
-        filtered_stats = [
-            s for s in attrs.get("stats", []) if s["stat_type"] not in stat_buff_types
-        ]
-
-        item = ItemData(
-            asset_name=asset_name,
-            name=display_name,
-            guid=_extract_guid(asset_path + ".meta") or "",
-            item_id=item_id,
-            icon_guid=icon_guid,
-            description=attrs.get("description") or "",
-            use_description=attrs.get("use_description") or "",
-            help_description=attrs.get("help_description") or "",
-            stack_size=attrs.get("stack_size"),
-            can_sell=attrs.get("can_sell", False),
-            sell_price=attrs.get("sell_price") or 0,
-            orbs_sell_price=attrs.get("orbs_sell_price") or 0,
-            ticket_sell_price=attrs.get("ticket_sell_price") or 0,
-            rarity=attrs.get("rarity"),
-            hearts=attrs.get("hearts"),
-            health=attrs.get("health"),
-            mana=attrs.get("mana"),
-            exp=attrs.get("exp"),
-            required_level=attrs.get("required_level"),
-            armor_set=attrs.get("armor_set"),
-            decoration_type=attrs.get("decoration_type"),
-            is_dlc=attrs.get("is_dlc", False),
-            is_forageable=attrs.get("is_forageable", False),
-            is_gem=attrs.get("is_gem", False),
-            is_animal_product=attrs.get("is_animal_product", False),
-            is_meal=attrs.get("is_meal", False),
-            is_fruit=attrs.get("is_fruit", False),
-            is_artisanry=attrs.get("is_artisanry", False),
-            is_potion=attrs.get("is_potion", False),
-            crop_yield=attrs.get("crop_yield"),
-            days_to_regrow=attrs.get("days_to_regrow"),
-            regrowable=attrs.get("regrowable", False),
-            has_set_season=attrs.get("has_set_season"),
-            set_season=attrs.get("set_season"),
-            seasons=attrs.get("seasons"),
-            stats=[StatEntry(s["stat_type"], s["value"] or 0.0) for s in filtered_stats],
-            max_stats=[StatEntry(s["stat_type"], s["value"] or 0.0) for s in attrs.get("max_stats", [])],
-            food_stat=[FoodStatEntry(f["increase"], f["stat"] or 0) for f in attrs.get("food_stat", [])],
-            stat_buff=stat_buff_entries,
-            exps=[ExpsEntry(e["profession"], e["amount"]) for e in attrs.get("exps", [])],
-            crop_stages=[CropStage(c["days_to_grow"], c.get("guid")) for c in attrs.get("crop_stages", [])],
-            placeable_on_tables=attrs.get("placeable_on_tables", False),
-            placeable_on_walls=attrs.get("placeable_on_walls", False),
-            placeable_as_rug=attrs.get("placeable_as_rug", False),
-            placeable_in_water=attrs.get("placeable_in_water", False),
-            pickaxeable=attrs.get("pickaxeable", False),
-            axeable=attrs.get("axeable", False),
-            can_rotate=attrs.get("can_rotate", False),
-        )
-
-        item.classification = _classify(item)
-        key = display_name.lower()
-        if key in all_items:
-            existing = all_items[key]
-            _log.warning(
-                "Display name collision: '%s' (asset: %s, id: %s) already exists as (asset: %s, id: %s) — keeping first.",
-                display_name, asset_name, item_id, existing.asset_name, existing.item_id,
-            )
-            print(f"  ⚠️  Collision: '{display_name}' ({asset_name}) duplicates ({existing.asset_name}) — keeping first.")
-        else:
-            all_items[key] = item
+            entry = previous[filename]
+            key_display_name = entry["key_display_name"]
+            item = _item_data_from_dict(entry["item"]) if entry["item"] else None
+            if item is not None:
+                renamed = False
+                if english_changed:
+                    name = display_names.get(key_display_name, item.asset_name)
+                    renamed = name != item.name
+                    item.name = name
+                if renamed or classifier_changed:
+                    item.classification = _classify(item)
+                    reclassified += 1
+        entries[filename] = {
+            "sources":          hashes,
+            "key_display_name": key_display_name,
+            "item":             dataclasses.asdict(item) if item else None,
+        }
+        built.append(item)
+
+    if reclassified:
+        _log.info("Re-classified %d unchanged items.", reclassified)
+
+    all_items = _merge_items(built)
 
     _save_cache(all_items)
+    _save_manifest({
+        "version":    _MANIFEST_VERSION,
+        "code":       code_hash,
+        "english":    english_hash,
+        "classifier": classifier_hash,
+        "entries":    entries,
+    })
     print(f"✅ Built {len(all_items)} items.")
     _log.info("Build complete: %d items.", len(all_items))
     return all_items
 
 
-def load_item(name: str, items: Optional[dict[str, ItemData]] = None) -> Optional[ItemData]:
+def load_item(name: str, items: Optional[Mapping[str, ItemData]] = None) -> Optional[ItemData]:
     """
     Look up a single item by display name (case-insensitive).
 
@@ -766,13 +985,20 @@ def load_item(name: str, items: Optional[dict[str, ItemData]] = None) -> Optiona
     return items.get(name.strip().lower())
 
 
+def run() -> None:
+    build_all_items()
+    print(f"JSON cache written to: {_CACHE_FILE}")
+
+
 if __name__ == "__main__":
     # Run directly to rebuild the JSON cache from raw game files.
     # Example: python builders/item_builder.py
-    # Add --force to bypass the cache check and always re-parse.
+    # Only items whose source files changed are re-parsed; add --force to re-parse everything.
+    # Add --workers N to parse assets across N processes (output is identical).
     import argparse
     parser = argparse.ArgumentParser(description="Rebuild the items JSON cache.")
-    parser.add_argument("--force", action="store_true", help="Force rebuild even if cache is valid.")
+    parser.add_argument("--force", action="store_true", help="Re-parse every item, ignoring the manifest.")
+    parser.add_argument("--workers", type=int, default=1, help="Parse assets in N processes (default: 1).")
     args = parser.parse_args()
-    build_all_items(force_rebuild=args.force)
+    build_all_items(force_rebuild=args.force, workers=args.workers)
     print(f"JSON cache written to: {_CACHE_FILE}")
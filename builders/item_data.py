@@ -8,6 +8,9 @@ as a cache / human-readable reference file.
 Sub-dataclasses (StatEntry, FoodStatEntry, StatBuffEntry, CropStage,
 ItemClassification) represent nested structures extracted from the raw
 game files.
+
+All classes use __slots__: thousands of ItemData objects are kept in memory
+by the item store, and slots drop the per-instance __dict__.
 """
 
 from __future__ import annotations
@@ -20,21 +23,21 @@ from typing import Optional
 # Sub-dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class StatEntry:
     """A single equipment or armor stat (stats / max_stats arrays)."""
     stat_type: int
     value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class FoodStatEntry:
     """A food stat increase entry (food_stat array)."""
     increase: float
     stat: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StatBuffEntry:
     """A timed stat buff entry (stat_buff array)."""
     stat_type: int
@@ -42,21 +45,21 @@ class StatBuffEntry:
     duration: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpsEntry:
     """An EXP bonus entry from consuming a food item (exps array)."""
     profession: int
     amount: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CropStage:
     """A single crop growth stage (crop_stages array)."""
     days_to_grow: float
     guid: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemClassification:
     """
     The result of classifying an item.
@@ -72,7 +75,7 @@ class ItemClassification:
 # Primary data model
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ItemData:
     """
     Fully structured representation of a single Sun Haven item.
@@ -0,0 +1,295 @@
+"""
+Item store — compact binary snapshot of items_data.json.
+
+The item builder writes items_data.bin next to the JSON cache. Layout:
+
+  b"SHIS" | u32 header length | header | item records
+
+The header (marshal) holds the schema, the JSON file's size/mtime, the
+lowercase-name keys and the name / item_id / GUID columns plus an offset
+table. Each item record is one marshal'd tuple of ItemData fields.
+
+open_store() memory-maps the snapshot and decodes only the header; an
+ItemData is built the first time it is accessed and then reused. Name
+lookups by item_id and GUID come from the header columns, built once per
+store, so consumers never decode items just to map ids to names.
+
+marshal is used (not pickle/JSON) because it is the fastest stdlib codec
+for plain tuples; the snapshot is a local cache and is rewritten whenever
+the Python version or the ItemData schema changes.
+
+Public API:
+  save_snapshot(items, json_path)  →  None
+  open_store(json_path)            →  ItemStore | None   (None if missing or stale)
+  release(json_path)               →  None   (decode everything, unmap the file)
+  names_by_id(items)               →  {str(item_id): name}
+  names_by_guid(items)             →  {guid: name}
+  all_names_by_id(items)           →  {str(item_id): [names]}
+    (items is whatever item_builder._load_cache() returned: the store's
+    shared indexes, or one pass over a plain dict)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Iterator, Mapping
+from typing import Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from builders.item_data import (
+    CropStage,
+    ExpsEntry,
+    FoodStatEntry,
+    ItemClassification,
+    ItemData,
+    StatBuffEntry,
+    StatEntry,
+)
+
+# ---------------------------------------------------------------------------
+# Format
+# ---------------------------------------------------------------------------
+
+_MAGIC = b"SHIS"
+_PREFIX = struct.Struct("<4sI")
+_STORE_VERSION = 1
+
+_FIELDS = tuple(f.name for f in dataclasses.fields(ItemData))
+
+# List fields whose elements are sub-dataclasses, decoded positionally
+_NESTED_FIELDS = {
+    "stats":       StatEntry,
+    "max_stats":   StatEntry,
+    "food_stat":   FoodStatEntry,
+    "stat_buff":   StatBuffEntry,
+    "exps":        ExpsEntry,
+    "crop_stages": CropStage,
+}
+_NESTED_SLOTS = tuple((_FIELDS.index(name), cls) for name, cls in _NESTED_FIELDS.items())
+_CLASSIFICATION_SLOT = _FIELDS.index("classification")
+
+_SCHEMA = (_STORE_VERSION, marshal.version, sys.version_info[:2], _FIELDS)
+
+
+def _snapshot_path(json_path: str) -> str:
+    return os.path.splitext(json_path)[0] + ".bin"
+
+
+def _file_stat(path: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _decode_item(record: bytes) -> ItemData:
+    values = list(marshal.loads(record))
+    for slot, cls in _NESTED_SLOTS:
+        values[slot] = [cls(*entry) for entry in values[slot]]
+    classification = values[_CLASSIFICATION_SLOT]
+    values[_CLASSIFICATION_SLOT] = ItemClassification(*classification) if classification else None
+    return ItemData(*values)
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class ItemStore(Mapping):
+    """
+    Read-only mapping of lowercase display name → ItemData backed by a
+    memory-mapped snapshot. Items are decoded on first access.
+    """
+
+    def __init__(self, mm: mmap.mmap, header: dict, data_start: int):
+        self._mm = mm
+        self._data_start = data_start
+        self._keys: list[str] = header["keys"]
+        self._names: list[str] = header["names"]
+        self._item_ids: list[int] = header["item_ids"]
+        self._guids: list[str] = header["guids"]
+        self._offsets = array("Q")
+        self._offsets.frombytes(header["offsets"])
+        self._position = {key: i for i, key in enumerate(self._keys)}
+        self._decoded: list[Optional[ItemData]] = [None] * len(self._keys)
+        self._lock = threading.Lock()
+        self._names_by_id: Optional[dict[str, str]] = None
+        self._names_by_guid: Optional[dict[str, str]] = None
+        self._all_names_by_id: Optional[dict[str, list[str]]] = None
+
+    # --- Mapping protocol ---
+
+    def __getitem__(self, key: str) -> ItemData:
+        return self._item(self._position[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._position
+
+    # --- Secondary indexes (header columns only, built once) ---
+
+    def names_by_id(self) -> dict[str, str]:
+        """{str(item_id): display name}; the last item with an id wins. Shared — do not modify."""
+        if self._names_by_id is None:
+            self._names_by_id = {str(item_id): name for item_id, name in zip(self._item_ids, self._names)}
+        return self._names_by_id
+
+    def names_by_guid(self) -> dict[str, str]:
+        """{asset GUID: display name}; the last item with a GUID wins. Shared — do not modify."""
+        if self._names_by_guid is None:
+            self._names_by_guid = {guid: name for guid, name in zip(self._guids, self._names) if guid}
+        return self._names_by_guid
+
+    def all_names_by_id(self) -> dict[str, list[str]]:
+        """{str(item_id): [display names in cache order]}. Shared — do not modify."""
+        if self._all_names_by_id is None:
+            all_names: dict[str, list[str]] = {}
+            for item_id, name in zip(self._item_ids, self._names):
+                all_names.setdefault(str(item_id), []).append(name)
+            self._all_names_by_id = all_names
+        return self._all_names_by_id
+
+    # --- Decoding ---
+
+    def _item(self, i: int) -> ItemData:
+        item = self._decoded[i]
+        if item is None:
+            with self._lock:
+                item = self._decoded[i]
+                if item is None:
+                    item = self._decode(i)
+        return item
+
+    def _decode(self, i: int) -> ItemData:
+        start = self._data_start + self._offsets[i]
+        end = self._data_start + self._offsets[i + 1]
+        item = _decode_item(self._mm[start:end])
+        self._decoded[i] = item
+        return item
+
+    def _detach(self) -> None:
+        """Decode every remaining item and close the mapping."""
+        with self._lock:
+            if self._mm.closed:
+                return
+            for i, item in enumerate(self._decoded):
+                if item is None:
+                    self._decode(i)
+            self._mm.close()
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+_open_stores: dict[str, tuple[tuple, ItemStore]] = {}
+_open_lock = threading.Lock()
+
+
+def save_snapshot(items: Mapping[str, ItemData], json_path: str) -> None:
+    """Write the binary snapshot for an items dict that was just saved to json_path."""
+    records = [marshal.dumps(dataclasses.astuple(item)) for item in items.values()]
+    offsets = array("Q", [0])
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+
+    header = marshal.dumps({
+        "schema":    _SCHEMA,
+        "json_stat": _file_stat(json_path),
+        "keys":      list(items.keys()),
+        "names":     [item.name for item in items.values()],
+        "item_ids":  [item.item_id for item in items.values()],
+        "guids":     [item.guid for item in items.values()],
+        "offsets":   offsets.tobytes(),
+    })
+
+    path = _snapshot_path(json_path)
+    release(json_path)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREFIX.pack(_MAGIC, len(header)))
+        f.write(header)
+        for record in records:
+            f.write(record)
+    os.replace(tmp_path, path)
+
+
+def open_store(json_path: str) -> Optional[ItemStore]:
+    """
+    Return the store for json_path, or None if the snapshot is missing or
+    does not match the JSON file. Memoized per process while both files are unchanged.
+    """
+    path = _snapshot_path(json_path)
+    stamp = (_file_stat(path), _file_stat(json_path))
+    if stamp[0] is None or stamp[1] is None:
+        return None
+
+    with _open_lock:
+        cached = _open_stores.get(json_path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, header_len = _PREFIX.unpack_from(mm, 0)
+            header = marshal.loads(mm[_PREFIX.size:_PREFIX.size + header_len]) if magic == _MAGIC else None
+        except (struct.error, EOFError, ValueError, TypeError):
+            header = None
+        if not header or header.get("schema") != _SCHEMA or tuple(header.get("json_stat") or ()) != stamp[1]:
+            mm.close()
+            return None
+
+        if cached:
+            cached[1]._detach()
+        store = ItemStore(mm, header, _PREFIX.size + header_len)
+        _open_stores[json_path] = (stamp, store)
+        return store
+
+
+def release(json_path: str) -> None:
+    """
+    Drop the memoized store for json_path. Its items are decoded first so
+    callers still holding it keep working, then the file is unmapped — a
+    mapped file cannot be replaced on Windows.
+    """
+    with _open_lock:
+        cached = _open_stores.pop(json_path, None)
+        if cached:
+            cached[1]._detach()
+
+# ---------------------------------------------------------------------------
+# Name indexes for any item mapping
+# ---------------------------------------------------------------------------
+
+def names_by_id(items: Mapping[str, ItemData]) -> dict[str, str]:
+    if isinstance(items, ItemStore):
+        return items.names_by_id()
+    return {str(item.item_id): item.name for item in items.values()}
+
+
+def names_by_guid(items: Mapping[str, ItemData]) -> dict[str, str]:
+    if isinstance(items, ItemStore):
+        return items.names_by_guid()
+    return {item.guid: item.name for item in items.values() if item.guid}
+
+
+def all_names_by_id(items: Mapping[str, ItemData]) -> dict[str, list[str]]:
+    if isinstance(items, ItemStore):
+        return items.all_names_by_id()
+    all_names: dict[str, list[str]] = {}
+    for item in items.values():
+        all_names.setdefault(str(item.item_id), []).append(item.name)
+    return all_names
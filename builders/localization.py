@@ -0,0 +1,248 @@
+"""
+Localization table — Layer 1 of the pipeline (shared by builders and exporters).
+
+Parses English.prefab once into a compact term → English text table:
+  - terms are kept in file order (duplicates preserved, last one wins on lookup)
+  - text is the raw first ``Languages:`` entry (the next non-empty line),
+    stripped but not decoded; callers apply their own YAML unquoting /
+    dialogue cleaning. Terms without one are reported and left out
+  - a sorted term index answers prefix queries ("NPC.", "Wedding.")
+
+The table is persisted to localization.sqlite keyed by the SHA-1 of
+English.prefab, so a patch run parses the file at most once and every
+later consumer (in-process or not) only reads the cached rows.
+
+Public API:
+  load_table(prefab_path=None)  →  LocalizationTable
+  source_hash(prefab_path=None) →  str | None   (content hash of English.prefab)
+
+Usage:
+    python builders/localization.py
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+from typing import Iterator, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import config.constants as constants
+from utils import file_utils
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+_INPUT_PREFAB = os.path.join(constants.INPUT_DIRECTORY, "English.prefab")
+_CACHE_FILE   = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "localization.sqlite")
+
+_TABLE_VERSION = 2
+
+# ---------------------------------------------------------------------------
+# Regex constants
+# ---------------------------------------------------------------------------
+
+_TERM_RE             = re.compile(r"^\s*-\s*Term:\s*(.+?)\s*$")
+_LANGUAGES_HEADER_RE = re.compile(r"^\s*Languages:")
+_LANG_ITEM_RE        = re.compile(r"^\s*-\s*(.*)\s*$")
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+class LocalizationTable:
+    """Read-only term → text table with file-order iteration and prefix queries."""
+
+    def __init__(self, source_hash: str, terms: list[str], texts: list[str]):
+        self.source_hash = source_hash
+        self._terms = terms
+        self._texts = texts
+        self._lookup: Optional[dict[str, str]] = None
+        self._sorted: Optional[tuple[list[str], list[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self.as_dict()
+
+    def get(self, term: str, default: Optional[str] = None) -> Optional[str]:
+        return self.as_dict().get(term, default)
+
+    def as_dict(self) -> dict[str, str]:
+        """Return {term: text}; for duplicated terms the last occurrence wins."""
+        if self._lookup is None:
+            self._lookup = dict(zip(self._terms, self._texts))
+        return self._lookup
+
+    def pairs(self) -> Iterator[tuple[str, str]]:
+        """Yield (term, text) in English.prefab order, duplicates included."""
+        return zip(self._terms, self._texts)
+
+    def with_prefix(self, prefix: str) -> list[tuple[str, str]]:
+        """Return (term, text) pairs whose term starts with prefix (case-sensitive), in file order."""
+        if self._sorted is None:
+            order = sorted(range(len(self._terms)), key=self._terms.__getitem__)
+            self._sorted = ([self._terms[i] for i in order], order)
+        keys, order = self._sorted
+        lo = bisect.bisect_left(keys, prefix)
+        hi = lo
+        while hi < len(keys) and keys[hi].startswith(prefix):
+            hi += 1
+        return [(self._terms[i], self._texts[i]) for i in sorted(order[lo:hi])]
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _parse_prefab(prefab_path: str) -> tuple[list[str], list[str]]:
+    terms: list[str] = []
+    texts: list[str] = []
+    dropped: list[str] = []
+    current_term: Optional[str] = None
+    waiting_for_lang = False
+
+    with open(prefab_path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            # Substring checks first — the regexes only run on candidate lines
+            m_term = _TERM_RE.match(line) if "Term:" in line else None
+            if m_term:
+                if waiting_for_lang:
+                    dropped.append(current_term)
+                current_term = m_term.group(1).strip()
+                waiting_for_lang = False
+                continue
+            if current_term and "Languages:" in line and _LANGUAGES_HEADER_RE.match(line):
+                waiting_for_lang = True
+                continue
+            if current_term and waiting_for_lang and line.strip():
+                m_lang = _LANG_ITEM_RE.match(line)
+                if m_lang:
+                    terms.append(current_term)
+                    texts.append(m_lang.group(1).strip())
+                else:
+                    dropped.append(current_term)
+                waiting_for_lang = False
+
+    if waiting_for_lang:
+        dropped.append(current_term)
+    if dropped:
+        shown = ", ".join(dropped[:10]) + (", ..." if len(dropped) > 10 else "")
+        print(f"  ⚠️  {len(dropped)} terms in {os.path.basename(prefab_path)} have no Languages entry: {shown}")
+
+    return terms, texts
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+def _load_persisted(source_hash: str) -> Optional[tuple[list[str], list[str]]]:
+    if not os.path.exists(_CACHE_FILE):
+        return None
+    try:
+        with sqlite3.connect(_CACHE_FILE) as conn:
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+            if meta.get("version") != str(_TABLE_VERSION) or meta.get("source_hash") != source_hash:
+                return None
+            rows = conn.execute("SELECT term, text FROM terms ORDER BY pos").fetchall()
+    except sqlite3.Error:
+        return None
+    return [r[0] for r in rows], [r[1] for r in rows]
+
+
+def _save_persisted(source_hash: str, terms: list[str], texts: list[str]) -> None:
+    file_utils.ensure_dir_exists(os.path.dirname(_CACHE_FILE))
+    tmp_path = _CACHE_FILE + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("CREATE TABLE terms (pos INTEGER PRIMARY KEY, term TEXT NOT NULL, text TEXT NOT NULL)")
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [("version", str(_TABLE_VERSION)), ("source_hash", source_hash)],
+        )
+        conn.executemany("INSERT INTO terms VALUES (?, ?, ?)", zip(range(len(terms)), terms, texts))
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, _CACHE_FILE)
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+_hash_memo: dict[str, tuple[tuple[int, int], str]] = {}
+_table_memo: dict[str, LocalizationTable] = {}
+
+
+def source_hash(prefab_path: Optional[str] = None) -> Optional[str]:
+    """Content hash of English.prefab (memoized per process while size/mtime are unchanged)."""
+    path = prefab_path or _INPUT_PREFAB
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    stat_key = (st.st_size, st.st_mtime_ns)
+    memo = _hash_memo.get(path)
+    if memo and memo[0] == stat_key:
+        return memo[1]
+    digest = _hash_file(path)
+    _hash_memo[path] = (stat_key, digest)
+    return digest
+
+
+def load_table(prefab_path: Optional[str] = None) -> LocalizationTable:
+    """
+    Return the localization table for English.prefab, parsing the file only
+    when no persisted table matches its content hash.
+
+    Raises FileNotFoundError if the prefab does not exist.
+    """
+    path = prefab_path or _INPUT_PREFAB
+    digest = source_hash(path)
+    if digest is None:
+        raise FileNotFoundError(f"English.prefab not found at: {path}")
+
+    table = _table_memo.get(digest)
+    if table is not None:
+        return table
+
+    persisted = _load_persisted(digest)
+    if persisted is None:
+        terms, texts = _parse_prefab(path)
+        _save_persisted(digest, terms, texts)
+    else:
+        terms, texts = persisted
+
+    table = LocalizationTable(digest, terms, texts)
+    _table_memo[digest] = table
+    return table
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run() -> None:
+    print("Loading localization table...")
+    table = load_table()
+    print(f"✅ {len(table)} terms cached in {_CACHE_FILE}")
+
+
+if __name__ == "__main__":
+    run()
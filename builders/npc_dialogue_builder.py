@@ -14,12 +14,14 @@ import logging
 import os
 import re
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Tuple
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 sys.stdout.reconfigure(encoding="utf-8")
 
 import config.constants as constants
+from builders import localization
+from builders.asset_index import load_index
 from utils import json_utils, file_utils
 from utils.text_utils import clean_game_dialogue
 from utils.guid_utils import extract_guid
@@ -54,9 +56,6 @@ _log = _setup_logger()
 # Regex constants
 # ---------------------------------------------------------------------------
 
-_TERM_RE             = re.compile(r"^\s*-\s*Term:\s*(.+?)\s*$")
-_LANGUAGES_HEADER_RE = re.compile(r"^\s*Languages:\s*$")
-_LANG_ITEM_RE        = re.compile(r"^\s*-\s*(.*)\s*$")
 _CYCLE_RE            = re.compile(r"^(TNPC|RNPC|NPC)\.([^.]+)\.(Cycle[^.]+)\.(.+)$", re.IGNORECASE)
 _TAIL_RE             = re.compile(r"^(D|O|R)(\d+)?([A-Za-z]*)$", re.IGNORECASE)
 _ONE_LINER_RE        = re.compile(r"^(RNPC|NPC)\.([^.]+)\.OL(?:(\d+)|(?:\.([^.]+)))?$", re.IGNORECASE)
@@ -94,28 +93,11 @@ def _decode_yaml_scalar(value: str) -> str:
 
 
 def _extract_term_english_pairs(prefab_path: str) -> List[Tuple[str, str]]:
-    pairs: List[Tuple[str, str]] = []
-    current_term: Optional[str] = None
-    waiting_for_lang = False
-
-    with open(prefab_path, "r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            m_term = _TERM_RE.match(line)
-            if m_term:
-                current_term = m_term.group(1).strip()
-                waiting_for_lang = False
-                continue
-            if current_term and _LANGUAGES_HEADER_RE.match(line):
-                waiting_for_lang = True
-                continue
-            if current_term and waiting_for_lang:
-                m_lang = _LANG_ITEM_RE.match(line)
-                if m_lang:
-                    text = clean_game_dialogue(_decode_yaml_scalar(m_lang.group(1)))
-                    pairs.append((current_term, text))
-                waiting_for_lang = False
-
-    return pairs
+    table = localization.load_table(prefab_path)
+    return [
+        (term, clean_game_dialogue(_decode_yaml_scalar(raw)))
+        for term, raw in table.pairs()
+    ]
 
 # ---------------------------------------------------------------------------
 # Cycle building
@@ -220,20 +202,21 @@ def _enrich_cycles(cycles: Dict[str, Any]) -> None:
                 for e in entries:
                     term_index.setdefault(e["term"], []).append(e)
 
-    for root, _, files in os.walk(_MONOBEHAVIOUR_DIR):
-        for f in files:
-            if f.lower().endswith(".asset") and "cycle" in f.lower():
-                for rec in _parse_cycle_asset_file(os.path.join(root, f)):
-                    key = rec.get("keyResponse") or rec.get("keyOption")
-                    if key in term_index:
-                        for e in term_index[key]:
-                            e["emotion"] = rec["emotion"]
-                            e["hearts"]  = rec["hearts"]
-                            if rec.get("quest"):
-                                e["quest"] = rec["quest"]
-                            if rec.get("item"):
-                                e["item"]       = rec["item"]
-                                e["itemAmount"] = rec.get("itemAmount")
+    index = load_index()
+    for f in index.files("MonoBehaviour", ".asset", recursive=True):
+        if "cycle" not in os.path.basename(f).lower():
+            continue
+        for rec in _parse_cycle_asset_file(os.path.join(_MONOBEHAVIOUR_DIR, f)):
+            key = rec.get("keyResponse") or rec.get("keyOption")
+            if key in term_index:
+                for e in term_index[key]:
+                    e["emotion"] = rec["emotion"]
+                    e["hearts"]  = rec["hearts"]
+                    if rec.get("quest"):
+                        e["quest"] = rec["quest"]
+                    if rec.get("item"):
+                        e["item"]       = rec["item"]
+                        e["itemAmount"] = rec.get("itemAmount")
 
 # ---------------------------------------------------------------------------
 # One-liners
@@ -0,0 +1,313 @@
+"""
+Prefab fields — single-pass field and block extraction for GameObject (.prefab) files.
+
+The GameObject folder is the largest input directory, and entity_builder and
+breakable_object_builder both pull a dozen scalar fields plus drop / loot
+tables out of every prefab in it. Instead of one full-text regex search per
+field, a PrefabExtractor compiles the literal keys of every field and block
+it was given into one alternation and scans the prefab text once, handing
+each hit to the field / block that owns the key:
+
+  Field  →  first occurrence whose full pattern matches at the key
+            (the raw group(1) string; callers strip / cast it)
+  Block  →  first line holding the key; the block parser reads lines from
+            there until the block ends (drop tables, loot tables, professionEXP)
+
+The scan stops as soon as every field and block has been found.
+
+Public API:
+  Field(name, key, pattern="", line_start=False)   scalar "key: value" field
+  line_field(name, key)                            →  Field whose key must start its line
+  Block(name, key, parse, line="")                 multi-line block
+  DROPS2, LOOT_TABLE, PROFESSION_EXP               Block definitions
+  PrefabExtractor(fields, blocks=())
+    .extract(text)                                 →  dict[name, str | parsed block]
+  read_prefab(path)                                →  str
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# ---------------------------------------------------------------------------
+# Definitions
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Field:
+    """
+    A scalar field. key is the literal text the scan looks for; pattern is
+    matched where key starts and its group(1) is the value (default: the
+    rest of the line, i.e. re.search(rf"{key}\s*(.+)", content)).
+    line_start=True only accepts keys that are the first thing on their line.
+    """
+    name: str
+    key: str
+    pattern: str = ""
+    line_start: bool = False
+
+
+def line_field(name: str, key: str) -> Field:
+    """A field whose key is the first thing on its line (^\s*key\s*:\s*value$)."""
+    return Field(name, key, rf"{re.escape(key)}\s*:\s*([^\n]+)$", line_start=True)
+
+
+@dataclass(frozen=True)
+class Block:
+    """
+    A multi-line block opened by the first line containing key (and, when
+    given, fully matching line); parse gets the lines from there on.
+    """
+    name: str
+    key: str
+    parse: Callable[[Iterable[str]], object]
+    line: str = ""
+
+# ---------------------------------------------------------------------------
+# Block parsers
+# ---------------------------------------------------------------------------
+
+def parse_drop_tables(lines: Iterable[str]) -> dict:
+    """Enemy _drops2: block → {"drop_table_1": [{id, drop_chance, drop_amount}, ...], ...}."""
+    drop_tables = []
+    current_table: list[dict] = []
+    drop_id = None
+    drop_chance = None
+    inside_drops2 = False
+
+    for line in lines:
+        line = line.rstrip()
+        stripped = line.strip()
+
+        if "_drops2:" in stripped:
+            inside_drops2 = True
+            continue
+
+        if inside_drops2:
+            if "- drops:" in stripped:
+                if current_table:
+                    drop_tables.append(current_table)
+                current_table = []
+                continue
+            elif not line.startswith(" "):
+                break
+
+            if "id:" in stripped:
+                try:
+                    drop_id = int(stripped.split("id:")[1].strip())
+                except Exception:
+                    drop_id = None
+            elif "dropChance:" in stripped:
+                try:
+                    drop_chance = float(stripped.split("dropChance:")[1].strip())
+                except Exception:
+                    drop_chance = None
+            elif "dropAmount:" in stripped:
+                match = re.search(r"x:\s*(\d+),\s*y:\s*(\d+)", stripped)
+                if match and drop_id is not None and drop_chance is not None:
+                    current_table.append({
+                        "id":          drop_id,
+                        "drop_chance": drop_chance,
+                        "drop_amount": int(match.group(1)),
+                    })
+                    drop_id = None
+                    drop_chance = None
+
+    if current_table:
+        drop_tables.append(current_table)
+
+    return {f"drop_table_{i + 1}": table for i, table in enumerate(drop_tables)}
+
+
+def parse_profession_exp(lines: Iterable[str]) -> list[dict] | None:
+    """Optional professionEXP: block → [{profession, exp}, ...] (None when absent)."""
+    prof_list = []
+    inside = False
+    current: dict = {}
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+
+        if not inside:
+            if re.match(r'^\s*professionEXP:\s*$', line):
+                inside = True
+            continue
+
+        if re.match(r'^\S', line):
+            break
+
+        if re.match(r'^\s*-\s*profession\s*:\s*(\d+)', line):
+            if current:
+                prof_list.append(current)
+            current = {}
+            m = re.search(r'profession\s*:\s*(\d+)', line)
+            current["profession"] = int(m.group(1)) if m else None
+            continue
+
+        m = re.search(r'\bexp\s*:\s*(\d+)', line)
+        if m:
+            current["exp"] = int(m.group(1))
+
+    if current:
+        prof_list.append(current)
+
+    return prof_list if inside else None
+
+
+def parse_loot_tables(lines: Iterable[str]) -> list[list[dict]]:
+    """
+    lootTable: section with one or more - drops: blocks → list of drop-table
+    lists, filtered to only tables with valid entries.
+    """
+    loot_tables = []
+    inside_loot_table = False
+    inside_drops_block = False
+    current_table: list[dict] = []
+    loot_indent = None
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+
+        if not inside_loot_table:
+            if re.match(r'^\s*lootTable:\s*$', line):
+                inside_loot_table = True
+                loot_indent = len(line) - len(line.lstrip(' '))
+            continue
+
+        curr_indent = len(line) - len(line.lstrip(' '))
+        if curr_indent <= (loot_indent or 0) and re.match(r'^\S', line):
+            if current_table:
+                loot_tables.append(current_table)
+                current_table = []
+            break
+
+        if re.match(r'^\s*-\s*drops\s*:\s*$', line):
+            if current_table:
+                loot_tables.append(current_table)
+                current_table = []
+            inside_drops_block = True
+            continue
+
+        if not inside_drops_block:
+            continue
+
+        if re.match(r'^\s*-\s*drop\s*:\s*(.+)$', line):
+            entry: dict = {"drop": None, "dropChance": None, "dropAmount": None}
+            entry["drop"] = re.sub(r'^\s*-\s*drop\s*:\s*', '', line).strip()
+            current_table.append(entry)
+            continue
+
+        m = re.search(r'\bdropChance\s*:\s*([0-9]+(?:\.[0-9]+)?)', line)
+        if m and current_table:
+            try:
+                current_table[-1]["dropChance"] = float(m.group(1))
+            except Exception:
+                current_table[-1]["dropChance"] = None
+            continue
+
+        m = re.search(r'\bdropAmount\s*:\s*\{?\s*x\s*:\s*(\d+)\s*,\s*y\s*:\s*(\d+)\s*\}?', line)
+        if m and current_table:
+            current_table[-1]["dropAmount"] = {"x": int(m.group(1)), "y": int(m.group(2))}
+            continue
+
+    if current_table:
+        loot_tables.append(current_table)
+
+    return [
+        tbl for tbl in loot_tables
+        if any(e.get("dropChance") is not None and e.get("dropAmount") for e in tbl)
+    ]
+
+
+DROPS2         = Block("drop_tables",    "_drops2:",       parse_drop_tables)
+LOOT_TABLE     = Block("loot_table",     "lootTable:",     parse_loot_tables,    r"\s*lootTable:\s*")
+PROFESSION_EXP = Block("profession_exp", "professionEXP:", parse_profession_exp, r"\s*professionEXP:\s*")
+
+# ---------------------------------------------------------------------------
+# Extractor
+# ---------------------------------------------------------------------------
+
+def _lines_from(text: str, pos: int) -> Iterator[str]:
+    """Lines of text (newline kept) starting at pos, without copying the rest of the file."""
+    end = len(text)
+    while pos < end:
+        nl = text.find("\n", pos)
+        if nl == -1:
+            yield text[pos:]
+            return
+        yield text[pos:nl + 1]
+        pos = nl + 1
+
+
+class PrefabExtractor:
+    """Extracts a fixed set of fields and blocks from prefab text in one scan."""
+
+    def __init__(self, fields: Iterable[Field], blocks: Iterable[Block] = ()):
+        self.fields = tuple(fields)
+        self.blocks = tuple(blocks)
+
+        # key → [(target index, verifier)]; fields and blocks may share a key
+        self._by_key: dict[str, list] = {}
+        for i, f in enumerate(self.fields):
+            pattern = re.compile(f.pattern or re.escape(f.key) + r"\s*(.+)", re.MULTILINE)
+            self._by_key.setdefault(f.key, []).append((i, pattern))
+        for i, b in enumerate(self.blocks, start=len(self.fields)):
+            self._by_key.setdefault(b.key, []).append((i, re.compile(b.line) if b.line else None))
+
+        # An alternation of plain literals keeps the regex engine's fast
+        # first-character skip, so one scan costs about one literal search
+        self._scan = re.compile("|".join(
+            re.escape(key) for key in sorted(self._by_key, key=len, reverse=True)
+        ))
+
+    def extract(self, text: str) -> dict:
+        """
+        {name: value} for every field and block found. Field values are the
+        raw matched strings; block values are whatever the block parser returns.
+        """
+        result: dict = {}
+        n_fields = len(self.fields)
+        remaining = n_fields + len(self.blocks)
+
+        for match in self._scan.finditer(text):
+            pos = match.start()
+            line_start = text.rfind("\n", 0, pos) + 1
+
+            for index, verify in self._by_key[match.group()]:
+                if index < n_fields:
+                    field = self.fields[index]
+                    if field.name in result:
+                        continue
+                    if field.line_start and text[line_start:pos].strip():
+                        continue
+                    value = verify.match(text, pos)
+                    if not value:
+                        continue            # keep looking, as re.search would
+                    result[field.name] = value.group(1)
+                else:
+                    block = self.blocks[index - n_fields]
+                    if block.name in result:
+                        continue
+                    if verify is not None:
+                        line_end = text.find("\n", pos)
+                        if not verify.fullmatch(text, line_start, len(text) if line_end == -1 else line_end):
+                            continue
+                    result[block.name] = block.parse(_lines_from(text, line_start))
+                remaining -= 1
+
+            if not remaining:
+                break
+
+        return result
+
+
+def read_prefab(path: str) -> str:
+    """Prefab text with universal newlines (same text file_utils.read_file_lines sees)."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
@@ -1,12 +1,16 @@
 """
 Quest builder — Layer 1 of the pipeline.
 
-Parses raw MonoBehaviour (.asset) files to extract quest data and writes
-three categorized JSON files:
+Parses raw MonoBehaviour (.asset) quest files and writes three categorized
+JSON files:
   - quest_data_BB_SQ.json    (Bulletin Board + Side quests, types 0/1)
   - quest_data_MainQuests.json (Main quests, types 2/3/4/8)
   - quest_data_IDK.json       (Uncategorized / unknown types)
 
+Only quest assets are parsed: the asset index recognises them by their
+top-level questName key or their m_Script GUID, so non-quest assets are
+never opened. GUIDs are resolved for quests only.
+
 Usage:
     python builders/quest_builder.py
 """
@@ -21,7 +25,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 sys.stdout.reconfigure(encoding="utf-8")
 
 import config.constants as constants
-from utils import file_utils, json_utils
+from builders.asset_index import AssetIndex, load_index
+from utils import diagnostics, file_utils, json_utils
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -29,25 +34,39 @@ from utils import file_utils, json_utils
 
 _MONOBEHAVIOUR_DIR = os.path.join(constants.INPUT_DIRECTORY, "MonoBehaviour")
 _OUTPUT_DIR        = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data")
-_DEBUG_DIR         = os.path.join(constants.DEBUG_DIRECTORY, "json")
+
+_diagnostics = diagnostics.get_sink("quest_builder")
 
 # ---------------------------------------------------------------------------
-# Helpers
+# Prefilter
 # ---------------------------------------------------------------------------
 
-def _extract_guid(meta_path: str) -> str | None:
-    try:
-        for line in file_utils.read_file_lines(meta_path):
-            match = re.search(r"guid:\s*([a-f0-9]+)", line)
-            if match:
-                return match.group(1)
-    except Exception as exc:
-        file_utils.append_line(
-            os.path.join(_DEBUG_DIR, "guid_extraction.txt"),
-            f"Error reading meta file {meta_path}: {exc}",
-        )
-    return None
+_MONOBEHAVIOUR_CLASS_ID = 114
+
+
+def _find_quest_files(index: AssetIndex, asset_files: list[str]) -> list[str]:
+    """
+    Return the asset files that hold quests, in asset order.
 
+    Files with a top-level questName key come straight from the asset index;
+    the m_Script GUIDs of those quest documents then pick up quests whose
+    questName the index did not record. No asset is opened.
+    """
+    indexed = set(index.files_with_key("MonoBehaviour", "questName"))
+
+    quest_scripts = {
+        doc.script
+        for filename in indexed
+        for doc in index.documents(os.path.join(_MONOBEHAVIOUR_DIR, filename), _MONOBEHAVIOUR_CLASS_ID)
+        if doc.script and "questName" in doc.keys
+    }
+    scripted = set(index.files_with_script("MonoBehaviour", quest_scripts))
+
+    return [f for f in asset_files if f in indexed or f in scripted]
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
 
 def _parse_quest_asset(file_path: str, guid_lookup: dict) -> dict:
     quest_data: dict = {
@@ -123,9 +142,8 @@ def _parse_quest_asset(file_path: str, guid_lookup: dict) -> dict:
                 pending_id = None
 
     except Exception as exc:
-        file_utils.append_line(
-            os.path.join(_DEBUG_DIR, "quest_parsing.txt"),
-            f"Error parsing {file_path}: {exc}",
+        _diagnostics.record(
+            "parse_error", f"Error parsing {file_path}: {exc}", severity="error", file=file_path,
         )
 
     return quest_data
@@ -137,16 +155,14 @@ def _parse_quest_asset(file_path: str, guid_lookup: dict) -> dict:
 
 def run() -> None:
     file_utils.ensure_dir_exists(_OUTPUT_DIR)
-    file_utils.ensure_dir_exists(_DEBUG_DIR)
+    _diagnostics.start()
 
-    # Build GUID lookup for every asset file
-    guid_lookup: dict = {}
-    for quest_file in os.listdir(_MONOBEHAVIOUR_DIR):
-        if quest_file.endswith(".asset"):
-            meta_path = os.path.join(_MONOBEHAVIOUR_DIR, quest_file + ".meta")
-            if os.path.exists(meta_path):
-                guid = _extract_guid(meta_path)
-                guid_lookup[quest_file] = guid
+    # Prefilter quest assets, then resolve GUIDs for those files only
+    index       = load_index()
+    asset_files = _find_quest_files(index, index.files("MonoBehaviour", ".asset"))
+    guid_lookup: dict = {
+        f: index.guid(os.path.join(_MONOBEHAVIOUR_DIR, f)) for f in asset_files
+    }
 
     quest_categories: dict = {
         "quest_data_BB_SQ":      {},
@@ -156,7 +172,6 @@ def run() -> None:
     guid_to_name: dict = {}
     all_quests: list   = []
 
-    asset_files = [f for f in os.listdir(_MONOBEHAVIOUR_DIR) if f.endswith(".asset")]
     total = len(asset_files)
     step  = max(1, total // 5)
 
@@ -198,12 +213,12 @@ def run() -> None:
             total_quests = sum(len(v) for v in data.values())
             print(f"  ✅ {category}.json — {total_quests} quests")
         except Exception as exc:
-            file_utils.append_line(
-                os.path.join(_DEBUG_DIR, "json_writing.txt"),
-                f"Error writing {output_path}: {exc}",
+            _diagnostics.record(
+                "write_error", f"Error writing {output_path}: {exc}", severity="error", file=output_path,
             )
 
     print("✅ Quest build complete.")
+    _diagnostics.print_summary()
 
 
 if __name__ == "__main__":
@@ -21,9 +21,11 @@ from collections import defaultdict
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
+from builders import item_store
+from builders.asset_index import load_index
 from builders.item_builder import _CACHE_FILE as _ITEM_CACHE_FILE, _load_cache
 from mappings.workbench_aliases import normalize_workbench
-from utils import file_utils, json_utils, text_utils
+from utils import diagnostics, file_utils, json_utils, text_utils
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -31,37 +33,40 @@ from utils import file_utils, json_utils, text_utils
 
 _MONOBEHAVIOUR_DIR = os.path.join(constants.INPUT_DIRECTORY, "MonoBehaviour")
 _CACHE_FILE        = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "recipes_data.json")
-_DEBUG_LOG         = os.path.join(constants.DEBUG_DIRECTORY, "json", "recipe_builder_debug.txt")
+
+_diagnostics = diagnostics.get_sink("recipe_builder")
 
 # ---------------------------------------------------------------------------
 # ID → name lookup (built from item builder cache)
 # ---------------------------------------------------------------------------
 
-def _build_id_to_names() -> defaultdict[str, list[str]]:
+def _build_id_to_names() -> dict[str, list[str]]:
     """Load ItemData cache and return a dict mapping item_id → [canonical names]."""
     if not os.path.exists(_ITEM_CACHE_FILE):
         raise FileNotFoundError(
             f"❌ Missing item cache. Run the item builder first:\n"
             f"   python builders/item_builder.py"
         )
-    items = _load_cache()
-    id_to_names: defaultdict[str, list[str]] = defaultdict(list)
-    for item in items.values():
-        id_to_names[str(item.item_id)].append(item.name)
-    return id_to_names
+    return item_store.all_names_by_id(_load_cache())
 
 
-def _get_canonical_name(item_id, fallback_name: str, recipe_name: str, id_to_names: defaultdict) -> str:
+def _get_canonical_name(item_id, fallback_name: str, recipe_name: str, id_to_names: dict) -> str:
     id_str = str(item_id).strip()
     names  = id_to_names.get(id_str)
 
     if not names:
-        file_utils.append_line(_DEBUG_LOG, f"[MISSING] ID {item_id} not found for '{fallback_name}' in {recipe_name}")
+        _diagnostics.record(
+            "missing_id", f"ID {item_id} not found for '{fallback_name}' in {recipe_name}",
+            item_id=id_str, name=fallback_name, file=recipe_name,
+        )
         return fallback_name
 
     norm_names = set(text_utils.normalize_for_compare(n) for n in names)
     if len(norm_names) > 1:
-        file_utils.append_line(_DEBUG_LOG, f"[CONFLICT] ID {item_id} has conflicting names {names} in {recipe_name}")
+        _diagnostics.record(
+            "conflicting_names", f"ID {item_id} has conflicting names {names} in {recipe_name}",
+            item_id=id_str, names=names, file=recipe_name,
+        )
         return fallback_name
 
     return names[0]
@@ -70,18 +75,7 @@ def _get_canonical_name(item_id, fallback_name: str, recipe_name: str, id_to_nam
 # Asset parsers
 # ---------------------------------------------------------------------------
 
-def _extract_guid(meta_path: str) -> str | None:
-    try:
-        for line in file_utils.read_file_lines(meta_path):
-            match = re.search(r"guid:\s*([a-f0-9]+)", line)
-            if match:
-                return match.group(1)
-    except Exception as exc:
-        print(f"  ⚠️  Error reading {meta_path}: {exc}")
-    return None
-
-
-def _parse_recipe_asset(file_path: str, id_to_names: defaultdict) -> dict:
+def _parse_recipe_asset(file_path: str, id_to_names: dict) -> dict:
     recipe_data: dict = {
         "inputs":                  [],
         "output":                  {},
@@ -187,22 +181,25 @@ def _generate_recipe_id(parsed_id: int, workbench_name: str, output_id) -> str:
 
 def run() -> None:
     file_utils.ensure_dir_exists(os.path.dirname(_CACHE_FILE))
-    file_utils.ensure_dir_exists(os.path.dirname(_DEBUG_LOG))
+    _diagnostics.start()
 
     print("Loading item data for ID → name lookup...")
     id_to_names = _build_id_to_names()
 
+    index       = load_index()
+    asset_files = index.files("MonoBehaviour", ".asset")
+
     # Parse all Recipe*.asset files
     print("Parsing recipe assets...")
     raw_recipes: dict = {}
-    for filename in os.listdir(_MONOBEHAVIOUR_DIR):
-        if filename.lower().startswith("recipe") and filename.endswith(".asset"):
+    for filename in asset_files:
+        if filename.lower().startswith("recipe"):
             asset_path = os.path.join(_MONOBEHAVIOUR_DIR, filename)
-            meta_path  = asset_path + ".meta"
 
             recipe_info = _parse_recipe_asset(asset_path, id_to_names)
-            if os.path.exists(meta_path):
-                recipe_info["guid"] = _extract_guid(meta_path)
+            guid = index.guid(asset_path)
+            if guid:
+                recipe_info["guid"] = guid
 
             id_match = re.search(r"[Rr]ecipe\s+(\d+)", filename)
             recipe_info["parsed_recipe_id"] = int(id_match.group(1)) if id_match else 0
@@ -210,7 +207,7 @@ def run() -> None:
 
     # Map recipe GUIDs → workbenches via RecipeList*.asset files
     guid_to_workbenches: defaultdict[str, set] = defaultdict(set)
-    for filename in os.listdir(_MONOBEHAVIOUR_DIR):
+    for filename in asset_files:
         m = re.match(r"^RecipeList[_ ]+(.+)\.asset$", filename)
         if not m:
             continue
@@ -232,7 +229,10 @@ def run() -> None:
         if not workbenches:
             output_name = data.get("output", {}).get("name", "")
             if " Jam" in output_name:
-                file_utils.append_line(_DEBUG_LOG, f"[INFERRED] {name} → Jam Maker")
+                _diagnostics.record(
+                    "inferred_workbench", f"{name} → Jam Maker", severity="info",
+                    file=name, workbench="Jam Maker",
+                )
                 workbenches.add("Jam Maker")
             else:
                 workbenches.add("Unknown Workbench")
@@ -262,6 +262,7 @@ def run() -> None:
 
     json_utils.write_json(final_recipes, _CACHE_FILE, indent=4)
     print(f"✅ {len(final_recipes)} recipes written to {_CACHE_FILE}")
+    _diagnostics.print_summary()
 
 
 if __name__ == "__main__":
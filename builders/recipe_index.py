@@ -0,0 +1,125 @@
+"""
+Recipe index — lookups over recipes_data.json (shared by formatters and exporters).
+
+recipes_data.json is keyed by recipe_id, so answering "which recipes make
+X" used to mean scanning every recipe for every item. The index is built
+once, on first use, with three lookups:
+  - output name     → recipes producing the item
+  - ingredient name → recipes consuming the item ("Used in")
+  - workbench       → recipes crafted at a workbench
+
+Names are compared after whitespace clean-up and lowercasing; workbenches
+after normalize_workbench() and lowercasing. Only recipes with an output
+name and at least one input are indexed by name (the others cannot be
+formatted).
+Every list keeps recipes_data.json order.
+
+The index is memoized per process and rebuilt when the JSON file changes.
+
+Public API:
+  load_recipe_index(json_path=None)  →  RecipeIndex   (empty if the file is missing)
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import defaultdict
+from typing import Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import config.constants as constants
+from mappings.workbench_aliases import normalize_workbench
+from utils import json_utils
+from utils.text_utils import clean_whitespace
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+_RECIPE_JSON_PATH = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "recipes_data.json")
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+def normalize_name(name: str) -> str:
+    """Key used for output / ingredient name lookups."""
+    return clean_whitespace(name or "").lower()
+
+
+def _workbench_key(workbench: str) -> str:
+    return normalize_workbench(workbench).strip().lower()
+
+
+class RecipeIndex:
+    """Read-only recipe lookups by output, ingredient and workbench."""
+
+    def __init__(self, recipes: dict):
+        self.recipes = recipes
+        self._by_output: defaultdict[str, list[dict]] = defaultdict(list)
+        self._by_input: defaultdict[str, list[dict]] = defaultdict(list)
+        self._by_workbench: defaultdict[str, list[dict]] = defaultdict(list)
+
+        for recipe in recipes.values():
+            self._by_workbench[_workbench_key(recipe.get("workbench", ""))].append(recipe)
+
+            output_name = (recipe.get("output") or {}).get("name")
+            inputs = recipe.get("inputs")
+            if not output_name or not inputs:
+                continue
+
+            self._by_output[normalize_name(output_name)].append(recipe)
+            # A recipe listing the same ingredient twice is still one use
+            for key in dict.fromkeys(normalize_name(i.get("name", "")) for i in inputs):
+                if key:
+                    self._by_input[key].append(recipe)
+
+    def __len__(self) -> int:
+        return len(self.recipes)
+
+    def producing(self, name: str) -> list[dict]:
+        """Recipes whose output is the named item."""
+        return list(self._by_output.get(normalize_name(name), ()))
+
+    def consuming(self, name: str) -> list[dict]:
+        """Recipes that use the named item as an ingredient."""
+        return list(self._by_input.get(normalize_name(name), ()))
+
+    def at_workbench(self, workbench: str) -> list[dict]:
+        """Recipes crafted at the workbench (raw or alias name)."""
+        return list(self._by_workbench.get(_workbench_key(workbench), ()))
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+_index_memo: dict[str, tuple[Optional[tuple[int, int]], RecipeIndex]] = {}
+_index_lock = threading.Lock()
+
+
+def _file_stat(path: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def load_recipe_index(json_path: Optional[str] = None) -> RecipeIndex:
+    """
+    Return the recipe index for recipes_data.json (or json_path).
+    Built on first call and reused until the file changes.
+    """
+    path = json_path or _RECIPE_JSON_PATH
+    stamp = _file_stat(path)
+    with _index_lock:
+        cached = _index_memo.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        recipes = (json_utils.load_json(path) or {}) if stamp else {}
+        index = RecipeIndex(recipes)
+        _index_memo[path] = (stamp, index)
+        return index
@@ -0,0 +1,165 @@
+"""
+Scene parser — streaming, document-level reader for Unity scene (.unity) files.
+
+Scene files run to hundreds of megabytes, so they are never read whole:
+the file is memory-mapped and searched in place, and only the ``--- !u!``
+documents that match are copied out of the map.
+
+find_components() yields every MonoBehaviour document that has a given
+top-level key (e.g. "_fish" for fish spawners), with the text from that key
+to the end of the document. resolve_game_objects() then makes one more
+search to name and place the GameObjects those components sit on:
+
+  GameObject  (class 1)          →  m_Name
+  Transform   (class 4 / 224)    →  m_LocalPosition (relative to its parent)
+
+Components inside prefab instances may point at stripped GameObjects;
+those resolve with name / position None.
+
+Public API:
+  iter_documents(buf)                    →  Iterator[SceneDocument]
+  find_components(path, key)             →  Iterator[SceneComponent]
+  resolve_game_objects(path, file_ids)   →  dict[int, SceneObject]
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# ---------------------------------------------------------------------------
+# Regex constants (bytes — documents are scanned without decoding)
+# ---------------------------------------------------------------------------
+
+_GAMEOBJECT_CLASS_ID    = 1
+_TRANSFORM_CLASS_IDS    = (4, 224)      # Transform, RectTransform
+_MONOBEHAVIOUR_CLASS_ID = 114
+
+_DOC_SEPARATOR   = b"\n--- !u!"
+_DOC_HEADER_RE   = re.compile(rb"^--- !u!(\d+) &(-?\d+)[^\n]*\n", re.MULTILINE)
+_GAMEOBJECT_RE   = re.compile(rb"^  m_GameObject: \{fileID: (-?\d+)", re.MULTILINE)
+_M_NAME_RE       = re.compile(rb"^  m_Name: ?([^\r\n]*)", re.MULTILINE)
+_POSITION_RE     = re.compile(
+    rb"^  m_LocalPosition: \{x: ([-\d.eE+]+), y: ([-\d.eE+]+), z: ([-\d.eE+]+)\}", re.MULTILINE
+)
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class SceneDocument:
+    """Byte range of one ``--- !u!`` document (header line included)."""
+    class_id: int
+    file_id: int
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class SceneComponent:
+    """A MonoBehaviour found by find_components(); text runs from the key to the end of the document."""
+    file_id: int
+    game_object_id: Optional[int]
+    text: str
+
+
+@dataclass(frozen=True)
+class SceneObject:
+    file_id: int
+    name: Optional[str]
+    position: Optional[tuple[float, float, float]]
+
+# ---------------------------------------------------------------------------
+# Document walking
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def _mapped(path: str) -> Iterator[Optional[mmap.mmap]]:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield None          # mmap cannot map an empty file
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
+def iter_documents(buf) -> Iterator[SceneDocument]:
+    """Yield the documents of a Unity YAML buffer (bytes or mmap) in file order."""
+    previous = None
+    for match in _DOC_HEADER_RE.finditer(buf):
+        if previous is not None:
+            yield SceneDocument(int(previous.group(1)), int(previous.group(2)), previous.start(), match.start())
+        previous = match
+    if previous is not None:
+        yield SceneDocument(int(previous.group(1)), int(previous.group(2)), previous.start(), len(buf))
+
+
+def _document_at(buf, pos: int) -> Optional[SceneDocument]:
+    """The document containing byte offset pos (None before the first header)."""
+    # The window reaches just far enough to catch a separator when pos is a header itself
+    start = buf.rfind(_DOC_SEPARATOR, 0, pos + len(_DOC_SEPARATOR) - 1) + 1     # -1 → 0: file opens with a header
+    header = _DOC_HEADER_RE.match(buf, start)
+    if not header:
+        return None
+    end = buf.find(_DOC_SEPARATOR, pos)
+    return SceneDocument(int(header.group(1)), int(header.group(2)), start, len(buf) if end == -1 else end + 1)
+
+
+def find_components(path: str, key: str) -> Iterator[SceneComponent]:
+    """Yield every MonoBehaviour in the scene with top-level `key`, in file order."""
+    needle = f"\n  {key}:".encode()
+    with _mapped(path) as mm:
+        if mm is None:
+            return
+        # Jump from match to match; documents without the key are never touched
+        pos = mm.find(needle)
+        while pos != -1:
+            doc = _document_at(mm, pos)
+            if doc is not None and doc.class_id == _MONOBEHAVIOUR_CLASS_ID:
+                go = _GAMEOBJECT_RE.search(mm, doc.start, pos)
+                yield SceneComponent(
+                    doc.file_id,
+                    int(go.group(1)) if go and go.group(1) != b"0" else None,
+                    mm[pos + len(needle):doc.end].decode("utf-8", errors="replace").replace("\r\n", "\n"),
+                )
+            pos = mm.find(needle, doc.end if doc is not None else pos + 1)
+
+
+def resolve_game_objects(path: str, file_ids: Iterable[int]) -> dict[int, SceneObject]:
+    """Name and local position of the GameObjects with these file IDs."""
+    wanted = set(file_ids)
+    names: dict[int, str] = {}
+    positions: dict[int, tuple[float, float, float]] = {}
+    if wanted:
+        ids = b"|".join(str(file_id).encode() for file_id in sorted(wanted))
+        header_re = re.compile(rb"^--- !u!%d &(%s)\b" % (_GAMEOBJECT_CLASS_ID, ids), re.MULTILINE)
+        owner_re  = re.compile(rb"^  m_GameObject: \{fileID: (%s)\}" % ids, re.MULTILINE)
+        with _mapped(path) as mm:
+            if mm is not None:
+                for match in header_re.finditer(mm):
+                    doc = _document_at(mm, match.start())
+                    name = _M_NAME_RE.search(mm, doc.start, doc.end)
+                    if name:
+                        names[doc.file_id] = name.group(1).decode("utf-8", errors="replace").strip()
+                for match in owner_re.finditer(mm):
+                    doc = _document_at(mm, match.start())
+                    if doc is None or doc.class_id not in _TRANSFORM_CLASS_IDS:
+                        continue
+                    pos = _POSITION_RE.search(mm, doc.start, doc.end)
+                    if pos:
+                        positions[int(match.group(1))] = tuple(float(v) for v in pos.groups())
+    return {
+        file_id: SceneObject(file_id, names.get(file_id), positions.get(file_id))
+        for file_id in wanted
+    }
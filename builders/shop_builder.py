@@ -17,6 +17,7 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
+from builders.asset_index import AssetIndex, load_index
 from utils import file_utils, json_utils
 
 # ---------------------------------------------------------------------------
@@ -40,25 +41,14 @@ _EDGE_CASE_SHOP_NAMES = [
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _extract_guid(meta_path: str) -> str | None:
-    if not os.path.exists(meta_path):
-        return None
-    with open(meta_path, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            match = re.match(r"guid:\s*(\S+)", line)
-            if match:
-                return match.group(1)
-    return None
-
-
-def _parse_shop_asset(asset_path: str) -> dict:
+def _parse_shop_asset(asset_path: str, index: AssetIndex) -> dict:
     base  = os.path.basename(asset_path).replace(".asset", "")
     clean = re.sub(r"(?:Merchant)?Table$", "", base, flags=re.IGNORECASE)
 
     shop_data: dict = {
         "file_name":     os.path.basename(asset_path),
         "shop_name":     clean.strip("_"),
-        "guid":          _extract_guid(asset_path + ".meta"),
+        "guid":          index.guid(asset_path),
         "starting_items": [],
         "random_items":   [],
     }
@@ -113,12 +103,10 @@ def _parse_shop_asset(asset_path: str) -> dict:
 def run() -> None:
     file_utils.ensure_dir_exists(os.path.dirname(_CACHE_FILE))
 
+    index = load_index()
     shop_list: list[dict] = []
 
-    for file_name in os.listdir(_MONOBEHAVIOUR_DIR):
-        if not file_name.endswith(".asset"):
-            continue
-
+    for file_name in index.files("MonoBehaviour", ".asset"):
         lower = file_name.lower()
         is_merchant    = "merchant" in lower and not file_name[0].isdigit()
         is_generalstore = "generalstore" in lower
@@ -128,7 +116,7 @@ def run() -> None:
             continue
 
         asset_path = os.path.join(_MONOBEHAVIOUR_DIR, file_name)
-        shop_data  = _parse_shop_asset(asset_path)
+        shop_data  = _parse_shop_asset(asset_path, index)
         shop_list.append(shop_data)
 
     if shop_list:
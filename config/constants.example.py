@@ -15,6 +15,9 @@ PWB_SETTINGS = {
     "NULL_EDIT_SLEEP_INTERVAL": 10,
     "MAX_RETRIES": 5,
     "THROTTLE": 5,
+    "READS_PER_SECOND": 5,      # Adaptive limiter ceilings (utils/rate_limiter.py);
+    "WRITES_PER_MINUTE": 6,     # halved on maxlag / Retry-After, recovered when healthy (6 ≈ the old edit pacing)
+    "IMAGE_WORKERS": 4,         # processes that crop / scale / encode images for upload (utils/image_upload.py)
     "USER_AGENT": "SH Wiki User (https://sunhaven.wiki.gg/wiki/User:YOURUSERNAMEHERE)",
 }
 
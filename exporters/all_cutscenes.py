@@ -17,6 +17,7 @@ import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from builders.localization import load_table
 from config import constants
 from utils import file_utils, text_utils
 
@@ -36,16 +37,10 @@ _HARDCODED_KEYS = {"Yes": "Yes", "No": "No"}
 
 
 def _load_localization(filepath: str) -> dict:
-    with open(filepath, encoding="utf-8") as f:
-        text = f.read()
-    entries = re.findall(
-        r'- Term:\s*(.*?)\n\s*TermType:.*?Languages:\s*- (.*?)\n',
-        text,
-        re.DOTALL,
-    )
+    table = load_table(filepath)
     return {
-        k.strip().strip('"').replace(" ", ""): v.strip().strip('"')
-        for k, v in entries
+        k.strip('"').replace(" ", ""): v.strip('"')
+        for k, v in table.pairs()
     }
 
 
@@ -16,8 +16,9 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
+from builders import item_store
 from builders.item_builder import _load_cache
-from utils import json_utils, file_utils
+from utils import diagnostics, json_utils, file_utils
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -25,7 +26,8 @@ from utils import json_utils, file_utils
 
 _ENTITIES_DATA  = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "entities_data.json")
 _OUTPUT_FILE    = os.path.join(constants.OUTPUT_DIRECTORY, "Wiki Formatted", "All Monster Drops.txt")
-_DEBUG_LOG      = os.path.join(constants.DEBUG_DIRECTORY, "all_monster_drops_debug.txt")
+
+_diagnostics = diagnostics.get_sink("all_monster_drops")
 
 # ---------------------------------------------------------------------------
 # Runner
@@ -33,13 +35,12 @@ _DEBUG_LOG      = os.path.join(constants.DEBUG_DIRECTORY, "all_monster_drops_deb
 
 def run() -> None:
     file_utils.ensure_dir_exists(os.path.dirname(_OUTPUT_FILE))
-    file_utils.ensure_dir_exists(os.path.dirname(_DEBUG_LOG))
+    _diagnostics.start()
 
     entities = json_utils.load_json(_ENTITIES_DATA)
 
     # Build item_id → name from item builder cache
-    items = _load_cache()
-    item_id_map: dict[int, str] = {item.item_id: item.name for item in items.values()}
+    item_names = item_store.names_by_id(_load_cache())
 
     output_lines: list[str] = []
 
@@ -70,16 +71,17 @@ def run() -> None:
 
                 if item_id == 0 or drop_amount == 0:
                     if item_id != 0:
-                        file_utils.append_line(
-                            _DEBUG_LOG,
+                        _diagnostics.record(
+                            "zero_quantity_drop",
                             f"Skipping 0-qty item: Monster='{enemy_name}' Table='{table_name}' ID={item_id}",
+                            severity="info", monster=enemy_name, table=table_name, item_id=item_id,
                         )
                     continue
 
                 raw_chance = (drop_chance / total_weight) * 100 if total_weight else 0
                 percent_chance = round(raw_chance, 2) if raw_chance < 1 else round(raw_chance, 1)
 
-                item_name = item_id_map.get(item_id, f"Item {item_id}")
+                item_name = item_names.get(str(item_id), f"Item {item_id}")
                 lines.append(
                     f" |{drop_index}_item = {item_name:<20} "
                     f"|{drop_index}_quantity = {drop_amount:<10} "
@@ -92,6 +94,7 @@ def run() -> None:
 
     file_utils.write_lines(_OUTPUT_FILE, [line + "\n\n" for line in output_lines])
     print(f"✅ Monster drops saved to {_OUTPUT_FILE}")
+    _diagnostics.print_summary()
 
 
 if __name__ == "__main__":
@@ -17,6 +17,7 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
+from builders import localization
 from utils import file_utils
 
 # ---------------------------------------------------------------------------
@@ -39,22 +40,21 @@ def _split_on_capitals(name: str) -> str:
 
 
 def _extract_npc_names(prefab_path: str) -> list[str]:
-    if not os.path.exists(prefab_path):
-        raise FileNotFoundError(f"English.prefab not found at: {prefab_path}")
+    table = localization.load_table(prefab_path)
 
     npc_names: set[str] = set()
     pattern = re.compile(r"\b(?:NPC|RNPC|TNPC)\.([^\s\.]+)\.")
 
-    with open(prefab_path, "r", encoding="utf-8", errors="replace") as f:
-        for line_num, line in enumerate(f, start=1):
-            for m in pattern.finditer(line):
+    for term, text in table.pairs():
+        for field in (term, text):
+            for m in pattern.finditer(field):
                 name = (m.group(1) or "").strip()
                 if name:
                     npc_names.add(name)
                 else:
                     file_utils.append_line(
                         _DEBUG_LOG,
-                        f"[WARN] Empty name match on line {line_num}: {line.strip()}",
+                        f"[WARN] Empty name match in term {term}: {field}",
                     )
 
     return sorted(npc_names, key=lambda x: x.lower())
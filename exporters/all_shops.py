@@ -19,6 +19,7 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
+from builders import item_store
 from builders.item_builder import _load_cache
 from utils import json_utils, file_utils
 
@@ -123,14 +124,12 @@ def _parse_shop_table_asset(asset_path: str) -> dict:
 # Item name / currency helpers
 # ---------------------------------------------------------------------------
 
-def _build_id_and_guid_map(items: dict) -> dict:
+def _build_id_and_guid_map(items) -> dict:
     """Build a combined id_str → name and guid → name map from item cache."""
-    result: dict[str, str] = {}
-    for item in items.values():
-        result[str(item.item_id)] = item.name
-        if hasattr(item, "guid") and item.guid:
-            result[item.guid] = item.name
-            result[item.guid.lower()] = item.name
+    by_guid = item_store.names_by_guid(items)
+    result: dict[str, str] = dict(item_store.names_by_id(items))
+    result.update(by_guid)
+    result.update((guid.lower(), name) for guid, name in by_guid.items())
     return result
 
 
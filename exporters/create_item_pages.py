@@ -6,22 +6,33 @@ and writes one .txt file per item to the output directory.
 
 Usage:
     python exporters/create_item_pages.py
+    python exporters/create_item_pages.py --all --workers 8
 
 Toggle TEST_RUN / TEST_ITEMS to target specific items, or set
-ALL_ITEMS = True to write pages for every item in the dataset.
+ALL_ITEMS = True (or pass --all) to write pages for every item in the dataset.
+
+With --workers N, pages are assembled in N processes. Each worker opens the
+item store and recipe index once; pages come back in item order and are
+written by a single writer thread through a bounded queue, so the output is
+identical for any worker count.
 """
 
 from __future__ import annotations
 
+import multiprocessing
 import os
+import queue
 import sys
+import threading
+from math import floor
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
 from builders.item_builder import _CACHE_FILE, _load_cache
+from builders.recipe_index import RecipeIndex, load_recipe_index
 from formatters.pages.item_page import export_item_page
-from utils import file_utils
+from utils import diagnostics, file_utils
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -39,11 +50,93 @@ TEST_ITEMS = [
 
 OUTPUT_DIR = os.path.join(constants.OUTPUT_DIRECTORY, "Wiki Formatted", "Item Pages")
 
+_WRITE_QUEUE_SIZE = 256     # Pages held in memory waiting for the writer thread
+
+# ---------------------------------------------------------------------------
+# Page assembly
+# ---------------------------------------------------------------------------
+
+_worker_context: dict = {}
+
+
+def _page_filename(name: str) -> str:
+    return name.replace(" ", "_").replace("'", "") + ".txt"
+
+
+def _render(key: str, items, recipes: RecipeIndex) -> tuple[str, str | None, str | None]:
+    """Return (key, display name, page) — name and page are None if the item is missing."""
+    item = items.get(key)
+    if item is None:
+        return key, None, None
+    return key, item.name, export_item_page(item, display_name=item.name, recipes=recipes)
+
+
+def _init_worker() -> None:
+    """Pool initializer: open the item store and build the recipe index once per worker."""
+    _worker_context["items"] = _load_cache()
+    _worker_context["recipes"] = load_recipe_index()
+
+
+def _render_in_worker(key: str) -> tuple[tuple[str, str | None, str | None], list[dict]]:
+    result = _render(key, _worker_context["items"], _worker_context["recipes"])
+    # Workers exit without flushing; hand diagnostics to the parent in item order
+    return result, diagnostics.drain_all()
+
+
+def _with_worker_diagnostics(results):
+    """Yield worker results, passing each one's diagnostics to this process's sinks."""
+    for result, records in results:
+        diagnostics.extend_all(records)
+        yield result
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+class _PageWriter(threading.Thread):
+    """Writes (filename, page) pairs from a bounded queue in the order received."""
+
+    _DONE = None
+
+    def __init__(self, output_dir: str):
+        super().__init__(daemon=True)
+        self.output_dir = output_dir
+        self.queue: queue.Queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+        self.written = 0
+        self.failed: list[tuple[str, str]] = []
+
+    def put(self, filename: str, page: str) -> None:
+        self.queue.put((filename, page))
+
+    def close(self) -> None:
+        self.queue.put(self._DONE)
+        self.join()
+
+    def run(self) -> None:
+        while True:
+            entry = self.queue.get()
+            if entry is self._DONE:
+                return
+            filename, page = entry
+            try:
+                with open(os.path.join(self.output_dir, filename), "w", encoding="utf-8") as f:
+                    f.write(page)
+                self.written += 1
+            except OSError as exc:
+                self.failed.append((filename, str(exc)))
+
 # ---------------------------------------------------------------------------
 # Runner
 # ---------------------------------------------------------------------------
 
-def run() -> None:
+def run(all_items: bool = ALL_ITEMS, workers: int = 1) -> None:
+    """
+    Write item pages for TEST_ITEMS, or for every item when all_items is set.
+
+    Args:
+        all_items: Write every item in the cache instead of TEST_ITEMS.
+        workers:   Number of processes assembling pages (output is identical).
+    """
     file_utils.ensure_dir_exists(OUTPUT_DIR)
 
     if not os.path.exists(_CACHE_FILE):
@@ -54,33 +147,57 @@ def run() -> None:
     print("Loading item data...")
     items = _load_cache()
 
-    targets = list(items.keys()) if ALL_ITEMS else [n.lower() for n in TEST_ITEMS]
-
-    created = 0
-    skipped = 0
-
-    for key in targets:
-        item = items.get(key)
-        if item is None:
-            print(f"  ⚠️  Not found: '{key}'")
-            skipped += 1
-            continue
-
-        page_content = export_item_page(item, display_name=item.name)
-        safe_filename = item.name.replace(" ", "_").replace("'", "") + ".txt"
-        output_path = os.path.join(OUTPUT_DIR, safe_filename)
-
-        try:
-            file_utils.write_lines(output_path, [page_content])
-            print(f"  ✅ {item.name}")
-            created += 1
-        except Exception as exc:
-            print(f"  ❌ Failed to write {item.name}: {exc}")
-            skipped += 1
-
-    print(f"\nDone. {created} written, {skipped} skipped.")
+    targets = list(items.keys()) if all_items else [n.lower() for n in TEST_ITEMS]
+    total = len(targets)
+    step = max(1, total // 5)
+    verbose = not all_items     # Per-item lines only for the short TEST_ITEMS list
+
+    recipe_diagnostics = diagnostics.get_sink("item_recipe")
+    recipe_diagnostics.start()
+
+    writer = _PageWriter(OUTPUT_DIR)
+    writer.start()
+    missing = 0
+
+    if workers > 1 and total > 1:
+        pool = multiprocessing.Pool(processes=workers, initializer=_init_worker)
+        chunksize = max(1, total // (workers * 16))
+        # imap preserves target order, so duplicate filenames resolve as in a serial run
+        results = _with_worker_diagnostics(pool.imap(_render_in_worker, targets, chunksize))
+    else:
+        pool = None
+        recipes = load_recipe_index()
+        results = (_render(key, items, recipes) for key in targets)
+
+    try:
+        for idx, (key, name, page) in enumerate(results):
+            if not verbose and idx % step == 0:
+                print(f"  🔄 {floor((idx / total) * 100)}% complete...")
+            if page is None:
+                print(f"  ⚠️  Not found: '{key}'")
+                missing += 1
+                continue
+            writer.put(_page_filename(name), page)
+            if verbose:
+                print(f"  ✅ {name}")
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        writer.close()
+
+    for filename, error in writer.failed:
+        print(f"  ❌ Failed to write {filename}: {error}")
+
+    print(f"\nDone. {writer.written} written, {missing + len(writer.failed)} skipped.")
     print(f"Output: {OUTPUT_DIR}")
+    recipe_diagnostics.print_summary()
 
 
 if __name__ == "__main__":
-    run()
+    import argparse
+    parser = argparse.ArgumentParser(description="Write wiki item pages.")
+    parser.add_argument("--all", action="store_true", help="Write a page for every item (same as ALL_ITEMS = True).")
+    parser.add_argument("--workers", type=int, default=1, help="Assemble pages in N processes (default: 1).")
+    args = parser.parse_args()
+    run(all_items=args.all or ALL_ITEMS, workers=args.workers)
@@ -19,6 +19,8 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
+from builders import localization
+from builders import item_store
 from builders.item_builder import _load_cache
 from utils import file_utils, text_utils
 
@@ -34,10 +36,7 @@ _PREFAB_PATH  = os.path.join(constants.INPUT_DIRECTORY, "English.prefab")
 # Prefab parsing (Memory Loss Potion lines)
 # ---------------------------------------------------------------------------
 
-_TERM_RE             = re.compile(r"^\s*-\s*Term:\s*(.+?)\s*$")
-_LANGUAGES_HEADER_RE = re.compile(r"^\s*Languages:\s*$")
-_LANG_ITEM_RE        = re.compile(r"^\s*-\s*(.*)\s*$")
-_MLP_TERM_RE         = re.compile(r"^RNPC\.([^.]+)\.MLP(?:\.Married)?$", re.IGNORECASE)
+_MLP_TERM_RE = re.compile(r"^RNPC\.([^.]+)\.MLP(?:\.Married)?$", re.IGNORECASE)
 
 
 def _decode_yaml_scalar(value: str) -> str:
@@ -58,32 +57,16 @@ def _decode_yaml_scalar(value: str) -> str:
 def _load_memory_loss_lines(prefab_path: str) -> dict:
     """Return {npc_name: {"normal": str, "married": str}} from English.prefab."""
     out: dict = {}
-    current_term = None
-    waiting = False
-
-    with open(prefab_path, "r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            m_term = _TERM_RE.match(line)
-            if m_term:
-                current_term = m_term.group(1).strip()
-                waiting = False
-                continue
-            if current_term and _LANGUAGES_HEADER_RE.match(line):
-                waiting = True
-                continue
-            if current_term and waiting:
-                m_lang = _LANG_ITEM_RE.match(line)
-                if m_lang:
-                    raw = _decode_yaml_scalar(m_lang.group(1))
-                    m_mlp = _MLP_TERM_RE.match(current_term)
-                    if m_mlp:
-                        npc = m_mlp.group(1)
-                        npc_map = out.setdefault(npc, {})
-                        if current_term.lower().endswith(".mlp.married"):
-                            npc_map["married"] = raw
-                        else:
-                            npc_map["normal"] = raw
-                waiting = False
+
+    for term, text in localization.load_table(prefab_path).pairs():
+        m_mlp = _MLP_TERM_RE.match(term)
+        if not m_mlp:
+            continue
+        npc_map = out.setdefault(m_mlp.group(1), {})
+        if term.lower().endswith(".mlp.married"):
+            npc_map["married"] = _decode_yaml_scalar(text)
+        else:
+            npc_map["normal"] = _decode_yaml_scalar(text)
 
     return out
 
@@ -269,8 +252,7 @@ def run() -> None:
     file_utils.ensure_dir_exists(_OUTPUT_DIR)
 
     # Build id → name from item builder cache
-    items = _load_cache()
-    id_to_name: dict[str, str] = {str(item.item_id): item.name for item in items.values()}
+    id_to_name = item_store.names_by_id(_load_cache())
 
     # Load Memory Loss Potion lines once
     memory_loss_map: dict = {}
@@ -19,6 +19,7 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
+from builders import item_store
 from builders.item_builder import _load_cache
 from utils import file_utils
 
@@ -100,8 +101,7 @@ def run() -> None:
     file_utils.ensure_dir_exists(os.path.dirname(_DEBUG_LOG))
 
     # Build id → name from item builder cache
-    items = _load_cache()
-    id_to_name: dict[str, str] = {str(item.item_id): item.name for item in items.values()}
+    id_to_name = item_store.names_by_id(_load_cache())
 
     results: list[str] = []
 
@@ -18,7 +18,7 @@ from collections import defaultdict
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
-from utils import file_utils
+from utils import diagnostics, file_utils
 from mappings.location_mapping import LOCATION_LINKS, PERSONAL_TERMS
 
 # ---------------------------------------------------------------------------
@@ -29,6 +29,8 @@ _INPUT_DIR     = os.path.join(constants.INPUT_DIRECTORY, "MonoBehaviour")
 _OUTPUT_DIR    = os.path.join(constants.OUTPUT_DIRECTORY, "Wiki Formatted", "NPC Schedules")
 _DEBUG_LOG     = os.path.join(constants.DEBUG_DIRECTORY, "npc_path_debug.txt")
 
+_diagnostics = diagnostics.get_sink("npc_walk_schedule")
+
 # ---------------------------------------------------------------------------
 # Testing config (set to False for production runs)
 # ---------------------------------------------------------------------------
@@ -192,6 +194,7 @@ def _add_grouped_blocks(
 def run() -> None:
     file_utils.ensure_dir_exists(_OUTPUT_DIR)
     file_utils.ensure_dir_exists(os.path.dirname(_DEBUG_LOG))
+    _diagnostics.start()
 
     path_files = [
         f for f in os.listdir(_INPUT_DIR)
@@ -236,7 +239,9 @@ def run() -> None:
                     debug_groups["\n".join(path_lines)].append(filename.replace(".asset", ""))
 
             except Exception as exc:
-                file_utils.append_line(_DEBUG_LOG, f"[ERROR] Failed to parse {filename}: {exc}")
+                _diagnostics.record(
+                    "parse_error", f"Failed to parse {filename}: {exc}", severity="error", npc=npc, file=filename,
+                )
 
         schedule_lines = [f"{{{{Schedule |character = {npc}"]
         group_id = 1
@@ -311,6 +316,7 @@ def run() -> None:
         file_utils.write_lines(_DEBUG_LOG, [line + "\n" for line in debug_lines])
 
     print(f"✅ NPC schedules written to: {_OUTPUT_DIR}")
+    _diagnostics.print_summary()
 
 
 if __name__ == "__main__":
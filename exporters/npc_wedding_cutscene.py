@@ -18,6 +18,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import config.constants as constants
+from builders import localization
 from utils.text_utils import clean_game_dialogue, clean_whitespace
 
 # ---------------------------------------------------------------------------
@@ -73,44 +74,21 @@ def _clean_text(raw_text: str) -> str:
     return clean_whitespace(clean_game_dialogue(raw_text))
 
 
-def _parse_wedding_terms(prefab_path: str) -> dict:
-    """Return {term: cleaned_english_text} for all Wedding.* terms."""
-    if not os.path.exists(prefab_path):
-        raise FileNotFoundError(f"Missing prefab file: {prefab_path}")
-
+def _wedding_terms(table: localization.LocalizationTable) -> dict:
+    """Return {term: cleaned_english_text} for all Wedding.* terms in a localization table."""
     term_to_text: dict = {}
+    # Terms are stored raw (possibly YAML-quoted), so filter after unquoting
+    for term, raw_text in table.pairs():
+        term = _unquote_unescape(term)
+        if term.startswith("Wedding."):
+            term_to_text[term] = _clean_text(_unquote_unescape(raw_text))
 
-    term_line_re      = re.compile(r"^\s*-\s*Term:\s*(.+?)\s*$")
-    languages_line_re = re.compile(r"^\s*Languages:\s*$")
-    languages_item_re = re.compile(r"^\s*-\s*(.*)\s*$")
-
-    current_term       = None
-    want_languages_item = False
-
-    with open(prefab_path, "r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            term_match = term_line_re.match(line)
-            if term_match:
-                current_term        = _unquote_unescape(term_match.group(1))
-                want_languages_item = False
-                continue
-
-            if not current_term or not current_term.startswith("Wedding."):
-                continue
-
-            if languages_line_re.match(line):
-                want_languages_item = True
-                continue
+    return term_to_text
 
-            if want_languages_item:
-                item_match = languages_item_re.match(line)
-                if item_match:
-                    raw_text = _unquote_unescape(item_match.group(1))
-                    term_to_text[current_term] = _clean_text(raw_text)
-                    current_term        = None
-                    want_languages_item = False
 
-    return term_to_text
+def _parse_wedding_terms(prefab_path: str) -> dict:
+    """Return {term: cleaned_english_text} for all Wedding.* terms."""
+    return _wedding_terms(localization.load_table(prefab_path))
 
 # ---------------------------------------------------------------------------
 # Runner
@@ -4,9 +4,9 @@ Item recipe exporter.
 Accepts an ItemData object and returns the wikitext recipe markup for
 the Crafting section of an item page.
 
-Note: Recipe data is still loaded from the recipes JSON cache produced
-by the recipe builder (not yet migrated). Once a RecipeData / recipe
-builder exists this module will be updated to accept typed objects.
+Recipes come from the shared recipe index (builders/recipe_index.py),
+built from recipes_data.json on first use, so each item is a dict lookup
+rather than a scan over every recipe.
 
 Replaces: formatter/page_section/item_recipe.py
 """
@@ -18,13 +18,10 @@ import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-import config.constants as constants
 from builders.item_data import ItemData
+from builders.recipe_index import RecipeIndex, load_recipe_index
 from mappings.workbench_aliases import normalize_workbench
-from utils import json_utils
-from utils.text_utils import clean_whitespace
-
-_RECIPE_JSON_PATH = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "recipes_data.json")
+from utils import diagnostics
 
 
 # ---------------------------------------------------------------------------
@@ -59,44 +56,26 @@ def format_recipe(recipe: dict) -> str:
         f"|id = {recipe_id}\n"
         f"|recipesource =   }}}}"
     )
-_RECIPE_DATA: dict = json_utils.load_json(_RECIPE_JSON_PATH) or {}
-
-_debug_log_path = os.path.join(
-    constants.DEBUG_DIRECTORY, "pywikibot", "unknown_workbench_recipes.log"
-)
-os.makedirs(os.path.dirname(_debug_log_path), exist_ok=True)
-
-
-# ---------------------------------------------------------------------------
-# Internal helpers
-# ---------------------------------------------------------------------------
-
-def _normalize_name(name: str) -> str:
-    return clean_whitespace(name).lower()
 
 
-def _get_recipes_by_output_name(name: str) -> list[dict]:
-    """Return all valid recipe dicts whose output name matches the given name."""
-    norm = _normalize_name(name)
-    return [
-        r for r in _RECIPE_DATA.values()
-        if _normalize_name(r.get("output", {}).get("name", "")) == norm
-        and r.get("output", {}).get("name")
-        and r.get("inputs")
-    ]
+# Recorded per item page; create_item_pages starts the sink and prints its summary,
+# other callers get a fresh file on the sink's first write
+_diagnostics = diagnostics.get_sink("item_recipe")
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def export_recipe(item: ItemData) -> str:
+def export_recipe(item: ItemData, index: RecipeIndex | None = None) -> str:
     """
     Generate recipe wikitext for the Crafting section of an item page.
 
-    Returns ``{{Recipe/none}}`` when no valid recipes are found.
+    Pass ``index`` when formatting many items to skip the per-call freshness
+    check of recipes_data.json. Returns ``{{Recipe/none}}`` when no valid
+    recipes are found.
     """
-    recipes = _get_recipes_by_output_name(item.name)
+    recipes = (index if index is not None else load_recipe_index()).producing(item.name)
 
     valid_recipes = []
     unknown_recipes = []
@@ -106,11 +85,11 @@ def export_recipe(item: ItemData) -> str:
         workbench = normalize_workbench(raw_workbench)
 
         if workbench == "Unknown":
-            with open(_debug_log_path, "a", encoding="utf-8") as log:
-                log.write(
-                    f"{item.name} - RecipeID: {r.get('recipe_id', '?')} "
-                    f"- RawWorkbench: {raw_workbench}\n"
-                )
+            _diagnostics.record(
+                "unknown_workbench",
+                f"{item.name} - RecipeID: {r.get('recipe_id', '?')} - RawWorkbench: {raw_workbench}",
+                item=item.name, recipe_id=r.get("recipe_id"), workbench=raw_workbench,
+            )
             unknown_recipes.append(r)
             continue
 
@@ -120,3 +99,16 @@ def export_recipe(item: ItemData) -> str:
     formatted = [f for f in (format_recipe(r) for r in recipes_to_use) if f.strip()]
 
     return "\n".join(formatted) if formatted else "{{Recipe/none}}"
+
+
+def export_used_in(item: ItemData, index: RecipeIndex | None = None) -> str:
+    """
+    Generate a bulleted "Used in" list of the products crafted from the item.
+
+    Each product appears once, in recipes_data.json order. Returns an empty
+    string when the item is not an ingredient of any recipe.
+    """
+    products = dict.fromkeys(
+        r["output"]["name"] for r in (index if index is not None else load_recipe_index()).consuming(item.name)
+    )
+    return "\n".join(f"*[[{name}]]" for name in products)
@@ -17,9 +17,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 
 import config.constants as constants
 from builders.item_data import ItemData
+from builders.recipe_index import RecipeIndex
 from formatters.item.item_infobox import export_infobox
 from formatters.item.item_navbox import export_navbox
-from formatters.item.item_recipe import export_recipe
+from formatters.item.item_recipe import export_recipe, export_used_in
 from formatters.item.item_summary import export_summary
 
 # ---------------------------------------------------------------------------
@@ -28,6 +29,7 @@ from formatters.item.item_summary import export_summary
 
 INCLUDE_HISTORY_SECTION = True
 INCLUDE_UPCOMING_BANNER = True
+INCLUDE_USED_IN_LIST = False    # Static "Used in" list under {{Item as ingredient}}
 
 
 # ---------------------------------------------------------------------------
@@ -130,21 +132,28 @@ def _build_media_trivia_comment() -> str:
 # Public API
 # ---------------------------------------------------------------------------
 
-def export_item_page(item: ItemData, display_name: str | None = None) -> str:
+def export_item_page(
+    item: ItemData,
+    display_name: str | None = None,
+    recipes: RecipeIndex | None = None,
+) -> str:
     """
     Assemble and return the complete wikitext for an item page.
 
     Args:
         item:         The ItemData object from the builder.
         display_name: Override display name (defaults to item.name).
+        recipes:      Recipe index to use (defaults to the shared one).
     """
     title = display_name or item.name
     cls = item.classification
 
     infobox = export_infobox(item)
     summary = export_summary(item, display_name=title)
-    recipe_markup = export_recipe(item)
+    recipe_markup = export_recipe(item, recipes)
     navbox = export_navbox(item)
+    used_in = export_used_in(item, recipes) if INCLUDE_USED_IN_LIST else ""
+    used_in_block = f"\n{used_in}" if used_in else ""
 
     house_display = _build_house_display_section(item).strip()
     wallpaper_floor_display = _build_wallpaper_flooring_display(item).strip()
@@ -174,7 +183,7 @@ def export_item_page(item: ItemData, display_name: str | None = None) -> str:
 {{{{Item collected from}}}}
 
 ==Item Uses==
-{{{{Item as ingredient}}}}
+{{{{Item as ingredient}}}}{used_in_block}
 
 ==Gifting==
 ===Gifting to NPCs===
@@ -15,6 +15,7 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 import config.constants as constants
+from builders import item_store
 from builders.item_builder import _load_cache
 from utils import json_utils, text_utils
 
@@ -45,9 +46,7 @@ def load_item_lookup() -> dict:
         return hardcoded
 
     try:
-        items = _load_cache()
-        for item in items.values():
-            hardcoded[str(item.item_id)] = item.name
+        hardcoded.update(item_store.names_by_id(_load_cache()))
     except Exception:
         pass
 
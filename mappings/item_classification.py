@@ -1,274 +1,374 @@
-def classify_item(item):
+"""
+Item classification — maps an item to (itemType, subtype, category).
+
+The rules are data (_RULES, top to bottom, first match wins) compiled once
+into a small engine, because classification runs for every item in every
+build and in the wiki infobox compares:
+
+  1. Hash dispatch on the exact useDescription: each useDescription value
+     gets the ordered list of rule groups that can fire for it (its own
+     groups plus the ones with no useDescription condition).
+  2. Within a group, one multi-keyword matcher finds every keyword in the
+     lowercased name in a single scan; the earliest rule that hit wins.
+     House customization is one group keyed by description prefix.
+
+Rule order (unchanged):
+  1. Animals        — pet / barn / wild, by useDescription
+  2. Weapons        — great sword, sword, hammer (swing); crossbow (fire);
+                      staff / staves whose description grants toolbelt bonuses
+  3. Tools          — axe, pickaxe, rod, hoe, watering can, fishing net, scythe
+  4. Forageables    — isForageable: no foodStat → Item/Forageables/Resources,
+                      else Forageables/Food
+  5. Fish           — hasSetSeason set and foodStat non-empty
+  6. Consumables    — meals, or non-potion non-forageable food (tome / jam / food);
+                      potions
+  7-8. Records, mounts (useDescription)
+  9. House customization (description prefix: door / patio / roof / walls / windows)
+  10-11. Tiles, flooring, wallpaper (useDescription)
+  12. Furniture     — "(Left click to place)", subtype from name keywords, else Misc
+  13. Equipment     — with stats: accessories then armor; without: clothing
+Anything else is ("", "", "").
+
+Public API:
+  classify_item(item)  →  (itemType, subtype, category)
+                          item is an ItemData or an item dict (name /
+                          description / useDescription / stats / foodStat /
+                          isForageable / isPotion / isMeal / hasSetSeason)
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Callable, NamedTuple, Optional
+
+Result = tuple[str, str, str]
+
+# ---------------------------------------------------------------------------
+# Item facts
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class _Facts:
+    """The fields the rules read, taken once from an ItemData or an item dict."""
+    name: str               # lowercased
+    desc: str
+    use_desc: str
+    stats: object
+    food_stat: object
+    is_forageable: object
+    is_potion: object
+    is_meal: object
+    has_set_season: object
+
+
+def _facts(item) -> _Facts:
+    if isinstance(item, dict) or not hasattr(item, "use_description"):
+        return _Facts(
+            name=str(item.get("name") or item.get("Name") or "").lower(),
+            desc=item.get("description") or item.get("Description") or "",
+            use_desc=item.get("useDescription") or item.get("UseDescription") or "",
+            stats=item.get("stats", ""),
+            food_stat=item.get("foodStat", ""),
+            is_forageable=item.get("isForageable", 0),
+            is_potion=item.get("isPotion", 0),
+            is_meal=item.get("isMeal", 0),
+            has_set_season=item.get("hasSetSeason"),
+        )
+    # ItemData (its is_* flags are bools, which compare equal to the dict's 0 / 1)
+    return _Facts(
+        str(item.name or "").lower(),
+        item.description or "",
+        item.use_description or "",
+        item.stats,
+        item.food_stat,
+        item.is_forageable,
+        item.is_potion,
+        item.is_meal,
+        item.has_set_season,
+    )
+
+# ---------------------------------------------------------------------------
+# Rule definitions
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class RuleGroup:
     """
-    Given an item dictionary, returns a tuple (itemType, subtype, category)
-    based on the following rules.
-
-    Animal classification (highest priority):
-      - If useDescription is exactly:
-          "\"(Grab a leash to have them follow you!)\\n(Left click at house or farm to place)\""
-          then itemType = "Animal", subtype = "Pet", category = "".
-      - If useDescription is exactly "(Left click at farm to place)" and description is not empty,
-          then itemType = "Animal", subtype = "Barn Animal", category = "".
-      - If useDescription is exactly "(Left click at farm to place)" and description is empty,
-          then itemType = "Animal", subtype = "Wild Animal", category = "".
-
-    Weapon classification:
-      - If the item name contains "sword" and useDescription is exactly "(Left click to swing)",
-          then itemType = "Equipment", subtype = "Weapon", category = "Sword".
-      - If the item name contains "crossbow" and useDescription is exactly "(Left click to fire)",
-          then itemType = "Equipment", subtype = "Weapon", category = "Crossbow".
-      - If the item name contains "staff" or "staves" and the description in
-        lower case includes "when selected on your toolbelt, this staff grants",
-          then itemType = "Equipment", subtype = "Weapon", category = "Staff".
-
-    Tool classification:
-      - If the item name contains "axe" and useDescription is exactly "(Left click on trees to use)",
-          then itemType = "Equipment", subtype = "Tool", category = "Axe".
-      - If the item name contains "pickaxe" and useDescription is exactly "(Left click on a rock or decoration to use)",
-          then itemType = "Equipment", subtype = "Tool", category = "Pickaxe".
-      - If useDescription is exactly "(Press left click and hold to cast your line)",
-          then itemType = "Equipment", subtype = "Tool", category = "Rod".
-      - If useDescription is exactly "\"(Left click to hoe)\\n(Right click to unhoe)\"",
-          then itemType = "Equipment", subtype = "Tool", category = "Hoe".
-      - If useDescription is exactly "\"(Left click on tilled dirt to water)\\n(Left click on water to refill)\"",
-          then itemType = "Equipment", subtype = "Tool", category = "Watering Can".
-      - If the item name contains "fishing net",
-          then itemType = "Equipment", subtype = "Tool", category = "Net".
-      - If the item name contains "scythe" and useDescription is exactly "(Left click to swing)",
-          then itemType = "Equipment", subtype = "Tool", category = "Scythe".
-    
-    Forageable classification:
-      - If isForageable is 1:
-            * If foodStat is empty → itemType = "Item", subtype = "Forageables", category = "Resources".
-            * If foodStat is non-empty → itemType = "Forageables", subtype = "Food", category = "".
-    
-    Fish classification:
-      - If hasSetSeason is not None and foodStat is non-empty,
-          then itemType = "Fish", subtype = "", category = "".
-    
-    Consumable Food classification:
-      - If isPotion is 0, isForageable is 0, and foodStat is non-empty,
-          then itemType = "Consumable", subtype = "Food", category = "".
-    
-    Furniture classification:
-      - If useDescription is exactly "(Left click to place)":
-          then itemType = "Furniture" and subtype is determined by key phrases in the name.
-          (For example, if name contains "end table" or "nightstand", subtype = "Nightstand"; if "bed", then
-           subtype is "Bed"; etc.)
-          Category remains blank.
-    
-    Equipment fallback classification:
-      For items that do not match any of the above:
-      - If stats is non-empty (apply accessory then Armor rules):
-          * If the name contains "ring", then return "Equipment", "Accessory", "Ring".
-          * Else if the name contains "amulet", then return "Equipment", "Accessory", "Amulet".
-          * Else if the name contains "keepsake", then return "Equipment", "Accessory", "Keepsake".
-          * Else if name contains "helmet", then return "Equipment", "Armor", "Helmet".
-          * Else if name contains any of "robe", "chest", "chestplate", "chest plate", then return "Equipment", "Armor", "Chest".
-          * Else if name contains any of "gloves", "gauntlets", then return "Equipment", "Armor", "Gloves".
-          * Else if name contains any of "leg", "legs", "shoes", "pants", then return "Equipment", "Armor", "Legs".
-          * Else if name contains any of "cape", "wings", "back", then return "Equipment", "Armor", "Cape".
-      - If stats is empty, apply Clothing rules:
-          * If name contains any of "hat", "crown", "headband", "headphones", "hood", "goggles", "tiara",
-            "helmet", "head scarf", "beanie", "halo", "helm", then return "Equipment", "Clothing", "Hat".
-          * Else if name contains "wig", then return "Equipment", "Clothing", "Wig".
-          * Else if name contains "dress" or "robe", then return "Equipment", "Clothing", "Dress".
-          * Else if name contains any of "chest", "gown", "toga", "kimono", "chestplate", "chest plate", 
-            "shirt", "tank top", "hoodie", "jacket", "crop top", "sweater", "torso", "costume", "outfit",
-            "vest", "coat", "tee", "t-shirt", "blouse", "suit", "cover up", then return "Equipment", "Clothing", "Shirt".
-          * Else if name contains any of "gloves", "gauntlets", then return "Equipment", "Clothing", "Gloves".
-          * Else if name contains any of "cape", "wings", "tail", then return "Equipment", "Clothing", "Cape".
-          * Else if name contains any of "pants", "slacks", "shoes", "boots", "greaves", then return "Equipment", "Clothing", "Pants".
-          * Else if name contains "shorts", then return "Equipment", "Clothing", "Shorts".
-          * Else if name contains any of "skirt", "skirts", then return "Equipment", "Clothing", "Skirt".
+    Consecutive rules sharing one guard. The group fires when use_desc (if
+    set) equals the item's useDescription and when(facts) (if set) is true;
+    the result is the first names entry with a keyword in the name, the
+    first matching desc_prefixes entry, or else default (None: no match).
     """
+    use_desc: Optional[str] = None
+    when: Optional[Callable[[_Facts], bool]] = None
+    names: tuple[tuple[tuple[str, ...], Result], ...] = ()
+    desc_prefixes: tuple[tuple[str, Result], ...] = ()
+    default: Optional[Result] = None
+
+
+_PET_USE_DESC   = "\"(Grab a leash to have them follow you!)\\n(Left click at house or farm to place)\""
+_FARM_USE_DESC  = "(Left click at farm to place)"
+_SWING_USE_DESC = "(Left click to swing)"
+_PLACE_USE_DESC = "(Left click to place)"
+
+
+def _is_food_consumable(f: _Facts) -> bool:
+    return f.is_meal == 1 or bool(f.is_potion == 0 and f.is_forageable == 0 and f.food_stat)
+
+
+_RULES: tuple[RuleGroup, ...] = (
+    # 1. Animals
+    RuleGroup(use_desc=_PET_USE_DESC, default=("Animal", "Pet", "")),
+    RuleGroup(use_desc=_FARM_USE_DESC, when=lambda f: bool(f.desc and f.desc.strip()),
+              default=("Animal", "Barn Animal", "")),
+    RuleGroup(use_desc=_FARM_USE_DESC, default=("Animal", "Wild Animal", "")),
+
+    # 2. Weapons
+    RuleGroup(use_desc=_SWING_USE_DESC, names=(
+        (("great sword",), ("Equipment", "Weapon", "Great Sword")),
+        (("sword",),       ("Equipment", "Weapon", "Sword")),
+        (("hammer",),      ("Equipment", "Weapon", "Hammer")),
+    )),
+    RuleGroup(use_desc="(Left click to fire)", names=(
+        (("crossbow",), ("Equipment", "Weapon", "Crossbow")),
+    )),
+    RuleGroup(
+        when=lambda f: bool(f.desc) and "when selected on your toolbelt, this staff grants" in f.desc.lower(),
+        names=((("staff", "staves"), ("Equipment", "Weapon", "Staff")),),
+    ),
+
+    # 3. Tools
+    RuleGroup(use_desc="(Left click on trees to use)", names=(
+        (("axe",), ("Equipment", "Tool", "Axe")),
+    )),
+    RuleGroup(use_desc="(Left click on a rock or decoration to use)", names=(
+        (("pickaxe",), ("Equipment", "Tool", "Pickaxe")),
+    )),
+    RuleGroup(use_desc="(Press left click and hold to cast your line)", default=("Equipment", "Tool", "Rod")),
+    RuleGroup(use_desc="\"(Left click to hoe)\\n(Right click to unhoe)\"", default=("Equipment", "Tool", "Hoe")),
+    RuleGroup(use_desc="\"(Left click on tilled dirt to water)\\n(Left click on water to refill)\"",
+              default=("Equipment", "Tool", "Watering Can")),
+    RuleGroup(names=((("fishing net",), ("Equipment", "Tool", "Net")),)),
+    RuleGroup(use_desc=_SWING_USE_DESC, names=(
+        (("scythe",), ("Equipment", "Tool", "Scythe")),
+    )),
+
+    # 4. Forageables (non-food → resources; food is mapped to the Consumable infobox later)
+    RuleGroup(when=lambda f: f.is_forageable == 1 and not f.food_stat, default=("Item", "Forageables", "Resources")),
+    RuleGroup(when=lambda f: f.is_forageable == 1, default=("Forageables", "Food", "")),
+
+    # 5. Fish
+    RuleGroup(when=lambda f: f.has_set_season is not None and bool(f.food_stat), default=("Fish", "", "")),
+
+    # 6. Consumables
+    RuleGroup(when=_is_food_consumable, names=(
+        (("tome",), ("Consumable", "Tome", "")),
+        (("jam",),  ("Consumable", "Jam", "")),
+    ), default=("Consumable", "Food", "")),
+    RuleGroup(when=lambda f: f.is_potion == 1, default=("Consumable", "Potion", "")),
+
+    # 7. Records
+    RuleGroup(use_desc="(Use on record player to play)", default=("Item", "Record", "")),
+
+    # 8. Mounts
+    RuleGroup(use_desc="(Left click to summon/unsummon mount)", default=("Item", "Mount", "")),
 
-    raw_name = item.get("name") or item.get("Name") or ""
-    name = str(raw_name).lower()
-
-    desc = item.get("description") or item.get("Description") or ""
-    use_desc = item.get("useDescription") or item.get("UseDescription") or ""
-
-    stats = item.get("stats", "")
-    foodStat = item.get("foodStat", "")
-    isForageable = item.get("isForageable", 0)
-    isPotion = item.get("isPotion", 0)
-    isMeal = item.get("isMeal", 0)
-    hasSetSeason = item.get("hasSetSeason")
-
-    # 1. Animal classification.
-    if use_desc == "\"(Grab a leash to have them follow you!)\\n(Left click at house or farm to place)\"":
-        return "Animal", "Pet", ""
-    elif use_desc == "(Left click at farm to place)":
-        if desc and desc.strip():
-            return "Animal", "Barn Animal", ""
-        else:
-            return "Animal", "Wild Animal", ""
-
-    # 2. Weapon classification.
-    if "great sword" in name and use_desc == "(Left click to swing)":
-        return "Equipment", "Weapon", "Great Sword"
-    if "sword" in name and use_desc == "(Left click to swing)":
-        return "Equipment", "Weapon", "Sword"
-    if "hammer" in name and use_desc == "(Left click to swing)":
-        return "Equipment", "Weapon", "Hammer"
-    if "crossbow" in name and use_desc == "(Left click to fire)":
-        return "Equipment", "Weapon", "Crossbow"
-    if ("staff" in name or "staves" in name) and desc and "when selected on your toolbelt, this staff grants" in desc.lower():
-        return "Equipment", "Weapon", "Staff"
-
-    # 3. Tool classification.
-    if "axe" in name and use_desc == "(Left click on trees to use)":
-        return "Equipment", "Tool", "Axe"
-    if "pickaxe" in name and use_desc == "(Left click on a rock or decoration to use)":
-        return "Equipment", "Tool", "Pickaxe"
-    if use_desc == "(Press left click and hold to cast your line)":
-        return "Equipment", "Tool", "Rod"
-    if use_desc == "\"(Left click to hoe)\\n(Right click to unhoe)\"":
-        return "Equipment", "Tool", "Hoe"
-    if use_desc == "\"(Left click on tilled dirt to water)\\n(Left click on water to refill)\"":
-        return "Equipment", "Tool", "Watering Can"
-    if "fishing net" in name:
-        return "Equipment", "Tool", "Net"
-    if "scythe" in name and use_desc == "(Left click to swing)":
-        return "Equipment", "Tool", "Scythe"
-
-    # 4. Forageable classification.
-    if isForageable == 1:
-        if not foodStat:
-            # NON-FOOD forageables → Item + Forageables/Resources
-            return "Item", "Forageables", "Resources"
-        else:
-            # FOOD forageables → Forageables/Food (mapped to Consumable infobox later)
-            return "Forageables", "Food", ""
-
-    # 5. Fish classification.
-    if hasSetSeason is not None and foodStat:
-        return "Fish", "", ""
-
-    # 6. Consumable classification.
-    if isMeal == 1 or (isPotion == 0 and isForageable == 0 and foodStat):
-        if "tome" in name.lower():
-            return "Consumable", "Tome", ""
-        if "jam" in name.lower():
-            return "Consumable", "Jam", ""
-        return "Consumable", "Food", ""
-
-    if isPotion == 1:
-        return "Consumable", "Potion", ""
-
-    # 7. Record classification.
-    if use_desc == "(Use on record player to play)":
-        return "Item", "Record", ""
-
-    # 8. Mount classification.
-    if use_desc == "(Left click to summon/unsummon mount)":
-        return "Item", "Mount", ""
-
-    # 9. House Customization
-    if desc.startswith("Customizes your house's door in a "):
-        return "Item", "House Customization", "Door"
-    if desc.startswith("Customizes your house's patio in a "):
-        return "Item", "House Customization", "Patio"
-    if desc.startswith("Customizes your house's roof in a "):
-        return "Item", "House Customization", "Roof"
-    if desc.startswith("Customizes your house's walls in a "):
-        return "Item", "House Customization", "Walls"
-    if desc.startswith("Customizes your house's windows in a "):
-        return "Item", "House Customization", "Windows"
+    # 9. House customization
+    RuleGroup(desc_prefixes=(
+        ("Customizes your house's door in a ",    ("Item", "House Customization", "Door")),
+        ("Customizes your house's patio in a ",   ("Item", "House Customization", "Patio")),
+        ("Customizes your house's roof in a ",    ("Item", "House Customization", "Roof")),
+        ("Customizes your house's walls in a ",   ("Item", "House Customization", "Walls")),
+        ("Customizes your house's windows in a ", ("Item", "House Customization", "Windows")),
+    )),
 
     # 10. Flooring
-    if use_desc == "(Left click to place path on farm)":
-        return "Furniture", "Tile", ""
-    if use_desc == "(Use on floor to place)":
-        return "Furniture", "Flooring", ""
+    RuleGroup(use_desc="(Left click to place path on farm)", default=("Furniture", "Tile", "")),
+    RuleGroup(use_desc="(Use on floor to place)", default=("Furniture", "Flooring", "")),
 
     # 11. Wallpaper
-    if use_desc == "(Use on a wall to place)":
-        return "Furniture", "Wallpaper", ""
-
-    # 12. Other Furniture classification.
-    if use_desc == "(Left click to place)":
-        if "end table" in name or "nightstand" in name or "night stand" in name:
-            return "Furniture", "Nightstand", ""
-        if "bed" in name:
-            return "Furniture", "Bed", ""
-        if "bridge" in name:
-            return "Furniture", "Bridge", ""
-        if "bookcase" in name:
-            return "Furniture", "Bookcase", ""
-        if "couch" in name:
-            return "Furniture", "Couch", ""
-        if any(k in name for k in ["chair", "floor cushion", "stool"]):
-            return "Furniture", "Chair", ""
-        if "chest" in name:
-            return "Furniture", "Chest", ""
-        if any(k in name for k in ["Fence", "Fences"]):
-            return "Furniture", "Fence", ""
-        if "fireplace" in name:
-            return "Furniture", "Fireplace", ""
-        if "gate" in name:
-            return "Furniture", "Fence Gate", ""
-        if "painting" in name:
-            return "Furniture", "Painting", ""
-        if any(k in name for k in ["statue", "sculpture", "model", "column"]):
-            return "Furniture", "Statue", ""
-        if any(k in name for k in ["plant", "tree", "vase", "cactus", "flower", "seaweed", "bush", "leaf", "ivy"]):
-            return "Furniture", "Plant", ""
-        if any(k in name for k in ["light", "lamp", "lantern", "candle", "candelabra"]):
-            return "Furniture", "Lighting", ""
-        if any(k in name for k in ["plushie", "plush"]):
-            return "Furniture", "Plushie", ""
-        if any(k in name for k in ["rug", "mat", "doormat"]):
-            return "Furniture", "Rug", ""
-        if "shelf" in name:
-            return "Furniture", "Shelf", ""
-        if "table" in name:
-            return "Furniture", "Table", ""
-        if any(k in name for k in ["wardrobe", "dresser"]):
-            return "Furniture", "Wardrobe", ""
-        if any(k in name for k in ["window", "windows"]):
-            return "Furniture", "Window", ""
-        if "selling portal" in name:
-            return "Furniture", "Selling Portal", ""
-        return "Furniture", "Misc", ""
-
-    # 13. Equipment fallback classification.
-    if stats:
-        if "ring" in name:
-            return "Equipment", "Accessory", "Ring"
-        if "amulet" in name:
-            return "Equipment", "Accessory", "Amulet"
-        if "keepsake" in name:
-            return "Equipment", "Accessory", "Keepsake"
-        if "helmet" in name:
-            return "Equipment", "Armor", "Helmet"
-        if any(k in name for k in ["robe", "chest", "chestplate", "chest plate"]):
-            return "Equipment", "Armor", "Chest"
-        if any(k in name for k in ["gloves", "gauntlets"]):
-            return "Equipment", "Armor", "Gloves"
-        if any(k in name for k in ["leg", "legs", "shoes", "pants"]):
-            return "Equipment", "Armor", "Legs"
-        if any(k in name for k in ["cape", "wings", "back"]):
-            return "Equipment", "Armor", "Cape"
-    else:
-        if any(k in name for k in ["hat", "cap", "crown", "headband", "headphones", "hood", "goggles", "tiara", "helmet", "head scarf", "beanie", "halo", "helm"]):
-            return "Equipment", "Clothing", "Hat"
-        if "wig" in name:
-            return "Equipment", "Clothing", "Wig"
-        if "dress" in name or "robe" in name:
-            return "Equipment", "Clothing", "Dress"
-        if any(k in name for k in ["chest", "gown", "toga", "kimono", "chestplate", "chest plate", "shirt", "tank top", "hoodie", "jacket", "crop top", "sweater", "torso", "costume", "outfit", "vest", "coat", "tee", "t-shirt", "blouse", "suit", "cover up"]):
-            return "Equipment", "Clothing", "Shirt"
-        if any(k in name for k in ["gloves", "gauntlets"]):
-            return "Equipment", "Clothing", "Gloves"
-        if any(k in name for k in ["cape", "wings", "tail"]):
-            return "Equipment", "Clothing", "Cape"
-        if any(k in name for k in ["pants", "slacks", "shoes", "boots", "greaves"]):
-            return "Equipment", "Clothing", "Pants"
-        if "shorts" in name:
-            return "Equipment", "Clothing", "Shorts"
-        if any(k in name for k in ["skirt", "skirts"]):
-            return "Equipment", "Clothing", "Skirt"
-
-    return "", "", ""
+    RuleGroup(use_desc="(Use on a wall to place)", default=("Furniture", "Wallpaper", "")),
+
+    # 12. Other furniture ("Fence" / "Fences" are capitalized, so never hit the lowercased name)
+    RuleGroup(use_desc=_PLACE_USE_DESC, names=(
+        (("end table", "nightstand", "night stand"),              ("Furniture", "Nightstand", "")),
+        (("bed",),                                                ("Furniture", "Bed", "")),
+        (("bridge",),                                             ("Furniture", "Bridge", "")),
+        (("bookcase",),                                           ("Furniture", "Bookcase", "")),
+        (("couch",),                                              ("Furniture", "Couch", "")),
+        (("chair", "floor cushion", "stool"),                     ("Furniture", "Chair", "")),
+        (("chest",),                                              ("Furniture", "Chest", "")),
+        (("Fence", "Fences"),                                     ("Furniture", "Fence", "")),
+        (("fireplace",),                                          ("Furniture", "Fireplace", "")),
+        (("gate",),                                               ("Furniture", "Fence Gate", "")),
+        (("painting",),                                           ("Furniture", "Painting", "")),
+        (("statue", "sculpture", "model", "column"),              ("Furniture", "Statue", "")),
+        (("plant", "tree", "vase", "cactus", "flower", "seaweed", "bush", "leaf", "ivy"),
+                                                                  ("Furniture", "Plant", "")),
+        (("light", "lamp", "lantern", "candle", "candelabra"),    ("Furniture", "Lighting", "")),
+        (("plushie", "plush"),                                    ("Furniture", "Plushie", "")),
+        (("rug", "mat", "doormat"),                               ("Furniture", "Rug", "")),
+        (("shelf",),                                              ("Furniture", "Shelf", "")),
+        (("table",),                                              ("Furniture", "Table", "")),
+        (("wardrobe", "dresser"),                                 ("Furniture", "Wardrobe", "")),
+        (("window", "windows"),                                   ("Furniture", "Window", "")),
+        (("selling portal",),                                     ("Furniture", "Selling Portal", "")),
+    ), default=("Furniture", "Misc", "")),
+
+    # 13. Equipment fallback — accessories / armor with stats, clothing without
+    RuleGroup(when=lambda f: bool(f.stats), names=(
+        (("ring",),                                      ("Equipment", "Accessory", "Ring")),
+        (("amulet",),                                    ("Equipment", "Accessory", "Amulet")),
+        (("keepsake",),                                  ("Equipment", "Accessory", "Keepsake")),
+        (("helmet",),                                    ("Equipment", "Armor", "Helmet")),
+        (("robe", "chest", "chestplate", "chest plate"), ("Equipment", "Armor", "Chest")),
+        (("gloves", "gauntlets"),                        ("Equipment", "Armor", "Gloves")),
+        (("leg", "legs", "shoes", "pants"),              ("Equipment", "Armor", "Legs")),
+        (("cape", "wings", "back"),                      ("Equipment", "Armor", "Cape")),
+    )),
+    RuleGroup(when=lambda f: not f.stats, names=(
+        (("hat", "cap", "crown", "headband", "headphones", "hood", "goggles", "tiara", "helmet",
+          "head scarf", "beanie", "halo", "helm"),                                        ("Equipment", "Clothing", "Hat")),
+        (("wig",),                                                                        ("Equipment", "Clothing", "Wig")),
+        (("dress", "robe"),                                                               ("Equipment", "Clothing", "Dress")),
+        (("chest", "gown", "toga", "kimono", "chestplate", "chest plate", "shirt", "tank top", "hoodie",
+          "jacket", "crop top", "sweater", "torso", "costume", "outfit", "vest", "coat", "tee",
+          "t-shirt", "blouse", "suit", "cover up"),                                       ("Equipment", "Clothing", "Shirt")),
+        (("gloves", "gauntlets"),                                                         ("Equipment", "Clothing", "Gloves")),
+        (("cape", "wings", "tail"),                                                       ("Equipment", "Clothing", "Cape")),
+        (("pants", "slacks", "shoes", "boots", "greaves"),                                ("Equipment", "Clothing", "Pants")),
+        (("shorts",),                                                                     ("Equipment", "Clothing", "Shorts")),
+        (("skirt", "skirts"),                                                             ("Equipment", "Clothing", "Skirt")),
+    )),
+)
+
+_NO_MATCH: Result = ("", "", "")
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+def _trie_pattern(words) -> str:
+    """
+    A regex for any of words, factored by shared prefixes ("chest", "chestplate",
+    "chest plate" → chest(?: plate|plate)?), so each position costs one pass
+    down the trie instead of one attempt per keyword. Greedy: the longest
+    word starting at a position is the one that matches.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+class _KeywordMatcher:
+    """
+    Returns the result of the earliest (keywords, result) entry with any
+    keyword inside the name — the same answer as testing the entries'
+    `kw in name` in order — from one regex scan.
+    """
+
+    def __init__(self, entries: tuple[tuple[tuple[str, ...], Result], ...]):
+        self._results = [result for _, result in entries]
+        first_entry: dict[str, int] = {}
+        for index, (keywords, _) in enumerate(entries):
+            for kw in keywords:
+                first_entry.setdefault(kw, index)
+        # At each position the scan reports only the longest keyword starting
+        # there; every shorter keyword starting at the same spot is a prefix
+        # of it, so fold their entries into the longest one's rank.
+        self._rank = {
+            kw: min(i for other, i in first_entry.items() if kw.startswith(other))
+            for kw in first_entry
+        }
+        pattern = _trie_pattern(first_entry)
+        self.search = re.compile(pattern).search
+        self._scan = re.compile("(?=(" + pattern + "))")
+
+    def resolve(self, name: str, start: int = 0) -> Result:
+        """The winning entry's result, given that some keyword starts at or after start."""
+        rank = self._rank
+        return self._results[min(rank[kw] for kw in self._scan.findall(name, start))]
+
+    def __call__(self, name: str) -> Optional[Result]:
+        # Most names miss most groups: one search rules them out before the full scan
+        first = self.search(name)
+        return None if first is None else self.resolve(name, first.start())
+
+
+class _CompiledGroup(NamedTuple):
+    """A RuleGroup ready to run: a plain tuple, so classify_item unpacks it instead of calling methods."""
+    names_first: bool                       # no default → a name hit is required; scan before the guard
+    search: Optional[Callable]              # names.search: any keyword in the name at all?
+    when: Optional[Callable[[_Facts], bool]]
+    names: Optional[_KeywordMatcher]
+    prefix_re: Optional[re.Pattern]
+    prefixes: dict[str, Result]
+    default: Optional[Result]
+
+    @classmethod
+    def of(cls, group: RuleGroup) -> "_CompiledGroup":
+        names = _KeywordMatcher(group.names) if group.names else None
+        return cls(
+            names_first=group.default is None and names is not None,
+            search=names.search if names is not None else None,
+            when=group.when,
+            names=names,
+            prefix_re=(
+                re.compile("|".join(re.escape(p) for p, _ in group.desc_prefixes))
+                if group.desc_prefixes else None
+            ),
+            prefixes=dict(group.desc_prefixes),
+            default=group.default,
+        )
+
+
+def _compile(rules: tuple[RuleGroup, ...]) -> tuple[dict[str, tuple[_CompiledGroup, ...]], tuple[_CompiledGroup, ...]]:
+    """(useDescription → ordered groups that can fire for it, groups for any other useDescription)."""
+    compiled = [(rule.use_desc, _CompiledGroup.of(rule)) for rule in rules]
+    unkeyed = tuple(group for use_desc, group in compiled if use_desc is None)
+    by_use_desc = {
+        value: tuple(group for use_desc, group in compiled if use_desc in (None, value))
+        for value in {rule.use_desc for rule in rules if rule.use_desc is not None}
+    }
+    return by_use_desc, unkeyed
+
+
+_BY_USE_DESC, _UNKEYED = _compile(_RULES)
+
+
+def classify_item(item) -> Result:
+    """(itemType, subtype, category) for an ItemData or item dict; ("", "", "") when no rule matches."""
+    facts = _facts(item)
+    name = facts.name
+    for names_first, search, when, names, prefix_re, prefixes, default in _BY_USE_DESC.get(facts.use_desc, _UNKEYED):
+        if names_first:
+            first = search(name)
+            if first is not None and (when is None or when(facts)):
+                return names.resolve(name, first.start())
+            continue
+        if when is not None and not when(facts):
+            continue
+        if names is not None:
+            hit = names(name)
+            if hit is not None:
+                return hit
+        if prefix_re is not None:
+            match = prefix_re.match(facts.desc)
+            if match:
+                return prefixes[match.group()]
+        if default is not None:
+            return default
+    return _NO_MATCH
@@ -0,0 +1,192 @@
+"""
+Structured diagnostics — buffered JSON-lines sink shared by builders,
+exporters and formatters.
+
+Each stage records its [MISSING] / [CONFLICT] style notes through one sink
+instead of appending them to a text log line by line. Records are held in
+memory and written in batches to:
+
+  <DEBUG_DIRECTORY>/diagnostics/<stage>.jsonl
+
+one JSON object per line:
+
+  {"stage": "recipe_builder", "severity": "warning", "category": "missing_id",
+   "message": "ID 123 not found for 'Apple' in ...", "item_id": "123", ...}
+
+so patch-day triage can filter by category or field (jq, pandas, grep).
+
+Usage in a stage:
+
+    _diagnostics = diagnostics.get_sink("recipe_builder")
+
+    def run():
+        _diagnostics.start()                  # truncate last run's file
+        ...
+        _diagnostics.record("missing_id", "ID 123 not found", item_id="123")
+        ...
+        _diagnostics.print_summary()          # flush + counts per category
+
+Buffered records are also flushed when the buffer fills and at interpreter
+exit. Pool workers exit without running atexit handlers, so they hand
+their records to the parent with drain_all() / extend_all().
+
+A sink whose stage never called start() (e.g. a formatter used from a
+wiki script) truncates its file on its first write in the process, so
+the file always holds a single run.
+
+Public API:
+  get_sink(stage)        →  DiagnosticsSink   (one per stage per process)
+  flush_all()            →  None
+  drain_all()            →  list[dict]        (take buffered records from every sink)
+  extend_all(records)    →  None              (route drained records to their sinks)
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sys
+import threading
+from collections import Counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import config.constants as constants
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+_DIAGNOSTICS_DIR = os.path.join(constants.DEBUG_DIRECTORY, "diagnostics")
+_BUFFER_SIZE     = 500
+
+SEVERITIES = ("info", "warning", "error")
+
+# ---------------------------------------------------------------------------
+# Sink
+# ---------------------------------------------------------------------------
+
+class DiagnosticsSink:
+    """Buffered JSON-lines writer for one stage's diagnostics."""
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.path = os.path.join(_DIAGNOSTICS_DIR, f"{stage}.jsonl")
+        self._buffer: list[dict] = []
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self) -> None:
+        """Begin a fresh run: drop buffered records, reset counts and truncate the file."""
+        with self._lock:
+            self._buffer.clear()
+            self._counts.clear()
+            os.makedirs(_DIAGNOSTICS_DIR, exist_ok=True)
+            open(self.path, "w", encoding="utf-8").close()
+            self._started = True
+
+    def record(self, category: str, message: str, severity: str = "warning", **fields) -> None:
+        """Buffer one diagnostic. Extra keyword fields are stored alongside the message."""
+        if severity not in SEVERITIES:
+            raise ValueError(f"Unknown severity '{severity}' (expected one of {SEVERITIES})")
+        entry = {
+            "stage":    self.stage,
+            "severity": severity,
+            "category": category,
+            "message":  message,
+            **fields,
+        }
+        self._add([entry])
+
+    def extend(self, records: list[dict]) -> None:
+        """Add records drained from another process."""
+        if records:
+            self._add(records)
+
+    def drain(self) -> list[dict]:
+        """Remove and return the buffered records without writing them."""
+        with self._lock:
+            records, self._buffer = self._buffer, []
+            return records
+
+    def flush(self) -> None:
+        with self._lock:
+            self._write_locked()
+
+    def summary(self) -> dict[str, int]:
+        """Counts per category recorded since start(), most frequent first."""
+        with self._lock:
+            return dict(self._counts.most_common())
+
+    def print_summary(self) -> None:
+        """Flush, then print a one-line summary of this run's diagnostics."""
+        self.flush()
+        counts = self.summary()
+        if not counts:
+            return
+        total = sum(counts.values())
+        detail = ", ".join(f"{n} {category}" for category, n in counts.items())
+        print(f"📋 {total} diagnostics ({detail}) → {self.path}")
+
+    # --- Internal ---
+
+    def _add(self, records: list[dict]) -> None:
+        with self._lock:
+            self._buffer.extend(records)
+            for entry in records:
+                self._counts[entry["category"]] += 1
+            if len(self._buffer) >= _BUFFER_SIZE:
+                self._write_locked()
+
+    def _write_locked(self) -> None:
+        if not self._buffer:
+            return
+        os.makedirs(_DIAGNOSTICS_DIR, exist_ok=True)
+        lines = "".join(json.dumps(entry, ensure_ascii=False, default=str) + "\n" for entry in self._buffer)
+        # First write without start(): replace last run's file instead of appending to it
+        with open(self.path, "a" if self._started else "w", encoding="utf-8") as f:
+            f.write(lines)
+        self._started = True
+        self._buffer.clear()
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+_sinks: dict[str, DiagnosticsSink] = {}
+_sinks_lock = threading.Lock()
+
+
+def get_sink(stage: str) -> DiagnosticsSink:
+    """Return the process-wide sink for a stage, creating it on first use."""
+    with _sinks_lock:
+        sink = _sinks.get(stage)
+        if sink is None:
+            sink = _sinks[stage] = DiagnosticsSink(stage)
+        return sink
+
+
+def flush_all() -> None:
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+    for sink in sinks:
+        sink.flush()
+
+
+def drain_all() -> list[dict]:
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+    return [entry for sink in sinks for entry in sink.drain()]
+
+
+def extend_all(records: list[dict]) -> None:
+    by_stage: dict[str, list[dict]] = {}
+    for entry in records:
+        by_stage.setdefault(entry["stage"], []).append(entry)
+    for stage, entries in by_stage.items():
+        get_sink(stage).extend(entries)
+
+
+atexit.register(flush_all)
@@ -0,0 +1,423 @@
+"""
+Fish spawn engine — spawn probability tensor for every fish, pool, level and skill combination.
+
+A fishing spot rolls one fish from a pool of drops. Each drop's weight is
+
+  drop_chance × rarity adjustment(skills) × rarity odds(level)
+
+  rarity odds        Rare / Epic / Legendary lerp from level 0 to 120
+                     (Common is always 1.0)
+  rarity adjustment  1 + 0.05 × Familiar Waters            for Epic
+                     1 + 0.05 × Familiar Waters
+                       + 0.1 × Advanced Fish Mapping       for Legendary
+
+and its spawn chance is weight / pool total × 100. Every fish spawner in a
+scene rolls from its own pools: a spawner without seasonal fish has one
+"Any" pool; a seasonal spawner has an "Any" pool of its year-round fish
+plus one pool per season (year-round + that season's fish).
+
+build() evaluates every pool entry at every level (0–120) and skill
+combination in one vectorized pass, giving
+
+  chance[entry, level, familiar_waters, advanced_fish_mapping]   (percent)
+
+save() writes the tensor as JSON Data/fish_spawn_table.npy (memory-mapped
+by load()) with a .json sidecar holding the pools, axes, the size/mtime of
+the source files, a hash of this module's source and the caller's key (a
+hash of whatever else the table was built from, e.g. the scene → location
+mapping); load() returns None when the table is missing or stale.
+
+Public API:
+  build(fish_spawner_data, items_by_name, scene_locations)  →  SpawnTable
+  load(path, sources, key="")                               →  SpawnTable | None
+  SpawnTable
+    .percentages(pool, level, familiar_waters, advanced_fish_mapping)  →  {fish: %}
+    .curve(pool, fish, familiar_waters, advanced_fish_mapping)         →  ndarray (per level)
+    .extremes(pool, fish)                                              →  (min %, max %)
+    .location_rows(min_query, max_query)                               →  [row dict, ...]
+    .save(path, sources, key="")
+    .write_curves_csv(path, skills) / .write_curves_json(path, skills)
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from typing import Iterable, Mapping
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+import config.constants as constants
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+LEVELS = np.arange(0, 121)                           # fishing levels 0–120
+FAMILIAR_WATERS_VALUES       = (0, 5, 10, 15)        # skill bonus, none → max
+ADVANCED_FISH_MAPPING_VALUES = (0, 10, 20, 30)
+
+# (level, familiar waters, advanced fish mapping) quoted as min / max on the wiki
+MIN_QUERY = (1, 0, 0)
+MAX_QUERY = (70, 15, 30)
+
+# Skill combinations written by the curve exports (no skills, max skills)
+CURVE_SKILLS = ((0, 0), (15, 30))
+
+SEASON_NAMES = {0: "Spring", 1: "Summer", 2: "Fall", 3: "Winter"}
+
+_RARITY_ODDS = {                                     # (odds at level 0, odds at level 120)
+    "Rare":      (0.8, 3.35),
+    "Epic":      (0.675, 4.25),
+    "Legendary": (0.55, 5.0),
+}
+
+_TABLE_VERSION = 2
+
+# ---------------------------------------------------------------------------
+# Table
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Pool:
+    """
+    One spawn pool: entries start:stop of the table. rows lists the fish
+    the wiki rows are emitted for, in order, as (name, skip_if_absent);
+    seasonal fish absent from the pool are listed with a 0 chance.
+    spawner is the index of the fish spawner in the scene's "spawners" list.
+    """
+    scene: str
+    location: str
+    season: str
+    start: int
+    stop: int
+    rows: tuple[tuple[str, bool], ...]
+    spawner: int = 0
+
+
+class SpawnTable:
+    """Spawn chances (percent) for every pool entry × level × Familiar Waters × Advanced Fish Mapping."""
+
+    def __init__(
+        self,
+        chance: np.ndarray,
+        fish: list[str],
+        pools: list[Pool],
+        familiar_waters: Iterable[float] = FAMILIAR_WATERS_VALUES,
+        advanced_fish_mapping: Iterable[float] = ADVANCED_FISH_MAPPING_VALUES,
+    ):
+        self.chance = chance
+        self.fish = fish
+        self.pools = pools
+        self.familiar_waters = tuple(familiar_waters)
+        self.advanced_fish_mapping = tuple(advanced_fish_mapping)
+
+    # --- Queries ---
+
+    def _axes(self, level: int, familiar_waters: float, advanced_fish_mapping: float) -> tuple[int, int, int]:
+        try:
+            return (
+                int(level) - int(LEVELS[0]),
+                self.familiar_waters.index(familiar_waters),
+                self.advanced_fish_mapping.index(advanced_fish_mapping),
+            )
+        except ValueError:
+            raise ValueError(
+                f"Skill values must be on the table grid: familiar waters {self.familiar_waters}, "
+                f"advanced fish mapping {self.advanced_fish_mapping}"
+            ) from None
+
+    def _entries(self, pool: Pool) -> dict[str, int]:
+        """{fish: entry index}; a fish listed twice keeps its last entry."""
+        return {self.fish[i]: i for i in range(pool.start, pool.stop)}
+
+    def percentages(
+        self,
+        pool: Pool,
+        level: int,
+        familiar_waters: float = 0,
+        advanced_fish_mapping: float = 0,
+    ) -> dict[str, float]:
+        """{fish: spawn %} for one pool at any level and skill combination."""
+        lvl, fw, afm = self._axes(level, familiar_waters, advanced_fish_mapping)
+        values = self.chance[pool.start:pool.stop, lvl, fw, afm].tolist()
+        return {self.fish[pool.start + i]: value for i, value in enumerate(values)}
+
+    def curve(
+        self,
+        pool: Pool,
+        fish: str,
+        familiar_waters: float = 0,
+        advanced_fish_mapping: float = 0,
+    ) -> np.ndarray:
+        """Spawn % of fish in pool at every level in LEVELS."""
+        _, fw, afm = self._axes(LEVELS[0], familiar_waters, advanced_fish_mapping)
+        return np.asarray(self.chance[self._entries(pool)[fish], :, fw, afm])
+
+    def extremes(self, pool: Pool, fish: str) -> tuple[float, float]:
+        """Lowest and highest spawn % of fish in pool over every level and skill combination."""
+        values = self.chance[self._entries(pool)[fish]]
+        return float(values.min()), float(values.max())
+
+    def location_rows(
+        self,
+        min_query: tuple[int, float, float] = MIN_QUERY,
+        max_query: tuple[int, float, float] = MAX_QUERY,
+    ) -> list[dict]:
+        """
+        {fish, scene, spawner, location, season, min, max} rows for every
+        pool, in scene order, with min / max rounded to 2 places as on the wiki.
+        """
+        rows: list[dict] = []
+        for pool in self.pools:
+            min_p = self.percentages(pool, *min_query)
+            max_p = self.percentages(pool, *max_query)
+            for fish_name, skip_if_absent in pool.rows:
+                if skip_if_absent and fish_name not in min_p:
+                    continue
+                rows.append({
+                    "fish": fish_name, "scene": pool.scene, "spawner": pool.spawner,
+                    "location": pool.location, "season": pool.season,
+                    "min": round(min_p.get(fish_name, 0.0), 2),
+                    "max": round(max_p.get(fish_name, 0.0), 2),
+                })
+        return rows
+
+    # --- Export ---
+
+    def _curves(self, skills: Iterable[tuple[float, float]]):
+        for pool in self.pools:
+            for fish_name, entry in self._entries(pool).items():
+                for fw_value, afm_value in skills:
+                    _, fw, afm = self._axes(LEVELS[0], fw_value, afm_value)
+                    yield pool, fish_name, fw_value, afm_value, self.chance[entry, :, fw, afm]
+
+    def write_curves_csv(self, path: str, skills: Iterable[tuple[float, float]] = CURVE_SKILLS) -> None:
+        """One row per fish × pool × skill combination; one column per level."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="") as out:
+            writer = csv.writer(out)
+            writer.writerow(
+                ["fish", "scene", "spawner", "location", "season", "familiar_waters", "advanced_fish_mapping"]
+                + [f"level_{level}" for level in LEVELS]
+            )
+            for pool, fish_name, fw_value, afm_value, values in self._curves(skills):
+                writer.writerow(
+                    [fish_name, pool.scene, pool.spawner, pool.location, pool.season, fw_value, afm_value]
+                    + [f"{v:.4f}" for v in values]
+                )
+
+    def write_curves_json(self, path: str, skills: Iterable[tuple[float, float]] = CURVE_SKILLS) -> None:
+        """{fish: [{scene, spawner, location, season, familiar_waters, advanced_fish_mapping, chance: [per level]}]}."""
+        curves: dict[str, list[dict]] = {}
+        for pool, fish_name, fw_value, afm_value, values in self._curves(skills):
+            curves.setdefault(fish_name, []).append({
+                "scene": pool.scene, "spawner": pool.spawner, "location": pool.location, "season": pool.season,
+                "familiar_waters": fw_value, "advanced_fish_mapping": afm_value,
+                "chance": [round(float(v), 4) for v in values],
+            })
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as out:
+            json.dump({"levels": LEVELS.tolist(), "fish": curves}, out, ensure_ascii=False)
+
+    # --- Storage ---
+
+    def save(self, path: str, sources: Iterable[str] = (), key: str = "") -> None:
+        """Write path (.npy tensor) and path.json (pools, axes, source stamps, code hash, key)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.save(path, np.ascontiguousarray(self.chance), allow_pickle=False)
+        meta = {
+            "version": _TABLE_VERSION,
+            "levels": [int(LEVELS[0]), int(LEVELS[-1])],
+            "familiar_waters": list(self.familiar_waters),
+            "advanced_fish_mapping": list(self.advanced_fish_mapping),
+            "fish": self.fish,
+            "pools": [asdict(pool) for pool in self.pools],
+            "sources": _stamps(sources),
+            "engine": _engine_hash(),
+            "key": key,
+        }
+        with open(path + ".json", "w", encoding="utf-8") as out:
+            json.dump(meta, out, ensure_ascii=False)
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+def _rarity_name(item) -> str:
+    return constants.RARITY_TYPE_MAPPING.get(int(getattr(item, "rarity", 0)), "Common")
+
+
+def _fish_season(fish_name: str, items_by_name: Mapping) -> str:
+    """Return 'Any', 'Spring', 'Summer', 'Fall', or 'Winter' for a fish."""
+    item = items_by_name.get(fish_name)
+    if not item:
+        return "Any"
+    if not int(getattr(item, "has_set_season", 0) or 0):
+        return "Any"
+    try:
+        return SEASON_NAMES.get(int(getattr(item, "set_season", None)), "Any")
+    except (TypeError, ValueError):
+        return "Any"
+
+
+def _drop_name(drop: dict) -> str:
+    return (drop.get("name") or "").strip()
+
+
+def _spawner_pools(spawner: dict, items_by_name: Mapping) -> list[tuple[str, list[dict], list[tuple[str, bool]] | None]]:
+    """
+    (season, drops, rows) per pool of one fish spawner. rows None means
+    "every fish in the pool"; otherwise the listed fish, as Pool.rows.
+    """
+    all_drops = spawner.get("fish_drops", [])
+    if not spawner.get("has_seasonal_fish", False):
+        return [("Any", all_drops, None)]
+
+    year_round: list[dict] = []
+    by_season: dict[int, list[dict]] = {idx: [] for idx in SEASON_NAMES}
+    season_index = {name: idx for idx, name in SEASON_NAMES.items()}
+    for drop in all_drops:
+        season = _fish_season(_drop_name(drop), items_by_name)
+        if season == "Any":
+            year_round.append(drop)
+        else:
+            by_season[season_index[season]].append(drop)
+
+    pools = []
+    if year_round:
+        pools.append(("Any", year_round, None))
+    # Year-round fish get a diluted per-season rate; seasonal fish always get a row
+    for season_idx, season_name in SEASON_NAMES.items():
+        season_drops = by_season[season_idx]
+        if not season_drops:
+            continue
+        rows = [(_drop_name(d), True) for d in year_round] + [(_drop_name(d), False) for d in season_drops]
+        pools.append((season_name, year_round + season_drops, rows))
+    return pools
+
+
+def build(
+    fish_spawner_data: Mapping[str, dict],
+    items_by_name: Mapping,
+    scene_locations: Mapping[str, str],
+    familiar_waters: Iterable[float] = FAMILIAR_WATERS_VALUES,
+    advanced_fish_mapping: Iterable[float] = ADVANCED_FISH_MAPPING_VALUES,
+) -> SpawnTable:
+    """
+    Build the spawn table for every scene in scene_locations (scene → location
+    name) that has spawner data. Drops with no name, no positive chance or
+    no item are left out of their pool.
+    """
+    familiar_waters = tuple(familiar_waters)
+    advanced_fish_mapping = tuple(advanced_fish_mapping)
+
+    fish: list[str] = []
+    chances: list[float] = []
+    rarities: list[str] = []
+    pools: list[Pool] = []
+
+    for scene_name, location_name in scene_locations.items():
+        scene_data = fish_spawner_data.get(scene_name)
+        if not scene_data:
+            continue
+        # Each spawner rolls from its own pool; older data without "spawners" has one
+        for spawner_idx, spawner in enumerate(scene_data.get("spawners") or [scene_data]):
+            for season, drops, rows in _spawner_pools(spawner, items_by_name):
+                start = len(fish)
+                for drop in drops:
+                    fish_name = _drop_name(drop)
+                    chance = float(drop.get("drop_chance") or 0)
+                    item = items_by_name.get(fish_name)
+                    if not fish_name or chance <= 0 or not item:
+                        continue
+                    fish.append(fish_name)
+                    chances.append(chance)
+                    rarities.append(_rarity_name(item))
+                if rows is None:
+                    rows = [(name, True) for name in dict.fromkeys(fish[start:])]
+                pools.append(Pool(scene_name, location_name, season, start, len(fish), tuple(rows), spawner_idx))
+
+    # Rarity odds by level: (1 - t) * a + t * b, t = level / 120; Common stays 1.0
+    t = LEVELS / 120.0
+    odds = np.ones((len(fish), len(LEVELS)))
+    adjustment = np.ones((len(fish), len(familiar_waters), len(advanced_fish_mapping)))
+    fw = 0.05 * np.asarray(familiar_waters, dtype=float)[:, None]
+    afm = 0.1 * np.asarray(advanced_fish_mapping, dtype=float)[None, :]
+    for rarity, (low, high) in _RARITY_ODDS.items():
+        mask = np.array([r == rarity for r in rarities], dtype=bool)
+        if not mask.any():
+            continue
+        odds[mask] = (1 - t) * low + t * high
+        if rarity == "Epic":
+            adjustment[mask] = np.broadcast_to(1.0 + fw, adjustment.shape[1:])
+        elif rarity == "Legendary":
+            adjustment[mask] = 1.0 + (fw + afm)
+
+    # weight[entry, level, fw, afm] = chance × adjustment × odds
+    weight = (np.asarray(chances)[:, None, None] * adjustment)[:, None, :, :] * odds[:, :, None, None]
+
+    # Pool totals summed entry by entry, then each weight → percent of its pool
+    chance_pct = np.zeros_like(weight)
+    for pool in pools:
+        if pool.stop == pool.start:
+            continue
+        block = weight[pool.start:pool.stop]
+        total = block[0].copy()
+        for row in block[1:]:
+            total += row
+        np.divide(block, total, out=chance_pct[pool.start:pool.stop], where=total > 0)
+    chance_pct *= 100.0
+
+    return SpawnTable(chance_pct, fish, pools, familiar_waters, advanced_fish_mapping)
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def _stamps(paths: Iterable[str]) -> dict[str, list[float]]:
+    stamps = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        stamps[os.path.abspath(path)] = [st.st_size, st.st_mtime]
+    return stamps
+
+
+def _engine_hash() -> str:
+    """Hash of this module's source, so a change to the spawn rules invalidates saved tables."""
+    with open(__file__, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def load(path: str, sources: Iterable[str] = (), key: str = "") -> SpawnTable | None:
+    """
+    Memory-map a saved table; None if it is missing, from another version,
+    older than sources, built by different engine code or with another key.
+    """
+    try:
+        with open(path + ".json", encoding="utf-8") as f:
+            meta = json.load(f)
+        chance = np.load(path, mmap_mode="r", allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != _TABLE_VERSION or meta.get("levels") != [int(LEVELS[0]), int(LEVELS[-1])]:
+        return None
+    if meta.get("sources") != _stamps(sources):
+        return None
+    if meta.get("engine") != _engine_hash() or meta.get("key") != key:
+        return None
+    pools = [
+        Pool(p["scene"], p["location"], p["season"], p["start"], p["stop"],
+             tuple((name, skip) for name, skip in p["rows"]), p["spawner"])
+        for p in meta["pools"]
+    ]
+    return SpawnTable(chance, meta["fish"], pools, meta["familiar_waters"], meta["advanced_fish_mapping"])
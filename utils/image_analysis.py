@@ -0,0 +1,257 @@
+"""
+Image analysis — alpha-channel bounds and padding for sprite images, vectorized.
+
+Sprites are mostly transparent canvas around the drawn pixels. Everything
+the crop / trim code needs comes from one NumPy pass over the alpha channel:
+
+  bbox     →  (left, top, right, bottom) of the pixels with alpha > 0
+              (PIL box convention: right / bottom exclusive; None when the
+              image is fully transparent)
+  padding  →  fully transparent columns / rows on each side
+              (left, top, right, bottom)
+
+analyze_directory() runs that over a whole folder (IMAGE_INPUT_DIRECTORY by
+default) and caches each result under the SHA-1 of the file's bytes in
+JSON Data/image_bounds.json. Files whose size and mtime did not change are
+not even re-read, renamed or duplicated files reuse the cached result, and
+only new content is decoded — so a rescan is I/O-bound, not CPU-bound.
+
+Public API:
+  ImageBounds(width, height, bbox)
+    .padding / .is_empty
+  alpha_bounds(image)                                      →  ImageBounds
+  analyze_bytes(data) / analyze_file(path)                 →  ImageBounds
+  analyze_directory(directory=None, suffixes=(".png",), workers=1)
+                                                           →  dict[str, ImageBounds]  (relative path → bounds)
+
+Usage:
+    python utils/image_analysis.py [directory] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+from PIL import Image
+
+import config.constants as constants
+from utils import file_utils
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+_CACHE_FILE = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "image_bounds.json")
+
+_CACHE_VERSION = 1
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ImageBounds:
+    width: int
+    height: int
+    bbox: Optional[tuple[int, int, int, int]]      # (left, top, right, bottom), right / bottom exclusive
+
+    @property
+    def is_empty(self) -> bool:
+        """True when every pixel is fully transparent."""
+        return self.bbox is None
+
+    @property
+    def padding(self) -> tuple[int, int, int, int]:
+        """Transparent columns / rows per side (left, top, right, bottom); the full size when empty."""
+        if self.bbox is None:
+            return self.width, self.height, self.width, self.height
+        left, top, right, bottom = self.bbox
+        return left, top, self.width - right, self.height - bottom
+
+    def to_json(self) -> list:
+        return [self.width, self.height, list(self.bbox) if self.bbox else None]
+
+    @classmethod
+    def from_json(cls, value: list) -> "ImageBounds":
+        width, height, bbox = value
+        return cls(width, height, tuple(bbox) if bbox else None)
+
+# ---------------------------------------------------------------------------
+# Analysis
+# ---------------------------------------------------------------------------
+
+def alpha_bounds(image: Image.Image) -> ImageBounds:
+    """Bounds of the non-transparent pixels of a PIL image (images without alpha are fully opaque)."""
+    width, height = image.size
+    if "A" not in image.getbands():
+        if image.mode == "P" or "transparency" in image.info:     # palette / tRNS transparency
+            image = image.convert("RGBA")
+        else:
+            return ImageBounds(width, height, (0, 0, width, height) if width and height else None)
+
+    opaque = np.asarray(image.getchannel("A")) != 0
+    columns = opaque.any(axis=0)
+    if not columns.any():
+        return ImageBounds(width, height, None)
+    rows = opaque.any(axis=1)
+
+    # argmax finds the first True from each end
+    left = int(columns.argmax())
+    right = width - int(columns[::-1].argmax())
+    top = int(rows.argmax())
+    bottom = height - int(rows[::-1].argmax())
+    return ImageBounds(width, height, (left, top, right, bottom))
+
+
+def analyze_bytes(data: bytes) -> ImageBounds:
+    with Image.open(io.BytesIO(data)) as image:
+        return alpha_bounds(image)
+
+
+def analyze_file(path: str) -> ImageBounds:
+    with Image.open(path) as image:
+        return alpha_bounds(image)
+
+# ---------------------------------------------------------------------------
+# Directory scan (cached per file hash)
+# ---------------------------------------------------------------------------
+
+def _load_cache() -> tuple[dict, dict]:
+    """({path: {"stat", "hash"}}, {hash: bounds json}) from the cache file, or empty."""
+    try:
+        with open(_CACHE_FILE, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}, {}
+    if raw.get("version") != _CACHE_VERSION:
+        return {}, {}
+    return raw.get("files", {}), raw.get("hashes", {})
+
+
+def _save_cache(files: dict, hashes: dict) -> None:
+    file_utils.ensure_dir_exists(os.path.dirname(_CACHE_FILE))
+    tmp_path = _CACHE_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": _CACHE_VERSION, "files": files, "hashes": hashes}, f, separators=(",", ":"))
+    os.replace(tmp_path, _CACHE_FILE)
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _analyze_job(path: str) -> tuple[Optional[list], Optional[str]]:
+    """Worker: (bounds json, None) or (None, error message)."""
+    try:
+        return analyze_file(path).to_json(), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _image_files(directory: str, suffixes: tuple[str, ...]) -> Iterator[os.DirEntry]:
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(suffixes):
+                    yield entry
+
+
+def analyze_directory(
+    directory: Optional[str] = None,
+    suffixes: tuple[str, ...] = (".png",),
+    workers: int = 1,
+) -> dict[str, ImageBounds]:
+    """
+    {path relative to directory: ImageBounds} for every image under directory
+    (default IMAGE_INPUT_DIRECTORY). Files whose size / mtime are unchanged
+    since the last scan are not read; changed files are hashed, and only
+    content never seen before is decoded, in `workers` processes.
+    Unreadable images are reported and left out.
+    """
+    directory = os.path.abspath(directory or constants.IMAGE_INPUT_DIRECTORY)
+    cached_files, hashes = _load_cache()
+    files: dict[str, dict] = {}
+    to_decode: dict[str, list[str]] = {}       # hash → paths with that content
+
+    for entry in _image_files(directory, suffixes):
+        st = entry.stat()
+        stat = [st.st_size, st.st_mtime_ns]
+        cached = cached_files.get(entry.path)
+        if cached and cached["stat"] == stat and cached["hash"] in hashes:
+            files[entry.path] = cached
+            continue
+        try:
+            digest = _hash_file(entry.path)
+        except OSError as e:
+            print(f"  ⚠️  Error reading {entry.path}: {e}")
+            continue
+        files[entry.path] = {"stat": stat, "hash": digest}
+        if digest not in hashes:
+            to_decode.setdefault(digest, []).append(entry.path)
+
+    if to_decode:
+        digests = list(to_decode)
+        paths = [to_decode[d][0] for d in digests]
+        if workers > 1 and len(paths) > 1:
+            with multiprocessing.Pool(processes=min(workers, len(paths))) as pool:
+                results = list(pool.imap(_analyze_job, paths, chunksize=16))
+        else:
+            results = [_analyze_job(path) for path in paths]
+
+        for digest, (bounds, error) in zip(digests, results):
+            if error is None:
+                hashes[digest] = bounds
+                continue
+            for path in to_decode[digest]:
+                print(f"  ⚠️  Error reading {path}: {error}")
+                del files[path]
+
+    # Other directories' entries are kept; hashes no file refers to are dropped
+    merged = {p: info for p, info in cached_files.items() if not p.startswith(directory + os.sep)}
+    merged.update(files)
+    if merged != cached_files:
+        used = {info["hash"] for info in merged.values()}
+        _save_cache(merged, {h: b for h, b in hashes.items() if h in used})
+
+    return {
+        os.path.relpath(path, directory).replace(os.sep, "/"): ImageBounds.from_json(hashes[info["hash"]])
+        for path, info in files.items()
+    }
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run(directory: Optional[str] = None, workers: int = 1) -> None:
+    directory = directory or constants.IMAGE_INPUT_DIRECTORY
+    print(f"🔄 Analyzing images in {directory}...")
+    bounds = analyze_directory(directory, workers=workers)
+    empty = sum(1 for b in bounds.values() if b.is_empty)
+    padded = sum(1 for b in bounds.values() if not b.is_empty and any(b.padding))
+    print(f"✅ {len(bounds)} images analyzed: {padded} with transparent padding, {empty} fully transparent.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Alpha bounds / padding for every image in a directory.")
+    parser.add_argument("directory", nargs="?", default=None, help="Directory to scan (default: IMAGE_INPUT_DIRECTORY).")
+    parser.add_argument("--workers", type=int, default=1, help="Decode new images in N processes (default: 1).")
+    args = parser.parse_args()
+    run(args.directory, workers=args.workers)
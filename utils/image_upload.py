@@ -0,0 +1,150 @@
+"""
+Image upload pipeline — render in worker processes, upload from memory.
+
+Image batch jobs (wanted files, mounts, house customization, display
+images) used to open, crop, scale and save every image to a temp file in
+the same loop that uploaded it, so CPU work, disk churn and network time
+added up. upload_images() splits that into two stages:
+
+  render   →  process pool: job.render() builds the PIL image, which is
+              encoded to PNG bytes in the worker (nothing touches disk)
+  upload   →  this process: one uploader sends the bytes in job order,
+              paced by the site's adaptive rate limiter (wiki_utils)
+
+Workers render ahead while the uploader waits on the network, so a batch
+takes roughly max(render, upload) instead of their sum.
+
+job.render must be picklable: a module-level function, or a
+functools.partial of one such as image_utils.render_image.
+
+Public API:
+  ImageJob(filename, render, text="", comment="Image upload", ignore_warnings=False)
+  UploadResult(job, uploaded, error=None)
+  upload_images(jobs, site=None, workers=IMAGE_WORKERS)  →  Iterator[UploadResult]  (job order)
+  encode_png(image)                                      →  bytes
+  upload_png(site, filename, data, text, comment, ignore_warnings=False)
+"""
+
+from __future__ import annotations
+
+import io
+import multiprocessing
+import os
+import sys
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pywikibot
+from pywikibot.exceptions import UploadError
+
+import config.constants as constants
+from utils import wiki_utils
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+IMAGE_WORKERS = constants.PWB_SETTINGS.get("IMAGE_WORKERS", min(4, os.cpu_count() or 1))
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ImageJob:
+    """One file to upload. filename has no "File:" prefix; text is the file page text."""
+    filename: str
+    render: Callable[[], object]        # → PIL.Image.Image
+    text: str = ""
+    comment: str = "Image upload"
+    ignore_warnings: bool = False       # True overwrites an existing file
+
+
+@dataclass(frozen=True)
+class UploadResult:
+    job: ImageJob
+    uploaded: bool
+    error: Optional[str] = None
+
+# ---------------------------------------------------------------------------
+# Encoding / uploading
+# ---------------------------------------------------------------------------
+
+def encode_png(image) -> bytes:
+    """PNG bytes for a PIL image (what image.save("x.png") would have written)."""
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def upload_png(site, filename: str, data: bytes, text: str, comment: str, ignore_warnings: bool = False) -> None:
+    """
+    Upload PNG bytes to File:filename without a temp file. Raises
+    UploadError for API warnings (file exists, duplicate, ...) unless
+    ignore_warnings is set, like FilePage.upload(ignore_warnings=False).
+    """
+    site.login()
+    request = site._request(
+        throttle=True,
+        # Pywikibot sends a dummy multipart file name as well; the title comes from "filename"
+        mime={"file": (data, ("image", "png"), {"filename": "FAKE-NAME"})},
+        parameters={
+            "action": "upload",
+            "token": site.tokens["csrf"],
+            "filename": filename,
+            "text": text or comment,
+            "comment": comment,
+            "ignorewarnings": ignore_warnings,
+        },
+    )
+    result = request.submit()["upload"]
+    if result.get("result") == "Warning":
+        code, detail = next(iter(result.get("warnings", {"warning": ""}).items()))
+        raise UploadError(code, f"{code}: {detail}")
+    if result.get("result") != "Success":
+        raise UploadError("unknown", f"Unrecognized upload response: {result}")
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+def _render_job(job: ImageJob) -> tuple[Optional[bytes], Optional[str]]:
+    """Worker: (png bytes, None) or (None, error message)."""
+    try:
+        return encode_png(job.render()), None
+    except Exception as e:
+        return None, f"Render failed: {e}"
+
+
+def _upload_rendered(site, jobs: list[ImageJob], rendered: Iterable) -> Iterator[UploadResult]:
+    for job, (data, error) in zip(jobs, rendered):
+        if error is None:
+            try:
+                upload_png(site, job.filename, data, job.text, job.comment, job.ignore_warnings)
+            except Exception as e:
+                error = f"Upload failed: {e}"
+        yield UploadResult(job, error is None, error)
+
+
+def upload_images(
+    jobs: Iterable[ImageJob],
+    site=None,
+    workers: int = IMAGE_WORKERS
+) -> Iterator[UploadResult]:
+    """
+    Render jobs in `workers` processes and upload them one at a time from
+    this process, yielding an UploadResult per job in job order. A job
+    that fails to render or upload is reported, not raised.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return
+    site = wiki_utils.limit_site(site or pywikibot.Site())
+
+    if workers > 1 and len(jobs) > 1:
+        with multiprocessing.Pool(processes=min(workers, len(jobs))) as pool:
+            yield from _upload_rendered(site, jobs, pool.imap(_render_job, jobs))
+    else:
+        yield from _upload_rendered(site, jobs, map(_render_job, jobs))
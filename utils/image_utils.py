@@ -1,7 +1,9 @@
 import os
-from PIL import Image, ImageChops
+from PIL import Image
 import pywikibot
 from datetime import datetime
+from utils import image_analysis, wiki_utils
+from utils.image_upload import encode_png, upload_png
 
 def log_debug(message, debug_path):
     timestamp = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
@@ -25,9 +27,7 @@ def crop_whitespace(image):
     if image.mode != "RGBA":
         image = image.convert("RGBA")
 
-    bg = Image.new("RGBA", image.size, (255, 255, 255, 0))
-    diff = ImageChops.difference(image, bg)
-    bbox = diff.getbbox()
+    bbox = image_analysis.alpha_bounds(image).bbox
     if bbox:
         return image.crop(bbox)
     return image
@@ -41,17 +41,34 @@ def scale_image_to_min_size(image, min_size=500):
     new_size = (int(width * scale), int(height * scale))
     return image.resize(new_size, Image.NEAREST)
 
-def upload_image(image, filename, caption_text=None, categories=None, debug_path="debug.log", upload_comment="Image upload"):
+def render_image(sources, mode=None, crop=False, scale=None, size=None, min_size=None):
     """
-    Save, upload to wiki, and apply caption/licensing/categories.
+    Build an upload image: open sources (one path, or (base, overlay) to
+    composite), optionally convert to mode and crop whitespace, then resize
+    by an integer nearest-neighbour scale, to an exact size, or to min_size.
+    Module-level so utils/image_upload.py can run it in a process pool
+    (ImageJob(render=functools.partial(render_image, ...))).
     """
-    temp_path = os.path.join("temp_upload", filename)
-    os.makedirs(os.path.dirname(temp_path), exist_ok=True)
-    image.save(temp_path)
-
-    site = pywikibot.Site()
-    file_page = pywikibot.FilePage(site, f"File:{filename}")
+    if isinstance(sources, str):
+        sources = (sources,)
+    if len(sources) == 2:
+        image = composite_images(*sources)
+    else:
+        image = Image.open(sources[0])
+    if mode:
+        image = image.convert(mode)
+    if crop:
+        image = crop_whitespace(image)
+    if scale:
+        image = image.resize((image.width * scale, image.height * scale), Image.NEAREST)
+    elif size:
+        image = image.resize(size, resample=Image.NEAREST)
+    elif min_size:
+        image = scale_image_to_min_size(image, min_size)
+    return image
 
+def file_page_text(caption_text=None, categories=None):
+    """File page text: optional caption, the game license, then categories."""
     wiki_text = []
     if caption_text:
         wiki_text.append("==Caption==")
@@ -64,16 +81,26 @@ def upload_image(image, filename, caption_text=None, categories=None, debug_path
     for cat in categories or []:
         wiki_text.append(f"[[Category:{cat}]]")
 
-    file_page.text = "\n".join(wiki_text)
+    return "\n".join(wiki_text)
 
+def upload_image(image, filename, caption_text=None, categories=None, debug_path="debug.log", upload_comment="Image upload", exists=None):
+    """
+    Upload one image from memory, with caption/licensing/categories.
+    Batches should build ImageJobs and use image_upload.upload_images(),
+    which renders in a process pool.
+
+    exists: whether File:<filename> is already on the wiki, when the caller
+    resolved it up front (wiki_utils.resolve_titles); None checks it here
+    with one API request.
+    """
+    site = wiki_utils.limit_site(pywikibot.Site())  # uploads paced by the shared rate limiter
     try:
-        if file_page.exists():
+        if exists is None:
+            exists = pywikibot.FilePage(site, f"File:{filename}").exists()
+        if exists:
             log_debug(f"Skipped upload for {filename} (already exists on wiki)", debug_path)
         else:
-            file_page.upload(temp_path, comment=upload_comment, ignore_warnings=False)
+            upload_png(site, filename, encode_png(image), file_page_text(caption_text, categories), upload_comment)
             log_debug(f"Uploaded: {filename}", debug_path)
     except Exception as e:
         log_debug(f"Upload failed for {filename}: {e}", debug_path)
-    finally:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
@@ -0,0 +1,261 @@
+"""
+In-process dependency-graph runner for the builder and exporter scripts.
+
+Each Stage names a script and the files/directories it reads and writes.
+A stage depends on every stage whose outputs overlap its inputs, so the
+graph is derived from the declarations rather than from list order.
+
+run_pipeline():
+  - imports each stage's module and calls its run() in a thread pool, so
+    independent stages overlap and share already-loaded caches (see
+    item_builder._load_cache)
+  - skips a stage when its inputs, its own source and the shared library
+    code are unchanged since its last successful run and its outputs exist
+  - on failure, skips the failed stage's dependents and keeps running
+    everything else
+
+Input signatures: files are content-hashed; directories use a listing of
+(path, size, mtime) — pass force=True after copying a dump with preserved
+timestamps.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import os
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Code shared by many stages — any change here re-runs every stage.
+# builders is included because exporters import non-stage builder modules
+# (item_store, recipe_index, localization, item_builder._load_cache).
+_LIBRARY_DIRS = ("builders", "config", "formatters", "mappings", "utils")
+
+_STATE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A pipeline step: a script with a run() function and its declared I/O."""
+    script: str
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    after: tuple[str, ...] = field(default=())   # extra ordering edges (script paths)
+
+    @property
+    def module(self) -> str:
+        return os.path.splitext(self.script)[0].replace("/", ".").replace("\\", ".")
+
+
+# ---------------------------------------------------------------------------
+# Signatures
+# ---------------------------------------------------------------------------
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _dir_signature(path: str) -> str:
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            rel = os.path.relpath(full, path)
+            digest.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class _Signatures:
+    """Per-run signature cache; entries are dropped when a stage rewrites them."""
+
+    def __init__(self):
+        self._memo: dict[str, str | None] = {}
+
+    def get(self, path: str) -> str | None:
+        if path not in self._memo:
+            if os.path.isdir(path):
+                self._memo[path] = _dir_signature(path)
+            elif os.path.isfile(path):
+                self._memo[path] = _hash_file(path)
+            else:
+                self._memo[path] = None
+        return self._memo[path]
+
+    def invalidate(self, paths: tuple[str, ...]) -> None:
+        for key in list(self._memo):
+            if any(_overlaps(key, p) for p in paths):
+                del self._memo[key]
+
+
+def _library_signature() -> str:
+    digest = hashlib.sha1()
+    for folder in _LIBRARY_DIRS:
+        for root, dirs, files in os.walk(os.path.join(_REPO_ROOT, folder)):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    path = os.path.join(root, name)
+                    digest.update(os.path.relpath(path, _REPO_ROOT).encode("utf-8"))
+                    digest.update(_hash_file(path).encode("ascii"))
+    return digest.hexdigest()
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+def _overlaps(a: str, b: str) -> bool:
+    """True if one path equals or contains the other."""
+    a, b = os.path.normpath(a), os.path.normpath(b)
+    return a == b or a.startswith(b + os.sep) or b.startswith(a + os.sep)
+
+
+def _dependencies(stages: list[Stage]) -> dict[str, set[str]]:
+    deps: dict[str, set[str]] = {s.script: set(s.after) for s in stages}
+    for consumer in stages:
+        for producer in stages:
+            if producer is consumer:
+                continue
+            if any(_overlaps(i, o) for i in consumer.inputs for o in producer.outputs):
+                deps[consumer.script].add(producer.script)
+    known = set(deps)
+    for script, needed in deps.items():
+        unknown = needed - known
+        if unknown:
+            raise ValueError(f"{script} depends on undeclared stages: {sorted(unknown)}")
+    return deps
+
+# ---------------------------------------------------------------------------
+# State
+# ---------------------------------------------------------------------------
+
+def _load_state(state_file: str) -> dict:
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return state.get("stages", {}) if state.get("version") == _STATE_VERSION else {}
+
+
+def _save_state(state_file: str, stages: dict) -> None:
+    os.makedirs(os.path.dirname(state_file), exist_ok=True)
+    tmp_path = state_file + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": _STATE_VERSION, "stages": stages}, f, indent=2)
+    os.replace(tmp_path, state_file)
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _run_stage(stage: Stage) -> None:
+    module = importlib.import_module(stage.module)
+    try:
+        module.run()
+    except SystemExit as exc:
+        if exc.code not in (None, 0):
+            raise RuntimeError(f"exited with code {exc.code}") from exc
+
+
+def run_pipeline(stages: list[Stage], state_file: str, workers: int = 4, force: bool = False) -> bool:
+    """
+    Run every stage in dependency order. Returns True if no stage failed.
+
+    Args:
+        stages:     Stage declarations; scripts are paths relative to the repo root.
+        state_file: JSON file recording the input signatures of the last successful runs.
+        workers:    Number of stages allowed to run at the same time.
+        force:      Run every stage regardless of recorded signatures.
+    """
+    deps = _dependencies(stages)
+    by_script = {s.script: s for s in stages}
+    state = {} if force else _load_state(state_file)
+    signatures = _Signatures()
+    library = _library_signature()
+
+    pending = [s.script for s in stages]
+    done: set[str] = set()
+    failed: set[str] = set()
+    running: dict = {}
+    counts = {"ran": 0, "skipped": 0, "failed": 0, "blocked": 0}
+
+    def fingerprint(stage: Stage) -> dict:
+        return {
+            "code":   _hash_file(os.path.join(_REPO_ROOT, stage.script)) + library,
+            "inputs": {p: signatures.get(p) for p in stage.inputs},
+        }
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while pending or running:
+            submitted = False
+            for script in list(pending):
+                needed = deps[script]
+                if needed & failed:
+                    pending.remove(script)
+                    failed.add(script)
+                    counts["blocked"] += 1
+                    print(f"⏭  Skipping {script} (upstream stage failed)")
+                    submitted = True
+                    continue
+                if not needed <= done:
+                    continue
+
+                pending.remove(script)
+                stage = by_script[script]
+                current = fingerprint(stage)
+                outputs_exist = all(os.path.exists(p) for p in stage.outputs)
+                if state.get(script) == current and outputs_exist:
+                    done.add(script)
+                    counts["skipped"] += 1
+                    print(f"⏭  {script} is up to date.")
+                    submitted = True
+                    continue
+
+                print(f"\n▶ Running {script}")
+                running[pool.submit(_run_stage, stage)] = (script, current, time.perf_counter())
+                submitted = True
+
+            if not running:
+                if pending and not submitted:
+                    raise ValueError(f"Dependency cycle between stages: {sorted(pending)}")
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                script, current, started = running.pop(future)
+                elapsed = time.perf_counter() - started
+                signatures.invalidate(by_script[script].outputs)
+                exc = future.exception()
+                if exc is None:
+                    done.add(script)
+                    state[script] = current
+                    counts["ran"] += 1
+                    print(f"✅ {script} completed successfully ({elapsed:.1f}s).\n")
+                else:
+                    failed.add(script)
+                    state.pop(script, None)
+                    counts["failed"] += 1
+                    print(f"❌ Error running {script}: {exc}")
+                    traceback.print_exception(type(exc), exc, exc.__traceback__)
+            _save_state(state_file, state)
+
+    print(
+        f"Pipeline finished: {counts['ran']} ran, {counts['skipped']} up to date, "
+        f"{counts['failed']} failed, {counts['blocked']} skipped after failures."
+    )
+    return not failed
@@ -0,0 +1,144 @@
+"""
+Adaptive rate limiter — token buckets for wiki reads and writes.
+
+Wiki scripts used to sleep a fixed SLEEP_INTERVAL (or CHUNK_SLEEP_SECONDS,
+DELAY, ...) after every save or batch, on top of Pywikibot's own throttle:
+too slow when the wiki is idle, and still not slow enough when it is busy.
+AdaptiveLimiter replaces those sleeps with two token buckets:
+
+  read   →  API queries (page text, revisions, category members, ...)
+  write  →  edits, uploads, moves, deletions
+
+Both run at their configured rate times a shared speed factor:
+
+  - backoff(seconds)  (maxlag error, Retry-After header, failed save)
+        halves the factor (down to _MIN_FACTOR) and pauses every request
+        for `seconds`
+  - healthy()  (response without Retry-After)
+        adds _RECOVERY_STEP to the factor every _RECOVER_AFTER calls,
+        back up to 1.0
+
+wiki_utils installs one limiter per site into Pywikibot's throttle, so
+every API request goes through it without changes to the calling script.
+
+Public API:
+  TokenBucket(rate, burst)
+  AdaptiveLimiter(read_rate, write_rate, burst=1)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+_MIN_FACTOR    = 1 / 32   # slowest speed: 1/32 of the configured rates
+_RECOVERY_STEP = 0.1      # factor added after _RECOVER_AFTER healthy responses
+_RECOVER_AFTER = 10
+
+# ---------------------------------------------------------------------------
+# Token bucket
+# ---------------------------------------------------------------------------
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available."""
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill_locked()
+            self.rate = rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, sleeping until they are available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill_locked()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def _refill_locked(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+# ---------------------------------------------------------------------------
+# Adaptive limiter
+# ---------------------------------------------------------------------------
+
+class AdaptiveLimiter:
+    """Read and write token buckets sharing one server-driven speed factor."""
+
+    def __init__(self, read_rate: float, write_rate: float, burst: float = 1.0):
+        self.read_rate = read_rate
+        self.write_rate = write_rate
+        self.factor = 1.0
+        self._reads = TokenBucket(read_rate, burst)
+        self._writes = TokenBucket(write_rate, 1.0)
+        self._paused_until = 0.0
+        self._healthy_count = 0
+        self._lock = threading.Lock()
+
+    # --- Requests ---
+
+    def read(self, tokens: float = 1.0) -> float:
+        """Block until a read may be sent. Returns seconds waited."""
+        return self.wait_paused() + self._reads.acquire(tokens)
+
+    def write(self) -> float:
+        """Block until a write may be sent. Returns seconds waited."""
+        return self.wait_paused() + self._writes.acquire()
+
+    # --- Server feedback ---
+
+    def backoff(self, seconds: float = 0.0) -> None:
+        """Server asked us to slow down: halve the speed and pause for `seconds`."""
+        with self._lock:
+            self.factor = max(_MIN_FACTOR, self.factor / 2)
+            self._healthy_count = 0
+            self._paused_until = max(self._paused_until, time.monotonic() + max(0.0, seconds))
+            self._apply_locked()
+
+    def healthy(self) -> None:
+        """A response without throttling hints: recover speed gradually."""
+        with self._lock:
+            if self.factor >= 1.0:
+                return
+            self._healthy_count += 1
+            if self._healthy_count >= _RECOVER_AFTER:
+                self._healthy_count = 0
+                self.factor = min(1.0, self.factor + _RECOVERY_STEP)
+                self._apply_locked()
+
+    def wait_paused(self) -> float:
+        """Block until a backoff pause is over. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                delay = self._paused_until - time.monotonic()
+            if delay <= 0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    # --- Internal ---
+
+    def _apply_locked(self) -> None:
+        self._reads.set_rate(self.read_rate * self.factor)
+        self._writes.set_rate(self.write_rate * self.factor)
@@ -0,0 +1,189 @@
+"""
+Reconciliation — match wiki page titles against JSON records (shared by the compare scripts).
+
+Every compare script answers the same questions for each wiki page: is
+there a JSON record with this name, is the page the base of a variant
+group, or is it wiki-only? And which JSON records were never matched?
+Scanning the JSON keys (or removing from a list) per page made those
+checks O(n) each; the Reconciler builds its indexes once:
+
+  - normalized name  → JSON keys with that name
+  - normalized base  → variant keys grouped under it (optional)
+
+and tracks unmatched JSON keys in a set, so classifying a page and
+claiming its records are O(1).
+
+Variant groups follow the item rules:
+  - "<base> (<variant>)"                          e.g. "bed (blue)"
+  - "<prefix> <base>" ending in a prefixed suffix  e.g. "red dragon mount whistle",
+    grouped under every trailing base ("dragon mount whistle", "mount whistle", ...)
+
+write_report() writes the standard compare layout:
+
+  === Mismatches ===
+  <title>
+      - <line>
+
+  === JSON Only ===
+  <json key>
+
+  === WIKI Only ===
+  <title>
+
+Public API:
+  Reconciler(names, normalize=normalize_title, group_variants=False)
+  format_diff_lines(diffs)  →  list[str]
+  write_report(path, mismatches, json_only, wiki_only, ...)  →  None
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+from typing import Callable, Iterable, Mapping
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils.compare_utils import normalize_title
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+MATCH     = "MATCH"
+VARIANTS  = "VARIANTS"
+WIKI_ONLY = "WIKI_ONLY"
+
+_PAREN_VARIANT_RE          = re.compile(r"^(.*) \(([^)]+)\)$")
+_PREFIXED_VARIANT_SUFFIXES = ("mount whistle", "pet")
+
+# ---------------------------------------------------------------------------
+# Reconciler
+# ---------------------------------------------------------------------------
+
+class Reconciler:
+    """
+    Title index over a set of JSON records.
+
+    names maps each JSON key to the name wiki titles are matched against
+    (an iterable of keys means every key is its own name). Index lists keep
+    the order of names.
+    """
+
+    def __init__(
+        self,
+        names: Mapping[str, str] | Iterable[str],
+        normalize: Callable[[str], str] = normalize_title,
+        group_variants: bool = False,
+    ):
+        if not isinstance(names, Mapping):
+            names = {key: key for key in names}
+
+        self.normalize = normalize
+        self._by_name: dict[str, list[str]] = {}
+        self._variants: dict[str, list[tuple[str, bool]]] = {}
+        self._unmatched: set[str] = set(names)
+        self._wiki_only: list[str] = []
+
+        for key, name in names.items():
+            norm = normalize(name)
+            self._by_name.setdefault(norm, []).append(key)
+            if group_variants:
+                self._index_variant(key, norm)
+
+    def _index_variant(self, key: str, norm: str) -> None:
+        paren = _PAREN_VARIANT_RE.match(norm)
+        if paren:
+            self._variants.setdefault(paren.group(1), []).append((key, False))
+        elif any(norm.endswith(" " + suffix) for suffix in _PREFIXED_VARIANT_SUFFIXES):
+            parts = norm.split(" ")
+            for i in range(1, len(parts)):
+                self._variants.setdefault(" ".join(parts[i:]), []).append((key, True))
+
+    # --- Lookups ---
+
+    def lookup(self, title: str) -> list[str]:
+        """JSON keys whose name matches the title."""
+        return list(self._by_name.get(self.normalize(title), ()))
+
+    def variants(self, title: str, include_prefixed: bool = True) -> list[str]:
+        """
+        Variant keys grouped under the title. include_prefixed=False keeps
+        only "<base> (<variant>)" keys (prefixed groups are mounts and pets).
+        """
+        return [
+            key for key, prefixed in self._variants.get(self.normalize(title), ())
+            if include_prefixed or not prefixed
+        ]
+
+    def classify(self, title: str, include_prefixed: bool = True) -> tuple[str, list[str]]:
+        """
+        (MATCH, keys) for a direct match, (VARIANTS, keys) for a variant base
+        (keys may be empty when include_prefixed filters them all out),
+        otherwise (WIKI_ONLY, []). Nothing is claimed or recorded.
+        """
+        norm = self.normalize(title)
+        if norm in self._by_name:
+            return MATCH, list(self._by_name[norm])
+        if norm in self._variants:
+            return VARIANTS, self.variants(title, include_prefixed)
+        return WIKI_ONLY, []
+
+    # --- Tracking ---
+
+    def claim(self, *keys: str) -> None:
+        """Mark JSON keys as matched by a wiki page."""
+        self._unmatched.difference_update(keys)
+
+    def add_wiki_only(self, title: str) -> None:
+        self._wiki_only.append(title)
+
+    def json_only(self, sort_key: Callable[[str], object] | None = None) -> list[str]:
+        """JSON keys never claimed, sorted."""
+        return sorted(self._unmatched, key=sort_key)
+
+    def wiki_only(self, sort_key: Callable[[str], object] | None = None) -> list[str]:
+        """Titles recorded with add_wiki_only(), sorted."""
+        return sorted(self._wiki_only, key=sort_key)
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+def format_diff_lines(diffs: Iterable[tuple[str, str, str]]) -> list[str]:
+    """(field, expected, actual) tuples → report lines (a "MATCH EXACTLY" field lists matching variants)."""
+    lines = []
+    for field, exp, act in diffs:
+        if field == "MATCH EXACTLY":
+            lines.append(f"{exp} {field}")
+        else:
+            lines.append(f"{field}: expected '{exp}' but found '{act}'")
+    return lines
+
+
+def write_report(
+    path: str,
+    mismatches: Iterable[tuple[str, Iterable[str]]],
+    json_only: Iterable[str],
+    wiki_only: Iterable[str],
+    json_label: str = "JSON Only",
+    wiki_label: str = "WIKI Only",
+) -> None:
+    """Write the standard compare report. mismatches is [(title, lines), ...]."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as out:
+        out.write("=== Mismatches ===\n")
+        for title, lines in mismatches:
+            out.write(f"{title}\n")
+            for line in lines:
+                out.write(f"    - {line}\n")
+            out.write("\n")
+
+        out.write(f"=== {json_label} ===\n")
+        for name in json_only:
+            out.write(f"{name}\n")
+
+        out.write(f"\n=== {wiki_label} ===\n")
+        for name in wiki_only:
+            out.write(f"{name}\n")
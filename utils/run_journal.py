@@ -0,0 +1,194 @@
+"""
+Run journal — resumable record of what an update script did to each page.
+
+Update scripts (update_item_infobox, update_recipe, update_fish_locations,
+top_shelf_rare_finds) walk thousands of pages in one pass. Without a record
+of progress, a network error, an expired login or Ctrl-C meant starting
+over. The journal stores one row per (script, title):
+
+  base_revid  →  revision the page was compared against
+  diff        →  planned changes, as JSON [[field, expected, actual], ...]
+  outcome     →  planned / updated / dry_run / no_change / skipped / failed
+  revid       →  revision after processing (the saved revision for edits)
+
+Each row is committed as soon as it is written, so an interrupted run
+loses at most the page in flight.
+
+Starting a script normally clears its journal. With --resume, pages whose
+outcome is final and whose current revid still equals the recorded revid
+are skipped; pages that failed, were only planned, or were edited on the
+wiki since are processed again. A dry run and a real run never resume each
+other.
+
+Journals live in JSON Data/run_journal.sqlite.
+
+Public API:
+  RESUME_FLAG                                   "--resume"
+  RunJournal(script, resume=False, dry_run=False)
+    .done(title, revid)                    →  bool
+    .plan(title, base_revid, diffs)        →  None
+    .finish(title, outcome, revid, detail) →  None
+    .close(completed=False)                →  None
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Iterable
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import config.constants as constants
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+RESUME_FLAG = "--resume"
+
+PLANNED   = "planned"
+UPDATED   = "updated"
+DRY_RUN   = "dry_run"
+NO_CHANGE = "no_change"
+SKIPPED   = "skipped"
+FAILED    = "failed"
+
+_FINAL_OUTCOMES = (UPDATED, DRY_RUN, NO_CHANGE, SKIPPED)
+
+_DB_FILE = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "run_journal.sqlite")
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def _connect() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(_DB_FILE), exist_ok=True)
+    # The update_item_infobox writer thread records outcomes too; RunJournal serializes access
+    conn = sqlite3.connect(_DB_FILE, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS runs ("
+        " script TEXT PRIMARY KEY, dry_run INTEGER NOT NULL,"
+        " started REAL NOT NULL, finished REAL)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pages ("
+        " script TEXT NOT NULL, title TEXT NOT NULL, base_revid INTEGER, diff TEXT,"
+        " outcome TEXT NOT NULL, revid INTEGER, detail TEXT, updated REAL NOT NULL,"
+        " PRIMARY KEY (script, title))"
+    )
+    return conn
+
+
+def _encode_diffs(diffs: Iterable) -> str:
+    return json.dumps([[str(v) if v is not None else None for v in diff] for diff in diffs], ensure_ascii=False)
+
+# ---------------------------------------------------------------------------
+# Journal
+# ---------------------------------------------------------------------------
+
+class RunJournal:
+    """Per-script page journal. Thread-safe; every write is committed immediately."""
+
+    def __init__(self, script: str, resume: bool = False, dry_run: bool = False):
+        self.script = script
+        self._lock = threading.Lock()
+        self._conn = _connect()
+        self._done: dict[str, int | None] = {}
+        self._planned: set[str] = set()
+
+        previous = self._conn.execute(
+            "SELECT dry_run, started, finished FROM runs WHERE script = ?", (script,)
+        ).fetchone()
+
+        if resume and previous and bool(previous[0]) != dry_run:
+            print(f"⚠️ Last {script} run had DRY_RUN={bool(previous[0])}; starting a fresh run instead of resuming.")
+            resume = False
+
+        if resume and previous:
+            placeholders = ",".join("?" * len(_FINAL_OUTCOMES))
+            self._done = dict(self._conn.execute(
+                f"SELECT title, revid FROM pages WHERE script = ? AND outcome IN ({placeholders})",
+                (script, *_FINAL_OUTCOMES),
+            ))
+            last = self._conn.execute(
+                "SELECT title FROM pages WHERE script = ? ORDER BY updated DESC LIMIT 1", (script,)
+            ).fetchone()
+            started = time.strftime("%Y-%m-%d %H:%M", time.localtime(previous[1]))
+            print(
+                f"📋 Resuming {script} run from {started}: {len(self._done)} pages done"
+                + (f", last was '{last[0]}'." if last else ".")
+            )
+            with self._conn:
+                self._conn.execute("UPDATE runs SET finished = NULL WHERE script = ?", (script,))
+            return
+
+        if resume:
+            print(f"⚠️ No previous {script} run to resume; starting a fresh run.")
+        elif previous and previous[2] is None:
+            print(f"⚠️ Previous {script} run did not finish; pass {RESUME_FLAG} to continue it instead.")
+
+        with self._conn:
+            self._conn.execute("DELETE FROM pages WHERE script = ?", (script,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs (script, dry_run, started, finished) VALUES (?, ?, ?, NULL)",
+                (script, int(dry_run), time.time()),
+            )
+
+    # --- Lookups ---
+
+    def done(self, title: str, revid: int | None) -> bool:
+        """True when the resumed run already finished title at this revision."""
+        return title in self._done and self._done[title] == revid
+
+    # --- Recording ---
+
+    def plan(self, title: str, base_revid: int | None, diffs: Iterable) -> None:
+        """Record the changes about to be saved, before saving them."""
+        with self._lock:
+            self._planned.add(title)
+        self._write(title, base_revid, _encode_diffs(diffs), PLANNED, None, "")
+
+    def finish(self, title: str, outcome: str, revid: int | None = None, detail: str = "") -> None:
+        """
+        Record the outcome for title. revid is the page revision afterwards
+        (the new revision for saves); the planned diff and base revid are kept.
+        """
+        with self._lock:
+            planned = title in self._planned
+        if planned:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "UPDATE pages SET outcome = ?, revid = ?, detail = ?, updated = ?"
+                    " WHERE script = ? AND title = ?",
+                    (outcome, revid, detail, time.time(), self.script, title),
+                )
+        else:
+            self._write(title, revid, None, outcome, revid, detail)
+
+    def close(self, completed: bool = False) -> None:
+        """Close the journal; completed=True marks the run as finished."""
+        with self._lock:
+            if completed:
+                with self._conn:
+                    self._conn.execute(
+                        "UPDATE runs SET finished = ? WHERE script = ?", (time.time(), self.script)
+                    )
+            self._conn.close()
+
+    # --- Internal ---
+
+    def _write(self, title, base_revid, diff, outcome, revid, detail) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages"
+                " (script, title, base_revid, diff, outcome, revid, detail, updated)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.script, title, base_revid, diff, outcome, revid, detail, time.time()),
+            )
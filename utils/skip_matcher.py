@@ -0,0 +1,77 @@
+"""
+Skip matcher — one compiled view of config/skip_items for every script that filters items.
+
+SKIP_ITEMS holds exact item / page names; SKIP_PATTERNS holds shell-style
+globs ("* bundle", "largerock*", "*foliage*"). Both are matched against the
+lowercased name (curly apostrophes straightened), with true glob semantics:
+"* bundle" skips "Alchemy Bundle" but not "Bundle of Joy".
+
+  names     →  frozenset, O(1) lookups
+  patterns  →  one regex (the fnmatch translation of every glob, alternated),
+               so a name is checked in a single match instead of a loop
+
+Scripts that only honour the exact list (page compares / updates) call
+is_listed(); item filters (item_builder, missing item validator / page
+creation) call skips(), which also applies the patterns.
+
+Public API:
+  SkipMatcher(names=(), patterns=())
+    .is_listed(name)         →  bool   exact SKIP_ITEMS-style name
+    .matches_pattern(name)   →  bool   any glob
+    .skips(name)             →  bool   either
+  skip_matcher()             →  SkipMatcher for config/skip_items (built once)
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+import sys
+import threading
+from typing import Iterable, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from config import skip_items
+from utils.text_utils import normalize_apostrophe
+
+
+def _normalize(name: str) -> str:
+    return normalize_apostrophe(name).lower()
+
+
+class SkipMatcher:
+    """Exact names + compiled glob patterns, matched case-insensitively."""
+
+    def __init__(self, names: Iterable[str] = (), patterns: Iterable[str] = ()):
+        self.names = frozenset(_normalize(n) for n in names)
+        self.patterns = tuple(_normalize(p) for p in patterns)
+        # fnmatch.translate yields "(?s:...)\Z"; the alternation still anchors at both ends
+        self._pattern_re = (
+            re.compile("|".join(fnmatch.translate(p) for p in self.patterns))
+            if self.patterns else None
+        )
+
+    def is_listed(self, name: str) -> bool:
+        return _normalize(name) in self.names
+
+    def matches_pattern(self, name: str) -> bool:
+        return self._pattern_re is not None and self._pattern_re.match(_normalize(name)) is not None
+
+    def skips(self, name: str) -> bool:
+        key = _normalize(name)
+        return key in self.names or (self._pattern_re is not None and self._pattern_re.match(key) is not None)
+
+
+_matcher: Optional[SkipMatcher] = None
+_matcher_lock = threading.Lock()
+
+
+def skip_matcher() -> SkipMatcher:
+    """The SkipMatcher for config/skip_items (SKIP_ITEMS + SKIP_PATTERNS), built on first call."""
+    global _matcher
+    with _matcher_lock:
+        if _matcher is None:
+            _matcher = SkipMatcher(skip_items.SKIP_ITEMS, skip_items.SKIP_PATTERNS)
+        return _matcher
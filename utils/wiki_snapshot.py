@@ -0,0 +1,160 @@
+"""
+Wiki snapshot store — local copy of page wikitext keyed by title and revision id.
+
+Compare/update scripts read the same few thousand infobox pages on every
+run, and most of them have not been edited since the last run. Instead of
+re-downloading every body, fetch_pages():
+
+  1. asks the API for the latest revision id of each title
+     (preloadpages(content=False): revisions without text, 50 titles per request)
+  2. downloads wikitext only for pages whose revid differs from the snapshot
+  3. returns {title: wikitext} for every existing page, from the snapshot
+
+Snapshots live in JSON Data/wiki_snapshot.sqlite, one row per (site, title).
+Scripts that save pages call remember(page) afterwards so their own edits do
+not trigger a re-download on the next run.
+
+Revision checks and body downloads are paced by the site's rate limiter
+(utils/rate_limiter.py, installed by wiki_utils.get_site()).
+
+Public API:
+  fetch_pages(site, titles, batch_size=50)  →  dict[str, str]   (title → wikitext)
+  revids(site, titles)                      →  dict[str, int]   (title → stored revid)
+  remember(page)                            →  None
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pywikibot
+
+import config.constants as constants
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+_DB_FILE = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "wiki_snapshot.sqlite")
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def _site_key(site) -> str:
+    return f"{site.family.name}:{site.code}"
+
+
+def _connect() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(_DB_FILE), exist_ok=True)
+    conn = sqlite3.connect(_DB_FILE, timeout=30)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pages ("
+        " site TEXT NOT NULL, title TEXT NOT NULL, revid INTEGER NOT NULL, text TEXT NOT NULL,"
+        " PRIMARY KEY (site, title))"
+    )
+    return conn
+
+
+def _load_rows(site_key: str, titles: list[str]) -> dict[str, tuple[int, str]]:
+    rows: dict[str, tuple[int, str]] = {}
+    with _connect() as conn:
+        # SQLite caps bound parameters; 500 is well below every build's limit
+        for start in range(0, len(titles), 500):
+            chunk = titles[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for title, revid, text in conn.execute(
+                f"SELECT title, revid, text FROM pages WHERE site = ? AND title IN ({placeholders})",
+                [site_key, *chunk],
+            ):
+                rows[title] = (revid, text)
+    return rows
+
+
+def _load_revids(site_key: str, titles: list[str]) -> dict[str, int]:
+    revids: dict[str, int] = {}
+    with _connect() as conn:
+        for start in range(0, len(titles), 500):
+            chunk = titles[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for title, revid in conn.execute(
+                f"SELECT title, revid FROM pages WHERE site = ? AND title IN ({placeholders})",
+                [site_key, *chunk],
+            ):
+                revids[title] = revid
+    return revids
+
+
+def _save_rows(site_key: str, rows: list[tuple[str, int, str]]) -> None:
+    if not rows:
+        return
+    with _connect() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO pages (site, title, revid, text) VALUES (?, ?, ?, ?)",
+            [(site_key, title, revid, text) for title, revid, text in rows],
+        )
+
+# ---------------------------------------------------------------------------
+# API access
+# ---------------------------------------------------------------------------
+
+def _latest_revids(site, titles: list[str], batch_size: int) -> dict[str, int]:
+    """{normalized title: latest revid} for the titles that exist."""
+    pages = (pywikibot.Page(site, t) for t in titles)
+    revids: dict[str, int] = {}
+    for page in site.preloadpages(pages, groupsize=batch_size, content=False):
+        if page.exists():
+            revids[page.title()] = page.latest_revision_id
+    return revids
+
+
+def _download(site, titles: list[str], batch_size: int) -> list[tuple[str, int, str]]:
+    rows: list[tuple[str, int, str]] = []
+    for start in range(0, len(titles), batch_size):
+        batch = [pywikibot.Page(site, t) for t in titles[start:start + batch_size]]
+        for page in site.preloadpages(batch, groupsize=batch_size):
+            if page.exists():
+                rows.append((page.title(), page.latest_revision_id, page.text or ""))
+    return rows
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def fetch_pages(site, titles: list[str], batch_size: int = 50) -> dict[str, str]:
+    """
+    Return {title: wikitext} for the existing pages among titles, downloading
+    only pages edited since they were last stored. Keys are normalized titles,
+    as returned by Page.title().
+    """
+    if not titles:
+        return {}
+    site_key = _site_key(site)
+    revids = _latest_revids(site, list(titles), batch_size)
+    stored = _load_rows(site_key, list(revids))
+
+    stale = [title for title, revid in revids.items() if stored.get(title, (None,))[0] != revid]
+    downloaded = _download(site, stale, batch_size) if stale else []
+    _save_rows(site_key, downloaded)
+
+    texts = {title: text for title, (_, text) in stored.items()}
+    texts.update((title, text) for title, _, text in downloaded)
+    return {title: texts[title] for title in revids if title in texts}
+
+
+def revids(site, titles: list[str]) -> dict[str, int]:
+    """
+    {title: revid} of the stored snapshot for titles. Right after
+    fetch_pages() these are the latest revision ids, at no extra API cost.
+    """
+    return _load_revids(_site_key(site), list(titles)) if titles else {}
+
+
+def remember(page) -> None:
+    """Store a page just saved by this script under its new revision id."""
+    if page.exists():
+        _save_rows(_site_key(page.site), [(page.title(), page.latest_revision_id, page.text or "")])
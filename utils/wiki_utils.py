@@ -1,9 +1,17 @@
 import sys
 import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
 import pywikibot
 import mwparserfromhell
 from pywikibot.pagegenerators import PreloadingGenerator
+from pywikibot.throttle import Throttle
 import config.constants as constants
+from utils import wiki_snapshot
+from utils.rate_limiter import AdaptiveLimiter
 
 # Pywikibot initialization (path & settings)
 sys.path.append(constants.ADDITIONAL_PATHS["PWB"])
@@ -12,14 +20,76 @@ pywikibot.config.max_retries = constants.PWB_SETTINGS["MAX_RETRIES"]
 pywikibot.config.retry_wait  = constants.PWB_SETTINGS["SLEEP_INTERVAL"]
 pywikibot.config.user_agent  = constants.PWB_SETTINGS["USER_AGENT"]
 
+_READS_PER_SECOND  = constants.PWB_SETTINGS.get("READS_PER_SECOND", 5)
+# About the old put_throttle + SLEEP_INTERVAL pacing; operators opt in to faster writes
+_WRITES_PER_MINUTE = constants.PWB_SETTINGS.get("WRITES_PER_MINUTE", 6)
+
+
+class _LimiterThrottle(Throttle):
+    """
+    Pywikibot throttle backed by an AdaptiveLimiter.
+
+    Pywikibot calls the throttle before every API request (write=True for
+    edits/uploads), sets retry_after from each response and calls lag() on
+    maxlag errors, so those hooks are all the limiter needs.
+    """
+
+    def __init__(self, site, limiter: AdaptiveLimiter):
+        self.limiter = limiter
+        super().__init__(site)
+
+    @property
+    def retry_after(self):
+        return self._retry_after
+
+    @retry_after.setter
+    def retry_after(self, value):
+        self._retry_after = value
+        if value:
+            self.limiter.backoff(value)
+        else:
+            self.limiter.healthy()
+
+    def __call__(self, requestsize: int = 1, write: bool = False) -> None:
+        if write:
+            self.limiter.write()
+        else:
+            self.limiter.read()
+
+    def lag(self, lagtime: float | None = None) -> None:
+        # A Retry-After header already backed off when retry_after was set
+        if not self._retry_after:
+            waittime = lagtime or pywikibot.config.retry_wait
+            self.limiter.backoff(min(waittime, pywikibot.config.retry_max))
+        self.limiter.wait_paused()
+
+
+def limit_site(site: pywikibot.Site) -> pywikibot.Site:
+    """
+    Route every API request for site through a shared AdaptiveLimiter
+    (reads / writes budgets from PWB_SETTINGS). Safe to call repeatedly.
+    """
+    if not isinstance(site.throttle, _LimiterThrottle):
+        limiter = AdaptiveLimiter(_READS_PER_SECOND, _WRITES_PER_MINUTE / 60, burst=_READS_PER_SECOND)
+        # BaseSite.throttle is a cached property stored on _throttle
+        site._throttle = _LimiterThrottle(site, limiter)
+    return site
+
+
+def rate_limiter(site: pywikibot.Site = None) -> AdaptiveLimiter:
+    """The adaptive limiter for site (default: get_site())."""
+    return limit_site(site or get_site()).throttle.limiter
+
+
 def get_site(
     code: str = "en",
     family: str = "sunhaven"
 ) -> pywikibot.Site:
     """
-    Return a configured Site object with PWB settings applied.
+    Return a configured Site object with PWB settings applied and its
+    requests routed through the adaptive rate limiter.
     """
-    return pywikibot.Site(code, family)
+    return limit_site(pywikibot.Site(code, family))
 
 
 def get_pages_with_template(
@@ -47,19 +117,147 @@ def get_pages_with_template(
 
 def fetch_pages(
     titles: list[str],
-    batch_size: int = 50
+    batch_size: int = 50,
+    use_snapshot: bool = True
 ) -> dict[str, str]:
     """
     Given a list of page titles, return a dict mapping title -> wikitext.
-    Uses PreloadingGenerator for efficient bulk fetch.
+
+    By default pages come from the local revision-keyed snapshot
+    (utils/wiki_snapshot.py): only pages edited since the last run are
+    downloaded. use_snapshot=False always downloads every page.
     """
     site = get_site()
+    if use_snapshot:
+        return wiki_snapshot.fetch_pages(site, titles, batch_size)
     page_objs = (pywikibot.Page(site, t) for t in titles)
     # Pass batch_size as positional parameter to avoid keyword errors
     pg = PreloadingGenerator(page_objs, batch_size)
     return {page.title(): page.text for page in pg}
 
 
+@dataclass(frozen=True)
+class PageStatus:
+    """Existence of one title on the wiki, as returned by resolve_titles()."""
+    title: str                      # normalized title ("file:foo.png" → "File:Foo.png")
+    exists: bool
+    redirect_target: str | None     # where the page redirects to; None when it is not a redirect
+    revid: int | None               # latest revision id; None when the page is missing
+
+
+def _query_titles(site: pywikibot.Site, titles: list[str], **params) -> dict:
+    request = site.simple_request(action="query", titles=titles, **params)
+    return request.submit().get("query", {})
+
+
+def _query_pages(query: dict) -> list[dict]:
+    # formatversion 1 keys pages by page id, formatversion 2 lists them
+    pages = query.get("pages", [])
+    return list(pages.values()) if isinstance(pages, dict) else pages
+
+
+def resolve_titles(
+    titles: Iterable[str],
+    site: pywikibot.Site = None,
+    batch_size: int = 50
+) -> dict[str, PageStatus]:
+    """
+    Resolve many titles at once: {requested title: PageStatus}.
+
+    Titles go to the API batch_size at a time (prop=info), so checking a few
+    hundred pages costs a handful of requests instead of one Page.exists()
+    round-trip each. Redirect targets cost one extra request for batches
+    that contain redirects.
+    """
+    site = site or get_site()
+    unique = list(dict.fromkeys(titles))
+    statuses: dict[str, PageStatus] = {}
+
+    for start in range(0, len(unique), batch_size):
+        batch = unique[start:start + batch_size]
+        query = _query_titles(site, batch, prop="info")
+        normalized = {entry["from"]: entry["to"] for entry in query.get("normalized", [])}
+        info = {page["title"]: page for page in _query_pages(query)}
+
+        redirects = [title for title, page in info.items() if page.get("redirect") not in (None, False)]
+        targets: dict[str, str] = {}
+        if redirects:
+            resolved = _query_titles(site, redirects, redirects=True)
+            targets = {entry["from"]: entry["to"] for entry in resolved.get("redirects", [])}
+
+        for title in batch:
+            key = normalized.get(title, title)
+            page = info.get(key, {})
+            exists = bool(page) and "missing" not in page and "invalid" not in page
+            statuses[title] = PageStatus(
+                title=key,
+                exists=exists,
+                redirect_target=targets.get(key),
+                revid=page.get("lastrevid") if exists else None,
+            )
+
+    return statuses
+
+
+def existing_titles(
+    titles: Iterable[str],
+    site: pywikibot.Site = None,
+    batch_size: int = 50
+) -> set[str]:
+    """The requested titles that already exist on the wiki (redirects count as existing)."""
+    return {title for title, status in resolve_titles(titles, site, batch_size).items() if status.exists}
+
+
+def prefetch_batches(
+    titles: list[str],
+    batch_size: int = 50,
+    fetch: Callable[[list[str]], dict[str, str]] | None = None,
+    depth: int = 1
+) -> Iterator[tuple[list[str], dict[str, str]]]:
+    """
+    Yield (batch, {title: wikitext}) for consecutive batches of titles while a
+    background thread fetches the next `depth` batches.
+
+    Fetching (network + rate limiter waits) overlaps with whatever the
+    caller does with the current batch, so a compare loop takes roughly
+    max(fetch, compare) instead of their sum. fetch defaults to fetch_pages;
+    its exceptions are re-raised in the caller.
+    """
+    if fetch is None:
+        fetch = lambda batch: fetch_pages(batch, batch_size=batch_size)
+
+    batches = [titles[i:i + batch_size] for i in range(0, len(titles), batch_size)]
+    ready: queue.Queue = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def producer() -> None:
+        for batch in batches:
+            try:
+                entry = (batch, fetch(batch), None)
+            except BaseException as exc:  # includes interrupts, so the caller never waits forever
+                entry = (batch, None, exc)
+            # Re-check stop while waiting so an abandoned consumer frees the thread
+            while not stop.is_set():
+                try:
+                    ready.put(entry, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+            if stop.is_set() or entry[2] is not None:
+                return
+
+    worker = threading.Thread(target=producer, name="wiki-prefetch", daemon=True)
+    worker.start()
+    try:
+        for _ in batches:
+            batch, texts, error = ready.get()
+            if error is not None:
+                raise error
+            yield batch, texts
+    finally:
+        stop.set()
+
+
 def parse_template_params(
     wikitext: str,
     template_name: str
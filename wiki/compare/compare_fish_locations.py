@@ -2,7 +2,8 @@
 Fish locations compare — wiki vs. data.
 
 Fetches all wiki pages that use {{Fish locations}}, parses the template,
-and compares against values computed from fish_spawner_data.json + items_data.json.
+and compares against the fish spawn table built from fish_spawner_data.json +
+items_data.json by exporters/fish_spawn_chance.py.
 
 Output mirrors compare_item_infobox.py:
   - Mismatches  (fish with differing entries between data and wiki)
@@ -17,7 +18,6 @@ from __future__ import annotations
 
 import os
 import sys
-import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
@@ -26,15 +26,14 @@ import re
 import mwparserfromhell
 
 import config.constants as constants
-from builders.item_builder import _load_cache
-from utils import json_utils, file_utils, wiki_utils
-from exporters.fish_spawn_chance import _SCENE_LOCATION_MAPPING, _compute_location_rows
+from utils import file_utils, reconcile, wiki_utils
+from utils.fish_spawn_engine import SpawnTable
+from exporters.fish_spawn_chance import load_spawn_table
 
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
 
-_FISH_DATA   = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "fish_spawner_data.json")
 _OUTPUT_FILE = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot", "fish_locations_compare.txt")
 _DEBUG_LOG   = os.path.join(constants.DEBUG_DIRECTORY, "pywikibot", "fish_locations_compare_debug.txt")
 
@@ -42,32 +41,23 @@ TEST_RUN   = False
 TEST_PAGES = ["Blazing Herring", "Angel Fish", "Turkeyfish"]
 
 BATCH_SIZE     = constants.PWB_SETTINGS["BATCH_SIZE"]
-SLEEP_INTERVAL = constants.PWB_SETTINGS["SLEEP_INTERVAL"]
 
 # ---------------------------------------------------------------------------
 # Expected data builder
 # ---------------------------------------------------------------------------
 
-def _build_expected_data(
-    fish_spawner_data: dict,
-    items_by_name: dict,
-) -> dict[str, set[tuple]]:
+def _build_expected_data(table: SpawnTable) -> dict[str, set[tuple]]:
     """
-    Compute expected (location, season, min, max) entries per fish from
-    scene data, using the same logic as the exporter.
+    Expected (location, season, min, max) entries per fish, read from the
+    exporter's spawn table (the same rows it writes to the wiki).
 
     Returns: { fish_name (original case): {(location, season, min, max), ...} }
     """
     fish_to_entries: dict[str, set] = {}
 
-    for scene_name, location_name in _SCENE_LOCATION_MAPPING.items():
-        scene_data = fish_spawner_data.get(scene_name)
-        if not scene_data:
-            continue
-
-        for row in _compute_location_rows(scene_data, items_by_name, location_name):
-            entry = (row["location"], row["season"], row["min"], row["max"])
-            fish_to_entries.setdefault(row["fish"], set()).add(entry)
+    for row in table.location_rows():
+        entry = (row["location"], row["season"], row["min"], row["max"])
+        fish_to_entries.setdefault(row["fish"], set()).add(entry)
 
     return fish_to_entries
 
@@ -155,14 +145,11 @@ def run() -> None:
     file_utils.ensure_dir_exists(os.path.dirname(_OUTPUT_FILE))
     file_utils.ensure_dir_exists(os.path.dirname(_DEBUG_LOG))
 
-    # Build expected data from scene JSON + items cache
-    fish_spawner_data = json_utils.load_json(_FISH_DATA)
-    items             = _load_cache()
-    items_by_name     = {item.name: item for item in items.values()}
-    expected_data     = _build_expected_data(fish_spawner_data, items_by_name)
+    # Expected data from the precomputed spawn table (rebuilt only if stale)
+    expected_data = _build_expected_data(load_spawn_table())
 
-    # Build a lowercase lookup for matching wiki page titles
-    expected_lower = {name.lower(): name for name in expected_data}
+    # Case-insensitive title index; unmatched fish are the Data Only list
+    reconciler = reconcile.Reconciler(expected_data.keys(), normalize=str.lower)
 
     # Fetch wiki pages
     pages = TEST_PAGES if TEST_RUN else wiki_utils.get_pages_with_template("Fish locations")
@@ -171,37 +158,35 @@ def run() -> None:
     processed = 0
 
     mismatches:  list = []
-    data_only:   list = sorted(expected_data.keys())   # remove as we find wiki matches
-    wiki_only:   list = []
     debug_lines: list = []
 
-    for i in range(0, total, BATCH_SIZE):
-        batch      = pages[i : i + BATCH_SIZE]
-        page_texts = wiki_utils.fetch_pages(batch, batch_size=BATCH_SIZE)
+    # The next batch is fetched in the background while this one is compared
+    for batch_no, (batch, page_texts) in enumerate(
+        wiki_utils.prefetch_batches(pages, batch_size=BATCH_SIZE)
+    ):
 
         for title in batch:
             processed += 1
             text      = page_texts.get(title, "")
-            title_key = title.lower()
 
             wiki_entries = _parse_fish_locations(text)
 
             if wiki_entries is None:
                 # Page exists but has no {{Fish locations}} template
-                wiki_only.append(title)
+                reconciler.add_wiki_only(title)
                 debug_lines.append(f"[NO TEMPLATE] {title}")
                 continue
 
-            if title_key not in expected_lower:
+            matched = reconciler.lookup(title)
+            if not matched:
                 # Wiki has template but we have no data for this fish
-                wiki_only.append(title)
+                reconciler.add_wiki_only(title)
                 debug_lines.append(f"[WIKI ONLY] {title}")
                 continue
 
-            # Found a match — remove from data_only tracking
-            canonical = expected_lower[title_key]
-            if canonical in data_only:
-                data_only.remove(canonical)
+            # Found a match — drop it from the Data Only list
+            canonical = matched[0]
+            reconciler.claim(canonical)
 
             d_only, w_only, v_diff = _compare_entries(
                 expected_data[canonical], wiki_entries
@@ -222,38 +207,32 @@ def run() -> None:
             else:
                 debug_lines.append(f"[MATCH] {title}")
 
-        if i // BATCH_SIZE % 10 == 0:
+        if batch_no % 10 == 0:
             percent = round((processed / total) * 100, 1)
             print(
                 f"     🔄 Reviewed {processed} of {total} pages "
-                f"({percent}% complete). Sleeping {SLEEP_INTERVAL} seconds."
+                f"({percent}% complete)."
             )
-            if not TEST_RUN:
-                time.sleep(SLEEP_INTERVAL)
 
     # Write report
-    with open(_OUTPUT_FILE, "w", encoding="utf-8") as out:
-        out.write("=== Mismatches ===\n")
-        for title, d_only, w_only, v_diff in mismatches:
-            out.write(f"{title}\n")
-            for loc, season, mn, mx in sorted(d_only):
-                out.write(f"    - [MISSING FROM WIKI] {loc} | {season}: {mn}% → {mx}%\n")
-            for loc, season, mn, mx in sorted(w_only):
-                out.write(f"    - [EXTRA ON WIKI] {loc} | {season}: {mn}% → {mx}%\n")
-            for loc, season, emn, emx, amn, amx in sorted(v_diff):
-                out.write(
-                    f"    - [WRONG VALUES] {loc} | {season}: "
-                    f"expected {emn}%→{emx}%, found {amn}%→{amx}%\n"
-                )
-            out.write("\n")
-
-        out.write("=== Data Only ===\n")
-        for name in sorted(data_only, key=str.lower):
-            out.write(f"{name}\n")
-
-        out.write("\n=== Wiki Only ===\n")
-        for name in sorted(wiki_only, key=str.lower):
-            out.write(f"{name}\n")
+    report = []
+    for title, d_only, w_only, v_diff in mismatches:
+        lines = [f"[MISSING FROM WIKI] {loc} | {season}: {mn}% → {mx}%" for loc, season, mn, mx in sorted(d_only)]
+        lines += [f"[EXTRA ON WIKI] {loc} | {season}: {mn}% → {mx}%" for loc, season, mn, mx in sorted(w_only)]
+        lines += [
+            f"[WRONG VALUES] {loc} | {season}: expected {emn}%→{emx}%, found {amn}%→{amx}%"
+            for loc, season, emn, emx, amn, amx in sorted(v_diff)
+        ]
+        report.append((title, lines))
+
+    reconcile.write_report(
+        _OUTPUT_FILE,
+        report,
+        reconciler.json_only(sort_key=str.lower),
+        reconciler.wiki_only(sort_key=str.lower),
+        json_label="Data Only",
+        wiki_label="Wiki Only",
+    )
 
     with open(_DEBUG_LOG, "w", encoding="utf-8") as dbg:
         dbg.write("\n".join(debug_lines))
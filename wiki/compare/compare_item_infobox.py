@@ -1,14 +1,13 @@
 import os
-import re
 import sys
-import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 import config.constants as constants
-from config.skip_items import SKIP_ITEMS, SKIP_FIELDS
+from config.skip_items import SKIP_FIELDS
 from wiki.shared import item_infobox_core
-from utils import file_utils, text_utils, wiki_utils
+from utils import file_utils, reconcile, text_utils, wiki_utils
+from utils.skip_matcher import skip_matcher
 
 TEST_RUN = False
 TEST_PAGES = [
@@ -31,7 +30,6 @@ debug_log_path = os.path.join(
 file_utils.ensure_dir_exists(os.path.dirname(debug_log_path))
 
 BATCH_SIZE = constants.PWB_SETTINGS["BATCH_SIZE"]
-SLEEP_INTERVAL = constants.PWB_SETTINGS["SLEEP_INTERVAL"]
 
 # Core decides which keys actually matter based on the infobox template.
 # This is only a required fallback argument.
@@ -42,50 +40,50 @@ data = item_infobox_core.load_normalized_json(json_file_path)
 
 matches = []
 mismatches = []
-jsononly = list(data.keys())
-wikionly = []
 debug_lines = []
 
 
-# Build variant map: base -> [variants]
-variant_map = {}
-for key in jsononly:
-    base_match = re.match(r"^(.*) \(([^)]+)\)$", key)
-    if base_match:
-        base = base_match.group(1)
-        variant_map.setdefault(base, []).append(key)
-    elif any(key.endswith(" " + p) for p in ["mount whistle", "pet"]):
-        parts = key.split(" ")
-        for i in range(1, len(parts)):
-            base = " ".join(parts[i:])
-            variant_map.setdefault(base, []).append(key)
+def _normalize(title):
+    return text_utils.normalize_apostrophe(title).lower()
+
+
+# Title and base -> [variants] indexes are built once; unmatched JSON keys
+# and wiki-only titles are tracked by the reconciler
+reconciler = reconcile.Reconciler(data.keys(), normalize=_normalize, group_variants=True)
 
 
 total = len(pages)
 processed = 0
 
-for i in range(0, total, BATCH_SIZE):
-    batch = pages[i : i + BATCH_SIZE]
-
-    # Use shared wiki util (PreloadingGenerator + site config)
-    page_texts = wiki_utils.fetch_pages(batch, batch_size=BATCH_SIZE)
+# Shared wiki util: unchanged pages come from the local snapshot, and requests
+# are paced by the site's rate limiter, so this loop does not sleep. The next
+# batch is fetched in the background while this one is compared.
+for batch_no, (batch, page_texts) in enumerate(
+    wiki_utils.prefetch_batches(pages, batch_size=BATCH_SIZE)
+):
 
     for title in batch:
         processed += 1
-        text = page_texts.get(title, "")
         normalized_title = text_utils.normalize_apostrophe(title).lower()
 
-        if normalized_title in SKIP_ITEMS:
+        if skip_matcher().is_listed(normalized_title):
             continue
 
-        subtype = item_infobox_core.extract_subtype(text)
+        # Parsed once; every compare below reuses the located infobox
+        page = item_infobox_core.ParsedPage(title, page_texts.get(title, ""))
+        subtype = page.subtype
+
+        kind, keys = reconciler.classify(
+            title, include_prefixed=subtype in ["Mount", "Pet"]
+        )
 
         # Exact JSON match
-        if normalized_title in data:
+        if kind == reconcile.MATCH:
+            item_key = keys[0]
             diffs, _ = item_infobox_core.compare_page_to_json(
                 title,
-                text,
-                data[normalized_title],
+                page,
+                data[item_key],
                 KEYS_TO_CHECK,
                 skip_fields_map=SKIP_FIELDS,
                 all_data=data,
@@ -101,24 +99,17 @@ for i in range(0, total, BATCH_SIZE):
                 matches.append(title)
                 debug_lines.append(f"[MATCH] {title}")
 
-            if normalized_title in jsononly:
-                jsononly.remove(normalized_title)
+            reconciler.claim(item_key)
 
-        # Variant match
-        elif normalized_title in variant_map:
+        # Variant match (mount / pet prefixes only count for those subtypes)
+        elif kind == reconcile.VARIANTS:
             matching = []
             differing = []
 
-            for variant in variant_map[normalized_title]:
-                if (
-                    subtype not in ["Mount", "Pet"]
-                    and not re.search(r" \([^)]+\)$", variant)
-                ):
-                    continue
-
+            for variant in keys:
                 diffs, _ = item_infobox_core.compare_page_to_json(
                     title,
-                    text,
+                    page,
                     data[variant],
                     KEYS_TO_CHECK,
                     skip_fields_map=SKIP_FIELDS,
@@ -138,8 +129,7 @@ for i in range(0, total, BATCH_SIZE):
                 else:
                     matching.append(variant)
 
-                if variant in jsononly:
-                    jsononly.remove(variant)
+                reconciler.claim(variant)
 
             if differing:
                 debug_lines.append(f"[VARIANT - MISMATCH] {title}")
@@ -176,41 +166,23 @@ for i in range(0, total, BATCH_SIZE):
 
         # Wiki-only
         else:
-            wikionly.append(title)
+            reconciler.add_wiki_only(title)
             debug_lines.append(f"[WIKI ONLY] {title}")
 
-    if i // BATCH_SIZE % 10 == 0:
+    if batch_no % 10 == 0:
         percent = round((processed / total) * 100, 1)
         print(
             f"     🔄 Reviewed {processed} of {total} pages "
-            f"({percent}% complete). Sleeping {SLEEP_INTERVAL} seconds."
+            f"({percent}% complete)."
         )
-        if not TEST_RUN:
-            time.sleep(SLEEP_INTERVAL)
-
-
-os.makedirs(os.path.dirname(output_file), exist_ok=True)
-with open(output_file, "w", encoding="utf-8") as out:
-    out.write("=== Mismatches ===\n")
-    for title, diffs in mismatches:
-        out.write(f"{title}\n")
-        for field, exp, act in diffs:
-            if field == "MATCH EXACTLY":
-                out.write(f"    - {exp} {field}\n")
-            else:
-                out.write(
-                    f"    - {field}: expected '{exp}' but found '{act}'\n"
-                )
-        out.write("\n")
 
-    out.write("=== JSON Only ===\n")
-    for name in sorted(jsononly):
-        out.write(f"{name}\n")
-
-    out.write("\n=== WIKI Only ===\n")
-    for name in sorted(wikionly):
-        out.write(f"{name}\n")
 
+reconcile.write_report(
+    output_file,
+    [(title, reconcile.format_diff_lines(diffs)) for title, diffs in mismatches],
+    reconciler.json_only(),
+    reconciler.wiki_only(),
+)
 
 with open(debug_log_path, "w", encoding="utf-8") as dbg:
     dbg.write("\n".join(debug_lines))
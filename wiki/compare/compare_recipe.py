@@ -1,14 +1,14 @@
 import os
 import sys
-import time
 import mwparserfromhell
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 import config.constants as constants
-from config.skip_items import SKIP_ITEMS, SKIP_FIELDS
+from config.skip_items import SKIP_FIELDS
 from wiki.shared import recipe_core
 from utils import file_utils, recipe_utils
+from utils.skip_matcher import skip_matcher
 
 json_file_path = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "recipes_data.json")
 output_file = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot", "recipe_compare.txt")
@@ -19,7 +19,6 @@ file_utils.ensure_dir_exists(os.path.dirname(debug_log_path))
 
 KEYS_TO_CHECK = ["product", "workbench", "ingredients", "time", "yield", "id"]
 BATCH_SIZE = constants.PWB_SETTINGS["BATCH_SIZE"]
-SLEEP_INTERVAL = constants.PWB_SETTINGS["SLEEP_INTERVAL"]
 
 def normalize_field(field, value):
     if field == "ingredients":
@@ -43,6 +42,7 @@ pages += recipe_core.get_recipe_none_pages()
 pages = list(set(pages))
 
 data = recipe_core.load_normalized_json(json_file_path)
+products = recipe_core.build_product_index(data)
 
 mismatches = []
 debug_lines = []
@@ -57,7 +57,7 @@ for i in range(0, total, BATCH_SIZE):
 
     for title in batch:
         processed += 1
-        if title in SKIP_ITEMS:
+        if skip_matcher().is_listed(title):
             continue
 
         text = page_texts.get(title, "")
@@ -68,7 +68,7 @@ for i in range(0, total, BATCH_SIZE):
             # Check for recipe/none
             none_templates = [tpl for tpl in parsed.filter_templates() if tpl.name.strip().lower() == "recipe/none"]
             if none_templates:
-                key, matched_json = recipe_core.find_json_by_product_name(data, title)
+                key, matched_json = recipe_core.find_json_by_product_name(data, title, index=products)
                 if matched_json:
                     rid = matched_json.get("recipe_id")
                     debug_lines.append(f"[RECIPE/NONE] {title} - Matching recipe ID {rid} found in JSON")
@@ -80,7 +80,7 @@ for i in range(0, total, BATCH_SIZE):
             continue
 
         for template in templates:
-            matched_json, logs = recipe_core.match_json_recipe(template, title, data, len(templates))
+            matched_json, logs = recipe_core.match_json_recipe(template, title, data, len(templates), index=products)
             debug_lines.extend(logs)
 
             if not matched_json:
@@ -119,8 +119,7 @@ for i in range(0, total, BATCH_SIZE):
 
     if processed % 500 == 0:
         percent = round((processed / total) * 100, 1)
-        print(f"     🔄 Reviewed {processed} of {total} pages ({percent}% complete). Sleeping {SLEEP_INTERVAL} seconds.")
-        time.sleep(SLEEP_INTERVAL)
+        print(f"     🔄 Reviewed {processed} of {total} pages ({percent}% complete).")
 
 # Write main output
 with open(output_file, "w", encoding="utf-8") as out:
@@ -6,20 +6,22 @@ Ensure image files are in the right place.
 
 import os
 import sys
-import time
-import traceback
 import pywikibot
+from functools import partial
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
-from config.skip_items import SKIP_ITEMS, SKIP_IMAGES
+from config.skip_items import SKIP_IMAGES
+from utils import wiki_utils
+from utils.image_upload import ImageJob, upload_images
+from utils.image_utils import render_image
+from utils.skip_matcher import skip_matcher
 from datetime import datetime
-from PIL import Image
 
 # Set up pyWikiBot configurations
 sys.path.append(constants.ADDITIONAL_PATHS["PWB"])
-site = pywikibot.Site()
+site = wiki_utils.limit_site(pywikibot.Site())  # API calls paced by the shared rate limiter
 pywikibot.config.verbose_output = False
 pywikibot.config.log = []
 pywikibot.config.noisy_output = False
@@ -38,71 +40,51 @@ missing_files = []
 target_scale = 5  # Scale image dimensions
 summary_text = "Uploading upscaled version of image"
 upload_template = "{{License|game}}"  
-CHUNK_SIZE = 5
-CHUNK_SLEEP_SECONDS = 10
 
 def log_debug(message):
     timestamp = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
     with open(debug_log_path, "a", encoding="utf-8") as f:
         f.write(f"{timestamp} {message}\n")
 
-def scale_image(image_path, scale):
-    with Image.open(image_path) as img:
-        new_size = (img.width * scale, img.height * scale)
-        return img.resize(new_size, Image.NEAREST)
-    
-def chunk_list(lst, chunk_size):
-    for i in range(0, len(lst), chunk_size):
-        yield lst[i:i + chunk_size]
-
-def upload_image(image, upload_name):
-    temp_path = os.path.join(output_file_path, upload_name)
-    image.save(temp_path)
-
-    page = pywikibot.FilePage(site, "File:" + upload_name)
-    page.text = upload_template
-
-    try:
-        if page.exists():
-            log_debug(f"Skipped upload for {upload_name} (already exists on wiki)")
-        else:
-            page.upload(temp_path, comment=summary_text, ignore_warnings=False)
-            log_debug(f"Uploaded: {upload_name}")
-    except Exception as e:
-        log_debug(f"Upload failed for {upload_name}: {e}")
-        log_debug(traceback.format_exc())
-    finally:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
-
-def process_image_line(line):
+def upload_title(line):
+    """File: title an input line uploads to (None for malformed lines)."""
     if '->' not in line:
-        return
+        return None
+    return "File:" + line.split('->', 1)[0].strip() + ".png"
+
+def process_image_line(line, existing_files):
+    """ImageJob for one "item -> texture file" line, or None when it is skipped."""
+    if '->' not in line:
+        return None
 
     item_name, file_name = [x.strip() for x in line.split('->', 1)]
 
-    if item_name.lower() in SKIP_ITEMS:
+    if skip_matcher().is_listed(item_name):
         log_debug(f"Skipping item (in SKIP_ITEMS): {item_name}")
-        return
+        return None
     if file_name in SKIP_IMAGES:
         log_debug(f"Skipping image (in SKIP_IMAGES): {file_name}")
-        return
+        return None
 
     upload_name = item_name + ".png"
+    if "File:" + upload_name in existing_files:
+        log_debug(f"Skipped upload for {upload_name} (already exists on wiki)")
+        return None
+
     image_path = os.path.join(image_input_directory, file_name)
 
     if not os.path.exists(image_path):
         log_debug(f"Missing file for upload: {file_name} (Expected path: {image_path})")
         missing_files.append(f"{item_name} -> {file_name}")
-        return
+        return None
 
-    try:
-        log_debug(f"Processing: {item_name}")
-        scaled_image = scale_image(image_path, target_scale)
-        upload_image(scaled_image, upload_name)
-    except Exception as e:
-        log_debug(f"Error with {item_name}: {e}")
-        log_debug(traceback.format_exc())
+    log_debug(f"Processing: {item_name}")
+    return ImageJob(
+        upload_name,
+        partial(render_image, image_path, scale=target_scale),
+        text=upload_template,
+        comment=summary_text,
+    )
 
 def main():
     if not os.path.exists(input_file_path):
@@ -113,24 +95,32 @@ def main():
     with open(input_file_path, 'r', encoding='utf-8') as f:
         lines = [line.strip() for line in f if line.strip()]
 
-    total = len(lines)
+    # One batched existence check for every upload instead of one request per image
+    existing_files = wiki_utils.existing_titles(
+        [title for title in map(upload_title, lines) if title], site
+    )
+
+    jobs = [job for job in (process_image_line(line, existing_files) for line in lines) if job]
+
+    total = len(jobs)
     actual_processed = 0
     last_reported_percent = -1
 
-    for i, chunk in enumerate(chunk_list(lines, CHUNK_SIZE), start=1):
-        for line in chunk:
-            process_image_line(line)
-            actual_processed += 1
-
-            percent = int((actual_processed / total) * 100)
-            if percent >= last_reported_percent + 10:
-                print(f"  ✅ {actual_processed}/{total} image uploads complete — ({percent}%). Sleeping {CHUNK_SLEEP_SECONDS}s...")
-                last_reported_percent = percent
+    # Images are scaled / encoded in worker processes while uploads run here
+    for result in upload_images(jobs, site):
+        if result.uploaded:
+            log_debug(f"Uploaded: {result.job.filename}")
+        else:
+            log_debug(f"{result.error} ({result.job.filename})")
+        actual_processed += 1
 
-        time.sleep(CHUNK_SLEEP_SECONDS)
+        percent = int((actual_processed / total) * 100)
+        if percent >= last_reported_percent + 10:
+            print(f"  ✅ {actual_processed}/{total} image uploads complete — ({percent}%).")
+            last_reported_percent = percent
 
     # Optional: Final summary
-    print(f"\n✅ Upload complete: {actual_processed}/{total} files processed.")
+    print(f"\n✅ Upload complete: {actual_processed}/{total} files processed ({len(lines)} listed).")
 
 if __name__ == "__main__":
     main()
@@ -6,59 +6,47 @@ wiki/validators/missing_item.py
 
 import os
 import sys
-import time
 import pywikibot
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
-from config.skip_items import SKIP_ITEMS, SKIP_PATTERNS
 from builders.item_builder import _load_cache
 from formatters.pages.item_page import export_item_page
+from utils import wiki_utils
 from utils.file_utils import read_file_lines, write_debug_log
+from utils.skip_matcher import skip_matcher
 
 # Set up necessary configurations
 sys.path.append(constants.ADDITIONAL_PATHS["PWB"])
-site = pywikibot.Site()
+site = wiki_utils.limit_site(pywikibot.Site())  # API calls paced by the shared rate limiter
 
 # Paths
 input_file = os.path.join(constants.OUTPUT_DIRECTORY, "Unique_Items_For_Patch.txt")
 debug_log_path = os.path.join(constants.DEBUG_DIRECTORY, "pywikibot", "pywikibot_create_item_page.txt")
 
 # Constants
-CHUNK_SIZE = 750
-CHUNK_SLEEP_SECONDS = 3
 SUMMARY_TEXT = "Page creation for a new item from most recent patch."
 
 # Load items cache — returns dict[lowercase_name -> ItemData]
 items_cache = _load_cache()
 
-# Load skip items
-skip_items_lower = {item.lower() for item in SKIP_ITEMS}
-skip_patterns_lower = [pattern.lower().replace('*', '') for pattern in SKIP_PATTERNS]
-
 # Read the items list
 item_names = [line.strip() for line in read_file_lines(input_file)]
 total = len(item_names)
 actual_processed = 0
 
-# Function to check skip patterns
+# Same skip rules as the item builder and the missing item validator
 def should_skip(item_name):
-    item_lower = item_name.lower()
-    if item_lower in skip_items_lower:
-        return True
-    for pattern in skip_patterns_lower:
-        if item_lower.endswith(pattern):
-            return True
-    return False
+    return skip_matcher().skips(item_name)
 
 # Initial terminal output
 print("🔍 Checking missing pages list...")
 write_debug_log("--- Starting page creation log ---", debug_log_path)
 
-# Main processing loop
-processed_in_chunk = 0
-for idx, item_name in enumerate(item_names, 1):
+# Build the work list: skip rules and cache lookups, then one batched existence check
+candidates = []
+for item_name in item_names:
     if should_skip(item_name):
         write_debug_log(f"Skipped '{item_name}' (matched skip pattern/item)", debug_log_path)
         continue
@@ -68,14 +56,22 @@ for idx, item_name in enumerate(item_names, 1):
         write_debug_log(f"Item '{item_name}' not found in item cache. Skipped.", debug_log_path)
         continue
 
-    item_data = items_cache[key]
-    page_title = item_data.name
+    candidates.append(items_cache[key])
+
+existing = wiki_utils.existing_titles([item_data.name for item_data in candidates], site)
+to_create = []
+for item_data in candidates:
+    if item_data.name in existing:
+        write_debug_log(f"Wiki page '{item_data.name}' already exists. Skipped.", debug_log_path)
+    else:
+        to_create.append(item_data)
+
+print(f"🔍 {len(to_create)} of {total} pages are missing on the wiki.")
 
-    # Check if page exists
+# Main processing loop
+for idx, item_data in enumerate(to_create, 1):
+    page_title = item_data.name
     page = pywikibot.Page(site, page_title)
-    if page.exists():
-        write_debug_log(f"Wiki page '{page_title}' already exists. Skipped.", debug_log_path)
-        continue
 
     # Generate content using formatter
     page_content = export_item_page(item_data, display_name=page_title)
@@ -89,18 +85,11 @@ for idx, item_name in enumerate(item_names, 1):
     except Exception as e:
         write_debug_log(f"Failed to create page '{page_title}': {e}", debug_log_path)
 
-    processed_in_chunk += 1
-
     # Progress updates every 10%
-    if idx % max(total // 10, 1) == 0:
+    if idx % max(len(to_create) // 10, 1) == 0:
         percent = (actual_processed / total) * 100
         print(f"  ✅ {actual_processed}/{total} page creations complete — ({percent:.1f}%).")
 
-    # Chunk handling
-    if processed_in_chunk >= CHUNK_SIZE:
-        time.sleep(CHUNK_SLEEP_SECONDS)
-        processed_in_chunk = 0
-
 # Final summary
 print(f"\n✅ Page creation complete: {actual_processed}/{total} pages processed.")
 write_debug_log(f"--- Completed: {actual_processed}/{total} pages processed ---", debug_log_path)
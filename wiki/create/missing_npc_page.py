@@ -4,7 +4,8 @@ Create missing NPC pages + upload associated NPC images.
 - Reads NPC names from:
   OUTPUT_DIRECTORY/Wiki Formatted/npc_list.txt
 
-- Skips if the NPC page already exists on the wiki.
+- Skips if the NPC page already exists on the wiki (all pages and images are
+  checked up front in 50-title batches via wiki_utils.resolve_titles).
 
 - Builds NPC page text by calling into:
   formatters.pages.npc_page (build_page_wikitext)
@@ -16,19 +17,23 @@ Create missing NPC pages + upload associated NPC images.
   <NPCName>_walk_south_0.png
 
 - If found, upscales and uploads to File:<NPCName>.png (skips if already exists).
+  Images are scaled and PNG-encoded in a process pool and uploaded from
+  memory once all pages are done (utils/image_upload.py).
 """
 
 import os
 import sys
-import time
 import traceback
 import pywikibot
+from functools import partial
 from datetime import datetime
-from PIL import Image
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
+from utils import wiki_utils
+from utils.image_upload import ImageJob, upload_images
+from utils.image_utils import render_image
 from utils.file_utils import read_file_lines
 from formatters.pages import npc_page as create_npc_page
 
@@ -68,7 +73,7 @@ def load_schedule_text(npc_name: str) -> str:
 
 # Set up pyWikiBot configurations
 sys.path.append(constants.ADDITIONAL_PATHS["PWB"])
-site = pywikibot.Site()
+site = wiki_utils.limit_site(pywikibot.Site())  # API calls paced by the shared rate limiter
 pywikibot.config.verbose_output = False
 pywikibot.config.log = []
 pywikibot.config.noisy_output = False
@@ -78,9 +83,6 @@ pywikibot.config.noisy_output = False
 npc_list = os.path.join(constants.OUTPUT_DIRECTORY, "Unique_NPC_Names_For_Patch.txt")
 image_input_directory = os.path.join(constants.IMAGE_INPUT_DIRECTORY)
 
-output_temp_directory = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot", "temp_uploads")
-os.makedirs(output_temp_directory, exist_ok=True)
-
 debug_log_path = os.path.join(constants.DEBUG_DIRECTORY, "pywikibot", "pywikibot_create_npc_pages.log")
 os.makedirs(os.path.dirname(debug_log_path), exist_ok=True)
 
@@ -95,7 +97,6 @@ UPLOAD_TEMPLATE = "{{License|game}}"
 TARGET_SCALE = 10
 
 CHUNK_SIZE = 25
-CHUNK_SLEEP_SECONDS = 3
 
 
 def log_debug(message: str) -> None:
@@ -145,13 +146,6 @@ def build_npc_page_text(npc_name: str) -> str:
     )
 
 
-def scale_image_nearest(image_path: str, scale: int) -> Image.Image:
-    with Image.open(image_path) as img:
-        img = img.convert("RGBA")
-        new_size = (img.width * scale, img.height * scale)
-        return img.resize(new_size, Image.NEAREST)
-
-
 def candidate_image_names(npc_name: str) -> list[str]:
     """
     Generate filename candidates for the npc_name across a few common name formats.
@@ -209,35 +203,8 @@ def find_associated_image_path(npc_name: str) -> str | None:
     return None
 
 
-def upload_image_to_wiki(image: Image.Image, upload_name: str) -> None:
-    temp_path = os.path.join(output_temp_directory, upload_name)
-    image.save(temp_path)
-
-    file_page = pywikibot.FilePage(site, "File:" + upload_name)
-    file_page.text = UPLOAD_TEMPLATE
-
-    try:
-        if file_page.exists():
-            log_debug(f"Skipped image upload '{upload_name}' (file already exists on wiki).")
-            return
-
-        if TEST_RUN:
-            log_debug(f"TEST_RUN: Would upload image '{upload_name}' from '{temp_path}'.")
-            return
-
-        file_page.upload(temp_path, comment=IMAGE_SUMMARY_TEXT, ignore_warnings=False)
-        log_debug(f"Uploaded image: {upload_name}")
-    finally:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
-
-
 def create_npc_page_on_wiki(npc_name: str, page_text: str) -> bool:
     page = pywikibot.Page(site, npc_name)
-    if page.exists():
-        log_debug(f"Skipped '{npc_name}' (page already exists).")
-        return False
-
     if TEST_RUN:
         log_debug(f"TEST_RUN: Would create page '{npc_name}'.")
         return True
@@ -267,9 +234,14 @@ def main() -> None:
     print(f"🔍 NPCs loaded: {total}")
     log_debug(f"NPCs loaded: {total} | Source: {npc_list}")
 
+    # One batched existence check for every page and image instead of one request each
+    print("🔍 Checking which NPC pages and images already exist...")
+    existing = wiki_utils.existing_titles(
+        [title for npc_name in npc_names for title in (npc_name, f"File:{npc_name}.png")], site
+    )
+
     created_pages = 0
-    attempted_images = 0
-    uploaded_images = 0
+    image_jobs = []
 
     processed = 0
     last_reported_percent = -1
@@ -279,36 +251,30 @@ def main() -> None:
             processed += 1
 
             try:
-                page_text = build_npc_page_text(npc_name)
-                created = create_npc_page_on_wiki(npc_name, page_text)
-
-                if created:
-                    created_pages += 1
+                if npc_name in existing:
+                    log_debug(f"Skipped '{npc_name}' (page already exists).")
+                else:
+                    page_text = build_npc_page_text(npc_name)
+                    if create_npc_page_on_wiki(npc_name, page_text):
+                        created_pages += 1
+
+                # Image handling: only attempt if the file is missing and we can find a local image
+                upload_name = f"{npc_name}.png"
+                if f"File:{upload_name}" in existing:
+                    log_debug(f"Skipped image upload '{upload_name}' (file already exists on wiki).")
+                    image_path = None
+                else:
+                    image_path = find_associated_image_path(npc_name)
+                    if not image_path:
+                        log_debug(f"No associated image found for '{npc_name}'. Skipping upload.")
 
-                # Image handling: only attempt if we can find a local image
-                image_path = find_associated_image_path(npc_name)
                 if image_path:
-                    attempted_images += 1
-
-                    upload_name = f"{npc_name}.png"
-                    scaled = scale_image_nearest(image_path, TARGET_SCALE)
-
-                    before = uploaded_images
-                    upload_image_to_wiki(scaled, upload_name)
-
-                    # If it didn't exist, upload_image_to_wiki logs upload; we can infer by checking again:
-                    # (Keep it simple: attempt a quick exists check to count successful uploads.)
-                    try:
-                        if pywikibot.FilePage(site, "File:" + upload_name).exists():
-                            # Might have already existed, but that's fine—best effort.
-                            # Only increment if it was newly created is hard without extra logic.
-                            # We'll do a light heuristic: if it didn't exist earlier, we'd need caching.
-                            pass
-                    except Exception:
-                        pass
-
-                else:
-                    log_debug(f"No associated image found for '{npc_name}'. Skipping upload.")
+                    image_jobs.append(ImageJob(
+                        upload_name,
+                        partial(render_image, image_path, mode="RGBA", scale=TARGET_SCALE),
+                        text=UPLOAD_TEMPLATE,
+                        comment=IMAGE_SUMMARY_TEXT,
+                    ))
 
             except Exception as e:
                 log_debug(f"FAILED '{npc_name}': {e}")
@@ -319,10 +285,22 @@ def main() -> None:
                 print(f"  ✅ {processed}/{total} processed — ({percent}%)")
                 last_reported_percent = percent
 
-        time.sleep(CHUNK_SLEEP_SECONDS)
-
-    print(f"\n✅ Done. Pages created: {created_pages}/{total}. Image attempts: {attempted_images}.")
-    log_debug(f"--- Completed. Pages created: {created_pages}/{total}. Image attempts: {attempted_images}. ---")
+    # Images are scaled / encoded in worker processes while uploads run here
+    uploaded_images = 0
+    if TEST_RUN:
+        for job in image_jobs:
+            log_debug(f"TEST_RUN: Would upload image '{job.filename}'.")
+    else:
+        print(f"🔄 Uploading {len(image_jobs)} NPC images...")
+        for result in upload_images(image_jobs, site):
+            if result.uploaded:
+                log_debug(f"Uploaded image: {result.job.filename}")
+                uploaded_images += 1
+            else:
+                log_debug(f"FAILED image '{result.job.filename}': {result.error}")
+
+    print(f"\n✅ Done. Pages created: {created_pages}/{total}. Images uploaded: {uploaded_images}/{len(image_jobs)}.")
+    log_debug(f"--- Completed. Pages created: {created_pages}/{total}. Images uploaded: {uploaded_images}/{len(image_jobs)}. ---")
 
 
 if __name__ == "__main__":
@@ -2,13 +2,14 @@ import os
 import re
 import sys
 import time
-import pywikibot
+from functools import partial
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
 from utils import image_utils
-from utils.wiki_utils import fetch_pages
+from utils.image_upload import ImageJob, upload_images
+from utils.wiki_utils import existing_titles, fetch_pages, get_site
 from pywikibot import Category
 
 # Paths
@@ -37,7 +38,8 @@ def find_image_file(pagename, is_flooring):
             return os.path.join(image_input_directory, file), file
     return None, None
 
-def process_page(title, is_flooring):
+def build_job(title, is_flooring):
+    """ImageJob for a page's display image, or None when no source image is found."""
     output_filename = f"{title} display.png"
     caption = f"[[{title}]]"
     category = "Flooring display images" if is_flooring else "Wallpaper display images"
@@ -45,35 +47,26 @@ def process_page(title, is_flooring):
     filepath, source_file = find_image_file(title, is_flooring)
     if not filepath:
         image_utils.log_debug(f"Image not found for: {title}", debug_log_path)
-        return False
+        return None
 
     image_utils.log_debug(f"Using file for {title}: {source_file}", debug_log_path)
 
-    try:
-        img = image_utils.crop_whitespace(image_utils.Image.open(filepath))
-
-        if is_flooring:
-            # Scale flooring to exactly 1080x780 (approx 500% if original is 216x156)
-            img = img.resize((1080, 780), resample=image_utils.Image.NEAREST)
-        else:
-            # Default scale to at least 500px on one side
-            img = image_utils.scale_image_to_min_size(img, 500)
-
-        image_utils.upload_image(
-            img,
-            output_filename,
-            caption_text=caption,
-            categories=[category],
-            debug_path=debug_log_path,
-            upload_comment=f"{category.split()[0]} display image upload"
-        )
-        return True
-    except Exception as e:
-        image_utils.log_debug(f"Failed processing {title}: {e}", debug_log_path)
-        return False
+    # Flooring is scaled to exactly 1080x780 (approx 500% if original is 216x156);
+    # wallpaper to at least 500px on one side
+    render = partial(
+        image_utils.render_image, filepath, crop=True,
+        size=(1080, 780) if is_flooring else None,
+        min_size=None if is_flooring else 500,
+    )
+    return ImageJob(
+        output_filename,
+        render,
+        text=image_utils.file_page_text(caption, [category]),
+        comment=f"{category.split()[0]} display image upload",
+    )
 
 def main():
-    site = pywikibot.Site()
+    site = get_site()  # API calls paced by the shared rate limiter
 
     for catname, is_flooring in [("Flooring", True), ("Wallpaper", False)]:
         print(f"🔍 Processing category: {catname}")
@@ -81,21 +74,33 @@ def main():
         titles = [page.title() for page in cat.articles()]
         pages = fetch_pages(titles)
 
-        total = len(pages)
-        number_processed = 0
+        # One batched existence check for every display image; pages that already have one are skipped
+        existing = existing_titles([f"File:{title} display.png" for title in pages], site)
+        jobs = []
+        for title in pages:
+            if f"File:{title} display.png" in existing:
+                image_utils.log_debug(f"Skipped upload for {title} display.png (already exists on wiki)", debug_log_path)
+                continue
+            job = build_job(title, is_flooring)
+            if job:
+                jobs.append(job)
+
+        total = len(jobs)
         actual_new_uploads = 0
 
-        for idx, (title, _) in enumerate(pages.items(), 1):
-            if process_page(title, is_flooring):
+        # Images are cropped / scaled / encoded in worker processes while uploads run here
+        for idx, result in enumerate(upload_images(jobs, site), 1):
+            if result.uploaded:
+                image_utils.log_debug(f"Uploaded: {result.job.filename}", debug_log_path)
                 actual_new_uploads += 1
-            number_processed += 1
+            else:
+                image_utils.log_debug(f"Failed processing {result.job.filename}: {result.error}", debug_log_path)
 
             if idx % max(total // 10, 1) == 0:
-                percent = (number_processed / total) * 100
-                print(f"      🔄 {number_processed}/{total} processed images — ({percent:.1f}%).")
-                time.sleep(3)
+                percent = (idx / total) * 100
+                print(f"      🔄 {idx}/{total} processed images — ({percent:.1f}%).")
 
-        print(f"✅ Display images uploads complete: {actual_new_uploads}/{total} pages processed.")
+        print(f"✅ Display images uploads complete: {actual_new_uploads}/{total} images uploaded.")
 
 if __name__ == "__main__":
     main()
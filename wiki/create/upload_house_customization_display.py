@@ -3,12 +3,14 @@ import re
 import sys
 import time
 import pywikibot
+from functools import partial
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
 from utils import image_utils
-from utils.wiki_utils import fetch_pages
+from utils.image_upload import ImageJob, upload_images
+from utils.wiki_utils import existing_titles, fetch_pages, limit_site
 from pywikibot import Category
 
 # Paths
@@ -77,88 +79,109 @@ def build_upload_name(style, type_uc, index):
 
     return f"{style} {base_type}{index + 1}.png"
 
-def process_page(page, title):
+def upload_titles(title):
+    """File: titles of every display image the page needs (empty for unrecognized names)."""
+    style, type_uc = extract_style_and_type(title)
+    if not style or not type_uc:
+        return []
+    return [f"File:{build_upload_name(style, type_uc, i)}" for i in range(HOUSE_TYPES[type_uc])]
+
+def plan_page(title, existing_files):
+    """
+    (jobs, done, expected) for a page: ImageJobs for its missing images,
+    how many are already on the wiki, and how many it needs. None when the
+    title is not a recognized house part.
+    """
     style, type_uc = extract_style_and_type(title)
     if not style or not type_uc:
         image_utils.log_debug(f"Unrecognized format: {title}", debug_log_path)
-        return False
+        return None
 
     expected_count = HOUSE_TYPES[type_uc]
     type_lc = type_uc.lower()
-    uploaded_or_skipped = 0
-
-    site = pywikibot.Site()
+    jobs = []
+    done = 0
 
     for i in range(expected_count):
+        upload_name = build_upload_name(style, type_uc, i)
+        if f"File:{upload_name}" in existing_files:
+            image_utils.log_debug(f"Skipped upload for {upload_name} (already exists on wiki)", debug_log_path)
+            done += 1
+            continue
+
         filepath, source_file = find_image_file(style, type_lc, i)
         if not filepath:
             image_utils.log_debug(f"Image not found for: {title} (index {i})", debug_log_path)
             continue
 
-        upload_name = build_upload_name(style, type_uc, i)
-        file_page = pywikibot.FilePage(site, upload_name)
-        if file_page.exists():
-            image_utils.log_debug(f"Skipped upload for {upload_name} (already exists on wiki)", debug_log_path)
-            uploaded_or_skipped += 1
-            continue
+        jobs.append(ImageJob(
+            upload_name,
+            partial(image_utils.render_image, filepath, crop=True, min_size=500),
+            text=image_utils.file_page_text(f"[[{title}]]", [f"Custom {type_lc} images"]),
+            comment=f"House {type_lc} image upload",
+        ))
+
+    return jobs, done, expected_count
+
+def remove_needed_category(site, title, text):
+    try:
+        # Remove [[Category:House images needed]] with any optional sortkey, wherever it appears
+        pattern = r'\[\[\s*[Cc]ategory\s*:\s*House images needed\s*(\|[^]]*)?\s*\]\]'
+        new_text, count = re.subn(pattern, '', text)
+
+        if count > 0:
+            page = pywikibot.Page(site, title)
+            page.text = new_text.strip()
+            page.save(summary="Remove House images needed category (images uploaded)")
+        else:
+            image_utils.log_debug(f"No removable House images needed category found on {title}", debug_log_path)
 
-        caption = f"[[{title}]]"
-        try:
-            img = image_utils.crop_whitespace(image_utils.Image.open(filepath))
-            img = image_utils.scale_image_to_min_size(img, 500)
-            image_utils.upload_image(
-                img,
-                upload_name,
-                caption_text=caption,
-                categories=[f"Custom {type_lc} images"],
-                debug_path=debug_log_path,
-                upload_comment=f"House {type_lc} image upload"
-            )
-            uploaded_or_skipped += 1
-        except Exception as e:
-            image_utils.log_debug(f"Failed uploading {upload_name}: {e}", debug_log_path)
-
-    if uploaded_or_skipped == expected_count:
-        try:
-            text = page.text
-
-            # Remove [[Category:House images needed]] with any optional sortkey, wherever it appears
-            pattern = r'\[\[\s*[Cc]ategory\s*:\s*House images needed\s*(\|[^]]*)?\s*\]\]'
-            new_text, count = re.subn(pattern, '', text)
-
-            if count > 0:
-                page.text = new_text.strip()
-                page.save(summary="Remove House images needed category (images uploaded)")
-            else:
-                image_utils.log_debug(f"No removable House images needed category found on {title}", debug_log_path)
-
-            return True
-        except Exception as e:
-            image_utils.log_debug(f"Failed to remove category for {title}: {e}", debug_log_path)
-            return False
-
-    return False
+        return True
+    except Exception as e:
+        image_utils.log_debug(f"Failed to remove category for {title}: {e}", debug_log_path)
+        return False
 
 def main():
-    site = pywikibot.Site()
+    site = limit_site(pywikibot.Site())
     cat = Category(site, "Category:House images needed")
     titles = [page.title() for page in cat.articles()]
     pages = fetch_pages(titles)
+    # One batched existence check for every display image instead of one request per file
+    existing_files = existing_titles([name for title in pages for name in upload_titles(title)], site)
 
     total = len(pages)
-    number_processed = 0
     actual_pages_resolved = 0
 
     print(f"🔍 Processing category: House images needed")
 
-    for idx, (title, page) in enumerate(pages.items(), 1):
-        if process_page(page, title):
-            actual_pages_resolved += 1
-        number_processed += 1
+    plans = {}
+    page_of = {}
+    jobs = []
+    for title in pages:
+        plan = plan_page(title, existing_files)
+        if plan is None:
+            continue
+        plans[title] = plan
+        for job in plan[0]:
+            page_of[job.filename] = title
+            jobs.append(job)
+
+    # Images are cropped / scaled / encoded in worker processes while uploads run here
+    done = {title: plan[1] for title, plan in plans.items()}
+    for idx, result in enumerate(upload_images(jobs, site), 1):
+        if result.uploaded:
+            image_utils.log_debug(f"Uploaded: {result.job.filename}", debug_log_path)
+            done[page_of[result.job.filename]] += 1
+        else:
+            image_utils.log_debug(f"Failed uploading {result.job.filename}: {result.error}", debug_log_path)
 
-        if idx % max(total // 10, 1) == 0:
-            percent = (number_processed / total) * 100
-            print(f"      🔄 {number_processed}/{total} processed pages — ({percent:.1f}%).")
+        if idx % max(len(jobs) // 10, 1) == 0:
+            percent = (idx / len(jobs)) * 100
+            print(f"      🔄 {idx}/{len(jobs)} processed images — ({percent:.1f}%).")
+
+    for title, (_, _, expected_count) in plans.items():
+        if done[title] == expected_count and remove_needed_category(site, title, pages[title]):
+            actual_pages_resolved += 1
 
     print(f"✅ House display uploads complete: {actual_pages_resolved}/{total} pages resolved.")
 
@@ -22,7 +22,7 @@ import pywikibot
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
-from utils import image_utils
+from utils import image_utils, wiki_utils
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -95,7 +95,7 @@ def upload_or_update_file(filepath, filename):
     Upload a new file, or patch the page text of an existing file with any
     missing license template or category.
     """
-    site      = pywikibot.Site()
+    site      = wiki_utils.limit_site(pywikibot.Site())
     file_page = pywikibot.FilePage(site, f"File:{filename}")
 
     if not file_page.exists():
@@ -5,12 +5,14 @@ import time
 import json
 import pywikibot
 import mwparserfromhell
+from functools import partial
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
 from utils import image_utils
-from utils.wiki_utils import fetch_pages, parse_template_params
+from utils.image_upload import ImageJob, upload_images
+from utils.wiki_utils import existing_titles, fetch_pages, limit_site, parse_template_params
 from utils.file_utils import write_debug_log
 
 # Paths
@@ -107,8 +109,18 @@ def get_best_image_pair(name, asset_name, is_front):
             return back, front, base
     return None, None, base_candidates[0]
 
-def process_page(title, text, item_data):
-    uploaded_images = 0
+def display_filenames(title):
+    """(front, side) display image file names for a mount page."""
+    display_base = title.replace(" Whistle", "").strip()
+    return f"{display_base}_Front.png", f"{ensure_mount_suffix(display_base)}.png"
+
+def plan_page(title, text, item_data, existing_files):
+    """
+    (jobs, done) for a mount page: ImageJobs for its front / side display
+    images that are not on the wiki yet, and how many already are.
+    """
+    jobs = []
+    done = 0
 
     wiki_params = parse_template_params(text, "Item infobox")
     is_dlc = wiki_params.get("dlc", "").strip().lower() == "true"
@@ -153,10 +165,8 @@ def process_page(title, text, item_data):
     else:
         side_back, side_front, _ = get_best_image_pair(name, asset_name, is_front=False)
 
-    front_out = f"{display_base}_Front.png"
-
+    front_out, side_out = display_filenames(title)
     side_display_base = ensure_mount_suffix(display_base)
-    side_out = f"{side_display_base}.png"
 
     front_caption = f"[[{title}|{display_base}]]"
     side_caption = f"[[{title}|{side_display_base}]]"
@@ -165,6 +175,11 @@ def process_page(title, text, item_data):
         ("Front", front_back, front_front, front_out, front_caption, ["Mount images"]),
         ("Side", side_back, side_front, side_out, side_caption, ["Mount images"] + (["DLC mount images"] if is_dlc else []))
     ]:
+        if f"File:{output}" in existing_files:
+            write_debug_log(f"Skipped upload for {output} (already exists on wiki)", debug_log_path)
+            done += 1
+            continue
+
         if not back or not front:
             write_debug_log(
                 f"Missing {label} image for {display_base}: {back if not back else front}",
@@ -172,40 +187,19 @@ def process_page(title, text, item_data):
             )
             continue
 
-        try:
-            img = image_utils.composite_images(back, front)
-            img = image_utils.crop_whitespace(img)
-            img = image_utils.scale_image_to_min_size(img, 500)
-            write_debug_log(f"Uploading cropped, upscaled version of image: {output}", debug_log_path)
-            image_utils.upload_image(
-                img,
-                output,
-                caption_text=caption_text,
-                categories=extra_cats,
-                debug_path=debug_log_path,
-                upload_comment="Mount display image upload."
-            )
-            write_debug_log(f"Uploaded: {output}", debug_log_path)
-            uploaded_images += 1
-        except Exception as e:
-            write_debug_log(
-                f"Failed to process {label} image for {display_base}: {e}",
-                debug_log_path
-            )
-
-    if uploaded_images < 2:
-        write_debug_log(
-            f"Skipping save for {title}: only {uploaded_images} image(s) uploaded",
-            debug_log_path
-        )
-        return None, None
+        write_debug_log(f"Uploading cropped, upscaled version of image: {output}", debug_log_path)
+        jobs.append(ImageJob(
+            output,
+            partial(image_utils.render_image, (back, front), crop=True, min_size=500),
+            text=image_utils.file_page_text(caption_text, extra_cats),
+            comment="Mount display image upload.",
+        ))
 
-    new_text = update_gallery_section(text)
-    return title, new_text
+    return jobs, done
 
 def main():
     print("🔍 Checking missing mount images list...")
-    site = pywikibot.Site()
+    site = limit_site(pywikibot.Site())
     cat = pywikibot.Category(site, f"Category:{CATEGORY_NAME}")
     pages = list(cat.articles())
     titles = [p.title() for p in pages]
@@ -214,19 +208,48 @@ def main():
         item_data = json.load(f)
 
     fetched = fetch_pages(titles)
+    # One batched existence check for every front / side image instead of one request per upload
+    existing_files = existing_titles(
+        [f"File:{name}" for title in fetched for name in display_filenames(title)], site
+    )
+
+    done = {}
+    page_of = {}
+    jobs = []
     for title, text in fetched.items():
         print(f"🛠️ Beginning process on: {title}")
-        updated_title, updated_text = process_page(title, text, item_data)
-        if updated_title and updated_text and updated_text != text:
-            page = pywikibot.Page(site, updated_title)
+        page_jobs, done[title] = plan_page(title, text, item_data, existing_files)
+        for job in page_jobs:
+            page_of[job.filename] = title
+            jobs.append(job)
+
+    # Images are composited / cropped / scaled in worker processes while uploads run here
+    for result in upload_images(jobs, site):
+        if result.uploaded:
+            write_debug_log(f"Uploaded: {result.job.filename}", debug_log_path)
+            done[page_of[result.job.filename]] += 1
+        else:
+            write_debug_log(f"Failed to process {result.job.filename}: {result.error}", debug_log_path)
+
+    for title, text in fetched.items():
+        if done[title] < 2:
+            write_debug_log(
+                f"Skipping save for {title}: only {done[title]} image(s) uploaded",
+                debug_log_path
+            )
+            continue
+
+        updated_text = update_gallery_section(text)
+        if updated_text != text:
+            page = pywikibot.Page(site, title)
             page.text = updated_text
             try:
-                print(f"✏️  Removing category on: {updated_title}")
+                print(f"✏️  Removing category on: {title}")
                 page.save(summary="Uploading mount images and updating display gallery.")
-                print(f"✅ Process complete, updated page: {updated_title}")
+                print(f"✅ Process complete, updated page: {title}")
             except Exception as e:
                 write_debug_log(
-                    f"Failed to update page {updated_title}: {e}",
+                    f"Failed to update page {title}: {e}",
                     debug_log_path
                 )
 
@@ -4,35 +4,39 @@ Uses Special:WantedFiles to find missing file pages on the wiki, then:
 - Uses that item's iconGUID and images_data.json to find the correct source texture
 - Falls back to icon_<ItemName>.png if needed
 - Scales the texture up and uploads it as the wanted file
+  (scaling / PNG encoding run in a process pool; uploads go from memory,
+  see utils/image_upload.py)
 """
 
 import os
 import sys
-import time
 import json
 import traceback
 from datetime import datetime
 
 import pywikibot
-from PIL import Image
+from functools import partial
 
 # Path setup
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 sys.stdout.reconfigure(encoding="utf-8")
 
 from config import constants
-from config.skip_items import SKIP_ITEMS, SKIP_IMAGES
+from config.skip_items import SKIP_IMAGES
+from utils import wiki_utils
+from utils.image_upload import ImageJob, upload_images
+from utils.image_utils import render_image
+from utils.skip_matcher import skip_matcher
 from utils.text_utils import normalize_apostrophe
 
 sys.path.append(constants.ADDITIONAL_PATHS["PWB"])
-site = pywikibot.Site()
+site = wiki_utils.limit_site(pywikibot.Site())  # API calls paced by the shared rate limiter
 pywikibot.config.verbose_output = False
 pywikibot.config.log = []
 pywikibot.config.noisy_output = False
 
 # Paths
 json_data_directory = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data")
-output_directory = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot")
 
 items_data_file = os.path.join(json_data_directory, "items_data.json")
 images_data_file = os.path.join(json_data_directory, "images_data.json")
@@ -51,9 +55,6 @@ TARGET_SCALE = 5
 SUMMARY_TEXT = "Uploading upscaled version of image"
 UPLOAD_TEMPLATE = "{{License|game}}"
 
-CHUNK_SIZE = 25
-CHUNK_SLEEP_SECONDS = 10
-
 
 def ensure_directory(path):
     os.makedirs(path, exist_ok=True)
@@ -71,43 +72,6 @@ def load_json(path):
         return json.load(f)
 
 
-def chunk_list(lst, chunk_size):
-    for i in range(0, len(lst), chunk_size):
-        yield lst[i : i + chunk_size]
-
-
-def scale_image(image_path, scale):
-    with Image.open(image_path) as img:
-        new_size = (img.width * scale, img.height * scale)
-        return img.resize(new_size, Image.NEAREST)
-
-
-def upload_image(image, upload_name):
-    ensure_directory(output_directory)
-    temp_path = os.path.join(output_directory, upload_name)
-    image.save(temp_path)
-
-    page = pywikibot.FilePage(site, "File:" + upload_name)
-    uploaded = False
-
-    try:
-        if page.exists():
-            log_debug(f"Skipped upload for {upload_name} (already exists on wiki)")
-        else:
-            page.text = UPLOAD_TEMPLATE
-            page.upload(temp_path, comment=SUMMARY_TEXT, ignore_warnings=False)
-            log_debug(f"Uploaded: {upload_name}")
-            uploaded = True
-    except Exception as e:
-        log_debug(f"Upload failed for {upload_name}: {e}")
-        log_debug(traceback.format_exc())
-    finally:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
-
-    return uploaded
-
-
 def build_normalized_item_index(items_data):
     index = {}
     for name in items_data.keys():
@@ -228,27 +192,28 @@ def find_existing_texture_file(texture_filename, base_name):
 
 
 def process_wanted_file(file_title, items_data, images_data, item_index):
+    """ImageJob that uploads the wanted file, or None when it cannot be mapped to a texture."""
     base_name = normalize_wanted_title_to_item_name(file_title)
     norm_base = normalize_apostrophe(base_name).lower()
 
     item_key = item_index.get(norm_base)
     if not item_key:
         log_debug(f"{file_title} -> No matching item in items_data.json (normalized={norm_base!r})")
-        return False
+        return None
 
-    if item_key.lower() in SKIP_ITEMS:
+    if skip_matcher().is_listed(item_key):
         log_debug(f"{file_title} -> Skipping item in SKIP_ITEMS: {item_key}")
-        return False
+        return None
 
     item = items_data.get(item_key)
     if not item:
         log_debug(f"{file_title} -> Item key {item_key!r} not found in items_data.json")
-        return False
+        return None
 
     icon_guid = item.get("iconGUID")
     if not icon_guid:
         log_debug(f"{file_title} -> Item {item_key!r} has no iconGUID")
-        return False
+        return None
 
     image_info = images_data.get(icon_guid)
     if not image_info:
@@ -256,7 +221,7 @@ def process_wanted_file(file_title, items_data, images_data, item_index):
             f"{file_title} -> No images_data entry for iconGUID {icon_guid!r} "
             f"(item {item_key!r})"
         )
-        return False
+        return None
 
     texture_filename = image_info.get("image")
     if not texture_filename:
@@ -264,39 +229,34 @@ def process_wanted_file(file_title, items_data, images_data, item_index):
             f"{file_title} -> images_data entry for {icon_guid!r} has no 'image' filename "
             f"(item {item_key!r})"
         )
-        return False
+        return None
 
     if texture_filename in SKIP_IMAGES:
         log_debug(
             f"{file_title} -> Skipping texture in SKIP_IMAGES: {texture_filename} "
             f"(item {item_key!r})"
         )
-        return False
+        return None
 
     source_path = find_existing_texture_file(texture_filename, base_name)
     if not source_path:
-        return False
+        return None
 
     upload_name = f"{base_name}.png"
 
-    try:
-        log_debug(
-            f"{file_title} -> Uploading '{upload_name}' from '{source_path}' "
-            f"(item={item_key!r}, GUID={icon_guid!r})"
-        )
-        scaled_image = scale_image(source_path, TARGET_SCALE)
-        uploaded = upload_image(scaled_image, upload_name)
-        return uploaded
-    except Exception as e:
-        log_debug(
-            f"{file_title} -> Error while scaling/uploading from {source_path!r}: {e}"
-        )
-        log_debug(traceback.format_exc())
-        return False
+    log_debug(
+        f"{file_title} -> Uploading '{upload_name}' from '{source_path}' "
+        f"(item={item_key!r}, GUID={icon_guid!r})"
+    )
+    return ImageJob(
+        upload_name,
+        partial(render_image, source_path, scale=TARGET_SCALE),
+        text=UPLOAD_TEMPLATE,
+        comment=SUMMARY_TEXT,
+    )
 
 
 def main():
-    ensure_directory(output_directory)
     ensure_directory(os.path.dirname(debug_log_path))
 
     items_data = load_json(items_data_file)
@@ -310,21 +270,41 @@ def main():
     wanted_files = get_wanted_files()
 
     total = len(wanted_files)
-    processed = 0
     uploaded_count = 0
 
-    for chunk in chunk_list(wanted_files, CHUNK_SIZE):
-        for file_title in chunk:
-            processed += 1
-            if process_wanted_file(
-                file_title=file_title,
-                items_data=items_data,
-                images_data=images_data,
-                item_index=item_index,
-            ):
-                uploaded_count += 1
-
-        time.sleep(CHUNK_SLEEP_SECONDS)
+    # Special:WantedFiles is cached, so drop files whose upload title
+    # (always {item name}.png) exists or is already queued
+    upload_titles = {
+        title: f"File:{normalize_wanted_title_to_item_name(title)}.png" for title in wanted_files
+    }
+    existing = wiki_utils.existing_titles(list(upload_titles.values()), site)
+    queued = set()
+    jobs = []
+    for file_title in wanted_files:
+        upload_title = upload_titles[file_title]
+        if upload_title in existing:
+            log_debug(f"{file_title} -> Skipped upload ({upload_title} already exists on wiki)")
+            continue
+        if upload_title in queued:
+            log_debug(f"{file_title} -> Skipped upload ({upload_title} already queued)")
+            continue
+        job = process_wanted_file(
+            file_title=file_title,
+            items_data=items_data,
+            images_data=images_data,
+            item_index=item_index,
+        )
+        if job:
+            jobs.append(job)
+            queued.add(upload_title)
+
+    # Images are scaled / encoded in worker processes while uploads run here
+    for result in upload_images(jobs, site):
+        if result.uploaded:
+            log_debug(f"Uploaded: {result.job.filename}")
+            uploaded_count += 1
+        else:
+            log_debug(f"{result.job.filename} -> {result.error}")
 
     log_debug(
         f"Finished Special:WantedFiles. Total: {total}, Uploaded: {uploaded_count}"
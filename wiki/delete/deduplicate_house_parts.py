@@ -16,8 +16,8 @@ Relies on preloaded page data, hash comparisons using imagehash, and structured
 
 import os
 import sys
-import time
 import requests
+from io import BytesIO
 import imagehash
 import pywikibot
 
@@ -26,19 +26,20 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 from config import constants
 from pywikibot.pagegenerators import PreloadingGenerator
 from utils import file_utils, wiki_utils
+from utils.image_upload import encode_png, upload_png
 from PIL import Image
 
 # Config
 debug_log_path = os.path.join(constants.DEBUG_DIRECTORY, "pywikibot", "normalize_house_variants.txt")
 file_utils.ensure_dir_exists(os.path.dirname(debug_log_path))
 
-site = wiki_utils.get_site()
+site = wiki_utils.get_site()  # API calls paced by the shared rate limiter
+limiter = wiki_utils.rate_limiter(site)
 image_input_directory = os.path.join(constants.IMAGE_INPUT_DIRECTORY)
 PART_SUFFIXES = ["Door", "Roof", "Walls", "Windows", "Patio"]
 
 HASH_TOLERANCE = 5
 MIN_SIZE = 200
-GLOBAL_SLEEP = 5
 
 # Logging
 def log_debug(msg):
@@ -91,9 +92,8 @@ def normalize_type(base_type, preloaded_pages):
         try:
             img = Image.open(local_path)
             img = img.resize(get_scaled_dimensions(img), resample=Image.NEAREST)
-            tmp_path = os.path.join(image_input_directory, f"upload_{base_type}.png")
-            img.save(tmp_path)
-            canonical_page.upload(tmp_path, ignore_warnings=True, comment="Uploading scaled canonical house image")
+            upload_png(site, canonical_name, encode_png(img), canonical_page.text,
+                       "Uploading scaled canonical house image", ignore_warnings=True)
             log_debug(f"📤 Uploaded: {canonical_name}")
         except Exception as e:
             log_debug(f"❌ Upload failed for {canonical_name}: {e}")
@@ -109,12 +109,10 @@ def normalize_type(base_type, preloaded_pages):
             continue
         try:
             downloaded = page.get_file_url()
-            tmp_path = os.path.join(image_input_directory, f"variant_{variant_name.lower().replace(' ', '_')}")
+            limiter.read()  # plain HTTP download, outside Pywikibot's throttle
             r = requests.get(downloaded)
             r.raise_for_status()
-            with open(tmp_path, "wb") as f:
-                f.write(r.content)
-            with Image.open(tmp_path) as img:
+            with Image.open(BytesIO(r.content)) as img:
                 variant_hashes[variant_name] = (get_image_hash(img), page)
         except Exception as e:
             log_debug(f"❌ Error hashing {variant_name}: {e}")
@@ -139,7 +137,6 @@ def normalize_type(base_type, preloaded_pages):
         for variant_name, (_, page) in variant_hashes.items():
             try:
                 page.delete(reason=f"Redirect to [[File:{canonical_name}]]", prompt=False)
-                time.sleep(1)
                 redirect = pywikibot.FilePage(site, variant_name)
                 redirect.text = f"#REDIRECT [[File:{canonical_name}]]"
                 redirect.save(summary=f"Redirect to [[File:{canonical_name}]]")
@@ -164,12 +161,10 @@ def normalize_type(base_type, preloaded_pages):
         else:
             try:
                 downloaded = alt_page.get_file_url()
-                tmp_path = os.path.join(image_input_directory, f"alt_{alt_name.lower().replace(' ', '_')}")
+                limiter.read()  # plain HTTP download, outside Pywikibot's throttle
                 r = requests.get(downloaded)
                 r.raise_for_status()
-                with open(tmp_path, "wb") as f:
-                    f.write(r.content)
-                with Image.open(tmp_path) as img:
+                with Image.open(BytesIO(r.content)) as img:
                     hash2 = get_image_hash(img)
                 if abs(hash1 - hash2) <= HASH_TOLERANCE:
                     page1.delete(reason=f"Duplicate of [[File:{canonical_name}]]", prompt=False)
@@ -203,8 +198,6 @@ def main():
 
     for base in base_types:
         normalize_type(base, preloaded)
-        print(f"⏳ Sleeping {GLOBAL_SLEEP}s to avoid rate limits...")
-        time.sleep(GLOBAL_SLEEP)
 
     log_debug("✅ Normalization complete.")
 
@@ -5,7 +5,6 @@ It logs all actions, deletes matching empty categories using Pywikibot, and skip
 
 import os
 import sys
-import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
@@ -22,7 +21,7 @@ PHRASE = "Drops "  # Change this to the desired phrase
 MATCH_START = True
 MATCH_END = False
 
-site = wiki_utils.get_site()
+site = wiki_utils.get_site()  # deletions paced by the shared rate limiter
 
 def log_debug(msg):
     file_utils.append_line(debug_log_path, msg)
@@ -50,7 +49,6 @@ def main():
             log_debug(f"🗑️ Deleting: {page.title()}")
             page.delete(reason="Unused category cleanup", prompt=False)
             count_deleted += 1
-            time.sleep(1)
         except Exception as e:
             log_debug(f"❌ Error deleting {page.title()}: {e}")
             count_skipped += 1
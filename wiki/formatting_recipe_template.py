@@ -12,6 +12,7 @@ import pywikibot
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
+from utils import wiki_utils
 
 # Setup PWB
 import sys
@@ -20,7 +21,7 @@ pywikibot.config.throttle = constants.PWB_SETTINGS["throttle"]
 pywikibot.config.max_retries = constants.PWB_SETTINGS["max_retries"]
 pywikibot.config.retry_wait = constants.PWB_SETTINGS["retry_wait"]
 pywikibot.config.user_agent = constants.PWB_SETTINGS["user_agent"]
-site = pywikibot.Site("en", "sunhaven")
+site = wiki_utils.get_site()
 
 # Target pages using Template:Recipe
 template = pywikibot.Page(site, "Template:Recipe")
@@ -1,14 +1,18 @@
-import time
+import os
+import sys
 import pywikibot
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils import wiki_utils
+
 # Config
 CATEGORY = "Clothing"       # e.g. "Clothing" or "Category:Clothing" or None
 TRANSCLUDES = None          # e.g. "Infobox item" or "Template:Infobox item" or None
 COMMENT = "Null Edit"
-DELAY = 0.5                 # seconds between edits
 TEST_LIMIT = None           # e.g. 25 to test on first 25 pages
 
-site = pywikibot.Site()
+site = wiki_utils.limit_site(pywikibot.Site())  # edits paced by the shared rate limiter
 
 def norm_category(name: str) -> str:
     return name if name.lower().startswith("category:") else f"Category:{name}"
@@ -41,7 +45,6 @@ for count, page in enumerate(pages_iter, start=1):
     try:
         page.touch(comment=COMMENT)
         print(f"✅ [{count}] {page.title()}")
-        time.sleep(DELAY)
     except Exception as e:
         print(f"❌ [{count}] {page.title()}: {e}")
 
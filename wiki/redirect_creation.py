@@ -10,10 +10,11 @@ import pywikibot
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import constants
+from utils import wiki_utils
 
 # Set up necessary configurations before other imports
 sys.path.append(constants.ADDITIONAL_PATHS["PWB"])
-site = pywikibot.Site()
+site = wiki_utils.limit_site(pywikibot.Site())
 
 def to_title_case(name):
     """Convert a string to title case while preserving apostrophes correctly."""
@@ -23,7 +24,7 @@ def to_title_case(name):
     ])
 
 def main():
-    site = pywikibot.Site()
+    site = wiki_utils.limit_site(pywikibot.Site())
     
     redirect_map = {
         "BASE PAGE NAME HERE": [
@@ -8,7 +8,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 from utils import text_utils
 from wiki.compare.infobox_fields import FIELD_MAP, FIELD_COMPUTATIONS
 from utils.compare_utils import compare_instance_generic
-from utils.wiki_utils import get_pages_with_template, parse_template_params
+from utils.wiki_utils import get_pages_with_template
 
 
 # Common keys across most infoboxes
@@ -111,18 +111,68 @@ def find_infobox_template(parsed):
     return None
 
 
+class ParsedPage:
+    """
+    One wiki page's wikitext, parsed with mwparserfromhell once.
+
+    The infobox template and its parameters are located on first use and
+    cached. Every function below that takes wikitext also accepts a
+    ParsedPage, so a compare/update pass over a page parses it only once.
+    update_fields() edits the infobox in place; str(page) re-serializes.
+    """
+
+    def __init__(self, title, text):
+        self.title = title
+        self.text = text or ""
+        self.wikicode = mwparserfromhell.parse(self.text)
+        self._infobox = None
+        self._infobox_found = False
+        self._params = None
+
+    def __str__(self):
+        return str(self.wikicode)
+
+    @property
+    def infobox(self):
+        if not self._infobox_found:
+            self._infobox = find_infobox_template(self.wikicode)
+            self._infobox_found = True
+        return self._infobox
+
+    @property
+    def template_name(self):
+        return self.infobox.name.strip() if self.infobox else None
+
+    @property
+    def subtype(self):
+        if self.infobox and self.infobox.has("subtype"):
+            return str(self.infobox.get("subtype").value).strip()
+        return ""
+
+    def params(self):
+        """Raw infobox params ({name: stripped value}); a copy callers may modify."""
+        if self._params is None:
+            template = self.infobox
+            self._params = {p.name.strip(): p.value.strip() for p in template.params} if template else {}
+        return dict(self._params)
+
+    def update_fields(self, diffs):
+        """Apply (field, expected, actual) diffs to the infobox in place."""
+        if self.infobox:
+            update_template_fields(self.infobox, diffs)
+            self._params = None
+
+
+def _as_page(wikitext, title=""):
+    return wikitext if isinstance(wikitext, ParsedPage) else ParsedPage(title, wikitext)
+
+
 def get_infobox_template_name(wikitext):
-    parsed = mwparserfromhell.parse(wikitext)
-    template = find_infobox_template(parsed)
-    return template.name.strip() if template else None
+    return _as_page(wikitext).template_name
 
 
 def get_infobox_param_map(wikitext, page_title):
-    template_name = get_infobox_template_name(wikitext)
-    if not template_name:
-        params = {}
-    else:
-        params = parse_template_params(wikitext, template_name)
+    params = _as_page(wikitext, page_title).params()
 
     if "name" not in params or not params["name"].strip():
         params["name"] = page_title.lower()
@@ -303,11 +353,13 @@ def compare_page_to_json(title, text, item_data, keys_to_check, skip_fields_map=
     """
     Compare a wiki page's infobox to JSON data.
 
+    - text may be raw wikitext or a ParsedPage (parsed once, reused).
     - Uses template-specific key lists for most infobox types.
     - Special-cases Agriculture infobox (crop + seed compare).
     """
-    wiki_params = get_infobox_param_map(text, title)
-    template_name = (get_infobox_template_name(text) or "").strip().lower()
+    page = _as_page(text, title)
+    wiki_params = get_infobox_param_map(page, title)
+    template_name = (page.template_name or "").strip().lower()
 
     skip_fields = []
     if isinstance(skip_fields_map, dict):
@@ -449,15 +501,15 @@ def update_template_fields(template, diffs):
 
 
 def update_infobox_text(text, diffs):
-    parsed = mwparserfromhell.parse(text)
-    template = find_infobox_template(parsed)
-    if template:
-        update_template_fields(template, diffs)
-        result = str(parsed)
+    """Return the page text with diffs applied to its infobox. A ParsedPage is edited in place."""
+    page = _as_page(text)
+    if page.infobox:
+        page.update_fields(diffs)
+        result = str(page)
         result = re.sub(r"\n+\}\}$", "\n}}", result)
         result = re.sub(r"(?<!\n)([^\n\S]*)(\n}})$", r"  }}", result)
         return result
-    return text
+    return page.text
 
 
 def get_infobox_pages(TEST_RUN=False, test_list=None):
@@ -475,23 +527,4 @@ def get_infobox_pages(TEST_RUN=False, test_list=None):
 
 
 def extract_subtype(wikitext):
-    parsed = mwparserfromhell.parse(wikitext)
-    template = find_infobox_template(parsed)
-    if template and template.has("subtype"):
-        return str(template.get("subtype").value).strip()
-    return ""
-
-
-def get_base_variant_key(normalized_title, data, subtype=None):
-    base_match = re.match(r"^(.*) \(([^)]+)\)$", normalized_title)
-    if base_match:
-        base_title = base_match.group(1)
-        if base_title in data:
-            return base_title, "VARIANTS"
-
-    if subtype in ["Mount", "Pet"]:
-        parts = normalized_title.split(" ", 1)
-        if len(parts) == 2 and parts[1] in data:
-            return parts[1], "VARIANTS"
-
-    return None, ""
+    return _as_page(wikitext).subtype
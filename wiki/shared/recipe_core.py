@@ -4,7 +4,7 @@ import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-from utils import text_utils, recipe_utils
+from utils import text_utils, recipe_utils, reconcile
 from utils.compare_utils import compare_instance_generic
 from utils.wiki_utils import get_pages_with_template, fetch_pages, parse_template_params
 from wiki.compare.recipe_fields import RECIPE_FIELD_MAP, RECIPE_COMPUTE_MAP, RECIPE_EXTRA_FIELDS
@@ -66,17 +66,27 @@ def compare_page_to_json(title, text, json_entry, keys_to_check, skip_fields_map
     diffs.extend(compare_extra_fields(json_entry, wiki_params, keys_to_check, title))
     return diffs, wiki_params
 
-def find_json_by_product_name(data, page_title):
-    title_lc = page_title.lower()
-    for key, record in data.items():
-        output = record.get("output", {})
-        name = output.get("name", "").lower().replace("(", "").replace(")", "").strip()
-        if name == title_lc.replace("(", "").replace(")", "").strip():
-            return key, record
+def _product_key(name):
+    return name.lower().replace("(", "").replace(")", "").strip()
+
+def build_product_index(data):
+    """Reconciler over product names (parentheses ignored), keyed by recipe id."""
+    names = {
+        key: record["output"].get("name", "")
+        for key, record in data.items()
+        if isinstance(record.get("output"), dict)
+    }
+    return reconcile.Reconciler(names, normalize=_product_key)
+
+def find_json_by_product_name(data, page_title, index=None):
+    index = index if index is not None else build_product_index(data)
+    keys = index.lookup(page_title)
+    if keys:
+        return keys[0], data[keys[0]]
     return None, None
 
 # NEW preferred matching logic
-def match_json_recipe(template, page_title, data, num_templates_on_page):
+def match_json_recipe(template, page_title, data, num_templates_on_page, index=None):
     logs = []
     recipe_id = template.get("id").value.strip() if template.has("id") else None
     product = template.get("product").value.strip() if template.has("product") else page_title
@@ -87,8 +97,10 @@ def match_json_recipe(template, page_title, data, num_templates_on_page):
             return entry, logs
         logs.append(f"[ID NOT FOUND] {page_title} - Recipe ID {recipe_id} not found in JSON data")
 
-    name_matches = [k for k, v in data.items()
-                    if isinstance(v.get("output"), dict) and v["output"].get("name", "").strip().lower() == product.lower()]
+    # The product index ignores parentheses; keep only exact name matches
+    index = index if index is not None else build_product_index(data)
+    name_matches = [k for k in index.lookup(product)
+                    if data[k]["output"].get("name", "").strip().lower() == product.lower()]
 
     if len(name_matches) == 1 and num_templates_on_page == 1:
         return data[name_matches[0]], logs
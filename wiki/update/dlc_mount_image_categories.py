@@ -7,16 +7,17 @@ so they show up in various DPL queries on the wiki.
 import os
 import re
 import sys
-import time
 import pywikibot
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
+from utils import wiki_utils
 
 # Pywikibot config
 sys.path.append(constants.ADDITIONAL_PATHS["PWB"])
-site = pywikibot.Site()
+site = wiki_utils.limit_site(pywikibot.Site())
+limiter = wiki_utils.rate_limiter(site)
 
 # Paths
 output_file_path = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot", "pywikibot_updateMountImage.txt")
@@ -31,9 +32,10 @@ def log_debug(message):
     with open(debug_log_path, "a", encoding="utf-8") as debug_file:
         debug_file.write(message + "\n")
 
-def throttled_sleep(context=""):
-    log_debug(f"🔄 Sleeping ({SLEEP_INTERVAL}s) - {context}")
-    time.sleep(SLEEP_INTERVAL)
+def back_off(context=""):
+    # Requests are paced by the shared rate limiter; only failures slow it down
+    log_debug(f"🔄 Backing off ({SLEEP_INTERVAL}s) - {context}")
+    limiter.backoff(SLEEP_INTERVAL)
 
 def write_section_header(file, header):
     file.write(f"\n### {header} ###\n")
@@ -44,20 +46,17 @@ def get_category_titles(page):
 def preload_pages(page_titles):
     pages = [pywikibot.Page(site, title) for title in page_titles]
     result = {page.title(): page for page in site.preloadpages(pages)}
-    throttled_sleep("After preloading pages")
     return result
 
 def preload_file_pages(file_titles):
     files = [pywikibot.FilePage(site, f"File:{title}") for title in file_titles]
     result = {file.title(with_ns=False): file for file in site.preloadpages(files)}
-    throttled_sleep("After preloading file pages")
     return result
 
 def get_category_members(category_name):
     try:
         cat = pywikibot.Category(site, f"Category:{category_name}")
         pages = set(page.title() for page in cat.articles())
-        throttled_sleep(f"After getting members of {category_name}")
         return pages
     except Exception as e:
         log_debug(f"Error fetching category {category_name}: {e}")
@@ -132,9 +131,7 @@ def main():
         missing_caption = []
         non_standard = []
 
-        for i, title in enumerate(common_pages):
-            throttled_sleep(f"Processing {i+1}/{len(common_pages)}: {title}")
-
+        for title in common_pages:
             if "whistle" not in title.lower():
                 non_standard.append(title)
                 continue
@@ -200,20 +197,18 @@ def main():
                             cat_page.text = f"{{{{category}}}}\n[[Category:{pack_category}]]"
                             cat_page.save(summary=f"Creating image category for {pack_category}")
                             log_debug(f"📁 Created category: [[Category:{pack_image_category}]]")
-                            throttled_sleep(f"After creating category: {pack_image_category}")
                         except Exception as e:
                             log_debug(f"❌ Failed to create category [[Category:{pack_image_category}]]: {e}")
-                            throttled_sleep("Error after failed category create")
+                            back_off("Error after failed category create")
 
                 if modified and updated_text.strip() != file_page.text.strip():
                     file_page.text = updated_text
                     try:
                         file_page.save(summary=f"Updated {image_type} image: added caption, licensing, categories")
                         log_debug(f"🔧 Fixed {file_name}: " + " + ".join(fix_log_parts))
-                        throttled_sleep(f"After saving: {file_name}")
                     except Exception as e:
                         log_debug(f"❌ Failed to save {file_name}: {e}")
-                        throttled_sleep("Error after failed file save")
+                        back_off("Error after failed file save")
 
         with open(output_file_path, "w", encoding="utf-8") as out:
             if missing_images:
@@ -7,17 +7,17 @@ so they show up in various DPL queries on the wiki.
 import os
 import re
 import sys
-import time
-import random
 import pywikibot
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 import config.constants as constants
+from utils import wiki_utils
 
 # Apply Pywikibot config from constants
 sys.path.append(constants.ADDITIONAL_PATHS["PWB"])
-site = pywikibot.Site()
+site = wiki_utils.limit_site(pywikibot.Site())
+limiter = wiki_utils.rate_limiter(site)
 
 # Paths
 output_file_path = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot", "pywikibot_updatePetImage.txt")
@@ -28,7 +28,7 @@ os.makedirs(os.path.dirname(debug_log_path), exist_ok=True)
 BASE_CATEGORIES = {"Sun Haven assets", "Pet images", "DLC pet images"}
 UNKNOWN_PACK_CATEGORY = "Unknown pack images"
 PACK_SUFFIX = " pack images"
-UPLOAD_SLEEP_INTERVAL = constants.PWB_SETTINGS["SLEEP_INTERVAL"]
+FAILURE_BACKOFF = 10  # seconds every request pauses after a failed save
 
 def log_debug(message):
     with open(debug_log_path, "a", encoding="utf-8") as debug_file:
@@ -40,26 +40,24 @@ def write_section_header(file, header):
 def get_category_titles(page):
     return set(cat.title().replace("Category:", "") for cat in page.categories())
 
-def preload_pages_batched(titles, batch_size=25, sleep_interval=2):
+def preload_pages_batched(titles, batch_size=25):
     pages = {}
     for i in range(0, len(titles), batch_size):
         batch = titles[i:i+batch_size]
         batch_pages = site.preloadpages([pywikibot.Page(site, title) for title in batch])
         for page in batch_pages:
             pages[page.title()] = page
-        log_debug(f"🛠️ Preloaded {len(batch)} pages, sleeping {sleep_interval}s...")
-        time.sleep(sleep_interval)
+        log_debug(f"🛠️ Preloaded {len(batch)} pages")
     return pages
 
-def preload_file_pages_batched(file_titles, batch_size=25, sleep_interval=2):
+def preload_file_pages_batched(file_titles, batch_size=25):
     pages = {}
     for i in range(0, len(file_titles), batch_size):
         batch = file_titles[i:i+batch_size]
         batch_pages = site.preloadpages([pywikibot.FilePage(site, f"File:{title}") for title in batch])
         for page in batch_pages:
             pages[page.title(with_ns=False)] = page
-        log_debug(f"🛠️ Preloaded {len(batch)} files, sleeping {sleep_interval}s...")
-        time.sleep(sleep_interval)
+        log_debug(f"🛠️ Preloaded {len(batch)} files")
     return pages
 
 def get_category_members(category_name):
@@ -73,9 +71,7 @@ def get_category_members(category_name):
 def main():
     try:
         pets_pages = get_category_members("Pets")
-        time.sleep(5)
         dlc_pages = get_category_members("DLC")
-        time.sleep(5)
 
         common_pages = sorted(pets_pages & dlc_pages)
         if not common_pages:
@@ -162,8 +158,6 @@ def main():
                         image_cat_page.text = f"{{{{category}}}}\n[[Category:{pack_category}]]"
                         image_cat_page.save(summary=f"Creating image category for {pack_category}")
                         log_debug(f"📁 Created category: [[Category:{pack_image_category}]]")
-                        log_debug(f"🕒 Sleeping for {UPLOAD_SLEEP_INTERVAL} seconds after saving [[Category:{pack_image_category}]], {time.strftime('%Y-%m-%d %H:%M:%S')}")
-                        time.sleep(UPLOAD_SLEEP_INTERVAL + random.uniform(1.0, 2.0))
                     except Exception as e:
                         log_debug(f"❌ Failed to create category page [[Category:{pack_image_category}]]: {e}")
 
@@ -174,11 +168,9 @@ def main():
                     file_page.save(summary="Updated image page: added missing caption, licensing, and categories")
                     log_debug(f"🔧 Fixed {file_name}: " + " + ".join(fix_log_parts))
                     upload_counter += 1
-                    log_debug(f"🕒 Sleeping for {UPLOAD_SLEEP_INTERVAL} seconds after saving {file_name}, {time.strftime('%Y-%m-%d %H:%M:%S')}")
-                    time.sleep(UPLOAD_SLEEP_INTERVAL + random.uniform(1.0, 2.0))
                 except Exception as e:
                     log_debug(f"❌ Failed to save {file_name}: {e}")
-                    time.sleep(10)  # Backoff after failure
+                    limiter.backoff(FAILURE_BACKOFF)
                     if missing:
                         missing_base.append(f"{file_name}: missing {', '.join(sorted(missing))}")
                     if not re.search(r'^\s*==\s*Caption\s*==\s*$', updated_text, re.IGNORECASE | re.MULTILINE):
@@ -9,6 +9,7 @@ based on items_data.json flags:
 
 Follows project path bootstrap + constants usage.
 No emojis in edit summary; emojis allowed in console/log output.
+Pass --resume to continue an interrupted run (see utils/run_journal.py).
 """
 
 import os
@@ -22,7 +23,7 @@ import traceback
 from typing import Dict, Any, Tuple
 
 import config.constants as constants
-from utils import file_utils
+from utils import file_utils, run_journal, wiki_utils
 
 import pywikibot
 try:
@@ -36,6 +37,7 @@ except ImportError:
 DRY_RUN = False
 TEST_RUN = True
 SAMPLE_LIMIT = 20
+RESUME = run_journal.RESUME_FLAG in sys.argv[1:]  # --resume: skip pages the interrupted run already finished
 
 # Console/log icons (console only; not used in edit summary)
 ICON_SCAN = "🔍"
@@ -216,13 +218,21 @@ def _inject_item_data_comment(page_text: str, infobox_wikitext: str) -> str:
 # -------------------------
 # Page update
 # -------------------------
-def update_page(site, logger, title: str, flags: Tuple[bool, bool]) -> Tuple[bool, str]:
+def update_page(site, logger, journal, title: str, flags: Tuple[bool, bool]) -> Tuple[bool, str]:
     add_top, add_rare = flags
     page = pywikibot.Page(site, title)
 
     if not page.exists():
         msg = f"{ICON_DEBUG} Missing page: {title}"
         logger.info(msg)
+        journal.finish(title, run_journal.SKIPPED)
+        return (False, msg)
+
+    # Page info loaded by exists() includes the latest revid; the text is only fetched when needed
+    revid = page.latest_revision_id
+    if journal.done(title, revid):
+        msg = f"{ICON_SCAN} Already processed at revision {revid}: {title}"
+        logger.info(msg)
         return (False, msg)
 
     text = page.text
@@ -230,6 +240,7 @@ def update_page(site, logger, title: str, flags: Tuple[bool, bool]) -> Tuple[boo
     if mwp is None:
         msg = f"{ICON_DEBUG} mwparserfromhell not installed; cannot edit: {title}"
         logger.error(msg)
+        journal.finish(title, run_journal.FAILED, revid, detail=msg)
         return (False, msg)
 
     code = mwp.parse(text)
@@ -238,12 +249,14 @@ def update_page(site, logger, title: str, flags: Tuple[bool, bool]) -> Tuple[boo
     if not infobox:
         msg = f"{ICON_DEBUG} No {{Item infobox}} or {{Agriculture infobox}} found on: {title}"
         logger.info(msg)
+        journal.finish(title, run_journal.SKIPPED, revid)
         return (False, msg)
 
     changed = ensure_params_with_newlines(infobox, add_top, add_rare)
     if not changed:
         msg = f"{ICON_SCAN} Up-to-date (no changes): {title} [{which}]"
         logger.info(msg)
+        journal.finish(title, run_journal.NO_CHANGE, revid)
         return (False, msg)
 
     # Render text from AST
@@ -256,9 +269,14 @@ def update_page(site, logger, title: str, flags: Tuple[bool, bool]) -> Tuple[boo
     # HARD-enforce line layout for our params & closing braces
     new_text = _force_line_layout(new_text)
 
+    journal.plan(title, revid, [
+        (field, "true", "") for field, wanted in (("topShelf", add_top), ("rareFinds", add_rare)) if wanted
+    ])
+
     if DRY_RUN:
         msg = f"{ICON_EDIT} DRY_RUN — would save [{which}] on: {title}"
         logger.info(msg)
+        journal.finish(title, run_journal.DRY_RUN, revid)
         return (True, msg)
 
     try:
@@ -266,10 +284,12 @@ def update_page(site, logger, title: str, flags: Tuple[bool, bool]) -> Tuple[boo
         page.save(summary=EDIT_SUMMARY, minor=False, force=False)
         msg = f"{ICON_DONE} Saved [{which}]: {title}"
         logger.info(msg)
+        journal.finish(title, run_journal.UPDATED, page.latest_revision_id)
         return (True, msg)
     except Exception as e:
         msg = f"{ICON_DEBUG} Save failed for {title}: {e}"
         logger.exception(msg)
+        journal.finish(title, run_journal.FAILED, revid, detail=str(e))
         return (False, msg)
 
 def log_progress(i: int, total: int, logger):
@@ -304,27 +324,32 @@ def main():
     total = len(titles)
     logger.info(f"{ICON_SCAN} Candidates: {total} (TEST_RUN={TEST_RUN}, DRY_RUN={DRY_RUN})")
 
-    site = pywikibot.Site()
+    site = wiki_utils.limit_site(pywikibot.Site())
     site.login()
 
+    journal = run_journal.RunJournal("top_shelf_rare_finds", resume=RESUME, dry_run=DRY_RUN)
     changed = skipped = errs = 0
+    interrupted = False
 
     for idx, title in enumerate(titles, start=1):
         log_progress(idx, total, logger)
         try:
-            did_change, msg = update_page(site, logger, title, candidates[title])
+            did_change, msg = update_page(site, logger, journal, title, candidates[title])
             if did_change:
                 changed += 1
             else:
                 skipped += 1
             pywikibot.output(msg)  # console echo
         except KeyboardInterrupt:
-            logger.warning(f"{ICON_DEBUG} Interrupted by user.")
+            logger.warning(f"{ICON_DEBUG} Interrupted by user. Run again with {run_journal.RESUME_FLAG} to continue.")
+            interrupted = True
             break
         except Exception as e:
             errs += 1
             logger.exception(f"{ICON_DEBUG} Error on {title}: {e}\n{traceback.format_exc()}")
 
+    journal.close(completed=not interrupted)
+
     logger.info(f"{ICON_DONE} Finished. Changed: {changed} | Skipped: {skipped} | Errors: {errs}"
                 + (f" | DRY_RUN" if DRY_RUN else "")
                 + (f" | TEST_RUN" if TEST_RUN else ""))
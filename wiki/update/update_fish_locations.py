@@ -2,19 +2,19 @@
 Fish locations updater — wiki update script.
 
 Fetches all wiki pages that use {{Fish locations}}, compares against values
-computed from fish_spawner_data.json + items_data.json, and updates pages
+from the fish spawn table (exporters/fish_spawn_chance.py), and updates pages
 where the template differs.
 
 Usage:
     python wiki/update/update_fish_locations.py
     python wiki/update/update_fish_locations.py -- "Blazing Herring" "Angel Fish"
+    python wiki/update/update_fish_locations.py --resume   (continue an interrupted run)
 """
 
 from __future__ import annotations
 
 import os
 import sys
-import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
@@ -24,9 +24,9 @@ import mwparserfromhell
 import pywikibot
 
 import config.constants as constants
-from builders.item_builder import _load_cache
-from utils import json_utils, file_utils, wiki_utils
-from exporters.fish_spawn_chance import _SCENE_LOCATION_MAPPING, _compute_location_rows
+from utils import file_utils, run_journal, wiki_snapshot, wiki_utils
+from utils.fish_spawn_engine import SpawnTable
+from exporters.fish_spawn_chance import load_spawn_table
 
 # ---------------------------------------------------------------------------
 # Settings
@@ -34,47 +34,38 @@ from exporters.fish_spawn_chance import _SCENE_LOCATION_MAPPING, _compute_locati
 
 DRY_RUN = False  # Set False to actually save edits
 
-ARG_PAGES = [a.lstrip("-") for a in sys.argv[1:] if a.lstrip("-")]
+RESUME    = run_journal.RESUME_FLAG in sys.argv[1:]  # Skip pages the interrupted run already finished
+ARG_PAGES = [a.lstrip("-") for a in sys.argv[1:] if a.lstrip("-") and a != run_journal.RESUME_FLAG]
 
-_FISH_DATA   = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "fish_spawner_data.json")
 _OUTPUT_FILE = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot", "fish_locations_update.txt")
 _DEBUG_LOG   = os.path.join(constants.DEBUG_DIRECTORY, "pywikibot", "fish_locations_update_debug.txt")
 
-BATCH_SIZE     = constants.PWB_SETTINGS["BATCH_SIZE"]
-SLEEP_INTERVAL = constants.PWB_SETTINGS["SLEEP_INTERVAL"]
+BATCH_SIZE = constants.PWB_SETTINGS["BATCH_SIZE"]
 
 # ---------------------------------------------------------------------------
 # Data builder
 # ---------------------------------------------------------------------------
 
-def _build_fish_rows(
-    fish_spawner_data: dict,
-    items_by_name: dict,
-) -> dict[str, list[dict]]:
+def _build_fish_rows(table: SpawnTable) -> dict[str, list[dict]]:
     """
-    Build a per-fish list of {location, season, min, max} row dicts,
-    de-duplicating identical entries that arise from multiple scenes
-    mapping to the same location.
+    Build a per-fish list of {location, season, min, max} row dicts from the
+    exporter's spawn table, de-duplicating identical entries that arise from
+    multiple scenes mapping to the same location.
 
     Returns: { fish_name: [{location, season, min, max}, ...] }
     """
     fish_to_rows: dict[str, list[dict]] = {}
 
-    for scene_name, location_name in _SCENE_LOCATION_MAPPING.items():
-        scene_data = fish_spawner_data.get(scene_name)
-        if not scene_data:
-            continue
-
-        for row in _compute_location_rows(scene_data, items_by_name, location_name):
-            entry = {
-                "location": row["location"],
-                "season":   row["season"],
-                "min":      row["min"],
-                "max":      row["max"],
-            }
-            existing = fish_to_rows.setdefault(row["fish"], [])
-            if entry not in existing:
-                existing.append(entry)
+    for row in table.location_rows():
+        entry = {
+            "location": row["location"],
+            "season":   row["season"],
+            "min":      row["min"],
+            "max":      row["max"],
+        }
+        existing = fish_to_rows.setdefault(row["fish"], [])
+        if entry not in existing:
+            existing.append(entry)
 
     return fish_to_rows
 
@@ -178,11 +169,8 @@ def run() -> None:
     file_utils.ensure_dir_exists(os.path.dirname(_OUTPUT_FILE))
     file_utils.ensure_dir_exists(os.path.dirname(_DEBUG_LOG))
 
-    # Build expected data
-    fish_spawner_data = json_utils.load_json(_FISH_DATA)
-    items             = _load_cache()
-    items_by_name     = {item.name: item for item in items.values()}
-    fish_to_rows      = _build_fish_rows(fish_spawner_data, items_by_name)
+    # Expected data from the precomputed spawn table (rebuilt only if stale)
+    fish_to_rows      = _build_fish_rows(load_spawn_table())
     expected_lower    = {name.lower(): name for name in fish_to_rows}
 
     # Build expected active-entry sets for comparison (excludes commented Any rows)
@@ -198,24 +186,34 @@ def run() -> None:
     pages = list(ARG_PAGES) if ARG_PAGES else wiki_utils.get_pages_with_template("Fish locations")
     total = len(pages)
 
-    site         = wiki_utils.get_site()
+    site         = wiki_utils.get_site()   # reads and saves paced by the shared rate limiter
     debug_lines: list[str] = []
     updated:     list[str] = []
     skipped:     list[str] = []
     change_lines: list[str] = []
 
+    # Every outcome is committed as it happens; --resume skips pages finished at their current revision
+    journal = run_journal.RunJournal("update_fish_locations", resume=RESUME, dry_run=DRY_RUN)
+
     for i in range(0, total, BATCH_SIZE):
         batch      = pages[i : i + BATCH_SIZE]
         page_texts = wiki_utils.fetch_pages(batch, batch_size=BATCH_SIZE)
+        revids     = wiki_snapshot.revids(site, batch)
 
         for title in batch:
             text      = page_texts.get(title, "")
             title_key = title.lower()
+            revid     = revids.get(title)
+
+            if journal.done(title, revid):
+                debug_lines.append(f"[RESUMED SKIP] {title} (unchanged since revision {revid})")
+                continue
 
             # Skip pages we have no data for
             if title_key not in expected_lower:
                 skipped.append(title)
                 debug_lines.append(f"[NO DATA] {title}")
+                journal.finish(title, run_journal.SKIPPED, revid)
                 continue
 
             canonical = expected_lower[title_key]
@@ -225,11 +223,13 @@ def run() -> None:
             if wiki_entries is None:
                 skipped.append(title)
                 debug_lines.append(f"[NO TEMPLATE] {title}")
+                journal.finish(title, run_journal.SKIPPED, revid)
                 continue
 
             # Compare active (non-commented) expected entries to wiki
             if wiki_entries == expected_active[canonical]:
                 debug_lines.append(f"[NO CHANGE] {title}")
+                journal.finish(title, run_journal.NO_CHANGE, revid)
                 continue
 
             # Build and apply the updated template
@@ -240,19 +240,26 @@ def run() -> None:
             change_lines.append("")
 
             page = pywikibot.Page(site, title)
+            journal.plan(title, revid, [
+                ("entries", sorted(expected_active[canonical], key=str), sorted(wiki_entries, key=str))
+            ])
 
             try:
                 if not DRY_RUN:
                     page.text = new_text
                     page.save(summary="Update fish locations from data")
-                    if not ARG_PAGES:
-                        time.sleep(SLEEP_INTERVAL)
 
+                journal.finish(
+                    title,
+                    run_journal.DRY_RUN if DRY_RUN else run_journal.UPDATED,
+                    revid if DRY_RUN else page.latest_revision_id,
+                )
                 updated.append(title)
                 status = "DRY RUN" if DRY_RUN else "UPDATED"
                 debug_lines.append(f"[{status}] {title}")
 
             except Exception as exc:
+                journal.finish(title, run_journal.FAILED, revid, detail=str(exc))
                 skipped.append(title)
                 debug_lines.append(f"[FAILED] {title} - {exc}")
 
@@ -261,10 +268,10 @@ def run() -> None:
             percent   = round((processed / total) * 100, 1)
             print(
                 f"     🔄 Reviewed {processed} of {total} pages "
-                f"({percent}% complete). Sleeping {SLEEP_INTERVAL} seconds."
+                f"({percent}% complete)."
             )
-            if not ARG_PAGES:
-                time.sleep(SLEEP_INTERVAL)
+
+    journal.close(completed=True)
 
     with open(_DEBUG_LOG, "w", encoding="utf-8") as dbg:
         dbg.write("\n".join(debug_lines))
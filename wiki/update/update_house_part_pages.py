@@ -35,7 +35,7 @@ import pywikibot
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
-from utils import image_utils
+from utils import image_utils, wiki_utils
 
 # ---------------------------------------------------------------------------
 # Debug log
@@ -258,7 +258,7 @@ def update_page(style, part_type):
     suffix = PART_PAGE_SUFFIX[part_type]
     title  = f"{style} {suffix}"
 
-    site = pywikibot.Site()
+    site = wiki_utils.limit_site(pywikibot.Site())
     page = pywikibot.Page(site, title)
 
     if not page.exists():
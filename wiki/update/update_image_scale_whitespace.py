@@ -1,31 +1,29 @@
 import os
 import re
 import sys
-import time
 import pywikibot
 import requests
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
-from utils import file_utils, wiki_utils
+from utils import file_utils, image_analysis, wiki_utils
+from utils.image_upload import encode_png, upload_png
 from PIL import Image
 from io import BytesIO
 
 # Config
 site = wiki_utils.get_site()
+limiter = wiki_utils.rate_limiter(site)  # API calls are paced automatically
 
 # Paths
 debug_log_path = os.path.join(constants.DEBUG_DIRECTORY, "pywikibot", "image_trim_scale_upload_debug.txt")
-temp_dir = os.path.join(constants.IMAGE_INPUT_DIRECTORY, "temp")
 file_utils.ensure_dir_exists(os.path.dirname(debug_log_path))
-file_utils.ensure_dir_exists(temp_dir)
 
 # Constants
 MIN_DIM = 300
 MAX_PAD = 10
 TARGET_PAD = 3
-SLEEP_INTERVAL = constants.PWB_SETTINGS["SLEEP_INTERVAL"]
 CATEGORY_NAME = "Crop stage images"
 START_AT_LETTER = "None"  # Leave as 'None' to disable filtering
 
@@ -38,6 +36,7 @@ def log_debug(msg):
 def download_image(page):
     try:
         url = page.get_file_url()
+        limiter.read()  # plain HTTP download, outside Pywikibot's throttle
         r = requests.get(url, headers={'User-Agent': 'image-fixer/1.0'})
         return Image.open(BytesIO(r.content)) if r.status_code == 200 else None
     except Exception as e:
@@ -45,25 +44,8 @@ def download_image(page):
         return None
 
 def get_transparent_bounds(img):
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-    w, h = img.size
-    px = img.load()
-
-    def is_col_transparent(x): return all(px[x, y][3] == 0 for y in range(h))
-    def is_row_transparent(y): return all(px[x, y][3] == 0 for x in range(w))
-
-    left = 0
-    while left < w and is_col_transparent(left): left += 1
-    right = w - 1
-    while right >= 0 and is_col_transparent(right): right -= 1
-
-    top = 0
-    while top < h and is_row_transparent(top): top += 1
-    bottom = h - 1
-    while bottom >= 0 and is_row_transparent(bottom): bottom -= 1
-
-    return left, top, w - 1 - right, h - 1 - bottom
+    """Transparent padding per side (left, top, right, bottom); the full size for a blank image."""
+    return image_analysis.alpha_bounds(img).padding
 
 def trim_whitespace(img, bounds):
     l, t, r, b = bounds
@@ -92,31 +74,18 @@ def scale_image(img):
     new_size = (round(w * scale), round(h * scale))
     return img.resize(new_size, Image.NEAREST)
 
-def save_temp_image(img, filename):
-    temp_path = os.path.join(temp_dir, filename.replace("File:", "").replace(" ", "_"))
-    img.save(temp_path)
-    return temp_path
-
 def upload_overwrite(file_page, img, summary):
-    temp_path = save_temp_image(img, file_page.title())
+    # Encoded and uploaded from memory; no temp file to write or clean up
     try:
-        file_page.upload(temp_path, comment=summary, ignore_warnings=True)
+        upload_png(site, file_page.title(with_ns=False), encode_png(img), "", summary, ignore_warnings=True)
         log_debug(f"📝 Overwrote {file_page.title()} - {summary}")
     except Exception as e:
         err = str(e)
         log_debug(f"❌ Upload failed for {file_page.title()}: {err}")
         # NEW: detect missing login / user rights issue
-        if "user right" in err.lower() or "does not have required user right" in err.lower():
+        if "user right" in err.lower() or "permissiondenied" in err.lower():
             print("\n🚨 ERROR: Not logged in or missing upload rights. Please run `pwb.py login` first.\n")
             sys.exit(1)  # stop script immediately
-    finally:
-        try:
-            os.remove(temp_path)
-            log_debug(f"🗑️ Deleted temp file: {temp_path}")
-        except Exception as e:
-            log_debug(f"⚠️ Failed to delete temp file {temp_path}: {e}")
-
-API_METADATA_SLEEP = 0.5  # seconds between file info queries
 
 def process_file(file_page):
     title = file_page.title(with_ns=False)
@@ -128,8 +97,6 @@ def process_file(file_page):
         log_debug(f"❌ File missing: {title}")
         return
 
-    # Throttle API metadata calls
-    time.sleep(API_METADATA_SLEEP)
     info = file_page.latest_file_info
     if not info or not info.mime or 'image' not in info.mime:
         log_debug(f"⏩ Skipped non-image or unknown type: {title}")
@@ -204,7 +171,5 @@ def main():
         if i % 250 == 0:
             log_debug(f"🔄 Progress: {i}/{len(filtered_pages)} images processed")
 
-        time.sleep(SLEEP_INTERVAL)
-
 if __name__ == "__main__":
     main()
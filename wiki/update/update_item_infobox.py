@@ -1,22 +1,24 @@
 import os
 import re
 import sys
-import time
+import queue
+import threading
 import pywikibot
-import mwparserfromhell
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
-from config.skip_items import SKIP_ITEMS, SKIP_FIELDS
+from config.skip_items import SKIP_FIELDS
 from wiki.shared import item_infobox_core
-from utils import file_utils, text_utils
+from utils import file_utils, reconcile, run_journal, text_utils, wiki_snapshot, wiki_utils
+from utils.skip_matcher import skip_matcher
 
 SKIP_VARIANTS_BASE = True       # Skip pages that are base names of variant groups
 DRY_RUN = False                  # No actual edits
 ADD_HISTORY = False              # Add a history bullet if changes were made
 
-ARG_PAGES = [a.lstrip("-") for a in sys.argv[1:]]  # Page titles; strip leading dashes (e.g. --Seaweed → Seaweed)
+RESUME = run_journal.RESUME_FLAG in sys.argv[1:]  # --resume: skip pages the interrupted run already finished
+ARG_PAGES = [a.lstrip("-") for a in sys.argv[1:] if a != run_journal.RESUME_FLAG]  # Page titles; strip leading dashes (e.g. --Seaweed → Seaweed)
 
 JSON_FILE = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "items_data.json")
 OUTPUT_FILE = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "pywikibot", "item_infobox_update.txt")
@@ -26,31 +28,37 @@ file_utils.ensure_dir_exists(os.path.dirname(OUTPUT_FILE))
 file_utils.ensure_dir_exists(os.path.dirname(debug_log_path))
 
 BATCH_SIZE = constants.PWB_SETTINGS["BATCH_SIZE"]
-SLEEP_INTERVAL = constants.PWB_SETTINGS["SLEEP_INTERVAL"]
+WRITE_QUEUE_SIZE = 100           # Edits waiting to save before comparing pauses
 
-site = pywikibot.Site()
+site = wiki_utils.limit_site(pywikibot.Site())  # reads and saves paced by the shared rate limiter
 
 
 def fetch_pages(titles):
-    page_texts = {}
-    page_objs = [pywikibot.Page(site, t) for t in titles]
-    for page in site.preloadpages(page_objs):
-        page_texts[page.title()] = page.text or ""
-    return page_texts
+    # Unchanged pages come from the local snapshot; only edited ones are downloaded
+    return wiki_snapshot.fetch_pages(site, titles, batch_size=BATCH_SIZE)
 
 
 pages = list(ARG_PAGES) if ARG_PAGES else item_infobox_core.get_infobox_pages(False, [])
 data = item_infobox_core.load_normalized_json(JSON_FILE)
 
+def _normalize(title):
+    return text_utils.normalize_apostrophe(title).lower()
+
+
+# Title and base -> [variants] indexes, built once (same rules as compare_item_infobox)
+reconciler = reconcile.Reconciler(data.keys(), normalize=_normalize, group_variants=True)
+
+journal = run_journal.RunJournal("update_item_infobox", resume=RESUME, dry_run=DRY_RUN)
+
 debug_lines = []
 updated = []
 skipped = []
 change_lines = []
 
 
-def apply_diffs_with_regex(text, diffs):
-    parsed = mwparserfromhell.parse(text)
-    infobox = item_infobox_core.find_infobox_template(parsed)
+def apply_diffs_with_regex(page, diffs):
+    text = page.text
+    infobox = page.infobox
 
     if not infobox:
         return text
@@ -114,147 +122,225 @@ def apply_diffs_with_regex(text, diffs):
     return text
 
 
-for i in range(0, len(pages), BATCH_SIZE):
-    batch = pages[i:i + BATCH_SIZE]
-    page_texts = fetch_pages(batch)
+def save_edit(title, new_text, diffs, base_revid):
+    """Save one page edit and journal the outcome; returns its debug lines. Runs on the writer thread."""
+    page = pywikibot.Page(site, title)
 
-    for title in batch:
-        text = page_texts.get(title, "")
-        normalized_title = text_utils.normalize_apostrophe(title).lower()
+    try:
+        if not DRY_RUN and base_revid is not None and page.latest_revision_id != base_revid:
+            # Edited on the wiki after the compare; failed rows are compared again on --resume
+            detail = f"edited since compare (revision {base_revid} → {page.latest_revision_id})"
+            journal.finish(title, run_journal.FAILED, base_revid, detail=detail)
+            skipped.append(title)
+            return [f"[EDIT CONFLICT] {title} - {detail}"]
+
+        if not DRY_RUN:
+            if ADD_HISTORY:
+                from utils.history_utils import append_history_entry
+                changed_fields = [field for field, _, _ in diffs]
+                summary = f"Updated {title} infobox fields: {', '.join(changed_fields)}"
+                patch = constants.PATCH_VERSION.replace("PBE ", "").strip()
+                new_text = append_history_entry(new_text, summary, patch)
+
+            page.text = new_text
+            changed_fields = [field for field, expected, actual in diffs if field != "name"]
+
+            seen = set()
+            changed_fields = [f for f in changed_fields if not (f in seen or seen.add(f))]
+
+            MAX_FIELDS_IN_SUMMARY = 4
+            if len(changed_fields) <= MAX_FIELDS_IN_SUMMARY:
+                summary = f"Update infobox from JSON: {', '.join(changed_fields)}"
+            else:
+                shown = changed_fields[:MAX_FIELDS_IN_SUMMARY]
+                remaining = len(changed_fields) - MAX_FIELDS_IN_SUMMARY
+                summary = (
+                    f"Update infobox from JSON: "
+                    f"{', '.join(shown)} (+{remaining} more)"
+                )
+            page.save(summary=summary)
+            wiki_snapshot.remember(page)
+
+        journal.finish(
+            title,
+            run_journal.DRY_RUN if DRY_RUN else run_journal.UPDATED,
+            base_revid if DRY_RUN else page.latest_revision_id,
+        )
+        updated.append(title)
+        status = "DRY RUN" if DRY_RUN else "UPDATED"
+        lines = [f"[{status}] {title}"]
+        for field, expected, actual in diffs:
+            lines.append(f"    - {field} expected: '{expected}' but found: '{actual}'")
+        return lines
+    except Exception as e:
+        journal.finish(title, run_journal.FAILED, base_revid, detail=str(e))
+        skipped.append(title)
+        return [f"[FAILED] {title} - {str(e)}"]
+
+
+class _EditWriter(threading.Thread):
+    """Saves queued edits in the order received while the main loop keeps comparing."""
+
+    _DONE = None
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self.cancelled = threading.Event()
+
+    def put(self, title, new_text, diffs, base_revid, debug_slot):
+        self.queue.put((title, new_text, diffs, base_revid, debug_slot))
+
+    def close(self, save=True):
+        """Wait for the queue to empty; save=False drops queued edits instead of saving them."""
+        if not save:
+            self.cancelled.set()
+        self.queue.put(self._DONE)
+        self.join()
+
+    def run(self):
+        while True:
+            entry = self.queue.get()
+            if entry is self._DONE:
+                return
+            title, new_text, diffs, base_revid, debug_slot = entry
+            if self.cancelled.is_set():
+                # Still journaled as planned, so --resume compares and saves it again
+                debug_lines[debug_slot] = f"[NOT SAVED] {title} (run interrupted, left for --resume)"
+                continue
+            debug_lines[debug_slot] = "\n".join(save_edit(title, new_text, diffs, base_revid))
 
-        if normalized_title in SKIP_ITEMS:
-            continue
 
-        subtype = item_infobox_core.extract_subtype(text)
-        item_key = None
-        classification = ""
+writer = _EditWriter()
+writer.start()
+completed = False
 
-        if normalized_title in data:
-            item_key = normalized_title
-        else:
-            item_key, classification = item_infobox_core.get_base_variant_key(normalized_title, data, subtype)
+try:
+    # The next batch is fetched in the background while this one is compared,
+    # and saves (paced by the rate limiter) run on the writer thread.
+    for batch_no, (batch, page_texts) in enumerate(
+        wiki_utils.prefetch_batches(pages, batch_size=BATCH_SIZE, fetch=fetch_pages)
+    ):
+        # Snapshot revids were refreshed by the fetch; the journal keys progress on them
+        revids = wiki_snapshot.revids(site, batch)
 
-        if SKIP_VARIANTS_BASE and classification == "VARIANTS":
-            debug_lines.append(f"[SKIPPED BASE] {title} (has JSON variants)")
-            continue
+        for title in batch:
+            normalized_title = text_utils.normalize_apostrophe(title).lower()
 
-        if not item_key:
-            skipped.append(title)
-            debug_lines.append(f"[NO JSON] {title}")
-            continue
+            if skip_matcher().is_listed(normalized_title):
+                continue
 
-        diffs, wiki_params = item_infobox_core.compare_page_to_json(
-            title,
-            text,
-            data[item_key],
-            None,
-            skip_fields_map=SKIP_FIELDS,
-            all_data=data,
-        )
+            revid = revids.get(title)
+            if journal.done(title, revid):
+                debug_lines.append(f"[RESUMED SKIP] {title} (unchanged since revision {revid})")
+                continue
 
-        def normalize_stat_plus(value):
-            if value is None:
-                return value
-            value = str(value)
-            # remove leading + inside stat brackets, keep -
-            return re.sub(r'«\+', '«', value)
+            # Parsed once; compare and edit below reuse the located infobox
+            parsed_page = item_infobox_core.ParsedPage(title, page_texts.get(title, ""))
+            subtype = parsed_page.subtype
 
-        effective_diffs = []
-        for field, expected, actual in diffs:
-            if field == "name":
-                continue
+            # Mount / pet prefix groups only count for those subtypes, as in compare_item_infobox
+            kind, keys = reconciler.classify(title, include_prefixed=subtype in ["Mount", "Pet"])
+            item_key = keys[0] if keys else None
 
-            # skip dlc=false/no/0
-            if field == "dlc" and str(expected).lower() in ["false", "no", "0"]:
+            if SKIP_VARIANTS_BASE and kind == reconcile.VARIANTS:
+                debug_lines.append(f"[SKIPPED BASE] {title} (has JSON variants)")
+                journal.finish(title, run_journal.SKIPPED, revid)
                 continue
 
-            # skip overwriting wiki values when JSON is blank
-            if expected is None or str(expected).strip() == "":
-                debug_lines.append(f"[SKIP BLANK EXPECTED] {title} - {field} (wiki='{actual}')")
+            if not item_key:
+                skipped.append(title)
+                debug_lines.append(f"[NO JSON] {title}")
+                journal.finish(title, run_journal.SKIPPED, revid)
                 continue
 
-            # ignore + vs no-sign differences for statInc ONLY
-            if field == "statInc":
-                if normalize_stat_plus(expected) == normalize_stat_plus(actual):
-                    debug_lines.append(
-                        f"[SKIP PLUS ONLY] {title} - {field} "
-                        f"(expected='{expected}', actual='{actual}')"
-                    )
+            diffs, wiki_params = item_infobox_core.compare_page_to_json(
+                title,
+                parsed_page,
+                data[item_key],
+                None,
+                skip_fields_map=SKIP_FIELDS,
+                all_data=data,
+            )
+
+            def normalize_stat_plus(value):
+                if value is None:
+                    return value
+                value = str(value)
+                # remove leading + inside stat brackets, keep -
+                return re.sub(r'«\+', '«', value)
+
+            effective_diffs = []
+            for field, expected, actual in diffs:
+                if field == "name":
                     continue
 
-            effective_diffs.append((field, expected, actual))
+                # skip dlc=false/no/0
+                if field == "dlc" and str(expected).lower() in ["false", "no", "0"]:
+                    continue
 
-        if not effective_diffs:
-            debug_lines.append(f"[NO APPLICABLE CHANGE] {title}")
-            continue
+                # skip overwriting wiki values when JSON is blank
+                if expected is None or str(expected).strip() == "":
+                    debug_lines.append(f"[SKIP BLANK EXPECTED] {title} - {field} (wiki='{actual}')")
+                    continue
 
-        diffs = effective_diffs
+                # ignore + vs no-sign differences for statInc ONLY
+                if field == "statInc":
+                    if normalize_stat_plus(expected) == normalize_stat_plus(actual):
+                        debug_lines.append(
+                            f"[SKIP PLUS ONLY] {title} - {field} "
+                            f"(expected='{expected}', actual='{actual}')"
+                        )
+                        continue
 
-        missing_seed = wiki_params.get(item_infobox_core.AGRI_MISSING_SEED_KEY, "")
-        if missing_seed:
-            debug_lines.append(
-                f"[AGRI NO SEED JSON] {title} - seed='{missing_seed}' (seed-derived fields left as-is on wiki)"
-            )
+                effective_diffs.append((field, expected, actual))
 
-        if not diffs:
-            debug_lines.append(f"[NO CHANGE] {title}")
-            continue
+            if not effective_diffs:
+                debug_lines.append(f"[NO APPLICABLE CHANGE] {title}")
+                journal.finish(title, run_journal.NO_CHANGE, revid)
+                continue
 
-        change_lines.append(f"{title}")
-        for field, expected, actual in diffs:
-            change_lines.append(f"* {field}: actual:'{actual}' → expected:'{expected}'")
-        change_lines.append("")  # blank line between pages
-
-        new_text = apply_diffs_with_regex(text, diffs)
-        page = pywikibot.Page(site, title)
-
-        try:
-            if not DRY_RUN:
-                if ADD_HISTORY:
-                    from utils.history_utils import append_history_entry
-                    changed_fields = [field for field, _, _ in diffs]
-                    summary = f"Updated {title} infobox fields: {', '.join(changed_fields)}"
-                    patch = constants.PATCH_VERSION.replace("PBE ", "").strip()
-                    new_text = append_history_entry(new_text, summary, patch)
-
-                page.text = new_text
-                changed_fields = [field for field, expected, actual in diffs if field != "name"]
-
-                seen = set()
-                changed_fields = [f for f in changed_fields if not (f in seen or seen.add(f))]
-
-                MAX_FIELDS_IN_SUMMARY = 4
-                if len(changed_fields) <= MAX_FIELDS_IN_SUMMARY:
-                    summary = f"Update infobox from JSON: {', '.join(changed_fields)}"
-                else:
-                    shown = changed_fields[:MAX_FIELDS_IN_SUMMARY]
-                    remaining = len(changed_fields) - MAX_FIELDS_IN_SUMMARY
-                    summary = (
-                        f"Update infobox from JSON: "
-                        f"{', '.join(shown)} (+{remaining} more)"
-                    )
-                page.save(summary=summary)
-
-                if not ARG_PAGES:
-                    time.sleep(SLEEP_INTERVAL)
-
-            updated.append(title)
-            status = "DRY RUN" if DRY_RUN else "UPDATED"
-            debug_lines.append(f"[{status}] {title}")
-            for field, expected, actual in diffs:
-                debug_lines.append(f"    - {field} expected: '{expected}' but found: '{actual}'")
-        except Exception as e:
-            skipped.append(title)
-            debug_lines.append(f"[FAILED] {title} - {str(e)}")
+            diffs = effective_diffs
 
-    if i // BATCH_SIZE % 10 == 0:
-        processed = i + len(batch)
-        percent = round((processed / len(pages)) * 100, 1)
-        print(
-            f"     🔄 Updated {processed} of {len(pages)} pages ({percent}% complete). Sleeping {SLEEP_INTERVAL} seconds."
-        )
-        if not ARG_PAGES:
-            time.sleep(SLEEP_INTERVAL)
+            missing_seed = wiki_params.get(item_infobox_core.AGRI_MISSING_SEED_KEY, "")
+            if missing_seed:
+                debug_lines.append(
+                    f"[AGRI NO SEED JSON] {title} - seed='{missing_seed}' (seed-derived fields left as-is on wiki)"
+                )
+
+            if not diffs:
+                debug_lines.append(f"[NO CHANGE] {title}")
+                journal.finish(title, run_journal.NO_CHANGE, revid)
+                continue
+
+            change_lines.append(f"{title}")
+            for field, expected, actual in diffs:
+                change_lines.append(f"* {field}: actual:'{actual}' → expected:'{expected}'")
+            change_lines.append("")  # blank line between pages
+
+            new_text = apply_diffs_with_regex(parsed_page, diffs)
+
+            # Journaled before saving, so an interrupted save is retried on --resume.
+            # Saved by the writer thread; its debug lines fill this slot
+            journal.plan(title, revid, diffs)
+            debug_lines.append("")
+            writer.put(title, new_text, diffs, revid, len(debug_lines) - 1)
+
+        if batch_no % 10 == 0:
+            processed = batch_no * BATCH_SIZE + len(batch)
+            percent = round((processed / len(pages)) * 100, 1)
+            print(
+                f"     🔄 Compared {processed} of {len(pages)} pages ({percent}% complete), "
+                f"{writer.queue.qsize()} edits waiting to save."
+            )
+    completed = True
+finally:
+    # On Ctrl-C or an error, queued edits are dropped rather than saved after the
+    # user asked to stop; only the save already in flight finishes
+    if not completed:
+        print(f"⚠️  Stopping: {writer.queue.qsize()} queued edits not saved (rerun with {run_journal.RESUME_FLAG}).")
+    writer.close(save=completed)
+    journal.close(completed)
 
 with open(debug_log_path, "w", encoding="utf-8") as dbg:
     dbg.write("\n".join(debug_lines))
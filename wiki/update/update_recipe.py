@@ -1,17 +1,17 @@
 import os
 import re
 import sys
-import time
 import pywikibot
 import mwparserfromhell
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from config import constants
-from config.skip_items import SKIP_ITEMS, SKIP_FIELDS
+from config.skip_items import SKIP_FIELDS
 from wiki.shared import recipe_core
 from wiki.compare.recipe_fields import RECIPE_FIELD_MAP
-from utils import file_utils, recipe_utils
+from utils import file_utils, recipe_utils, run_journal, wiki_snapshot, wiki_utils
+from utils.skip_matcher import skip_matcher
 
 SKIP_WORKBENCH = True           # Skip updating the workbench
 SKIP_SKILL_TOMES = True         # Skip items that have the words "Skill Tome" in them.
@@ -22,18 +22,22 @@ ADD_HISTORY = True              # Add a history bullet if changes were made
 TEST_RUN = True                # Only process test pages
 TEST_PAGES = ["Deadwood Lamp", "Dynus Lamp", "Monstrous Window"]
 
+RESUME = run_journal.RESUME_FLAG in sys.argv[1:]  # --resume: skip pages the interrupted run already finished
+
 json_file_path = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "recipes_data.json")
 debug_log_path = os.path.join(".hidden", "debug_output", "pywikibot", "recipe_update_debug.txt")
 file_utils.ensure_dir_exists(os.path.dirname(debug_log_path))
 
 KEYS_TO_CHECK = ["product", "workbench", "ingredients", "time", "yield", "id"]
 BATCH_SIZE = constants.PWB_SETTINGS["BATCH_SIZE"]
-SLEEP_INTERVAL = constants.PWB_SETTINGS["SLEEP_INTERVAL"]
 
-site = pywikibot.Site()
+site = wiki_utils.limit_site(pywikibot.Site())  # reads and saves paced by the shared rate limiter
 pages = recipe_core.get_recipe_pages(TEST_RUN, TEST_PAGES) + recipe_core.get_recipe_none_pages(TEST_RUN, TEST_PAGES)
 pages = list(dict.fromkeys(pages))  # Removes duplicates while preserving order
 data = recipe_core.load_normalized_json(json_file_path)
+products = recipe_core.build_product_index(data)
+
+journal = run_journal.RunJournal("update_recipe", resume=RESUME, dry_run=DRY_RUN)
 
 debug_lines = []
 updated = []
@@ -60,7 +64,14 @@ def find_json_by_id_or_product(data, title):
     for key, entry in data.items():
         if entry.get("recipe_id") == title:
             return key, entry
-    return recipe_core.find_json_by_product_name(data, title)
+    return recipe_core.find_json_by_product_name(data, title, index=products)
+
+def page_outcome(outcomes):
+    """Journal outcome for a page from its per-template outcomes; any failure means retry on --resume."""
+    for outcome in (run_journal.FAILED, run_journal.UPDATED, run_journal.DRY_RUN, run_journal.NO_CHANGE):
+        if outcome in outcomes:
+            return outcome
+    return run_journal.SKIPPED
 
 def title_case_ingredients(value):
     parts = [x.strip().title() for x in value.split(";") if x.strip()]
@@ -119,20 +130,25 @@ def apply_diffs_with_regex(text, diffs, target_template):
 for i in range(0, len(pages), BATCH_SIZE):
     batch = pages[i:i + BATCH_SIZE]
     page_texts = recipe_core.fetch_pages(batch)
+    revids = wiki_snapshot.revids(wiki_utils.get_site(), batch)  # refreshed by the fetch above
 
     batch_index = i // BATCH_SIZE
     if batch_index > 0 and batch_index % 10 == 0:
         percent = round(((i + BATCH_SIZE) / len(pages)) * 100, 1)
-        print(f"     🔄 Updated {i + BATCH_SIZE} of {len(pages)} pages ({percent}% complete). Sleeping {SLEEP_INTERVAL} seconds.")
-        if not TEST_RUN:
-            time.sleep(SLEEP_INTERVAL)
+        print(f"     🔄 Updated {i + BATCH_SIZE} of {len(pages)} pages ({percent}% complete).")
 
     for title in batch:
         did_save_page = False
         text = page_texts.get(title, "")
-        if title in SKIP_ITEMS or (SKIP_SKILL_TOMES and "skill tome" in title.lower()):
+        if skip_matcher().is_listed(title) or (SKIP_SKILL_TOMES and "skill tome" in title.lower()):
             continue
 
+        base_revid = revid = revids.get(title)
+        if journal.done(title, base_revid):
+            debug_lines.append(f"[RESUMED SKIP] {title} (unchanged since revision {base_revid})")
+            continue
+        outcomes = []
+
         parsed = mwparserfromhell.parse(text)
         templates = [tpl for tpl in parsed.filter_templates() if tpl.name.strip().lower() == "recipe"]
 
@@ -144,6 +160,7 @@ for i in range(0, len(pages), BATCH_SIZE):
                     debug_lines.extend(match_logs)
                     if not matched_json:
                         debug_lines.append(f"[RECIPE/NONE - NO MATCH] {title}")
+                        outcomes.append(run_journal.SKIPPED)
                         break
 
                     mapped = {}
@@ -170,6 +187,7 @@ for i in range(0, len(pages), BATCH_SIZE):
                     debug_lines.append(f"[REPLACED RECIPE/NONE] {title}")
 
                     page = pywikibot.Page(site, title)
+                    journal.plan(title, base_revid, [("recipe/none", formatted_tpl, str(tpl))])
                     try:
                         if not DRY_RUN:
                             if ADD_HISTORY:
@@ -180,24 +198,26 @@ for i in range(0, len(pages), BATCH_SIZE):
                                 text = append_history_entry(text, summary, patch)
                             page.text = text
                             page.save(summary="Adding recipe to craft item.")
-                            if not TEST_RUN:
-                                time.sleep(SLEEP_INTERVAL)
+                            revid = page.latest_revision_id
+                        outcomes.append(run_journal.DRY_RUN if DRY_RUN else run_journal.UPDATED)
                         updated.append(title)
                         debug_lines.append(f"[{'DRY RUN' if DRY_RUN else 'UPDATED'}] {title}")
                         did_save_page = True
                     except Exception as e:
+                        outcomes.append(run_journal.FAILED)
                         skipped.append(title)
                         debug_lines.append(f"[FAILED] {title} - {str(e)}")
                     break
 
             if did_save_page or not templates:
+                journal.finish(title, page_outcome(outcomes), revid)
                 continue
 
         if did_save_page:
             continue
 
         for template in templates:
-            matched_json, match_logs = recipe_core.match_json_recipe(template, title, data, len(templates))
+            matched_json, match_logs = recipe_core.match_json_recipe(template, title, data, len(templates), index=products)
             debug_lines.extend(match_logs)
 
             if not matched_json:
@@ -211,9 +231,11 @@ for i in range(0, len(pages), BATCH_SIZE):
                     debug_lines.append(f"[FALLBACK PRODUCT MATCH] {title} → {key}")
                 elif len(matches) > 1:
                     debug_lines.append(f"[FALLBACK ABORT] {title} - Multiple JSON matches for '{product}'")
+                    outcomes.append(run_journal.SKIPPED)
                     continue
                 else:
                     debug_lines.append(f"[NO MATCH] {title} - No JSON match for product '{product}'")
+                    outcomes.append(run_journal.SKIPPED)
                     continue
 
             diffs, wiki_params = recipe_core.compare_page_to_json(
@@ -242,10 +264,12 @@ for i in range(0, len(pages), BATCH_SIZE):
 
             if not non_skipped_diffs:
                 debug_lines.append(f"[NO CHANGE] {title}")
+                outcomes.append(run_journal.NO_CHANGE)
                 continue
 
             new_text = apply_diffs_with_regex(text, clean_diffs, template)
             page = pywikibot.Page(site, title)
+            journal.plan(title, base_revid, non_skipped_diffs)
 
             try:
                 if not DRY_RUN:
@@ -259,9 +283,9 @@ for i in range(0, len(pages), BATCH_SIZE):
                     summary = f"Updating {', '.join([f for f, _, _ in non_skipped_diffs])}."
                     page.text = new_text
                     page.save(summary=summary)
-                    if not TEST_RUN:
-                        time.sleep(SLEEP_INTERVAL)
+                    revid = page.latest_revision_id
 
+                outcomes.append(run_journal.DRY_RUN if DRY_RUN else run_journal.UPDATED)
                 updated.append(title)
                 status = "DRY RUN" if DRY_RUN else "UPDATED"
                 debug_lines.append(f"[{status}] {title}")
@@ -270,9 +294,14 @@ for i in range(0, len(pages), BATCH_SIZE):
                         continue
                     debug_lines.append(f"    - {field} expected: '{expected}' but found: '{actual}'")
             except Exception as e:
+                outcomes.append(run_journal.FAILED)
                 skipped.append(title)
                 debug_lines.append(f"[FAILED] {title} - {str(e)}")
 
+        journal.finish(title, page_outcome(outcomes), revid)
+
+journal.close(completed=True)
+
 with open(debug_log_path, "w", encoding="utf-8") as dbg:
     dbg.write("\n".join(debug_lines))
 
@@ -1,7 +1,6 @@
 import os
 import re
 import sys
-import time
 import pywikibot
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
@@ -9,7 +8,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 from config import constants
 from utils import file_utils, wiki_utils
 
-site = wiki_utils.get_site()
+site = wiki_utils.get_site()  # API calls paced by the shared rate limiter
 debug_log_path = os.path.join(constants.DEBUG_DIRECTORY, "pywikibot", "media_rename_log.txt")
 file_utils.ensure_dir_exists(os.path.dirname(debug_log_path))
 
@@ -150,7 +149,6 @@ def main():
             continue
         log_debug(f"\n--- [{i}] Processing {name} ---")
         process_npc(name)
-        time.sleep(1)  # be nice to the API
 
 if __name__ == "__main__":
     main()
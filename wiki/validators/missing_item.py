@@ -7,20 +7,20 @@ import re
 import sys
 import json
 import time
-import fnmatch
 import pywikibot
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 sys.stdout.reconfigure(encoding='utf-8')
 
 from config import constants
-from config.skip_items import SKIP_ITEMS, SKIP_PATTERNS
+from utils import wiki_utils
+from utils.skip_matcher import skip_matcher
 from collections import defaultdict
 from itertools import islice
 
 # Set up paths and pywikibot site
 sys.path.append(constants.ADDITIONAL_PATHS["PWB"])
-site = pywikibot.Site("en", "sunhaven")
+site = wiki_utils.get_site()
 
 output_directory = os.path.join(constants.OUTPUT_DIRECTORY, "Pywikibot")
 os.makedirs(output_directory, exist_ok=True)
@@ -33,13 +33,7 @@ comparison_json_only_path = os.path.join(output_directory, "Item_Comparison_JSON
 debug_log_path = os.path.join(constants.DEBUG_DIRECTORY, "pywikibot")
 
 def should_skip(name):
-    name = name.lower()
-    if name in SKIP_ITEMS:
-        return True
-    for pattern in SKIP_PATTERNS:
-        if fnmatch.fnmatch(name, pattern.lower()):
-            return True
-    return False
+    return skip_matcher().skips(name)
 
 def get_base_and_variant(name):
     name = name.strip().lower()
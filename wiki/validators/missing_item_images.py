@@ -6,7 +6,6 @@ For items missing their image in the wiki, it will map the file name of the item
 import os
 import sys
 import json
-import time
 import pywikibot
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
@@ -14,10 +13,11 @@ sys.stdout.reconfigure(encoding='utf-8')
 
 from config import constants
 from utils.text_utils import normalize_apostrophe
+from utils import wiki_utils
 
 # Set up necessary configurations before other imports
 sys.path.append(constants.ADDITIONAL_PATHS["PWB"])
-site = pywikibot.Site()
+site = wiki_utils.limit_site(pywikibot.Site())  # API calls paced by the shared rate limiter
 
 # Paths
 json_data_directory = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data")
@@ -32,7 +32,6 @@ debug_log_path = os.path.join(constants.DEBUG_DIRECTORY, "pywikibot", "pywikibot
 
 # Constants
 CHUNK_SIZE = 750
-CHUNK_SLEEP_SECONDS = 3
 
 def load_json(path):
     with open(path, "r", encoding="utf-8") as f:
@@ -81,8 +80,7 @@ def step1_combined_check_and_map():
         processed = i * CHUNK_SIZE
         percent = min(int((processed / total) * 100), 100)
         actual_processed = min(processed, total)
-        print(f"  ✅ {actual_processed}/{total} items complete — ({percent}%). Sleeping {CHUNK_SLEEP_SECONDS}s...")
-        time.sleep(CHUNK_SLEEP_SECONDS)
+        print(f"  ✅ {actual_processed}/{total} items complete — ({percent}%).")
 
     missing_items = all_missing_items
 
@@ -5,19 +5,20 @@ Includes redirect recovery and progress logging.
 
 import os
 import sys
-import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 sys.stdout.reconfigure(encoding="utf-8")
 
 from config import constants
 from utils import json_utils, file_utils
-from utils.wiki_utils import get_site
+from utils.wiki_utils import get_site, rate_limiter
 from itertools import islice
 
 # Setup wiki site
 site = get_site()
 
+RATE_LIMIT_BACKOFF = 20  # seconds every request pauses after a ratelimited error
+
 # Paths and filenames
 json_path = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data")
 quest_files = ["quest_data_BB_SQ.json", "quest_data_MainQuests.json"]
@@ -70,11 +71,10 @@ def recheck_redirects(titles: set[str]) -> set[str]:
                 break
             except Exception as e:
                 if "ratelimited" in str(e).lower():
-                    print("⚠️ Rate limited. Sleeping...")
-                    time.sleep(20)
+                    print("⚠️ Rate limited. Backing off...")
+                    rate_limiter(site).backoff(RATE_LIMIT_BACKOFF)
                 else:
                     raise
-        time.sleep(0.1)
 
     file_utils.write_lines(recovered_log_path, sorted(recovered))
     return recovered
@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 sys.stdout.reconfigure(encoding='utf-8')
 
 from config import constants
-from utils import file_utils
+from utils import file_utils, wiki_utils
 
 # Setup PWB and site
 sys.path.append(constants.ADDITIONAL_PATHS["PWB"])
@@ -20,7 +20,7 @@ pywikibot.config.throttle = constants.PWB_SETTINGS["throttle"]
 pywikibot.config.max_retries = constants.PWB_SETTINGS["max_retries"]
 pywikibot.config.retry_wait = constants.PWB_SETTINGS["retry_wait"]
 pywikibot.config.user_agent = constants.PWB_SETTINGS["user_agent"]
-site = pywikibot.Site("en", "sunhaven")
+site = wiki_utils.get_site()
 
 # Paths
 json_file_path = os.path.join(constants.OUTPUT_DIRECTORY, "JSON Data", "recipes_data.json")